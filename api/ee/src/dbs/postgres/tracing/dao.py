@@ -16,7 +16,7 @@ from oss.src.dbs.postgres.shared.engine import (
     get_transactions_engine,
     get_analytics_engine,
 )
-from oss.src.dbs.postgres.tracing.dbes import SpanDBE
+from oss.src.dbs.postgres.tracing.dbes import SpanDBE, TraceDBE, TraceHashDBE
 
 from ee.src.dbs.postgres.subscriptions.dbes import SubscriptionDBE
 
@@ -62,6 +62,18 @@ TRACING_DELETE_SQL = text(
           WHERE sp.project_id = et.project_id
             AND sp.trace_id   = et.trace_id
           RETURNING 1
+        ),
+        expired_summaries AS (
+          DELETE FROM public.traces tr
+          USING expired_traces et
+          WHERE tr.project_id = et.project_id
+            AND tr.trace_id   = et.trace_id
+        ),
+        expired_hashes AS (
+          DELETE FROM public.trace_hashes th
+          USING expired_traces et
+          WHERE th.project_id = et.project_id
+            AND th.trace_id   = et.trace_id
         )
         SELECT
           (SELECT count(*) FROM expired_traces) AS traces_selected,
@@ -220,6 +232,32 @@ class TracingRetentionDAO:
                 .cte("deleted")
             )
 
+            deleted_summaries = (
+                delete(TraceDBE)
+                .where(
+                    tuple_(TraceDBE.project_id, TraceDBE.trace_id).in_(
+                        select(
+                            expired_traces.c.project_id,
+                            expired_traces.c.trace_id,
+                        )
+                    )
+                )
+                .cte("deleted_summaries")
+            )
+
+            deleted_hashes = (
+                delete(TraceHashDBE)
+                .where(
+                    tuple_(TraceHashDBE.project_id, TraceHashDBE.trace_id).in_(
+                        select(
+                            expired_traces.c.project_id,
+                            expired_traces.c.trace_id,
+                        )
+                    )
+                )
+                .cte("deleted_hashes")
+            )
+
             stmt = select(
                 select(func.count())
                 .select_from(expired_traces)
@@ -229,7 +267,7 @@ class TracingRetentionDAO:
                 .select_from(deleted)
                 .scalar_subquery()
                 .label("spans_deleted"),
-            )
+            ).add_cte(deleted_summaries, deleted_hashes)
 
             result = await session.execute(stmt)
 
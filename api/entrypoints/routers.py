@@ -72,6 +72,7 @@ from oss.src.dbs.postgres.tracing.dao import TracingDAO
 from oss.src.dbs.postgres.events.dao import EventsDAO
 from oss.src.dbs.postgres.blobs.dao import BlobsDAO
 from oss.src.dbs.postgres.git.dao import GitDAO
+from oss.src.dbs.postgres.testsets.dao import TestsetChunksDAO
 from oss.src.dbs.postgres.evaluations.dao import EvaluationsDAO
 from oss.src.dbs.postgres.folders.dao import FoldersDAO
 
@@ -80,6 +81,7 @@ from oss.src.core.secrets.services import VaultService
 from oss.src.core.webhooks.service import WebhooksService
 from oss.src.core.tracing.service import TracingService
 from oss.src.core.events.service import EventsService
+from oss.src.core.events.utils import flush_read_events
 from oss.src.core.sessions.records.service import RecordsService
 from oss.src.core.testcases.service import TestcasesService
 from oss.src.core.testsets.service import TestsetsService
@@ -143,6 +145,7 @@ from oss.src.apis.fastapi.ai_services.router import AIServicesRouter
 from oss.src.core.accounts.service import PlatformAdminAccountsService
 from oss.src.apis.fastapi.accounts.router import PlatformAdminAccountsRouter
 from oss.src.dbs.postgres.gateway.connections.dao import ConnectionsDAO
+from oss.src.dbs.postgres.tools.dao import ToolCatalogDAO
 from oss.src.core.gateway.connections.providers.composio import (
     ComposioConnectionsAdapter,
 )
@@ -153,6 +156,7 @@ from oss.src.core.gateway.catalog.registry import CatalogGatewayRegistry
 from oss.src.core.gateway.catalog.service import CatalogService
 from oss.src.core.tools.providers.composio import ComposioToolsAdapter
 from oss.src.core.tools.registry import ToolsGatewayRegistry
+from oss.src.core.tools.catalog import ToolCatalog
 from oss.src.core.tools.service import ToolsService
 from oss.src.apis.fastapi.tools.router import ToolsRouter
 from oss.src.dbs.postgres.triggers.dao import TriggersDAO
@@ -163,7 +167,10 @@ from oss.src.apis.fastapi.triggers.router import TriggersRouter
 from oss.src.tasks.asyncio.triggers.dispatcher import TriggersDispatcher
 from oss.src.tasks.taskiq.triggers.worker import TriggersWorker
 from oss.src.tasks.taskiq.shared.broker import ProducerOnlyRedisStreamBroker
-from oss.src.apis.fastapi.shared.utils import SupportHeadersMiddleware
+from oss.src.apis.fastapi.shared.utils import (
+    ReadRoutingMiddleware,
+    SupportHeadersMiddleware,
+)
 from oss.src.dbs.postgres.mounts.dao import MountsDAO
 from oss.src.core.mounts.service import MountsService
 from oss.src.core.store.storage import ObjectStore
@@ -312,6 +319,8 @@ async def lifespan(*args, **kwargs):
 
     await _triggers_broker.shutdown()
 
+    await flush_read_events()
+
     for adapter in _composio_adapters.values():
         await adapter.close()
 
@@ -515,6 +524,9 @@ app.add_middleware(
     allow_headers=["Content-Type"] + get_all_supertokens_cors_headers(),
 )
 
+# Above auth, analytics and throttling, so all of a request's tasks share its scope.
+app.add_middleware(ReadRoutingMiddleware)
+
 
 # The middleware resolves trailing slashes against the route table instead, so no redirect
 # is emitted: Starlette's would be built from the post-strip path and lose the /api prefix.
@@ -556,6 +568,7 @@ testsets_dao = GitDAO(
     VariantDBE=TestsetVariantDBE,
     RevisionDBE=TestsetRevisionDBE,
 )
+testset_chunks_dao = TestsetChunksDAO(engine=_transactions_engine)
 
 queries_dao = GitDAO(
     engine=_transactions_engine,
@@ -584,6 +597,7 @@ session_streams_dao = SessionStreamsDAO(engine=_transactions_engine)
 session_turns_dao = SessionTurnsDAO(engine=_transactions_engine)
 
 connections_dao = ConnectionsDAO(engine=_transactions_engine)
+tool_catalog_dao = ToolCatalogDAO(engine=_transactions_engine)
 mounts_dao = MountsDAO(engine=_transactions_engine)
 session_attachments_dao = SessionAttachmentsDAO(engine=_transactions_engine)
 
@@ -626,6 +640,7 @@ testcases_service = TestcasesService(
 testsets_service = TestsetsService(
     testsets_dao=testsets_dao,
     testcases_service=testcases_service,
+    testset_chunks_dao=testset_chunks_dao,
 )
 
 simple_testsets_service = SimpleTestsetsService(
@@ -811,6 +826,7 @@ tools_service = ToolsService(
     connections_service=connections_service,
     catalog_service=catalog_service,
     adapter_registry=tools_adapter_registry,
+    tool_catalog=ToolCatalog(catalog_dao=tool_catalog_dao),
 )
 
 # Triggers adapter + service
@@ -1499,6 +1515,13 @@ app.include_router(
     include_in_schema=False,
 )
 
+app.include_router(
+    router=tools.admin_router,
+    prefix="/admin/tools",
+    tags=["Tools", "Admin"],
+    include_in_schema=False,
+)
+
 app.include_router(
     router=sessions.interactions.router,
     prefix="/sessions/interactions",
@@ -81,6 +81,7 @@ from oss.src.dbs.postgres.testsets.dbes import (
     TestsetRevisionDBE,
     TestsetVariantDBE,
 )
+from oss.src.dbs.postgres.testsets.dao import TestsetChunksDAO
 from oss.src.dbs.postgres.triggers.dao import TriggersDAO
 from oss.src.dbs.postgres.tracing.dao import TracingDAO
 from oss.src.dbs.postgres.webhooks.dao import WebhooksDAO
@@ -285,7 +286,9 @@ def _build_evaluations_broker() -> tuple[AsyncBroker, int]:
     queries_service = QueriesService(queries_dao=queries_dao)
     testcases_service = TestcasesService(testcases_dao=testcases_dao)
     testsets_service = TestsetsService(
-        testsets_dao=testsets_dao, testcases_service=testcases_service
+        testsets_dao=testsets_dao,
+        testcases_service=testcases_service,
+        testset_chunks_dao=TestsetChunksDAO(),
     )
     SimpleTestsetsService(testsets_service=testsets_service)
     workflows_service = WorkflowsService(
@@ -28,6 +28,7 @@ from oss.src.core.secrets.services import VaultService
 from oss.src.core.sessions.interactions.service import SessionInteractionsService
 from oss.src.core.sessions.records.service import RecordsService
 from oss.src.core.tracing.service import TracingService
+from oss.src.core.tracing.utils.pricing import refresh_pricing_index
 from oss.src.dbs.postgres.events.dao import EventsDAO
 from oss.src.dbs.postgres.secrets.dao import SecretsDAO
 from oss.src.dbs.postgres.sessions.interactions.dao import SessionInteractionsDAO
@@ -72,6 +73,9 @@ def _selected_streams() -> List[str]:
 
 
 async def _build_spans_worker(redis_client: Redis) -> StreamConsumer:
+    # Compile model prices now rather than on the first LLM span
+    refresh_pricing_index()
+
     return TracingWorker(
         service=TracingService(tracing_dao=TracingDAO()),
         redis_client=redis_client,
@@ -122,6 +126,7 @@ async def _build_events_worker(redis_client: Redis) -> StreamConsumer:
         subscriptions_dao=webhooks_dao,
         vault_service=vault_service,
         deliver_task=webhooks_worker.deliver_webhook,
+        deliver_batch_task=webhooks_worker.deliver_webhook_batch,
     )
 
     return EventsWorker(
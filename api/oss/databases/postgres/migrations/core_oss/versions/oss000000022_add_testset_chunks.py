@@ -0,0 +1,82 @@
+"""add testset chunks
+
+Revision ID: oss000000022
+Revises: oss000000021
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "oss000000022"
+down_revision: Union[str, None] = "oss000000021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Existing revisions keep their inline testcase_ids and are chunked on their
+# next delta commit, so no backfill.
+
+
+def upgrade() -> None:
+    op.create_table(
+        "testset_chunks",
+        sa.Column("project_id", sa.UUID(as_uuid=True), nullable=False),
+        sa.Column("id", sa.UUID(as_uuid=True), nullable=False),
+        sa.Column("set_id", sa.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "testcase_ids",
+            postgresql.ARRAY(sa.UUID(as_uuid=True)),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.func.current_timestamp(),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("created_by_id", sa.UUID(as_uuid=True), nullable=True),
+        sa.Column("updated_by_id", sa.UUID(as_uuid=True), nullable=True),
+        sa.Column("deleted_by_id", sa.UUID(as_uuid=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["projects.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id", "set_id"],
+            ["testset_artifacts.project_id", "testset_artifacts.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("project_id", "id"),
+    )
+    op.create_index(
+        "ix_testset_chunks_project_id_set_id",
+        "testset_chunks",
+        ["project_id", "set_id"],
+    )
+    op.create_index(
+        "ix_testset_chunks_testcase_ids_gin",
+        "testset_chunks",
+        ["testcase_ids"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_testset_chunks_testcase_ids_gin",
+        table_name="testset_chunks",
+    )
+    op.drop_index(
+        "ix_testset_chunks_project_id_set_id",
+        table_name="testset_chunks",
+    )
+    op.drop_table("testset_chunks")
@@ -0,0 +1,75 @@
+"""add tool catalog
+
+Revision ID: oss000000023
+Revises: oss000000022
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "oss000000023"
+down_revision: Union[str, None] = "oss000000022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The tables start empty and are filled by the tools catalog cron; until its
+# first run, the tools endpoints keep reading the catalog from the provider.
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tool_catalog_integrations",
+        sa.Column("provider_key", sa.String(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column(
+            "data",
+            postgresql.JSONB(none_as_null=True, astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column("synced_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("provider_key", "key"),
+    )
+    op.create_index(
+        "ix_tool_catalog_integrations_provider_key_synced_at",
+        "tool_catalog_integrations",
+        ["provider_key", "synced_at"],
+    )
+
+    op.create_table(
+        "tool_catalog_actions",
+        sa.Column("provider_key", sa.String(), nullable=False),
+        sa.Column("integration_key", sa.String(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column(
+            "data",
+            postgresql.JSONB(none_as_null=True, astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column(
+            "schemas",
+            postgresql.JSONB(none_as_null=True, astext_type=sa.Text()),
+            nullable=True,
+        ),
+        sa.Column("synced_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("provider_key", "integration_key", "key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tool_catalog_actions")
+    op.drop_index(
+        "ix_tool_catalog_integrations_provider_key_synced_at",
+        table_name="tool_catalog_integrations",
+    )
+    op.drop_table("tool_catalog_integrations")
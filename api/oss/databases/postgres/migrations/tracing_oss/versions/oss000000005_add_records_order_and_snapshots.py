@@ -0,0 +1,74 @@
+"""add_records_order_and_snapshots
+
+Revision ID: oss000000005
+Revises: oss000000004
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "oss000000005"
+down_revision: Union[str, None] = "oss000000004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The session order get_records reads and seeks by. NULL timestamps/indexes map to
+    # +infinity, matching the NULLS LAST order, so a row-value comparison can seek past a
+    # cursor. The expressions must stay byte-for-byte those of the DAO's sort keys.
+    op.create_index(
+        "ix_records_project_id_session_id_order",
+        "records",
+        [
+            "project_id",
+            "session_id",
+            sa.text("coalesce(timestamp, 'infinity'::timestamptz)"),
+            "created_at",
+            sa.text("coalesce(record_index, 2147483647)"),
+            "record_id",
+        ],
+        unique=False,
+        postgresql_include=["updated_at"],
+    )
+
+    op.create_table(
+        "record_snapshots",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("session_id", sa.String(), nullable=False),
+        sa.Column("snapshot_kind", sa.String(), nullable=False),
+        sa.Column("cursor_timestamp", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("cursor_created_at", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("cursor_record_index", sa.Integer(), nullable=True),
+        sa.Column("cursor_record_id", sa.UUID(), nullable=False),
+        sa.Column("record_count", sa.Integer(), nullable=False),
+        sa.Column("record_checksum", sa.Numeric(), nullable=False),
+        sa.Column(
+            "state",
+            postgresql.JSONB(none_as_null=True, astext_type=sa.Text()),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("created_by_id", sa.UUID(), nullable=True),
+        sa.Column("updated_by_id", sa.UUID(), nullable=True),
+        sa.Column("deleted_by_id", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("project_id", "session_id", "snapshot_kind"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("record_snapshots")
+    op.drop_index("ix_records_project_id_session_id_order", table_name="records")
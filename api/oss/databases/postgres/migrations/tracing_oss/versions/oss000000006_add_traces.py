@@ -0,0 +1,156 @@
+"""add_traces
+
+Revision ID: oss000000006
+Revises: oss000000005
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "oss000000006"
+down_revision: Union[str, None] = "oss000000005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# One pass over the spans already stored, with the same aggregates as the DAO's
+# build_trace_summary_stmt; the tracing worker keeps the rows current from here on.
+BACKFILL_SQL = """
+    INSERT INTO traces (
+        project_id,
+        trace_id,
+        trace_type,
+        span_name,
+        status_code,
+        start_time,
+        end_time,
+        latest_start_time,
+        duration_ms,
+        session_id,
+        user_id,
+        agent_id,
+        span_count,
+        tokens,
+        costs,
+        "references"
+    )
+    SELECT
+        project_id,
+        trace_id,
+        (array_agg(trace_type) FILTER (WHERE parent_id IS NULL))[1],
+        (array_agg(span_name) FILTER (WHERE parent_id IS NULL))[1],
+        (array_agg(status_code) FILTER (WHERE parent_id IS NULL))[1],
+        min(start_time),
+        max(end_time),
+        max(start_time),
+        EXTRACT(epoch FROM max(end_time) - min(start_time)) * 1000,
+        max(coalesce(session_id, attributes -> 'ag' -> 'session' ->> 'id')),
+        max(coalesce(user_id, attributes -> 'ag' -> 'user' ->> 'id')),
+        max(coalesce(agent_id, attributes -> 'ag' -> 'agent' ->> 'id')),
+        count(*),
+        (array_agg(
+            CASE
+                WHEN jsonb_typeof(attributes #> '{ag,metrics,tokens,cumulative,total}') = 'number'
+                THEN (attributes #>> '{ag,metrics,tokens,cumulative,total}')::float
+            END
+        ) FILTER (WHERE parent_id IS NULL))[1],
+        (array_agg(
+            CASE
+                WHEN jsonb_typeof(attributes #> '{ag,metrics,costs,cumulative,total}') = 'number'
+                THEN (attributes #>> '{ag,metrics,costs,cumulative,total}')::float
+            END
+        ) FILTER (WHERE parent_id IS NULL))[1],
+        (array_agg("references") FILTER (WHERE parent_id IS NULL))[1]
+    FROM spans
+    GROUP BY project_id, trace_id
+    ON CONFLICT (project_id, trace_id) DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "traces",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("trace_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "trace_type",
+            postgresql.ENUM(name="tracetype", create_type=False),
+            nullable=True,
+        ),
+        sa.Column("span_name", sa.VARCHAR(), nullable=True),
+        sa.Column(
+            "status_code",
+            postgresql.ENUM(name="otelstatuscode", create_type=False),
+            nullable=True,
+        ),
+        sa.Column("start_time", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("end_time", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("latest_start_time", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.Column("duration_ms", sa.FLOAT(), nullable=True),
+        sa.Column("session_id", sa.VARCHAR(), nullable=True),
+        sa.Column("user_id", sa.VARCHAR(), nullable=True),
+        sa.Column("agent_id", sa.VARCHAR(), nullable=True),
+        sa.Column("span_count", sa.INTEGER(), nullable=False),
+        sa.Column("tokens", sa.FLOAT(), nullable=True),
+        sa.Column("costs", sa.FLOAT(), nullable=True),
+        sa.Column(
+            "references",
+            postgresql.JSONB(none_as_null=True, astext_type=sa.Text()),
+            nullable=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("created_by_id", sa.UUID(), nullable=True),
+        sa.Column("updated_by_id", sa.UUID(), nullable=True),
+        sa.Column("deleted_by_id", sa.UUID(), nullable=True),
+        sa.PrimaryKeyConstraint("project_id", "trace_id"),
+    )
+
+    op.execute(BACKFILL_SQL)
+
+    op.create_index(
+        "ix_traces_project_id_latest_start_time",
+        "traces",
+        ["project_id", "latest_start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_traces_project_id_session_id_start_time",
+        "traces",
+        ["project_id", "session_id", "start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_traces_project_id_user_id_start_time",
+        "traces",
+        ["project_id", "user_id", "start_time"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_traces_references_gin",
+        "traces",
+        ["references"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"references": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_traces_references_gin", table_name="traces")
+    op.drop_index("ix_traces_project_id_user_id_start_time", table_name="traces")
+    op.drop_index("ix_traces_project_id_session_id_start_time", table_name="traces")
+    op.drop_index("ix_traces_project_id_latest_start_time", table_name="traces")
+    op.drop_table("traces")
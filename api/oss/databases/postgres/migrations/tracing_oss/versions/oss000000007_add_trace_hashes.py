@@ -0,0 +1,59 @@
+"""add_trace_hashes
+
+Revision ID: oss000000007
+Revises: oss000000006
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "oss000000007"
+down_revision: Union[str, None] = "oss000000006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The root span hashes already stored; the tracing worker indexes new ones at ingest.
+BACKFILL_SQL = """
+    INSERT INTO trace_hashes (project_id, hash_id, trace_id, start_time)
+    SELECT sp.project_id, (h.value ->> 'id')::uuid, sp.trace_id, sp.start_time
+    FROM spans sp
+    CROSS JOIN LATERAL jsonb_array_elements(sp.hashes) AS h(value)
+    WHERE sp.parent_id IS NULL
+      AND jsonb_typeof(sp.hashes) = 'array'
+      AND h.value ->> 'id' ~* '^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$'
+    ON CONFLICT (project_id, hash_id, trace_id) DO NOTHING
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trace_hashes",
+        sa.Column("project_id", sa.UUID(), nullable=False),
+        sa.Column("hash_id", sa.UUID(), nullable=False),
+        sa.Column("trace_id", sa.UUID(), nullable=False),
+        sa.Column("start_time", sa.TIMESTAMP(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("project_id", "hash_id", "trace_id"),
+    )
+
+    op.execute(BACKFILL_SQL)
+
+    op.create_index(
+        "ix_trace_hashes_project_id_hash_id_start_time",
+        "trace_hashes",
+        ["project_id", "hash_id", "start_time", "trace_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_trace_hashes_project_id_hash_id_start_time",
+        table_name="trace_hashes",
+    )
+    op.drop_table("trace_hashes")
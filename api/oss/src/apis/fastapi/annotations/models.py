@@ -1,6 +1,6 @@
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from oss.src.core.shared.dtos import (
     Link,
@@ -11,8 +11,13 @@ from oss.src.core.annotations.types import (
     AnnotationCreate,
     AnnotationEdit,
     AnnotationQuery,
+    AnnotationBulkEdit,
+    AnnotationBulkResult,
 )
 
+# Large enough to label a testset page at a time, small enough for one ingest batch
+MAX_BULK_ANNOTATIONS = 1000
+
 # ANNOTATIONS ------------------------------------------------------------------
 
 
@@ -24,6 +29,20 @@ class AnnotationEditRequest(BaseModel):
     annotation: AnnotationEdit
 
 
+class AnnotationsCreateRequest(BaseModel):
+    annotations: List[AnnotationCreate] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ANNOTATIONS,
+    )
+
+
+class AnnotationsEditRequest(BaseModel):
+    annotations: List[AnnotationBulkEdit] = Field(
+        min_length=1,
+        max_length=MAX_BULK_ANNOTATIONS,
+    )
+
+
 class AnnotationQueryRequest(BaseModel):
     annotation: Optional[AnnotationQuery] = None
     #
@@ -50,3 +69,8 @@ class AnnotationLinkResponse(BaseModel):
 class AnnotationLinksResponse(BaseModel):
     count: int = 0
     annotation_links: List[Link] = []
+
+
+class AnnotationResultsResponse(BaseModel):
+    count: int = 0
+    annotation_results: List[AnnotationBulkResult] = []
@@ -16,10 +16,13 @@ from oss.src.core.annotations.service import (
 from oss.src.apis.fastapi.annotations.models import (
     AnnotationCreateRequest,
     AnnotationEditRequest,
+    AnnotationsCreateRequest,
+    AnnotationsEditRequest,
     AnnotationQueryRequest,
     AnnotationResponse,
     AnnotationsResponse,
     AnnotationLinkResponse,
+    AnnotationResultsResponse,
 )
 
 from oss.src.core.access.permissions.types import Permission
@@ -53,6 +56,28 @@ class AnnotationsRouter:
             response_model_exclude_none=True,
         )
 
+        # POST /api/annotations/bulk
+        self.router.add_api_route(
+            "/bulk",
+            self.create_annotations,
+            methods=["POST"],
+            operation_id="create_annotations",
+            status_code=status.HTTP_200_OK,
+            response_model=AnnotationResultsResponse,
+            response_model_exclude_none=True,
+        )
+
+        # PATCH /api/annotations/bulk
+        self.router.add_api_route(
+            "/bulk",
+            self.edit_annotations,
+            methods=["PATCH"],
+            operation_id="edit_annotations",
+            status_code=status.HTTP_200_OK,
+            response_model=AnnotationResultsResponse,
+            response_model_exclude_none=True,
+        )
+
         # GET /api/annotations/{trace_id}
         self.router.add_api_route(
             "/{trace_id}",
@@ -128,6 +153,64 @@ class AnnotationsRouter:
 
         return annotation_response
 
+    @intercept_exceptions()
+    async def create_annotations(
+        self,
+        request: Request,
+        *,
+        annotations_create_request: AnnotationsCreateRequest,
+    ) -> AnnotationResultsResponse:
+        if not await check_action_access(  # type: ignore
+            user_uid=request.state.user_id,
+            project_id=request.state.project_id,
+            permission=Permission.EDIT_ANNOTATIONS,  # type: ignore
+        ):
+            raise FORBIDDEN_EXCEPTION  # type: ignore
+
+        annotation_results = await self.annotations_service.create_bulk(
+            organization_id=UUID(request.state.organization_id),
+            project_id=UUID(request.state.project_id),
+            user_id=UUID(request.state.user_id),
+            #
+            annotation_creates=annotations_create_request.annotations,
+        )
+
+        annotation_results_response = AnnotationResultsResponse(
+            count=sum(1 for result in annotation_results if result.annotation_link),
+            annotation_results=annotation_results,
+        )
+
+        return annotation_results_response
+
+    @intercept_exceptions()
+    async def edit_annotations(
+        self,
+        request: Request,
+        *,
+        annotations_edit_request: AnnotationsEditRequest,
+    ) -> AnnotationResultsResponse:
+        if not await check_action_access(  # type: ignore
+            user_uid=request.state.user_id,
+            project_id=request.state.project_id,
+            permission=Permission.EDIT_ANNOTATIONS,  # type: ignore
+        ):
+            raise FORBIDDEN_EXCEPTION  # type: ignore
+
+        annotation_results = await self.annotations_service.edit_bulk(
+            organization_id=UUID(request.state.organization_id),
+            project_id=UUID(request.state.project_id),
+            user_id=UUID(request.state.user_id),
+            #
+            annotation_edits=annotations_edit_request.annotations,
+        )
+
+        annotation_results_response = AnnotationResultsResponse(
+            count=sum(1 for result in annotation_results if result.annotation_link),
+            annotation_results=annotation_results,
+        )
+
+        return annotation_results_response
+
     @intercept_exceptions()
     @suppress_exceptions(default=AnnotationResponse(), exclude=[HTTPException])
     async def fetch_annotation(
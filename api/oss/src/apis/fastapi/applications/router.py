@@ -91,6 +91,7 @@ from oss.src.resources.workflows.catalog import (
 from oss.src.core.access.permissions.types import Permission
 from oss.src.core.access.permissions.service import check_action_access
 from oss.src.apis.fastapi.shared.exceptions import FORBIDDEN_EXCEPTION
+from oss.src.apis.fastapi.shared.utils import etag_response
 
 
 log = get_module_logger(__name__)
@@ -1380,7 +1381,10 @@ class ApplicationsRouter:
             count=application_revision_response.count,
         )
 
-        return application_revision_response
+        return etag_response(
+            request=request,
+            content=application_revision_response,
+        )
 
     @intercept_exceptions()
     @handle_git_exceptions()
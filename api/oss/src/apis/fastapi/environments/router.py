@@ -75,6 +75,7 @@ from oss.src.apis.fastapi.environments.utils import (
 from oss.src.core.access.permissions.types import Permission
 from oss.src.core.access.permissions.service import check_action_access
 from oss.src.apis.fastapi.shared.exceptions import FORBIDDEN_EXCEPTION
+from oss.src.apis.fastapi.shared.utils import etag_response
 
 
 log = get_module_logger(__name__)
@@ -819,7 +820,10 @@ class EnvironmentsRouter:
             count=environment_revision_response.count,
         )
 
-        return environment_revision_response
+        return etag_response(
+            request=request,
+            content=environment_revision_response,
+        )
 
     @intercept_exceptions()
     @handle_git_exceptions()
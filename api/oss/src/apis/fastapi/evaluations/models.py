@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from uuid import UUID
 from datetime import datetime
 
@@ -236,6 +236,14 @@ class EvaluationResultIdsRequest(BaseModel):
     result_ids: List[UUID]
 
 
+class EvaluationResultsExportRequest(BaseModel):
+    run_id: UUID
+    #
+    columns: Optional[List[str]] = None
+    #
+    file_type: Literal["arrow", "parquet"] = "arrow"
+
+
 class EvaluationResultResponse(BaseModel):
     count: int = 0
     result: Optional[EvaluationResult] = None
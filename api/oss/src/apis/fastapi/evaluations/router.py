@@ -3,6 +3,7 @@ from uuid import UUID
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Request, Query, HTTPException, status as http_status
+from fastapi.responses import StreamingResponse
 
 from oss.src.utils.common import is_ee
 from oss.src.utils.logging import get_module_logger
@@ -49,6 +50,7 @@ from oss.src.apis.fastapi.evaluations.models import (
     EvaluationResultsSetRequest,
     EvaluationResultQueryRequest,
     EvaluationResultIdsRequest,
+    EvaluationResultsExportRequest,
     EvaluationResultResponse,
     EvaluationResultsResponse,
     EvaluationResultIdResponse,
@@ -106,6 +108,8 @@ from oss.src.apis.fastapi.evaluations.models import (
 )
 from oss.src.apis.fastapi.evaluations.utils import (
     handle_evaluation_closed_exception,
+    export_rows_to_file_chunks,
+    EVALUATIONS_EXPORT_MEDIA_TYPES,
 )
 from oss.src.core.evaluations.types import (
     SimpleQueueScenariosQuery,
@@ -375,6 +379,15 @@ class EvaluationsRouter:
             operation_id="query_results",
         )
 
+        # POST /api/evaluations/results/export
+        self.router.add_api_route(
+            path="/results/export",
+            methods=["POST"],
+            endpoint=self.export_results,
+            response_class=StreamingResponse,
+            operation_id="export_results",
+        )
+
         # GET /api/evaluations/results/{result_id}
         self.router.add_api_route(
             path="/results/{result_id}",
@@ -1270,6 +1283,50 @@ class EvaluationsRouter:
 
         return results_response
 
+    # POST /evaluations/results/export
+    @intercept_exceptions()
+    async def export_results(
+        self,
+        request: Request,
+        *,
+        results_export_request: EvaluationResultsExportRequest,
+    ) -> StreamingResponse:
+        if not await check_action_access(  # type: ignore
+            user_uid=request.state.user_id,
+            project_id=request.state.project_id,
+            permission=Permission.VIEW_EVALUATION_RESULTS,  # type: ignore
+        ):
+            raise FORBIDDEN_EXCEPTION  # type: ignore
+
+        export = await self.evaluations_service.export_results(
+            project_id=UUID(request.state.project_id),
+            #
+            run_id=results_export_request.run_id,
+            #
+            columns=results_export_request.columns,
+        )
+
+        if export is None:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail=f"Evaluation run {results_export_request.run_id} not found.",
+            )
+
+        columns, batches = export
+        file_type = results_export_request.file_type
+        extension = "arrows" if file_type == "arrow" else "parquet"
+        filename = f"results_{results_export_request.run_id}.{extension}"
+
+        return StreamingResponse(
+            export_rows_to_file_chunks(
+                columns=columns,
+                batches=batches,
+                file_type=file_type,
+            ),
+            media_type=EVALUATIONS_EXPORT_MEDIA_TYPES[file_type],
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
+
     # GET /evaluations/results/{result_id}
     @intercept_exceptions()
     @suppress_exceptions(default=EvaluationResultResponse(), exclude=[HTTPException])
@@ -1,4 +1,4 @@
-from typing import Optional, List, Literal
+from typing import Optional, List, Literal, Dict, Any, AsyncIterator
 from uuid import UUID
 from datetime import datetime
 from functools import wraps
@@ -24,6 +24,7 @@ from oss.src.core.evaluations.types import (
 )
 
 from oss.src.apis.fastapi.shared.utils import (
+    DrainableSink,
     parse_metadata,
 )
 from oss.src.apis.fastapi.evaluations.models import (
@@ -50,6 +51,11 @@ from oss.src.apis.fastapi.evaluations.models import (
 
 log = get_module_logger(__name__)
 
+EVALUATIONS_EXPORT_MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
 
 def handle_evaluation_closed_exception():
     def decorator(func):
@@ -371,3 +377,39 @@ async def parse_queue_query_request(
     )
 
     return queue_query_request
+
+
+async def export_rows_to_file_chunks(
+    *,
+    columns: Dict[str, str],
+    batches: AsyncIterator[List[Dict[str, Any]]],
+    file_type: Literal["arrow", "parquet"],
+) -> AsyncIterator[bytes]:
+    """Encode batches of export rows as an Arrow IPC stream or Parquet file.
+
+    Each batch becomes one record batch (Arrow) or row group (Parquet) and is
+    flushed as soon as it is encoded, so the rows are never all in memory.
+    """
+    # pyarrow is heavy; only pay for the import when a run is exported.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {"string": pa.string(), "float": pa.float64(), "bool": pa.bool_()}
+    schema = pa.schema(
+        [pa.field(name, types[kind]) for name, kind in columns.items()],
+    )
+
+    sink = DrainableSink()
+    if file_type == "parquet":
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    try:
+        async for rows in batches:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
@@ -41,8 +41,13 @@ from oss.src.utils.exceptions import intercept_exceptions
 from oss.src.utils.logging import get_module_logger
 
 from oss.src.dbs.redis.sessions.contract import project_watch_channel, watch_channel
+from oss.src.dbs.redis.sessions.watch import read_watch_log
 from oss.src.dbs.redis.shared.engine import get_streams_engine
-from oss.src.apis.fastapi.sessions.watch import watch_event_stream
+from oss.src.apis.fastapi.sessions.watch import (
+    WatchHub,
+    WatchReplay,
+    watch_event_stream,
+)
 
 from oss.src.core.access.permissions.types import Permission
 from oss.src.core.access.permissions.service import check_action_access
@@ -178,6 +183,24 @@ def _validate_session_id_http(session_id: str) -> None:
         )
 
 
+# Every watch stream in the process shares this hub's single pub/sub connection.
+_watch_hub = WatchHub(pubsub_factory=lambda: get_streams_engine().get_redis().pubsub())
+
+
+def _watch_replay() -> Optional[WatchReplay]:
+    if not env.sessions.watch_replay_enabled:
+        return None
+
+    async def replay(channel: str, last_event_id: str):
+        return await read_watch_log(
+            get_streams_engine().get_redis(),
+            channel=channel,
+            last_event_id=last_event_id,
+        )
+
+    return replay
+
+
 def _handle_session_exceptions():
     def decorator(func):
         @wraps(func)
@@ -580,9 +603,11 @@ class SessionStreamsRouter:
         request. There is no interceptor to refresh-and-retry a stream, so the
         client must refresh the session itself and reopen (see the web hooks).
 
-        The stream has no replay/cursor semantics — ``EventSource`` reconnects
-        and clients revalidate once on every ``open``, which covers any missed
-        notifications.
+        Each event carries an SSE ``id``. ``EventSource`` reconnects with it as
+        ``Last-Event-ID`` and is replayed what it missed from the channel's short
+        replay log; ``ready`` then carries ``{"replayed": true}``. Otherwise
+        (first connect, log trimmed or expired, replay disabled) clients
+        revalidate once on ``ready``, which covers any missed notifications.
 
         NOTE (spec surface): this route appears in OpenAPI for documentation,
         but Fern does not model SSE — consume it with a native ``EventSource``
@@ -603,11 +628,11 @@ class SessionStreamsRouter:
 
         stream = watch_event_stream(
             channel=watch_channel(str(project_id), session_id),
-            # One pubsub connection per SSE connection (v1 — simplest correct
-            # teardown story; revisit with a shared listener if counts grow).
-            pubsub_factory=lambda: get_streams_engine().get_redis().pubsub(),
+            hub=_watch_hub,
             heartbeat_seconds=env.sessions.watch_heartbeat_seconds,
             retry_milliseconds=env.sessions.watch_retry_milliseconds,
+            last_event_id=request.headers.get("last-event-id"),
+            replay=_watch_replay(),
         )
         return StreamingResponse(
             stream,
@@ -649,9 +674,11 @@ class SessionStreamsRouter:
 
         stream = watch_event_stream(
             channel=project_watch_channel(str(authorized_project_id)),
-            pubsub_factory=lambda: get_streams_engine().get_redis().pubsub(),
+            hub=_watch_hub,
             heartbeat_seconds=env.sessions.watch_heartbeat_seconds,
             retry_milliseconds=env.sessions.watch_retry_milliseconds,
+            last_event_id=request.headers.get("last-event-id"),
+            replay=_watch_replay(),
         )
         return StreamingResponse(
             stream,
@@ -1,16 +1,30 @@
 """SSE frame generator for ``GET /sessions/streams/watch`` (M3 live relay).
 
-Bridges one Redis pub/sub subscription (durable plane, one per SSE connection)
-into `text/event-stream` frames. Events carry TYPE + minimal metadata only —
-clients revalidate through their existing query paths; no record payloads ride
-the wire. Idle periods emit ``: heartbeat`` comment frames so proxies and
-clients never see a silent connection.
+Bridges Redis pub/sub (durable plane) into `text/event-stream` frames. Events carry
+TYPE + minimal metadata only — clients revalidate through their existing query paths;
+no record payloads ride the wire. Idle periods emit ``: heartbeat`` comment frames so
+proxies and clients never see a silent connection.
+
+Every stream in a process shares ONE pub/sub connection through a ``WatchHub``. The
+hub subscribes each channel once, however many streams watch it, and fans each message
+out to per-stream buffers. One connection per SSE stream would cap a pod's watchers at
+its Redis connection budget, since every open browser tab holds a stream.
 """
 
+import asyncio
 import json
 import math
 import threading
-from typing import Any, AsyncIterator, Callable, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
 
 from oss.src.dbs.redis.sessions.contract import (
     WATCH_EVENT_INTERACTION,
@@ -18,6 +32,7 @@ from oss.src.dbs.redis.sessions.contract import (
     WATCH_EVENT_READY,
     WATCH_EVENT_RECORDS_CHANGED,
 )
+from oss.src.utils.env import env
 from oss.src.utils.logging import get_module_logger
 
 log = get_module_logger(__name__)
@@ -77,9 +92,14 @@ def retry_frame(retry_milliseconds: int) -> str:
     return f"retry: {retry_milliseconds}\n\n"
 
 
-def ready_frame() -> str:
-    """Emitted once the Redis subscription is live: the client's cue to revalidate."""
-    return "event: " + WATCH_EVENT_READY + "\ndata: {}\n\n"
+def ready_frame(*, replayed: bool = False) -> str:
+    """Emitted once the Redis subscription is live: the client's cue to revalidate.
+
+    ``replayed`` tells a reconnecting client that the frames before this one were
+    everything it missed, so there is nothing to revalidate.
+    """
+    data = '{"replayed": true}' if replayed else "{}"
+    return "event: " + WATCH_EVENT_READY + "\ndata: " + data + "\n\n"
 
 
 _KNOWN_EVENTS = {
@@ -92,8 +112,7 @@ _KNOWN_EVENTS = {
 # Each project event family also needs its view permission in the project route's conjunction.
 
 
-def format_watch_frame(raw: Any) -> Optional[str]:
-    """One published payload -> one SSE frame; None for anything malformed/unknown."""
+def _watch_payload(raw: Any) -> Optional[Dict[str, Any]]:
     try:
         payload = json.loads(raw)
     except (ValueError, TypeError):
@@ -106,17 +125,260 @@ def format_watch_frame(raw: Any) -> Optional[str]:
     # publish must drop its own frame, never the connection.
     if not isinstance(event, str) or event not in _KNOWN_EVENTS:
         return None
-    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    return payload
+
+
+def _event_id(payload: Dict[str, Any]) -> Optional[str]:
+    event_id = payload.get("event_id")
+    # A line break would end the `id:` field early and smuggle in another one
+    if not isinstance(event_id, str) or not event_id.isalnum():
+        return None
+    return event_id
+
+
+def _watch_frame(payload: Dict[str, Any]) -> str:
+    event_id = _event_id(payload)
+    if event_id is None:
+        return f"event: {payload['type']}\ndata: {json.dumps(payload)}\n\n"
+    # The id rides the SSE `id:` field, where EventSource keeps it for `Last-Event-ID`
+    data = {key: value for key, value in payload.items() if key != "event_id"}
+    return f"event: {payload['type']}\nid: {event_id}\ndata: {json.dumps(data)}\n\n"
+
+
+def format_watch_frame(raw: Any) -> Optional[str]:
+    """One published payload -> one SSE frame; None for anything malformed/unknown."""
+    payload = _watch_payload(raw)
+    return _watch_frame(payload) if payload is not None else None
+
+
+# Returned by `WatchSubscription.get` once the stream must end.
+_CLOSED = object()
+
+# How long the hub's reader waits on Redis per poll; only bounds how soon it notices
+# it has been cancelled.
+_HUB_POLL_SECONDS = 1.0
+
+
+class WatchSubscription:
+    """One stream's seat on a ``WatchHub``: a bounded buffer of published messages.
+
+    A stream that falls ``buffer_size`` messages behind is evicted rather than buffered
+    for without bound: it ends, and its client reconnects (catching up from the replay
+    log) instead of one slow tab growing the whole process.
+    """
+
+    def __init__(self, channel: str, *, buffer_size: int) -> None:
+        self.channel = channel
+        self.evicted = False
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+
+    def deliver(self, message: Any) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            log.warning("[WATCH] evicting a slow watch stream", channel=self.channel)
+            self.evicted = True
+            self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._queue.put_nowait(_CLOSED)
+        except asyncio.QueueFull:  # evicted: `get` ends it without draining
+            pass
+
+    async def get(self, *, timeout: float) -> Any:
+        """The next message; None when idle for ``timeout``; ``_CLOSED`` once ended."""
+        if self.evicted:
+            return _CLOSED
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class WatchHub:
+    """One Redis pub/sub connection per process, fanned out to every watch stream.
+
+    A channel is subscribed on Redis when its first stream arrives and unsubscribed when
+    its last one leaves; the connection itself is closed when no stream is left. If it
+    fails, every stream on it is ended, and their clients reconnect onto a fresh one.
+    """
+
+    def __init__(
+        self,
+        *,
+        pubsub_factory: Callable[[], Any],
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        self._pubsub_factory = pubsub_factory
+        self._buffer_size = buffer_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._pubsub: Any = None
+        self._reader: Optional[asyncio.Task] = None
+        # Streams per channel, and the channels actually subscribed on Redis, which
+        # lag behind while a release is being synced.
+        self._channels: Dict[str, Set[WatchSubscription]] = {}
+        self._subscribed: Set[str] = set()
+
+    @property
+    def channels(self) -> Dict[str, Set[WatchSubscription]]:
+        return self._channels
+
+    def _bind_loop(self) -> asyncio.Lock:
+        # A pub/sub connection belongs to the loop that opened it; a new loop (each test,
+        # a fresh `asyncio.run`) starts over.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._lock is None:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._pubsub = None
+            self._reader = None
+            self._channels = {}
+            self._subscribed = set()
+        return self._lock
+
+    async def subscribe(self, channel: str) -> WatchSubscription:
+        async with self._bind_loop():
+            if self._pubsub is None:
+                self._pubsub = self._pubsub_factory()
+
+            subscription = WatchSubscription(
+                channel,
+                buffer_size=self._buffer_size or env.sessions.watch_buffer_size,
+            )
+            self._channels.setdefault(channel, set()).add(subscription)
+
+            try:
+                if channel not in self._subscribed:
+                    await self._pubsub.subscribe(channel)
+                    self._subscribed.add(channel)
+            except BaseException:
+                self._forget(subscription)
+                await self._sync()
+                raise
+
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read(self._pubsub))
+
+            return subscription
+
+    def _forget(self, subscription: WatchSubscription) -> None:
+        subscription.close()
+        subscriptions = self._channels.get(subscription.channel)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._channels[subscription.channel]
+
+    def release(self, subscription: WatchSubscription) -> "asyncio.Task[None]":
+        """Take a stream off the hub, and sync Redis subscriptions in the background.
+
+        The bookkeeping is synchronous, and the Redis side runs as its own task: a stream
+        is released from its cancellation path, where an awaited cleanup would be
+        cancelled again and leave the channel subscribed for good.
+        """
+        self._forget(subscription)
+
+        async def _sync_locked() -> None:
+            async with self._bind_loop():
+                await self._sync()
+
+        return asyncio.create_task(_sync_locked())
+
+    async def _sync(self) -> None:
+        pubsub = self._pubsub
+        if pubsub is None:
+            return
+
+        for channel in self._subscribed - set(self._channels):
+            self._subscribed.discard(channel)
+            try:
+                await pubsub.unsubscribe(channel)
+            except Exception as exc:  # pragma: no cover — teardown is best-effort
+                log.warning(
+                    "[WATCH] pubsub unsubscribe failed",
+                    channel=channel,
+                    error=repr(exc),
+                )
+
+        if not self._channels:
+            await self._close()
+
+    async def _close(self) -> None:
+        pubsub, reader = self._pubsub, self._reader
+        self._pubsub = None
+        self._reader = None
+        self._subscribed = set()
+
+        reader_running = reader is not None and reader is not asyncio.current_task()
+        if reader_running:
+            reader.cancel()
+
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except Exception as exc:  # pragma: no cover — teardown is best-effort
+                log.warning("[WATCH] pubsub close failed", error=repr(exc))
+
+        # A read blocked on the socket may only notice the cancellation once the
+        # connection is gone, so the reader is awaited after closing, and not forever.
+        if reader_running:
+            await asyncio.wait({reader}, timeout=_HUB_POLL_SECONDS)
+
+    async def _read(self, pubsub: Any) -> None:
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=_HUB_POLL_SECONDS,
+                )
+                if message is None or message.get("type") != "message":
+                    continue
+                channel = message.get("channel")
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                for subscription in tuple(self._channels.get(channel, ())):
+                    subscription.deliver(message.get("data"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # A connection being closed by `_close` (which holds the lock) can fail
+            # its pending read rather than take the cancellation; it is already gone.
+            if self._pubsub is not pubsub:
+                return
+            log.warning("[WATCH] pubsub connection lost", error=repr(exc))
+            async with self._bind_loop():
+                if self._pubsub is not pubsub:
+                    return
+                for subscriptions in self._channels.values():
+                    for subscription in subscriptions:
+                        subscription.close()
+                self._channels = {}
+                await self._close()
+
+
+# (channel, last event id) -> the messages published after it, or None if unknown.
+WatchReplay = Callable[[str, str], Awaitable[Optional[List[bytes]]]]
 
 
 async def watch_event_stream(
     *,
     channel: str,
-    pubsub_factory: Callable[[], Any],
+    hub: WatchHub,
     heartbeat_seconds: float,
     retry_milliseconds: int,
+    last_event_id: Optional[str] = None,
+    replay: Optional[WatchReplay] = None,
 ) -> AsyncIterator[str]:
-    """Subscribe to the session's watch channel and yield SSE frames forever.
+    """Subscribe to a watch channel through the hub and yield SSE frames forever.
 
     The first frame is a ``retry:`` preamble: it pins the client's built-in
     auto-reconnect delay (implementation-defined otherwise) so a server-side
@@ -130,31 +392,54 @@ async def watch_event_stream(
     the stream. ``ready`` is emitted once the subscription is live, so a revalidation
     keyed on it cannot straddle the gap.
 
-    The subscription is torn down in ``finally`` — a client disconnect cancels
-    the generator (GeneratorExit/CancelledError), which is exactly the cleanup
-    path, so no Redis subscription outlives its SSE connection. CancelledError is
-    never swallowed here: the ``finally`` guards only the best-effort teardown.
+    A client reconnecting with ``Last-Event-ID`` is first replayed what it missed, when
+    the channel's replay log still reaches back to that event; ``ready`` then says so,
+    and the client skips its revalidation. The log is read AFTER subscribing, so an event
+    can arrive both ways; the live copy of a replayed event is dropped.
+
+    The stream leaves the hub in ``finally`` — a client disconnect cancels the
+    generator (GeneratorExit/CancelledError), which is exactly the cleanup path, so no
+    channel stays subscribed for a stream that is gone. CancelledError is never
+    swallowed here.
 
     Server shutdown is the OTHER release path: the loop re-checks the module
     shutdown flag at least every ``_SHUTDOWN_POLL_SECONDS``, and returns as soon
     as it is set — uvicorn's drain would otherwise wait on this generator forever
     (see the module comment). The heartbeat cadence is preserved by counting idle
-    polls rather than lengthening the wait.
+    polls rather than lengthening the wait. A stream evicted by the hub, or whose
+    hub connection failed, returns too, and its client reconnects.
     """
-    pubsub = pubsub_factory()
+    subscription = await hub.subscribe(channel)
     try:
-        await pubsub.subscribe(channel)
         yield retry_frame(retry_milliseconds)
-        yield ready_frame()
+
+        replayed_ids: Set[str] = set()
+        missed: Optional[List[bytes]] = None
+        if last_event_id and replay is not None:
+            try:
+                missed = await replay(channel, last_event_id)
+            except Exception as exc:
+                log.warning(
+                    "[WATCH] replay failed",
+                    channel=channel,
+                    error=repr(exc),
+                )
+        for raw in missed or ():
+            payload = _watch_payload(raw)
+            if payload is None:
+                continue
+            if (event_id := _event_id(payload)) is not None:
+                replayed_ids.add(event_id)
+            yield _watch_frame(payload)
+
+        yield ready_frame(replayed=missed is not None)
+
         poll_seconds = min(heartbeat_seconds, _SHUTDOWN_POLL_SECONDS)
         idle_polls_per_heartbeat = max(1, math.ceil(heartbeat_seconds / poll_seconds))
         idle_polls = 0
         while not _shutdown.is_set():
-            message = await pubsub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=poll_seconds,
-            )
-            if _shutdown.is_set():
+            message = await subscription.get(timeout=poll_seconds)
+            if _shutdown.is_set() or message is _CLOSED:
                 break
             if message is None:
                 idle_polls += 1
@@ -163,27 +448,11 @@ async def watch_event_stream(
                     yield HEARTBEAT_FRAME
                 continue
             idle_polls = 0
-            if message.get("type") != "message":
+            payload = _watch_payload(message)
+            if payload is None:
+                continue
+            if replayed_ids and _event_id(payload) in replayed_ids:
                 continue
-            frame = format_watch_frame(message.get("data"))
-            if frame is not None:
-                yield frame
+            yield _watch_frame(payload)
     finally:
-        # Two independent attempts: a failing unsubscribe must not skip the close, or the
-        # connection outlives the disconnected client.
-        try:
-            await pubsub.unsubscribe(channel)
-        except Exception as exc:  # pragma: no cover — teardown is best-effort
-            log.warning(
-                "[WATCH] pubsub unsubscribe failed",
-                channel=channel,
-                error=repr(exc),
-            )
-        try:
-            await pubsub.aclose()
-        except Exception as exc:  # pragma: no cover — teardown is best-effort
-            log.warning(
-                "[WATCH] pubsub close failed",
-                channel=channel,
-                error=repr(exc),
-            )
+        await asyncio.shield(hub.release(subscription))
@@ -1,12 +1,19 @@
 from typing import Optional, Tuple, List, Any
+from hashlib import blake2b
+from io import RawIOBase
 from json import loads
 
+import orjson
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
 from oss.src.core.shared.dtos import (
     Flags,
     Tags,
     Meta,
     Windowing,
 )
+from oss.src.dbs.postgres.shared.engine import routing_scope
 from oss.src.utils.context import support_ctx
 
 
@@ -88,6 +95,57 @@ class SupportHeadersMiddleware:
             support_ctx.reset(token)
 
 
+class ReadRoutingMiddleware:
+    """Pure-ASGI middleware that scopes Postgres read-your-writes pinning to
+    one request: once the request writes to a database, its reads from that
+    database skip the replica, in every task the request spawns.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with routing_scope():
+            await self.app(scope, receive, send)
+
+
+def etag_response(
+    *,
+    request: Request,
+    content: BaseModel,
+) -> Response:
+    """Serialize `content` as the route would, tagged with a strong ETag.
+
+    The tag hashes the exact response bytes, so a client echoing it back in
+    `If-None-Match` gets a bodiless 304 until the response would change.
+    """
+    body = orjson.dumps(content.model_dump(mode="json", exclude_none=True))
+    etag = f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match compares weakly, so a W/ prefix still matches
+        candidates = {
+            candidate.strip().removeprefix("W/")
+            for candidate in if_none_match.split(",")
+        }
+        if etag in candidates or "*" in candidates:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag},
+            )
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
 def parse_metadata(
     flags: Optional[str] = None,
     tags: Optional[str] = None,
@@ -191,3 +249,27 @@ def compute_next_windowing(
             )
 
     return None
+
+
+class DrainableSink(RawIOBase):
+    """Write-only sink that hands out what was written so far, keeping its position."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
@@ -239,6 +239,10 @@ class TestsetRevisionCommitRequest(BaseModel):
     testset_revision: TestsetRevisionCommit = Field(
         description="New revision to commit. Pass either `data` (full replacement of the testcase list) or `delta` (add/remove/replace operations against the base revision) — not both.",
     )
+    include_testcase_ids: Optional[bool] = Field(
+        default=None,
+        description="Include the ordered list of testcase IDs in the response. Defaults to true (opt-out); opting out keeps column-only deltas from rewriting testcases at commit time.",
+    )
     include_testcases: Optional[bool] = Field(
         default=None,
         description="Include full testcase objects in the response.",
@@ -1,10 +1,6 @@
 from typing import Optional, List, Literal, Dict, Any
 from uuid import uuid4, UUID
 from json import loads, JSONDecodeError
-from io import BytesIO
-
-import csv
-from io import StringIO
 
 import orjson
 from pydantic import ValidationError
@@ -85,8 +81,11 @@ from oss.src.apis.fastapi.testsets.models import (
     SimpleTestsetsResponse,
 )
 from oss.src.apis.fastapi.testsets.utils import (
-    csv_file_to_json_array,
-    json_file_to_json_array,
+    file_to_json_array,
+    json_array_to_file_chunks,
+    TESTSETS_FILE_MEDIA_TYPES,
+    TESTSETS_FILE_TYPES,
+    TESTSETS_FILE_TYPE_EXCEPTION,
     TESTSETS_SIZE_EXCEPTION,
 )
 
@@ -1191,9 +1190,9 @@ class TestsetsRouter:
         *,
         testset_revision_id: UUID,
         #
-        file_type: Optional[Literal["csv", "json"]] = Query(
+        file_type: Optional[Literal["csv", "json", "jsonl", "parquet"]] = Query(
             "csv",
-            description="File type to download. Supported: 'csv' or 'json'. Default: 'csv'.",
+            description="File type to download. Supported: 'csv', 'json', 'jsonl' or 'parquet'. Default: 'csv'.",
         ),
         file_name: Optional[str] = Query(
             None,
@@ -1207,11 +1206,8 @@ class TestsetsRouter:
         ):
             raise FORBIDDEN_EXCEPTION  # type: ignore
 
-        if file_type is None or file_type not in ["csv", "json"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+        if file_type is None or file_type not in TESTSETS_FILE_TYPES:
+            raise TESTSETS_FILE_TYPE_EXCEPTION
 
         # Fetch the revision with testcases
         testset_revision_response = await self.fetch_testset_revision(
@@ -1241,46 +1237,15 @@ class TestsetsRouter:
             _build_testcase_export_row(testcase) for testcase in testcases or []
         ]
 
-        if file_type.lower() == "json":
-            buffer = BytesIO(orjson.dumps(testcases_data))
-
-            return StreamingResponse(
-                buffer,
-                media_type="application/json",
-                headers={"Content-Disposition": f"attachment; filename={filename}"},
-            )
-
-        elif file_type.lower() == "csv":
-            buffer = BytesIO()
+        if file_type.lower() == "csv":
             _drop_empty_export_columns(testcases_data)
-            csv_data = _prepare_testcases_for_csv(testcases_data)
-            if csv_data:
-                # Collect all unique keys from all rows to handle heterogeneous data
-                all_keys = set()
-                for row in csv_data:
-                    all_keys.update(row.keys())
-                fieldnames = sorted(all_keys)  # Sort for consistent column order
-
-                text_buf = StringIO()
-                writer = csv.DictWriter(
-                    text_buf, fieldnames=fieldnames, extrasaction="ignore"
-                )
-                writer.writeheader()
-                writer.writerows(csv_data)
-                buffer = BytesIO(text_buf.getvalue().encode("utf-8"))
-            buffer.seek(0)
-
-            return StreamingResponse(
-                buffer,
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"},
-            )
+            testcases_data = _prepare_testcases_for_csv(testcases_data)
 
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+        return StreamingResponse(
+            json_array_to_file_chunks(testcases_data, file_type),
+            media_type=TESTSETS_FILE_MEDIA_TYPES[file_type.lower()],
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
 
     @intercept_exceptions()
     async def create_testset_revision_from_file(
@@ -1290,7 +1255,7 @@ class TestsetsRouter:
         testset_revision_id: UUID,
         #
         file: UploadFile = File(...),
-        file_type: Literal["csv", "json"] = Form("csv"),
+        file_type: Literal["csv", "json", "jsonl", "parquet"] = Form("csv"),
         #
         include_testcases: Optional[bool] = Form(None),
     ) -> TestsetRevisionResponse:
@@ -1301,34 +1266,23 @@ class TestsetsRouter:
         ):
             raise FORBIDDEN_EXCEPTION  # type: ignore
 
-        if file_type is None or file_type not in ["csv", "json"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+        if file_type is None or file_type not in TESTSETS_FILE_TYPES:
+            raise TESTSETS_FILE_TYPE_EXCEPTION
 
         if (file.size or 0) > TESTSETS_SIZE_LIMIT:
             raise TESTSETS_SIZE_EXCEPTION
 
         testcases_data = {}
 
-        if file_type.lower() == "json":
-            try:
-                testcases_data = await json_file_to_json_array(file)
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to read JSON file: {e}",
-                ) from e
-
-        elif file_type.lower() == "csv":
-            try:
-                testcases_data = await csv_file_to_json_array(file)
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to read CSV file: {e}",
-                ) from e
+        try:
+            testcases_data = await file_to_json_array(file, file_type)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to read {file_type.upper()} file: {e}",
+            ) from e
 
         testcases = []
         try:
@@ -1469,6 +1423,7 @@ class TestsetsRouter:
             user_id=UUID(request.state.user_id),
             #
             testset_revision_commit=commit,
+            include_testcase_ids=testset_revision_commit_request.include_testcase_ids,
             include_testcases=testset_revision_commit_request.include_testcases,
         )
 
@@ -2011,7 +1966,7 @@ class SimpleTestsetsRouter:
         testset_id: UUID,
         #
         file: UploadFile = File(...),
-        file_type: Literal["csv", "json"] = Form("csv"),
+        file_type: Literal["csv", "json", "jsonl", "parquet"] = Form("csv"),
         testset_name: Optional[str] = File(None),
         testset_description: Optional[str] = Form(None),
         testset_tags: Optional[str] = Form(None),
@@ -2024,11 +1979,8 @@ class SimpleTestsetsRouter:
         ):
             raise FORBIDDEN_EXCEPTION  # type: ignore
 
-        if file_type is None or file_type not in ["csv", "json"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Supported types are 'CSV' and 'JSON'.",
-            )
+        if file_type is None or file_type not in TESTSETS_FILE_TYPES:
+            raise TESTSETS_FILE_TYPE_EXCEPTION
 
         if (file.size or 0) > TESTSETS_SIZE_LIMIT:  # Preemptively check file size
             raise TESTSETS_SIZE_EXCEPTION
@@ -2046,31 +1998,15 @@ class SimpleTestsetsRouter:
         testcases = []
         testcases_data = {}
 
-        if file_type.lower() == "json":
-            try:
-                testcases_data = await json_file_to_json_array(json_file=file)
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to read JSON file: {e}",
-                ) from e
-
-        elif file_type.lower() == "csv":
-            try:
-                testcases_data = await csv_file_to_json_array(csv_file=file)
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to read CSV file: {e}",
-                ) from e
-
-        else:
+        try:
+            testcases_data = await file_to_json_array(file, file_type)
+        except HTTPException:
+            raise
+        except Exception as e:
             raise HTTPException(
                 status_code=400,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+                detail=f"Failed to read {file_type.upper()} file: {e}",
+            ) from e
 
         try:
             _normalize_testcase_dedup_ids(testcases_data)
@@ -2155,7 +2091,7 @@ class SimpleTestsetsRouter:
         *,
         testset_id: UUID,
         #
-        file_type: Optional[Literal["csv", "json"]] = None,
+        file_type: Optional[Literal["csv", "json", "jsonl", "parquet"]] = None,
         file_name: Optional[str] = None,
     ) -> StreamingResponse:  # type: ignore
         if not await check_action_access(  # type: ignore
@@ -2165,11 +2101,8 @@ class SimpleTestsetsRouter:
         ):
             raise FORBIDDEN_EXCEPTION  # type: ignore
 
-        if file_type is None or file_type not in ["csv", "json"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+        if file_type is None or file_type not in TESTSETS_FILE_TYPES:
+            raise TESTSETS_FILE_TYPE_EXCEPTION
 
         simple_testset_response = await self.fetch_simple_testset(
             request=request,
@@ -2193,46 +2126,15 @@ class SimpleTestsetsRouter:
             _build_testcase_export_row(testcase) for testcase in testcases or []
         ]
 
-        if file_type.lower() == "json":
-            buffer = BytesIO(orjson.dumps(testcases_data))
-
-            return StreamingResponse(
-                buffer,
-                media_type="application/json",
-                headers={"Content-Disposition": f"attachment; filename={filename}"},
-            )
-
-        elif file_type.lower() == "csv":
-            buffer = BytesIO()
+        if file_type.lower() == "csv":
             _drop_empty_export_columns(testcases_data)
-            csv_data = _prepare_testcases_for_csv(testcases_data)
-            if csv_data:
-                # Collect all unique keys from all rows to handle heterogeneous data
-                all_keys = set()
-                for row in csv_data:
-                    all_keys.update(row.keys())
-                fieldnames = sorted(all_keys)  # Sort for consistent column order
-
-                text_buf = StringIO()
-                writer = csv.DictWriter(
-                    text_buf, fieldnames=fieldnames, extrasaction="ignore"
-                )
-                writer.writeheader()
-                writer.writerows(csv_data)
-                buffer = BytesIO(text_buf.getvalue().encode("utf-8"))
-            buffer.seek(0)
-
-            return StreamingResponse(
-                buffer,
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename={filename}"},
-            )
+            testcases_data = _prepare_testcases_for_csv(testcases_data)
 
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+        return StreamingResponse(
+            json_array_to_file_chunks(testcases_data, file_type),
+            media_type=TESTSETS_FILE_MEDIA_TYPES[file_type.lower()],
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
 
     @intercept_exceptions()
     @suppress_exceptions(default=SimpleTestsetsResponse(), exclude=[HTTPException])
@@ -2318,7 +2220,7 @@ class SimpleTestsetsRouter:
         request: Request,
         *,
         file: UploadFile = File(...),
-        file_type: Literal["csv", "json"] = Form("csv"),
+        file_type: Literal["csv", "json", "jsonl", "parquet"] = Form("csv"),
         testset_slug: Optional[str] = Form(None),
         testset_name: Optional[str] = File(None),
         testset_description: Optional[str] = Form(None),
@@ -2332,11 +2234,8 @@ class SimpleTestsetsRouter:
         ):
             raise FORBIDDEN_EXCEPTION  # type: ignore
 
-        if file_type is None or file_type not in ["csv", "json"]:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+        if file_type is None or file_type not in TESTSETS_FILE_TYPES:
+            raise TESTSETS_FILE_TYPE_EXCEPTION
 
         if (file.size or 0) > TESTSETS_SIZE_LIMIT:  # Preemptively check file size
             raise TESTSETS_SIZE_EXCEPTION
@@ -2355,31 +2254,15 @@ class SimpleTestsetsRouter:
         testcases = []
         testcases_data = {}
 
-        if file_type.lower() == "json":
-            try:
-                testcases_data = await json_file_to_json_array(file)
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to read JSON file: {e}",
-                ) from e
-
-        elif file_type.lower() == "csv":
-            try:
-                testcases_data = await csv_file_to_json_array(file)
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to read CSV file: {e}",
-                ) from e
-
-        else:
+        try:
+            testcases_data = await file_to_json_array(file, file_type)
+        except HTTPException:
+            raise
+        except Exception as e:
             raise HTTPException(
                 status_code=400,
-                detail="Invalid file type. Supported types are 'csv' and 'json'.",
-            )
+                detail=f"Failed to read {file_type.upper()} file: {e}",
+            ) from e
 
         try:
             _normalize_testcase_dedup_ids(testcases_data)
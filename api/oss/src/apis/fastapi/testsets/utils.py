@@ -1,12 +1,13 @@
-from typing import Dict, Any, Optional, Literal, List
+from typing import Dict, Any, Optional, Literal, List, BinaryIO, Iterable, Iterator
 from uuid import UUID
 from datetime import datetime
 from json import dumps
 from hashlib import blake2b as digest
 from copy import deepcopy
 
+import asyncio
 import csv
-from io import StringIO
+from io import BufferedReader, BytesIO, RawIOBase, StringIO, TextIOWrapper
 
 import orjson as oj
 
@@ -14,7 +15,7 @@ from fastapi import HTTPException, Query
 
 from oss.src.utils.logging import get_module_logger
 
-from oss.src.apis.fastapi.shared.utils import parse_metadata
+from oss.src.apis.fastapi.shared.utils import DrainableSink, parse_metadata
 from oss.src.apis.fastapi.testsets.models import (
     TestsetQueryRequest,
     TestsetVariantQueryRequest,
@@ -662,6 +663,25 @@ TESTSETS_COUNT_EXCEPTION = HTTPException(
     detail=TESTSETS_COUNT_WARNING,
 )
 
+TESTSETS_FILE_TYPES = ("csv", "json", "jsonl", "parquet")
+TESTSETS_FILE_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+TESTSETS_FILE_TYPE_WARNING = (
+    "Invalid file type. Supported types are 'csv', 'json', 'jsonl' and 'parquet'."
+)
+
+TESTSETS_FILE_TYPE_EXCEPTION = HTTPException(
+    status_code=400,
+    detail=TESTSETS_FILE_TYPE_WARNING,
+)
+
+TESTSETS_READ_CHUNK_SIZE = 64 * 1024  # 64 KB per upload read
+TESTSETS_WRITE_BATCH_SIZE = 500  # 500 testcases per download chunk
+
 
 def validate_testset_limits(rows: List[dict]) -> tuple[int, int]:
     i = -1
@@ -688,16 +708,90 @@ def to_uuid(id, data):
         return str(compute_blob_id(blob_data=data))
 
 
+class _BoundedReader(RawIOBase):
+    """Reads through to an upload, failing as soon as it exceeds the size limit.
+
+    Uploads are spooled to disk by the multipart parser, so the limit is what
+    keeps an oversized file (or one sent without a Content-Length) from ever
+    being pulled into memory.
+    """
+
+    def __init__(self, raw: BinaryIO, limit: Optional[int] = None):
+        self._raw = raw
+        self._limit = limit if limit is not None else TESTSETS_SIZE_LIMIT
+        self._size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._raw.read(len(buffer))
+        self._size += len(data)
+        if self._size > self._limit:
+            log.error(TESTSETS_SIZE_WARNING)
+            raise TESTSETS_SIZE_EXCEPTION
+        buffer[: len(data)] = data
+        return len(data)
+
+
+async def _open_upload(file) -> BinaryIO:
+    """Return the binary file behind an UploadFile (or a bounded copy of any async reader)."""
+    raw = getattr(file, "file", None)
+    if raw is not None:
+        return raw
+
+    if not hasattr(file, "read"):
+        raise TypeError("Unsupported file type")
+
+    buffer = BytesIO()
+    while True:
+        chunk = await file.read(TESTSETS_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        if buffer.tell() + len(chunk) > TESTSETS_SIZE_LIMIT:
+            log.error(TESTSETS_SIZE_WARNING)
+            raise TESTSETS_SIZE_EXCEPTION
+        buffer.write(chunk)
+
+    buffer.seek(0)
+    return buffer
+
+
+def _open_text_upload(raw: BinaryIO) -> TextIOWrapper:
+    """Decode an upload incrementally; closing the wrapper leaves the upload open."""
+    return TextIOWrapper(
+        BufferedReader(_BoundedReader(raw), TESTSETS_READ_CHUNK_SIZE),
+        encoding="utf-8-sig",
+        newline="",
+    )
+
+
+def _cast_columns(row: Dict[str, Any], column_types: Optional[dict]) -> None:
+    """Apply type conversion if specified, preserving original values on failure."""
+    for col, dtype in (column_types or {}).items():
+        if col in row:
+            value = row[col]
+            if value is None or value == "":
+                continue
+            try:
+                row[col] = dtype(value)
+            except (ValueError, TypeError):
+                log.warning(
+                    "[TESTSETS] Failed to cast column '%s' value '%s' using %s",
+                    col,
+                    value,
+                    getattr(dtype, "__name__", str(dtype)),
+                )
+
+
 async def json_file_to_json_array(
     json_file,
 ):
     """Reads a JSON file from path or UploadFile and returns the parsed data."""
     try:
-        if hasattr(json_file, "read"):  # Covers UploadFile or similar
-            content = await json_file.read()  # Read async
-            return oj.loads(content)
-        else:
-            raise TypeError("Unsupported file type")
+        raw = await _open_upload(json_file)
+        content = await asyncio.to_thread(_BoundedReader(raw).readall)
+        return oj.loads(content)
     except oj.JSONDecodeError as e:
         log.error("[TESTSETS] Invalid JSON format", exc_info=True)
         raise e
@@ -706,6 +800,81 @@ async def json_file_to_json_array(
         raise e
 
 
+def _read_jsonl_rows(raw: BinaryIO) -> List[Any]:
+    rows = []
+    with _open_text_upload(raw) as text:
+        for line_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(oj.loads(line))
+            except oj.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+    return rows
+
+
+async def jsonl_file_to_json_array(
+    jsonl_file,
+):
+    """Reads a JSON Lines file (one testcase object per line), line by line."""
+    try:
+        raw = await _open_upload(jsonl_file)
+        return await asyncio.to_thread(_read_jsonl_rows, raw)
+    except Exception as e:
+        log.error("[TESTSETS] Could not read JSONL file", exc_info=True)
+        raise e
+
+
+def _read_parquet_rows(raw: BinaryIO) -> List[Dict[str, Any]]:
+    # pyarrow is heavy; only pay for the import when a Parquet file shows up.
+    import pyarrow.parquet as pq
+
+    raw.seek(0, 2)
+    if raw.tell() > TESTSETS_SIZE_LIMIT:
+        log.error(TESTSETS_SIZE_WARNING)
+        raise TESTSETS_SIZE_EXCEPTION
+    raw.seek(0)
+
+    rows = []
+    parquet_file = pq.ParquetFile(raw)
+    for batch in parquet_file.iter_batches(batch_size=TESTSETS_WRITE_BATCH_SIZE):
+        # Round-trip through JSON: testcases are JSON, Parquet cells may be
+        # dates, decimals or bytes.
+        rows.extend(oj.loads(oj.dumps(batch.to_pylist(), default=str)))
+    return rows
+
+
+async def parquet_file_to_json_array(
+    parquet_file,
+):
+    """Reads a Parquet file row group by row group, one testcase per row."""
+    try:
+        raw = await _open_upload(parquet_file)
+        return await asyncio.to_thread(_read_parquet_rows, raw)
+    except Exception as e:
+        log.error("[TESTSETS] Could not read Parquet file", exc_info=True)
+        raise e
+
+
+async def file_to_json_array(
+    file,
+    file_type: str,
+):
+    """Reads an uploaded testset file of any supported type into a JSON array."""
+    file_type = file_type.lower()
+
+    if file_type == "csv":
+        return await csv_file_to_json_array(file)
+    if file_type == "json":
+        return await json_file_to_json_array(file)
+    if file_type == "jsonl":
+        return await jsonl_file_to_json_array(file)
+    if file_type == "parquet":
+        return await parquet_file_to_json_array(file)
+
+    raise TESTSETS_FILE_TYPE_EXCEPTION
+
+
 def json_array_to_json_file(
     json_file,
     data,
@@ -816,35 +985,25 @@ async def csv_file_to_json_array(
         list: A list of dictionaries representing the CSV rows.
     """
     try:
-        data = await csv_file.read()
-        text = data.decode("utf-8-sig")
-        reader = csv.DictReader(StringIO(text))
-        rows = list(reader)
-
-        # Apply type conversion if specified, preserving original values on failure
-        if column_types:
-            for row in rows:
-                for col, dtype in column_types.items():
-                    if col in row:
-                        value = row[col]
-                        if value is None or value == "":
-                            continue
-                        try:
-                            row[col] = dtype(value)
-                        except (ValueError, TypeError):
-                            log.warning(
-                                "[TESTSETS] Failed to cast column '%s' value '%s' using %s",
-                                col,
-                                value,
-                                getattr(dtype, "__name__", str(dtype)),
-                            )
-
-        return rows
+        raw = await _open_upload(csv_file)
+        return await asyncio.to_thread(_read_csv_rows, raw, column_types)
     except Exception as e:
         log.error("[TESTSETS] Could not read CSV file", exc_info=True)
         raise e
 
 
+def _read_csv_rows(
+    raw: BinaryIO,
+    column_types: Optional[dict] = None,
+) -> List[Dict[str, Any]]:
+    rows = []
+    with _open_text_upload(raw) as text:
+        for row in csv.DictReader(text):
+            _cast_columns(row, column_types)
+            rows.append(row)
+    return rows
+
+
 def json_array_to_csv_file(
     json_array,
     output_csv_file,
@@ -934,3 +1093,130 @@ def csv_data_to_json_array(
                         )
 
     return csv_data
+
+
+def json_array_to_json_chunks(
+    rows: Iterable[Dict[str, Any]],
+) -> Iterator[bytes]:
+    """Encode rows as one JSON array, a batch of rows at a time."""
+    yield b"["
+    separator = b""
+    batch: List[bytes] = []
+    for row in rows:
+        batch.append(oj.dumps(row))
+        if len(batch) >= TESTSETS_WRITE_BATCH_SIZE:
+            yield separator + b",".join(batch)
+            separator = b","
+            batch = []
+    if batch:
+        yield separator + b",".join(batch)
+    yield b"]"
+
+
+def json_array_to_jsonl_chunks(
+    rows: Iterable[Dict[str, Any]],
+) -> Iterator[bytes]:
+    """Encode rows as JSON Lines, a batch of rows at a time."""
+    batch: List[bytes] = []
+    for row in rows:
+        batch.append(oj.dumps(row, option=oj.OPT_APPEND_NEWLINE))
+        if len(batch) >= TESTSETS_WRITE_BATCH_SIZE:
+            yield b"".join(batch)
+            batch = []
+    if batch:
+        yield b"".join(batch)
+
+
+def json_array_to_csv_chunks(
+    rows: List[Dict[str, Any]],
+) -> Iterator[bytes]:
+    """Encode rows as CSV (sorted union of keys as header), a batch of rows at a time."""
+    if not rows:
+        return
+
+    # Collect all unique keys from all rows to handle heterogeneous data
+    all_keys = set()
+    for row in rows:
+        all_keys.update(row.keys())
+    fieldnames = sorted(all_keys)  # Sort for consistent column order
+
+    text_buf = StringIO()
+    writer = csv.DictWriter(text_buf, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+
+    for start in range(0, len(rows), TESTSETS_WRITE_BATCH_SIZE):
+        writer.writerows(rows[start : start + TESTSETS_WRITE_BATCH_SIZE])
+        yield text_buf.getvalue().encode("utf-8")
+        text_buf.seek(0)
+        text_buf.truncate()
+
+
+def json_array_to_parquet_chunks(
+    rows: List[Dict[str, Any]],
+) -> Iterator[bytes]:
+    """Encode rows as Parquet, one row group per batch of rows.
+
+    Scalar columns keep their type. Nested values, and columns whose values do
+    not share a type, are written as JSON strings, as in the CSV export.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    all_keys = set()
+    for row in rows:
+        all_keys.update(row.keys())
+    fieldnames = sorted(all_keys)
+
+    fields = []
+    for name in fieldnames:
+        values = [_parquet_value(row.get(name)) for row in rows]
+        try:
+            fields.append(pa.field(name, pa.array(values).type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            fields.append(pa.field(name, pa.string()))
+    schema = pa.schema(fields)
+    string_columns = {f.name for f in fields if f.type == pa.string()}
+
+    sink = DrainableSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for start in range(0, len(rows), TESTSETS_WRITE_BATCH_SIZE):
+            batch = rows[start : start + TESTSETS_WRITE_BATCH_SIZE]
+            columns = {
+                name: [
+                    _parquet_value(row.get(name), as_string=name in string_columns)
+                    for row in batch
+                ]
+                for name in fieldnames
+            }
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def _parquet_value(value: Any, as_string: bool = False) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return oj.dumps(value).decode("utf-8")
+    if as_string and not isinstance(value, str):
+        return oj.dumps(value).decode("utf-8")
+    return value
+
+
+def json_array_to_file_chunks(
+    rows: List[Dict[str, Any]],
+    file_type: str,
+) -> Iterator[bytes]:
+    """Encode rows for download in the given file type, chunk by chunk."""
+    file_type = file_type.lower()
+
+    if file_type == "csv":
+        return json_array_to_csv_chunks(rows)
+    if file_type == "json":
+        return json_array_to_json_chunks(rows)
+    if file_type == "jsonl":
+        return json_array_to_jsonl_chunks(rows)
+    if file_type == "parquet":
+        return json_array_to_parquet_chunks(rows)
+
+    raise TESTSETS_FILE_TYPE_EXCEPTION
@@ -223,6 +223,17 @@ class ToolsRouter:
             response_model_exclude_none=True,
         )
 
+        # --- Tool Catalog (admin) ---
+        # The cron driver POSTs to /admin/tools/catalog/refresh (mounted in
+        # entrypoints/routers.py under prefix /admin/tools). No auth/entitlement.
+        self.admin_router = APIRouter()
+        self.admin_router.add_api_route(
+            "/catalog/refresh",
+            self.refresh_catalog,
+            methods=["POST"],
+            operation_id="refresh_tool_catalog",
+        )
+
         # --- Tool Connections ---
         self.router.add_api_route(
             "/connections/query",
@@ -721,6 +732,26 @@ class ToolsRouter:
 
         return response
 
+    @intercept_exceptions()
+    @handle_adapter_exceptions()
+    async def refresh_catalog(
+        self,
+        *,
+        provider_key: str = Query("composio"),
+    ) -> Any:
+        # ----------------------------------------------------------------------
+        # THIS IS AN ADMIN ENDPOINT
+        # NO CHECK FOR PERMISSIONS / ENTITLEMENTS
+        # ----------------------------------------------------------------------
+
+        # The sync runs in the background: a full crawl outlasts the cron's timeout
+        started = await self.tools_service.refresh_catalog(provider_key=provider_key)
+
+        if not started:
+            return {"status": "skipped"}
+
+        return {"status": "success"}
+
     # -----------------------------------------------------------------------
     # Tool Connections
     # -----------------------------------------------------------------------
@@ -80,6 +80,7 @@ from oss.src.apis.fastapi.workflows.models import (
 )
 from oss.src.apis.fastapi.shared.utils import (
     compute_next_windowing,
+    etag_response,
 )
 from oss.src.apis.fastapi.workflows.utils import (
     parse_workflow_query_request_from_params,
@@ -2027,7 +2028,10 @@ class WorkflowsRouter:
             retrieval_info=retrieval_info,
         )
 
-        return workflow_revision_response
+        return etag_response(
+            request=request,
+            content=workflow_revision_response,
+        )
 
     @intercept_exceptions()
     @handle_workflow_exceptions()
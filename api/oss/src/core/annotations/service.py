@@ -1,4 +1,5 @@
-from typing import Optional, List, Dict, Any
+from json import dumps
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID, uuid4
 
 from genson import SchemaBuilder
@@ -49,6 +50,8 @@ from oss.src.core.annotations.types import (
     AnnotationCreate,
     AnnotationEdit,
     AnnotationQuery,
+    AnnotationBulkEdit,
+    AnnotationBulkResult,
 )
 
 from oss.src.core.annotations.utils import validate_data_against_schema
@@ -59,6 +62,19 @@ log = get_module_logger(__name__)
 ANNOTATION_URI = "agenta:custom:feedback:v0"
 
 
+def _parse_trace_id(trace_id: Optional[str]) -> Optional[str]:
+    # Accepts the hex, 0x-hex and dashed forms, so lookups match either way
+    try:
+        return UUID(trace_id.removeprefix("0x")).hex if trace_id else None
+    except ValueError:
+        return None
+
+
+def _parse_span_id(span_id: Optional[str]) -> Optional[str]:
+    # Accepts the hex and 0x-hex forms
+    return span_id.removeprefix("0x").lower() if span_id else None
+
+
 class AnnotationsService:
     def __init__(
         self,
@@ -80,75 +96,18 @@ class AnnotationsService:
         #
         annotation_create: AnnotationCreate,
     ) -> Optional[Annotation]:
-        simple_evaluator_slug = (
-            annotation_create.references.evaluator.slug
-            if annotation_create.references.evaluator
-            else None
-        ) or uuid4().hex[-12:]
-
-        simple_evaluator_flags = SimpleEvaluatorFlags(
-            is_evaluator=True,
-        )
-
         (
             evaluator_revision,
-            _,
+            simple_evaluator,
             retrieval_info,
-        ) = await self.evaluators_service.retrieve_evaluator_revision(
+        ) = await self._resolve_evaluator(
             project_id=project_id,
+            user_id=user_id,
             #
-            evaluator_ref=annotation_create.references.evaluator,
-            evaluator_variant_ref=annotation_create.references.evaluator_variant,
-            evaluator_revision_ref=annotation_create.references.evaluator_revision,
+            references=annotation_create.references,
+            data=annotation_create.data,
         )
 
-        if evaluator_revision is None:
-            builder = SchemaBuilder()
-            builder.add_object(annotation_create.data)
-            evaluator_outputs_schema: Dict[str, Any] = builder.to_schema()
-
-            simple_evaluator_data = SimpleEvaluatorData(
-                uri=ANNOTATION_URI,
-                schemas=dict(
-                    outputs=evaluator_outputs_schema,
-                ),
-            )
-
-            simple_evaluator_create = SimpleEvaluatorCreate(
-                slug=simple_evaluator_slug,
-                #
-                name=simple_evaluator_slug,
-                #
-                flags=simple_evaluator_flags,
-                #
-                data=simple_evaluator_data,
-            )
-
-            simple_evaluator = await self.simple_evaluators_service.create(
-                project_id=project_id,
-                user_id=user_id,
-                #
-                simple_evaluator_create=simple_evaluator_create,
-            )
-
-            if simple_evaluator:
-                (
-                    evaluator_revision,
-                    _,
-                    retrieval_info,
-                ) = await self.evaluators_service.retrieve_evaluator_revision(
-                    project_id=project_id,
-                    #
-                    evaluator_ref=Reference(id=simple_evaluator.id),
-                )
-        elif evaluator_revision.evaluator_id:
-            simple_evaluator = await self.simple_evaluators_service.fetch(
-                project_id=project_id,
-                evaluator_id=evaluator_revision.evaluator_id,
-            )
-        else:
-            simple_evaluator = None
-
         if not evaluator_revision or not evaluator_revision.data:
             return None
 
@@ -159,24 +118,15 @@ class AnnotationsService:
             else {},
         )
 
-        annotation_flags = AnnotationFlags(
-            is_evaluator=True,
-            is_custom=annotation_create.origin == AnnotationOrigin.CUSTOM,
-            is_feedback=annotation_create.origin == AnnotationOrigin.HUMAN,
-            is_sdk=annotation_create.channel == AnnotationChannel.SDK,
-            is_web=annotation_create.channel == AnnotationChannel.WEB,
-            is_evaluation=annotation_create.kind == AnnotationKind.EVAL,
+        annotation_flags = self._annotation_flags(
+            origin=annotation_create.origin,
+            kind=annotation_create.kind,
+            channel=annotation_create.channel,
         )
 
-        reference_dict = annotation_create.references.model_dump()
-        if retrieval_info:
-            if retrieval_info.references:
-                reference_dict.update(retrieval_info.references)
-            if retrieval_info.selector:
-                reference_dict["selector"] = retrieval_info.selector
-
-        annotation_references = AnnotationReferences(
-            **reference_dict,
+        annotation_references = self._annotation_references(
+            references=annotation_create.references,
+            retrieval_info=retrieval_info,
         )
 
         annotation_link = await self._create_annotation(
@@ -289,68 +239,18 @@ class AnnotationsService:
         if annotation is None:
             return None
 
-        simple_evaluator_slug = (
-            annotation.references.evaluator.slug
-            if annotation.references.evaluator
-            else None
-        ) or uuid4().hex[-12:]
-
-        simple_evaluator_flags = SimpleEvaluatorFlags(
-            is_evaluator=True,
-        )
-
         (
             evaluator_revision,
             _,
             retrieval_info,
-        ) = await self.evaluators_service.retrieve_evaluator_revision(
+        ) = await self._resolve_evaluator(
             project_id=project_id,
+            user_id=user_id,
             #
-            evaluator_ref=annotation.references.evaluator,
-            evaluator_variant_ref=annotation.references.evaluator_variant,
-            evaluator_revision_ref=annotation.references.evaluator_revision,
+            references=annotation.references,
+            data=annotation_edit.data,
         )
 
-        if not evaluator_revision:
-            builder = SchemaBuilder()
-            builder.add_object(annotation_edit.data)
-            evaluator_outputs_schema: Dict[str, Any] = builder.to_schema()
-
-            simple_evaluator_data = SimpleEvaluatorData(
-                uri=ANNOTATION_URI,
-                schemas=dict(
-                    outputs=evaluator_outputs_schema,
-                ),
-            )
-
-            simple_evaluator_create = SimpleEvaluatorCreate(
-                slug=simple_evaluator_slug,
-                #
-                name=simple_evaluator_slug,
-                #
-                flags=simple_evaluator_flags,
-                #
-                data=simple_evaluator_data,
-            )
-
-            simple_evaluator = await self.simple_evaluators_service.create(
-                project_id=project_id,
-                user_id=user_id,
-                #
-                simple_evaluator_create=simple_evaluator_create,
-            )
-
-            if simple_evaluator:
-                (
-                    evaluator_revision,
-                    _,
-                    retrieval_info,
-                ) = await self.evaluators_service.retrieve_evaluator_revision(
-                    project_id=project_id,
-                    #
-                    evaluator_ref=Reference(id=simple_evaluator.id),
-                )
-
         if not evaluator_revision or not evaluator_revision.data:
             return None
 
@@ -361,31 +261,20 @@ class AnnotationsService:
             else {},
         )
 
-        reference_dict = (
-            annotation_edit.references.model_dump()
-            if annotation_edit.references
-            else annotation.references.model_dump()
+        annotation_references = self._annotation_references(
+            references=annotation_edit.references or annotation.references,
+            retrieval_info=retrieval_info,
         )
-        if retrieval_info:
-            if retrieval_info.references:
-                reference_dict.update(retrieval_info.references)
-            if retrieval_info.selector:
-                reference_dict["selector"] = retrieval_info.selector
-
-        annotation_references = AnnotationReferences(**reference_dict)
         annotation_links = (
             annotation_edit.links
             if annotation_edit.links is not None
             else annotation.links
         )
 
-        annotation_flags = AnnotationFlags(
-            is_evaluator=True,
-            is_custom=annotation.origin == AnnotationOrigin.CUSTOM,
-            is_feedback=annotation.origin == AnnotationOrigin.HUMAN,
-            is_sdk=annotation.channel == AnnotationChannel.SDK,
-            is_web=annotation.channel == AnnotationChannel.WEB,
-            is_evaluation=annotation.kind == AnnotationKind.EVAL,
+        annotation_flags = self._annotation_flags(
+            origin=annotation.origin,
+            kind=annotation.kind,
+            channel=annotation.channel,
         )
 
         annotation_link = await self._edit_annotation(
@@ -534,17 +423,426 @@ class AnnotationsService:
         )
         return annotations
 
-    # -------- Internal Functions -------------------------------------------------------------------
+    async def create_bulk(
+        self,
+        *,
+        organization_id: UUID,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        annotation_creates: List[AnnotationCreate],
+    ) -> List[AnnotationBulkResult]:
+        """Create many annotations, resolving each distinct evaluator once and
+        writing every annotation trace in a single ingest batch.
+
+        Results are returned in request order; an item that cannot be created
+        carries an error instead of a link, without failing the others.
+        """
+        results = [AnnotationBulkResult() for _ in annotation_creates]
+        evaluators: Dict[str, Any] = {}
+        spans: List[OTelFlatSpan] = []
+        indices: List[int] = []
+
+        for index, annotation_create in enumerate(annotation_creates):
+            try:
+                (
+                    evaluator_revision,
+                    simple_evaluator,
+                    retrieval_info,
+                ) = await self._resolve_evaluator_once(
+                    evaluators,
+                    project_id=project_id,
+                    user_id=user_id,
+                    #
+                    references=annotation_create.references,
+                    data=annotation_create.data,
+                )
 
-    async def _create_annotation(
+                validate_data_against_schema(
+                    annotation_create.data,
+                    (evaluator_revision.data.schemas.outputs or {})
+                    if evaluator_revision.data.schemas
+                    else {},
+                )
+
+                span = self._build_annotation_span(
+                    name=simple_evaluator.slug if simple_evaluator else None,
+                    #
+                    flags=self._annotation_flags(
+                        origin=annotation_create.origin,
+                        kind=annotation_create.kind,
+                        channel=annotation_create.channel,
+                    ),
+                    tags=annotation_create.tags,
+                    meta=annotation_create.meta,
+                    #
+                    data=annotation_create.data,
+                    #
+                    references=self._annotation_references(
+                        references=annotation_create.references,
+                        retrieval_info=retrieval_info,
+                    ),
+                    links=annotation_create.links,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                results[index].error = str(e)
+                continue
+
+            spans.append(span)
+            indices.append(index)
+
+        return await self._ingest_annotation_spans(
+            organization_id=organization_id,
+            project_id=project_id,
+            user_id=user_id,
+            #
+            spans=spans,
+            indices=indices,
+            results=results,
+        )
+
+    async def edit_bulk(
         self,
         *,
         organization_id: UUID,
         project_id: UUID,
         user_id: UUID,
         #
-        name: Optional[str],
+        annotation_edits: List[AnnotationBulkEdit],
+    ) -> List[AnnotationBulkResult]:
+        """Edit many annotations, fetching them in one query, resolving each
+        distinct evaluator once and writing every edit in a single ingest batch.
+        """
+        results = [AnnotationBulkResult() for _ in annotation_edits]
+        evaluators: Dict[str, Any] = {}
+        spans: List[OTelFlatSpan] = []
+        indices: List[int] = []
+
+        trace_ids = [
+            _parse_trace_id(annotation_edit.trace_id)
+            for annotation_edit in annotation_edits
+        ]
+
+        annotation_links = [
+            Link(trace_id=trace_id) for trace_id in set(trace_ids) if trace_id
+        ]
+
+        annotations = (
+            await self._query_annotation(
+                project_id=project_id,
+                user_id=user_id,
+                #
+                annotation_links=annotation_links,
+                #
+                windowing=Windowing(limit=len(annotation_links)),
+            )
+            if annotation_links
+            else []
+        )
+
+        existing = {
+            _parse_trace_id(annotation.trace_id): annotation
+            for annotation in annotations
+        }
+
+        for index, annotation_edit in enumerate(annotation_edits):
+            try:
+                annotation = existing.get(trace_ids[index])
+
+                if annotation is None or (
+                    annotation_edit.span_id
+                    and _parse_span_id(annotation_edit.span_id)
+                    != _parse_span_id(annotation.span_id)
+                ):
+                    raise ValueError("Annotation not found")
+
+                (
+                    evaluator_revision,
+                    _,
+                    retrieval_info,
+                ) = await self._resolve_evaluator_once(
+                    evaluators,
+                    project_id=project_id,
+                    user_id=user_id,
+                    #
+                    references=annotation.references,
+                    data=annotation_edit.data,
+                )
+
+                validate_data_against_schema(
+                    annotation_edit.data,
+                    (evaluator_revision.data.schemas.outputs or {})
+                    if evaluator_revision.data.schemas
+                    else {},
+                )
+
+                span = self._build_annotation_edit_span(
+                    annotation=annotation,
+                    #
+                    flags=self._annotation_flags(
+                        origin=annotation.origin,
+                        kind=annotation.kind,
+                        channel=annotation.channel,
+                    ),
+                    tags=annotation_edit.tags,
+                    meta=annotation_edit.meta,
+                    #
+                    data=annotation_edit.data,
+                    #
+                    references=self._annotation_references(
+                        references=annotation_edit.references or annotation.references,
+                        retrieval_info=retrieval_info,
+                    ),
+                    links=(
+                        annotation_edit.links
+                        if annotation_edit.links is not None
+                        else annotation.links
+                    ),
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                results[index].error = str(e)
+                continue
+
+            spans.append(span)
+            indices.append(index)
+
+        return await self._ingest_annotation_spans(
+            organization_id=organization_id,
+            project_id=project_id,
+            user_id=user_id,
+            #
+            spans=spans,
+            indices=indices,
+            results=results,
+        )
+
+    # -------- Internal Functions -------------------------------------------------------------------
+
+    async def _resolve_evaluator(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
         #
+        references: SimpleTraceReferences,
+        data: Data,
+    ) -> Tuple[Optional[Any], Optional[Any], Optional[Any]]:
+        """Retrieve the annotation's evaluator revision, creating a simple
+        evaluator shaped after `data` when the referenced one does not exist.
+        """
+        simple_evaluator_slug = (
+            references.evaluator.slug if references.evaluator else None
+        ) or uuid4().hex[-12:]
+
+        simple_evaluator_flags = SimpleEvaluatorFlags(
+            is_evaluator=True,
+        )
+
+        (
+            evaluator_revision,
+            _,
+            retrieval_info,
+        ) = await self.evaluators_service.retrieve_evaluator_revision(
+            project_id=project_id,
+            #
+            evaluator_ref=references.evaluator,
+            evaluator_variant_ref=references.evaluator_variant,
+            evaluator_revision_ref=references.evaluator_revision,
+        )
+
+        if evaluator_revision is None:
+            builder = SchemaBuilder()
+            builder.add_object(data)
+            evaluator_outputs_schema: Dict[str, Any] = builder.to_schema()
+
+            simple_evaluator_data = SimpleEvaluatorData(
+                uri=ANNOTATION_URI,
+                schemas=dict(
+                    outputs=evaluator_outputs_schema,
+                ),
+            )
+
+            simple_evaluator_create = SimpleEvaluatorCreate(
+                slug=simple_evaluator_slug,
+                #
+                name=simple_evaluator_slug,
+                #
+                flags=simple_evaluator_flags,
+                #
+                data=simple_evaluator_data,
+            )
+
+            simple_evaluator = await self.simple_evaluators_service.create(
+                project_id=project_id,
+                user_id=user_id,
+                #
+                simple_evaluator_create=simple_evaluator_create,
+            )
+
+            if simple_evaluator:
+                (
+                    evaluator_revision,
+                    _,
+                    retrieval_info,
+                ) = await self.evaluators_service.retrieve_evaluator_revision(
+                    project_id=project_id,
+                    #
+                    evaluator_ref=Reference(id=simple_evaluator.id),
+                )
+        elif evaluator_revision.evaluator_id:
+            simple_evaluator = await self.simple_evaluators_service.fetch(
+                project_id=project_id,
+                evaluator_id=evaluator_revision.evaluator_id,
+            )
+        else:
+            simple_evaluator = None
+
+        return evaluator_revision, simple_evaluator, retrieval_info
+
+    async def _resolve_evaluator_once(
+        self,
+        evaluators: Dict[str, Any],
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        references: SimpleTraceReferences,
+        data: Data,
+    ) -> Tuple[Any, Optional[Any], Optional[Any]]:
+        """`_resolve_evaluator`, memoized per evaluator reference in `evaluators`.
+
+        Items without an evaluator id or slug get an evaluator of their own, as
+        in `create`, so they are resolved one by one.
+        """
+        if not references.evaluator or not (
+            references.evaluator.id or references.evaluator.slug
+        ):
+            resolved = await self._resolve_evaluator(
+                project_id=project_id,
+                user_id=user_id,
+                #
+                references=references,
+                data=data,
+            )
+        else:
+            key = dumps(
+                [
+                    references.evaluator,
+                    references.evaluator_variant,
+                    references.evaluator_revision,
+                ],
+                default=lambda reference: reference.model_dump(mode="json"),
+                sort_keys=True,
+            )
+
+            if key not in evaluators:
+                try:
+                    evaluators[key] = await self._resolve_evaluator(
+                        project_id=project_id,
+                        user_id=user_id,
+                        #
+                        references=references,
+                        data=data,
+                    )
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    evaluators[key] = e
+
+            resolved = evaluators[key]
+
+            if isinstance(resolved, Exception):
+                raise resolved
+
+        evaluator_revision, simple_evaluator, retrieval_info = resolved
+
+        if not evaluator_revision or not evaluator_revision.data:
+            raise ValueError("Evaluator not found")
+
+        return evaluator_revision, simple_evaluator, retrieval_info
+
+    async def _ingest_annotation_spans(
+        self,
+        *,
+        organization_id: UUID,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        spans: List[OTelFlatSpan],
+        indices: List[int],
+        results: List[AnnotationBulkResult],
+    ) -> List[AnnotationBulkResult]:
+        if not spans:
+            return results
+
+        try:
+            links = await self.tracing_service.ingest_spans(
+                organization_id=organization_id,
+                project_id=project_id,
+                user_id=user_id,
+                spans=spans,
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            log.error("Failed to ingest annotations", exc_info=True)
+
+            for index in indices:
+                results[index].error = str(e)
+
+            return results
+
+        # The ingested links carry normalized hex ids, whatever form was sent
+        ingested = {
+            _parse_trace_id(link.trace_id): link
+            for link in links or []
+            if link.trace_id and link.span_id
+        }
+
+        for index, span in zip(indices, spans):
+            link = ingested.get(_parse_trace_id(span.trace_id))
+
+            if link is None:
+                results[index].error = "Failed to ingest annotation"
+                continue
+
+            results[index].annotation_link = Link(
+                trace_id=link.trace_id,
+                span_id=link.span_id,
+            )
+
+        return results
+
+    @staticmethod
+    def _annotation_flags(
+        *,
+        origin: AnnotationOrigin,
+        kind: AnnotationKind,
+        channel: AnnotationChannel,
+    ) -> AnnotationFlags:
+        return AnnotationFlags(
+            is_evaluator=True,
+            is_custom=origin == AnnotationOrigin.CUSTOM,
+            is_feedback=origin == AnnotationOrigin.HUMAN,
+            is_sdk=channel == AnnotationChannel.SDK,
+            is_web=channel == AnnotationChannel.WEB,
+            is_evaluation=kind == AnnotationKind.EVAL,
+        )
+
+    @staticmethod
+    def _annotation_references(
+        *,
+        references: SimpleTraceReferences,
+        retrieval_info: Optional[Any],
+    ) -> AnnotationReferences:
+        reference_dict = references.model_dump()
+        if retrieval_info:
+            if retrieval_info.references:
+                reference_dict.update(retrieval_info.references)
+            if retrieval_info.selector:
+                reference_dict["selector"] = retrieval_info.selector
+
+        return AnnotationReferences(**reference_dict)
+
+    @staticmethod
+    def _annotation_attributes(
+        *,
         flags: AnnotationFlags,
         tags: Optional[Tags] = None,
         meta: Optional[Meta] = None,
@@ -552,24 +850,16 @@ class AnnotationsService:
         data: Data,
         #
         references: AnnotationReferences,
-        links: AnnotationLinks,
-    ) -> Optional[Link]:
-        trace_id = uuid4().hex
-        span_id = uuid4().hex[16:]
-        span_type = SpanType.TASK
-        span_name = name or references.evaluator.slug or "annotation"
-
+    ) -> Dict[str, Any]:
         _references = references.model_dump(
             mode="json",
             exclude_none=True,
             exclude_unset=True,
         )
 
-        _links = build_otel_links(links)
-
         _flags = flags.model_dump(mode="json", exclude_none=True)
 
-        _attributes = build_simple_trace_attributes(
+        return build_simple_trace_attributes(
             flags=_flags,
             tags=tags,
             meta=meta,
@@ -577,20 +867,98 @@ class AnnotationsService:
             references=_references,
         )
 
+    def _build_annotation_span(
+        self,
+        *,
+        name: Optional[str],
+        #
+        flags: AnnotationFlags,
+        tags: Optional[Tags] = None,
+        meta: Optional[Meta] = None,
+        #
+        data: Data,
+        #
+        references: AnnotationReferences,
+        links: AnnotationLinks,
+    ) -> OTelFlatSpan:
+        return OTelFlatSpan(
+            trace_id=uuid4().hex,
+            span_id=uuid4().hex[16:],
+            span_type=SpanType.TASK,
+            span_name=name or references.evaluator.slug or "annotation",
+            attributes=self._annotation_attributes(
+                flags=flags,
+                tags=tags,
+                meta=meta,
+                data=data,
+                references=references,
+            ),
+            links=build_otel_links(links),
+        )
+
+    def _build_annotation_edit_span(
+        self,
+        *,
+        annotation: Annotation,
+        #
+        flags: AnnotationFlags,
+        tags: Optional[Tags] = None,
+        meta: Optional[Meta] = None,
+        #
+        data: Data,
+        #
+        references: AnnotationReferences,
+        links: AnnotationLinks,
+    ) -> OTelFlatSpan:
+        return OTelFlatSpan(
+            trace_id=annotation.trace_id,
+            span_id=annotation.span_id,
+            attributes=self._annotation_attributes(
+                flags=flags,
+                tags=tags,
+                meta=meta,
+                data=data,
+                references=references,
+            ),
+            links=build_otel_links(links),
+        )
+
+    async def _create_annotation(
+        self,
+        *,
+        organization_id: UUID,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        name: Optional[str],
+        #
+        flags: AnnotationFlags,
+        tags: Optional[Tags] = None,
+        meta: Optional[Meta] = None,
+        #
+        data: Data,
+        #
+        references: AnnotationReferences,
+        links: AnnotationLinks,
+    ) -> Optional[Link]:
+        span = self._build_annotation_span(
+            name=name,
+            #
+            flags=flags,
+            tags=tags,
+            meta=meta,
+            #
+            data=data,
+            #
+            references=references,
+            links=links,
+        )
+
         links = await self.tracing_service.create_trace(
             organization_id=organization_id,
             project_id=project_id,
             user_id=user_id,
-            spans=[
-                OTelFlatSpan(
-                    trace_id=trace_id,
-                    span_id=span_id,
-                    span_type=span_type,
-                    span_name=span_name,
-                    attributes=_attributes,
-                    links=_links,
-                )
-            ],
+            spans=[span],
         )
 
         _link = first_link(links)
@@ -704,36 +1072,24 @@ class AnnotationsService:
         if not annotation.trace_id or not annotation.span_id:
             return None
 
-        _references = references.model_dump(
-            mode="json",
-            exclude_none=True,
-            exclude_unset=True,
-        )
-
-        _links = build_otel_links(links)
-
-        _flags = flags.model_dump(mode="json", exclude_none=True)
-
-        _attributes = build_simple_trace_attributes(
-            flags=_flags,
+        span = self._build_annotation_edit_span(
+            annotation=annotation,
+            #
+            flags=flags,
             tags=tags,
             meta=meta,
+            #
             data=data,
-            references=_references,
+            #
+            references=references,
+            links=links,
         )
 
         links = await self.tracing_service.edit_trace(
             organization_id=organization_id,
             project_id=project_id,
             user_id=user_id,
-            spans=[
-                OTelFlatSpan(
-                    trace_id=annotation.trace_id,
-                    span_id=annotation.span_id,
-                    attributes=_attributes,
-                    links=_links,
-                )
-            ],
+            spans=[span],
         )
 
         _link = first_link(links)
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from oss.src.core.shared.dtos import Reference
+from pydantic import BaseModel
+
+from oss.src.core.shared.dtos import Link, Reference
 from oss.src.core.workflows.dtos import (
     WorkflowFlags,
     WorkflowQueryFlags,
@@ -55,3 +57,13 @@ class AnnotationEdit(SimpleTraceEdit):
 
 class AnnotationQuery(SimpleTraceQuery):
     pass
+
+
+class AnnotationBulkEdit(AnnotationEdit):
+    trace_id: str
+    span_id: Optional[str] = None
+
+
+class AnnotationBulkResult(BaseModel):
+    annotation_link: Optional[Link] = None
+    error: Optional[str] = None
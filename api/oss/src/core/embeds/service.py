@@ -9,7 +9,14 @@ from typing import Optional, Dict, Any
 from uuid import UUID
 
 from oss.src.utils.logging import get_module_logger
-from oss.src.core.embeds.utils import resolve_embeds, create_universal_resolver
+from oss.src.core.embeds.utils import (
+    cache_resolved_configuration,
+    configuration_cache_key,
+    create_universal_resolver,
+    fetch_resolved_configuration,
+    record_dependencies,
+    resolve_embeds,
+)
 from oss.src.core.embeds.dtos import ErrorPolicy, ResolutionInfo
 
 
@@ -47,6 +54,8 @@ class EmbedsService:
         max_embeds: int = 100,
         error_policy: ErrorPolicy = ErrorPolicy.EXCEPTION,
         include_archived: Optional[bool] = True,
+        #
+        revision_id: Optional[UUID] = None,
     ) -> tuple[Dict[str, Any], ResolutionInfo]:
         """
         Resolve embedded references in a configuration.
@@ -60,10 +69,28 @@ class EmbedsService:
             max_embeds: Maximum total embeds allowed (default: 100)
             error_policy: How to handle errors (EXCEPTION, PLACEHOLDER, KEEP)
             include_archived: Include archived entities
+            revision_id: Stored revision the configuration belongs to; when set,
+                the result is cached under it until an embedded entity moves
 
         Returns:
             Tuple of (resolved configuration dict, ResolutionInfo metadata)
         """
+        cache_key = configuration_cache_key(
+            revision_id=revision_id,
+            include_archived=include_archived,
+            max_depth=max_depth,
+            max_embeds=max_embeds,
+            error_policy=error_policy,
+        )
+
+        if cache_key is not None:
+            cached = await fetch_resolved_configuration(
+                project_id=project_id,
+                key=cache_key,
+            )
+            if cached is not None:
+                return cached
+
         # Create universal resolver with all available services
         resolver_callback = create_universal_resolver(
             project_id=project_id,
@@ -75,6 +102,15 @@ class EmbedsService:
             evaluators_service=self.evaluators_service,
         )
 
+        stamps: Dict[str, Optional[str]] = {}
+
+        if cache_key is not None:
+            resolver_callback = record_dependencies(
+                resolver_callback,
+                stamps,
+                project_id=project_id,
+            )
+
         # Resolve embeds
         resolved_config, resolution_info = await resolve_embeds(
             configuration=configuration,
@@ -84,4 +120,14 @@ class EmbedsService:
             error_policy=error_policy,
         )
 
+        # Placeholders for failed embeds are not worth keeping
+        if cache_key is not None and not resolution_info.errors:
+            await cache_resolved_configuration(
+                project_id=project_id,
+                key=cache_key,
+                configuration=resolved_config,
+                resolution_info=resolution_info,
+                stamps=stamps,
+            )
+
         return resolved_config, resolution_info
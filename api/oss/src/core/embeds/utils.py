@@ -5,13 +5,16 @@ These functions are called by services (WorkflowsService, EnvironmentsService)
 to resolve embedded references in their configurations.
 """
 
-from typing import Dict, Any, List, Set, Callable, Awaitable, Optional, Tuple
+from typing import Dict, Any, List, Set, Callable, Awaitable, Optional, Tuple, Union
 from copy import deepcopy
+from uuid import uuid4
 from json import dumps
+import asyncio
 import re
 
 from agenta.sdk.utils.resolvers import resolve_any
 from oss.src.utils.logging import get_module_logger
+from oss.src.utils.caching import get_cache, invalidate_cache, set_cache
 from oss.src.core.embeds.dtos import (
     ObjectEmbed,
     StringEmbed,
@@ -41,6 +44,21 @@ AG_EMBED_KEY = "@ag.embed"
 AG_REFERENCES_KEY = "@ag.references"
 AG_SELECTOR_KEY = "@ag.selector"
 SNIPPET_DEFAULT_PATH = "prompt.messages.0.content"
+MAX_CONCURRENT_RESOLUTIONS = 10  # resolver calls in flight per resolution
+
+# Revisions fetched by id never change their data, so they are shared across
+# resolutions. Everything else (slugs, versions, variants, artifacts) moves on
+# commit or deploy and is fetched every time.
+EMBEDS_REVISION_CACHE_NAMESPACE = "embeds:revision"
+EMBEDS_REVISION_CACHE_TTL = 5 * 60  # 5 minutes
+
+# Resolved configurations of a stored revision are keyed by that revision's id
+# and remember a stamp for every revision, variant and artifact they embedded.
+# Commits, deploys and edits drop the stamps of what they touch, so a cached
+# result is served only while none of its dependencies has moved.
+EMBEDS_CONFIGURATION_CACHE_NAMESPACE = "embeds:configuration"
+EMBEDS_DEPENDENCY_CACHE_NAMESPACE = "embeds:dependency"
+EMBEDS_CONFIGURATION_CACHE_TTL = 5 * 60  # 5 minutes
 
 # Entity hierarchy: category → ordered levels (shallow to deep)
 ENTITY_HIERARCHY: Dict[str, List[str]] = {
@@ -254,6 +272,35 @@ def create_universal_resolver(
         return None
 
     async def resolver_callback(references: Dict[str, Reference]) -> Dict[str, Any]:
+        cache_key = _revision_cache_key(
+            references=references,
+            include_archived=include_archived,
+        )
+
+        if cache_key is None:
+            return await _resolve_uncached(references)
+
+        cached = await get_cache(
+            namespace=EMBEDS_REVISION_CACHE_NAMESPACE,
+            project_id=str(project_id),
+            key=cache_key,
+        )
+        if cached is not None:
+            return cached
+
+        resolved = await _resolve_uncached(references)
+
+        await set_cache(
+            namespace=EMBEDS_REVISION_CACHE_NAMESPACE,
+            project_id=str(project_id),
+            key=cache_key,
+            value=resolved,
+            ttl=EMBEDS_REVISION_CACHE_TTL,
+        )
+
+        return resolved
+
+    async def _resolve_uncached(references: Dict[str, Reference]) -> Dict[str, Any]:
         # Parse all entity types to extract category and levels.
         # All references are guaranteed same-family by _resolve_references.
         parsed: Dict[str, Reference] = {}  # level -> ref
@@ -514,6 +561,302 @@ def create_universal_resolver(
     return resolver_callback
 
 
+def _revision_cache_key(
+    *,
+    references: Dict[str, Reference],
+    include_archived: Any,
+) -> Optional[str]:
+    """
+    Cache key for a reference bundle that pins an immutable revision, else None.
+
+    Only bundles whose deepest level is a revision addressed by id qualify.
+    Lookups that exclude archived entities are never cached: archiving does not
+    touch the revision data, but it does flip the lookup to "not found".
+    """
+    if include_archived is not True:
+        return None
+
+    revision_refs = [
+        ref
+        for entity_type, ref in references.items()
+        if entity_type.endswith("_revision")
+    ]
+    if len(revision_refs) != 1 or revision_refs[0].id is None:
+        return None
+
+    return _references_key(references)
+
+
+def configuration_cache_key(
+    *,
+    revision_id: Any,  # UUID
+    include_archived: Any,
+    max_depth: int,
+    max_embeds: int,
+    error_policy: ErrorPolicy,
+) -> Optional[str]:
+    """
+    Cache key for the resolved configuration of a stored revision, else None.
+
+    As with revisions, lookups that exclude archived entities are not cached.
+    """
+    if include_archived is not True or revision_id is None:
+        return None
+
+    return f"{revision_id}:{max_depth}:{max_embeds}:{ErrorPolicy(error_policy).value}"
+
+
+def embedded_dependencies(
+    *,
+    references: Dict[str, Reference],
+    resolved: Any,
+) -> List[str]:
+    """
+    Ids a resolved embed depends on.
+
+    An embed pinned to a revision moves only when that revision is edited; one
+    addressed by variant or artifact also moves with every commit to them.
+    """
+    if not isinstance(resolved, dict) or not resolved.get("id"):
+        return []
+
+    if any(entity_type.endswith("_revision") for entity_type in references):
+        keys = ("id",)
+    else:
+        keys = ("id", "variant_id", "artifact_id")
+
+    return [str(resolved[key]) for key in keys if resolved.get(key)]
+
+
+async def _snapshot_stamps(
+    *,
+    project_id: Any,  # UUID
+    ids: List[str],
+) -> Dict[str, str]:
+    """Current stamp of each id, minting the missing ones."""
+    stamps: Dict[str, str] = {}
+
+    for id in ids:
+        stamp = await get_cache(
+            namespace=EMBEDS_DEPENDENCY_CACHE_NAMESPACE,
+            project_id=str(project_id),
+            key=id,
+            retry=False,
+        )
+
+        if stamp is None:
+            stamp = uuid4().hex
+
+            # Outlives the entries that record it, which then expire first
+            await set_cache(
+                namespace=EMBEDS_DEPENDENCY_CACHE_NAMESPACE,
+                project_id=str(project_id),
+                key=id,
+                value=stamp,
+                ttl=2 * EMBEDS_CONFIGURATION_CACHE_TTL,
+            )
+
+        stamps[id] = stamp
+
+    return stamps
+
+
+def record_dependencies(
+    resolver_callback: Callable[[Dict[str, Reference]], Awaitable[Dict[str, Any]]],
+    stamps: Dict[str, Optional[str]],
+    *,
+    project_id: Any,  # UUID
+) -> Callable[[Dict[str, Reference]], Awaitable[Dict[str, Any]]]:
+    """
+    Wrap a resolver so that every embed it resolves adds the stamps of its
+    dependencies to `stamps`.
+
+    A stamp is taken before the data it vouches for is read, so a move racing
+    the resolution drops a stamp the cached result already carries. Ids known
+    only from the result are stamped and then resolved once more. A dependency
+    that moved in between is recorded without a stamp, which keeps the result
+    out of the cache.
+    """
+
+    async def recording_callback(references: Dict[str, Reference]) -> Dict[str, Any]:
+        snapshot: Dict[str, Optional[str]] = dict(
+            await _snapshot_stamps(
+                project_id=project_id,
+                ids=sorted({str(ref.id) for ref in references.values() if ref.id}),
+            )
+        )
+
+        resolved = await resolver_callback(references)
+
+        dependencies = embedded_dependencies(references=references, resolved=resolved)
+        unstamped = [
+            dependency for dependency in dependencies if dependency not in snapshot
+        ]
+
+        if unstamped:
+            snapshot.update(
+                await _snapshot_stamps(project_id=project_id, ids=unstamped)
+            )
+
+            resolved = await resolver_callback(references)
+
+            moved = embedded_dependencies(references=references, resolved=resolved)
+            if moved != dependencies:
+                dependencies = moved
+                snapshot = {}
+
+        for dependency in dependencies:
+            stamp = snapshot.get(dependency)
+            stamps[dependency] = (
+                stamp if stamps.get(dependency, stamp) == stamp else None
+            )
+
+        return resolved
+
+    return recording_callback
+
+
+async def fetch_resolved_configuration(
+    *,
+    project_id: Any,  # UUID
+    key: str,
+) -> Optional[Tuple[Dict[str, Any], ResolutionInfo]]:
+    """A cached resolution, unless any of the stamps it recorded has moved."""
+    cached = await get_cache(
+        namespace=EMBEDS_CONFIGURATION_CACHE_NAMESPACE,
+        project_id=str(project_id),
+        key=key,
+    )
+
+    if not isinstance(cached, dict):
+        return None
+
+    stamps: Dict[str, str] = cached.get("stamps") or {}
+
+    current = await asyncio.gather(
+        *(
+            get_cache(
+                namespace=EMBEDS_DEPENDENCY_CACHE_NAMESPACE,
+                project_id=str(project_id),
+                key=dependency,
+                retry=False,
+            )
+            for dependency in stamps
+        )
+    )
+
+    if list(stamps.values()) != list(current):
+        return None
+
+    return (
+        cached["configuration"],
+        ResolutionInfo.model_validate(cached["resolution_info"]),
+    )
+
+
+async def cache_resolved_configuration(
+    *,
+    project_id: Any,  # UUID
+    key: str,
+    configuration: Dict[str, Any],
+    resolution_info: ResolutionInfo,
+    stamps: Dict[str, Optional[str]],
+) -> None:
+    """Store a resolution along with the stamps recorded while resolving it."""
+    # A dependency that moved mid-resolution has no stamp to check against
+    if any(stamp is None for stamp in stamps.values()):
+        return
+
+    await set_cache(
+        namespace=EMBEDS_CONFIGURATION_CACHE_NAMESPACE,
+        project_id=str(project_id),
+        key=key,
+        value={
+            "configuration": configuration,
+            "resolution_info": resolution_info.model_dump(mode="json"),
+            "stamps": dict(sorted(stamps.items())),
+        },
+        ttl=EMBEDS_CONFIGURATION_CACHE_TTL,
+    )
+
+
+async def invalidate_resolved_configurations(
+    *,
+    project_id: Any,  # UUID
+    ids: List[Any],  # UUIDs
+) -> None:
+    """Drop the stamps of moved entities, invalidating every result embedding them."""
+    for id in {str(id) for id in ids if id}:
+        await invalidate_cache(
+            namespace=EMBEDS_DEPENDENCY_CACHE_NAMESPACE,
+            project_id=str(project_id),
+            key=id,
+        )
+
+
+def _references_key(references: Dict[str, Reference]) -> str:
+    """Stable identity of a reference bundle, for memoization."""
+    return "|".join(
+        f"{entity_type}={ref.id or ''}/{ref.slug or ''}/{ref.version or ''}"
+        for entity_type, ref in sorted(references.items())
+    )
+
+
+class _ResolverMemo:
+    """
+    Memoizing, concurrency-bounded front for a resolver callback.
+
+    One memo lives for one top-level resolve_embeds() call (nested resolutions
+    share it), so a reference embedded in many places is fetched once. Every
+    caller receives its own deep copy, because inlined values are mutated by
+    later iterations. Failures are memoized too and re-raised to every caller.
+    """
+
+    def __init__(
+        self,
+        resolver_callback: Callable[[Dict[str, Reference]], Awaitable[Dict[str, Any]]],
+        max_concurrency: int = MAX_CONCURRENT_RESOLUTIONS,
+    ):
+        self.resolver_callback = resolver_callback
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: Dict[str, "asyncio.Future[Any]"] = {}
+
+    async def __call__(self, references: Dict[str, Reference]) -> Any:
+        key = _references_key(references)
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(references))
+            self._tasks[key] = task
+
+        return deepcopy(await asyncio.shield(task))
+
+    async def _fetch(self, references: Dict[str, Reference]) -> Any:
+        async with self._semaphore:
+            return await self.resolver_callback(references)
+
+    def peek(self, references: Dict[str, Reference]) -> Any:
+        """Return an already resolved value (not a copy), or None."""
+        task = self._tasks.get(_references_key(references))
+        if task is None or not task.done() or task.cancelled():
+            return None
+        if task.exception() is not None:
+            return None
+        return task.result()
+
+    async def prefetch(self, bundles: List[Dict[str, Reference]]) -> None:
+        """Resolve bundles concurrently; errors stay memoized for the caller."""
+        tasks = []
+        for references in bundles:
+            key = _references_key(references)
+            if key not in self._tasks:
+                self._tasks[key] = asyncio.ensure_future(self._fetch(references))
+            tasks.append(self._tasks[key])
+
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def resolve_embeds(
     *,
     configuration: Dict[str, Any],
@@ -532,6 +875,11 @@ async def resolve_embeds(
     3. Inlines the resolved values
     4. Handles cycles, depth limits, and errors
 
+    Each distinct reference is fetched once per call (nested resolutions
+    included), and the references found at one level are fetched concurrently
+    before they are inlined in order. After the first level, only the subtrees
+    that were just inlined are scanned again.
+
     Args:
         configuration: Config with potential embeds
         resolver_callback: Async function that fetches entity by Dict[entity_type, reference]
@@ -550,6 +898,10 @@ async def resolve_embeds(
     # Work on a copy to avoid mutating input
     config_copy = deepcopy(configuration)
 
+    # Nested resolutions reuse the memo of the resolution that started them
+    if not isinstance(resolver_callback, _ResolverMemo):
+        resolver_callback = _ResolverMemo(resolver_callback)
+
     depth = 0
     total_embeds = 0
     depth_reached = 0
@@ -558,19 +910,35 @@ async def resolve_embeds(
     failed_locations: Set[str] = set()  # Track failed embeds to skip on KEEP policy
     # Track which iteration each canonical was resolved in for circular detection
     seen_by_iteration: Dict[str, int] = {}
+    # Locations inlined by the previous iteration (None: scan the whole config)
+    modified_locations: Optional[List[str]] = None
 
     while depth < max_depth:
         # Find embeds in current config state
-        object_embeds = find_object_embeds(config_copy)
-        string_embeds = find_string_embeds(config_copy)
-        shorthand_embeds = find_snippet_embeds(config_copy)
+        object_embeds, string_embeds, shorthand_embeds = _find_embeds(
+            config=config_copy,
+            locations=modified_locations,
+        )
 
         if not object_embeds and not string_embeds and not shorthand_embeds:
             # No more embeds to resolve
             break
 
+        # Fetch every distinct reference of this level up front, concurrently
+        await _prefetch_embed_references(
+            embeds=[
+                embed
+                for embed in [*object_embeds, *string_embeds, *shorthand_embeds]
+                if embed.location not in failed_locations
+            ],
+            memo=resolver_callback,
+            seen_by_iteration=seen_by_iteration,
+            current_iteration=depth,
+        )
+
         # Track if we processed any embeds this iteration
         processed_any = False
+        modified_locations = []
 
         # Resolve object embeds first (structural replacement)
         for embed in object_embeds:
@@ -591,6 +959,7 @@ async def resolve_embeds(
                     error_policy=error_policy,
                 )
                 references_used.append(embed.references)
+                modified_locations.append(embed.location)
                 total_embeds += 1 + nested_embeds
                 depth_reached = max(depth_reached, depth + 1 + nested_depth)
                 processed_any = True
@@ -629,6 +998,7 @@ async def resolve_embeds(
                     error_policy=error_policy,
                 )
                 references_used.append(embed.references)
+                modified_locations.append(embed.location)
                 total_embeds += 1 + nested_embeds
                 depth_reached = max(depth_reached, depth + 1 + nested_depth)
                 processed_any = True
@@ -665,6 +1035,7 @@ async def resolve_embeds(
                     error_policy=error_policy,
                 )
                 references_used.append(embed.references)
+                modified_locations.append(embed.location)
                 total_embeds += 1 + nested_embeds
                 depth_reached = max(depth_reached, depth + 1 + nested_depth)
                 processed_any = True
@@ -701,6 +1072,149 @@ async def resolve_embeds(
     return (config_copy, resolution_info)
 
 
+def _find_embeds(
+    *,
+    config: Dict[str, Any],
+    locations: Optional[List[str]] = None,
+) -> Tuple[List[ObjectEmbed], List[StringEmbed], List[SnippetEmbed]]:
+    """
+    Find object, string and snippet embeds in the whole config, or only in the
+    subtrees at the given locations.
+
+    Embed locations are identical to those of a full scan.
+    """
+    if locations is None:
+        return (
+            find_object_embeds(config),
+            find_string_embeds(config),
+            find_snippet_embeds(config),
+        )
+
+    object_embeds: List[ObjectEmbed] = []
+    string_embeds: List[StringEmbed] = []
+    snippet_embeds: List[SnippetEmbed] = []
+
+    for location in _outermost_locations(locations):
+        try:
+            value = extract_path(config, location)
+        except PathExtractionError:
+            continue
+
+        # Scan {key: value} from the parent path: string finders only look at
+        # strings held by a container, and this keeps locations absolute.
+        parent_path, _, key = location.rpartition(".")
+        scope = {key: value}
+
+        object_embeds.extend(find_object_embeds(scope, parent_path))
+        string_embeds.extend(find_string_embeds(scope, parent_path))
+        snippet_embeds.extend(find_snippet_embeds(scope, parent_path))
+
+    return (object_embeds, string_embeds, snippet_embeds)
+
+
+def _outermost_locations(locations: List[str]) -> List[str]:
+    """Deduplicate locations, dropping those nested under another one."""
+    unique = list(dict.fromkeys(locations))
+    return [
+        location
+        for location in unique
+        if not any(
+            other != location and location.startswith(f"{other}.") for other in unique
+        )
+    ]
+
+
+async def _prefetch_embed_references(
+    *,
+    embeds: List[Union[ObjectEmbed, StringEmbed, SnippetEmbed]],
+    memo: _ResolverMemo,
+    seen_by_iteration: Dict[str, int],
+    current_iteration: int,
+) -> None:
+    """
+    Warm the memo with every distinct reference of one level, concurrently.
+
+    Key-selector hops are prefetched as a second round once their targets are
+    known. Nothing is raised here: bundles that would fail validation or close
+    a cycle are left out, and fetch errors stay memoized, so the in-order pass
+    surfaces every error exactly as before, under the caller's error policy.
+    """
+
+    def _prefetchable(references: Optional[Dict[str, Reference]]) -> bool:
+        if not references:
+            return False
+        categories = {entity_type.split("_", 1)[0] for entity_type in references}
+        if len(categories) > 1:
+            return False
+        return not any(
+            seen_by_iteration.get(
+                f"{entity_type}:{canonicalize_reference(reference)}",
+                current_iteration,
+            )
+            < current_iteration
+            for entity_type, reference in references.items()
+        )
+
+    await memo.prefetch(
+        [embed.references for embed in embeds if _prefetchable(embed.references)]
+    )
+
+    hops: List[Dict[str, Reference]] = []
+    for embed in embeds:
+        selector_key = embed.selector.key if embed.selector else None
+        if selector_key is None or (
+            selector_key == "" and not isinstance(embed, SnippetEmbed)
+        ):
+            continue
+
+        resolved_value = memo.peek(embed.references)
+        if resolved_value is None:
+            continue
+
+        references = _key_hop_references(
+            resolved_value=resolved_value,
+            selector_key=selector_key,
+        )
+        if _prefetchable(references):
+            hops.append(references)
+
+    await memo.prefetch(hops)
+
+
+def _key_hop_references(
+    *,
+    resolved_value: Any,
+    selector_key: str,
+) -> Optional[Dict[str, Reference]]:
+    """References a key selector would follow, or None when it would fail."""
+    try:
+        references = _require_revision_data_references(resolved_value=resolved_value)
+    except PathExtractionError:
+        return None
+
+    if selector_key == "":
+        # Snippet auto-select: only defined for exactly one entry
+        if len(references) != 1:
+            return None
+        ref_entry = next(iter(references.values()))
+    else:
+        ref_entry = _lookup_reference_entry(
+            references=references,
+            selector_key=selector_key,
+        )
+
+    if not isinstance(ref_entry, dict) or not ref_entry:
+        return None
+
+    try:
+        return {
+            entity_type: Reference.model_validate(raw_ref)
+            for entity_type, raw_ref in ref_entry.items()
+        }
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
 async def _resolve_and_inline_object_embed(
     *,
     config: Dict[str, Any],
@@ -34,6 +34,7 @@ from oss.src.core.embeds.dtos import (
     ErrorPolicy,
     ResolutionInfo,
 )
+from oss.src.core.embeds.utils import invalidate_resolved_configurations
 
 from oss.src.core.events.utils import publish_revision_event
 from oss.src.core.git.dtos import (
@@ -726,6 +727,11 @@ class EnvironmentsService:
         if not revision:
             return None
 
+        await invalidate_resolved_configurations(
+            project_id=project_id,
+            ids=[revision.variant_id, revision.artifact_id],
+        )
+
         environment_revision = EnvironmentRevision(
             **revision.model_dump(
                 mode="json",
@@ -901,6 +907,7 @@ class EnvironmentsService:
             configuration=environment_revision.data.model_dump(mode="json")
             if environment_revision.data
             else {},
+            revision_id=environment_revision.id,
         )
 
         if environment_revision.data:
@@ -932,6 +939,11 @@ class EnvironmentsService:
         if not revision:
             return None
 
+        await invalidate_resolved_configurations(
+            project_id=project_id,
+            ids=[revision.id],
+        )
+
         environment_revision = EnvironmentRevision(
             **revision.model_dump(
                 mode="json",
@@ -1115,6 +1127,11 @@ class EnvironmentsService:
         if not revision:
             return None
 
+        await invalidate_resolved_configurations(
+            project_id=project_id,
+            ids=[revision.variant_id, revision.artifact_id],
+        )
+
         environment_revision = EnvironmentRevision(
             **revision.model_dump(
                 mode="json",
@@ -1333,6 +1350,7 @@ class EnvironmentsService:
             max_embeds=max_embeds,
             error_policy=ErrorPolicy(error_policy),
             include_archived=include_archived,
+            revision_id=revision.id,
         )
 
         revision.data = EnvironmentRevisionData(**revision_data)
@@ -8,7 +8,7 @@ from agenta.sdk.evaluations.runtime.models import (
 )
 from agenta.sdk.models.evaluations import EvaluationStatus as SDKEvaluationStatus
 
-from oss.src.core.evaluations.runtime.cache import RunnableCacheResolver
+from oss.src.core.evaluations.runtime.cache import CacheLookup, RunnableCacheResolver
 from oss.src.core.evaluations.types import (
     EvaluationClosedConflict,
     EvaluationMetricsRefresh,
@@ -598,17 +598,20 @@ class APICachedRunner:
         # hash_id and the next run cannot reuse this trace by hash.
         missing_hash_ids: List[Optional[str]] = []
 
-        for idx, request in enumerate(requests):
-            cache = await self.cache_resolver.resolve(
-                project_id=project_id,
-                #
-                enabled=self.enabled and self.tracing_service is not None,
-                #
-                references=request.references,
-                links=request.links,
-                #
-                required_count=1,
-            )
+        caches = await self.cache_resolver.resolve_many(
+            project_id=project_id,
+            #
+            enabled=self.enabled and self.tracing_service is not None,
+            #
+            lookups=[
+                CacheLookup(references=request.references, links=request.links)
+                for request in requests
+            ],
+            #
+            required_count=1,
+        )
+
+        for idx, (request, cache) in enumerate(zip(requests, caches)):
             reusable = cache.reusable_traces[0] if cache.reusable_traces else None
             if reusable and getattr(reusable, "trace_id", None):
                 results[idx] = WorkflowExecutionResult(
@@ -12,6 +12,11 @@ from oss.src.core.evaluations.utils import (
 from oss.src.core.tracing.service import TracingService
 
 
+class CacheLookup(BaseModel):
+    references: Optional[Dict[str, Any]] = None
+    links: Optional[Dict[str, Any]] = None
+
+
 class CacheResolution(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -44,33 +49,62 @@ class RunnableCacheResolver:
         #
         required_count: int = 1,
     ) -> CacheResolution:
-        hash_id = make_hash(
-            references=references,
-            links=links,
-        )
-
-        if not enabled or not hash_id or required_count <= 0:
-            return CacheResolution(
-                hash_id=hash_id,
-                reusable_traces=[],
-                missing_count=max(0, required_count),
+        return (
+            await self.resolve_many(
+                project_id=project_id,
+                #
+                enabled=enabled,
+                #
+                lookups=[CacheLookup(references=references, links=links)],
+                #
+                required_count=required_count,
             )
+        )[0]
 
-        cached_traces = await self._traces.fetch_traces_by_hash(
-            project_id=project_id,
-            hash_id=hash_id,
-            limit=required_count,
-        )
-        reusable_traces = select_traces_for_reuse(
-            traces=cached_traces,
-            required_count=required_count,
-        )
-
-        return CacheResolution(
-            hash_id=hash_id,
-            reusable_traces=reusable_traces,
-            missing_count=plan_missing_traces(
+    async def resolve_many(
+        self,
+        *,
+        project_id: UUID,
+        #
+        enabled: bool,
+        #
+        lookups: List[CacheLookup],
+        #
+        required_count: int = 1,
+    ) -> List[CacheResolution]:
+        """Resolve a slice of cells at once: one trace lookup covers all their hashes."""
+        hash_ids = [
+            make_hash(
+                references=lookup.references,
+                links=lookup.links,
+            )
+            for lookup in lookups
+        ]
+
+        cached_traces: Dict[str, Any] = {}
+        if enabled and required_count > 0:
+            cached_traces = await self._traces.fetch_traces_by_hashes(
+                project_id=project_id,
+                hash_ids=[hash_id for hash_id in hash_ids if hash_id],
+                limit=required_count,
+            )
+
+        resolutions: List[CacheResolution] = []
+        for hash_id in hash_ids:
+            reusable_traces = select_traces_for_reuse(
+                traces=cached_traces.get(hash_id) if hash_id else None,
                 required_count=required_count,
-                reusable_count=len(reusable_traces),
-            ),
-        )
+            )
+
+            resolutions.append(
+                CacheResolution(
+                    hash_id=hash_id,
+                    reusable_traces=reusable_traces,
+                    missing_count=plan_missing_traces(
+                        required_count=required_count,
+                        reusable_count=len(reusable_traces),
+                    ),
+                )
+            )
+
+        return resolutions
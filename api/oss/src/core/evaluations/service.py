@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Tuple, Dict, Any, AsyncIterator, TYPE_CHECKING
 from uuid import UUID
 from asyncio import sleep
 from copy import deepcopy
@@ -108,6 +108,13 @@ from oss.src.core.evaluations.utils import (
 )
 
 from oss.src.core.evaluations.utils import get_metrics_keys_from_schema
+from oss.src.core.evaluations.utils import (
+    ExportKind,
+    export_result_columns,
+    export_metric_columns,
+    project_export_columns,
+    pivot_export_rows,
+)
 from oss.src.core.evaluations.runtime.topology import classify_run_topology
 from oss.src.core.evaluations.runtime.sources import SourceResolution
 from oss.src.core.evaluations.runtime.runner import TaskiqEvaluationTaskRunner
@@ -117,6 +124,9 @@ from oss.src.core.evaluations.runtime.operations import SliceOperations
 
 log = get_module_logger(__name__)
 
+# Scenarios pivoted per page of a columnar results export
+EXPORT_BATCH_SIZE = 1_000
+
 # Product policy toggle: when True, every evaluation run keeps a default queue
 # even when it has no human evaluators. Keep this as a global until the product
 # decision is finalized.
@@ -1248,6 +1258,116 @@ class EvaluationsService:
             windowing=windowing,
         )
 
+    async def export_results(
+        self,
+        *,
+        project_id: UUID,
+        #
+        run_id: UUID,
+        #
+        columns: Optional[List[str]] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> Optional[Tuple[Dict[str, ExportKind], AsyncIterator[List[Dict[str, Any]]]]]:
+        """A run's results pivoted to one row per scenario, page by page.
+
+        Returns the export schema (column name -> kind) and an iterator over
+        batches of rows, or None if the run does not exist. Columns are
+        `scenario_id`, `status`, one per step result field and one per metric
+        in the run-level metrics; `columns` projects them down, and only the
+        projected steps' results are read.
+        """
+        run = await self.fetch_run(
+            project_id=project_id,
+            #
+            run_id=run_id,
+        )
+
+        if not run:
+            return None
+
+        repeats = (run.data.repeats if run.data else None) or 1
+        step_keys = [step.key for step in (run.data.steps if run.data else None) or []]
+
+        run_metrics = await self.query_metrics(
+            project_id=project_id,
+            #
+            metric=EvaluationMetricsQuery(
+                run_id=run_id,
+                scenario_ids=False,
+            ),
+        )
+
+        schema: Dict[str, ExportKind] = {
+            "scenario_id": "string",
+            "status": "string",
+        } | project_export_columns(
+            columns=export_result_columns(step_keys=step_keys, repeats=repeats)
+            | export_metric_columns(metrics=run_metrics),
+            projection=columns,
+        )
+
+        projected_step_keys = [
+            step_key
+            for step_key in step_keys
+            if any(name.startswith(f"{step_key}.") for name in schema)
+        ]
+
+        async def _batches() -> AsyncIterator[List[Dict[str, Any]]]:
+            windowing = Windowing(limit=batch_size)
+
+            while True:
+                scenarios = await self.query_scenarios(
+                    project_id=project_id,
+                    #
+                    scenario=EvaluationScenarioQuery(run_id=run_id),
+                    #
+                    windowing=windowing,
+                )
+
+                if not scenarios:
+                    return
+
+                scenario_ids = [scenario.id for scenario in scenarios]
+
+                results = (
+                    await self.query_results(
+                        project_id=project_id,
+                        #
+                        result=EvaluationResultQuery(
+                            run_id=run_id,
+                            scenario_ids=scenario_ids,
+                            step_keys=projected_step_keys,
+                        ),
+                    )
+                    if projected_step_keys
+                    else []
+                )
+
+                metrics = await self.query_metrics(
+                    project_id=project_id,
+                    #
+                    metric=EvaluationMetricsQuery(
+                        run_id=run_id,
+                        scenario_ids=scenario_ids,
+                    ),
+                )
+
+                yield pivot_export_rows(
+                    scenarios=scenarios,
+                    results=results,
+                    metrics=metrics,
+                    #
+                    columns=schema,
+                    repeats=repeats,
+                )
+
+                if len(scenarios) < batch_size:
+                    return
+
+                windowing = Windowing(limit=batch_size, next=scenarios[-1].id)
+
+        return schema, _batches()
+
     async def refresh_metrics(
         self,
         *,
@@ -2,23 +2,13 @@ from typing import List, Tuple, Dict, Optional, Any, Literal
 from uuid import UUID
 from asyncio import sleep
 
+import orjson
+
 from oss.src.utils.logging import get_module_logger
 from oss.src.core.shared.dtos import Windowing
 from oss.src.core.shared.dtos import Trace
 from oss.src.core.shared.dtos import Traces
 from oss.src.core.tracing.utils.hashing import make_hash_id
-from oss.src.core.tracing.dtos import (
-    ComparisonOperator,
-    Condition,
-    Fields,
-    Filtering,
-    Focus,
-    Format,
-    Formatting,
-    ListOperator,
-    LogicalOperator,
-    TracingQuery,
-)
 
 # Divides cleanly into 1, 2, 3, 4, 5, 6, 8, 10, ...
 DEFAULT_BATCH_SIZE = 1 * 2 * 3 * 4 * 5
@@ -356,6 +346,186 @@ def _has_usable_root_span(trace: Any) -> bool:
     return False
 
 
+# - COLUMNAR EXPORT -------------------------------------------------------------
+
+# Cell fields exported for every (step, repeat) result
+RESULT_EXPORT_FIELDS = ("status", "trace_id", "testcase_id", "hash_id", "error")
+
+ExportKind = Literal["string", "float", "bool"]
+
+
+def _result_column_prefix(*, step_key: str, repeat_idx: int, repeats: int) -> str:
+    if repeats > 1:
+        return f"{step_key}.{repeat_idx}"
+    return step_key
+
+
+def export_result_columns(
+    *,
+    step_keys: List[str],
+    repeats: int,
+) -> Dict[str, ExportKind]:
+    """`<step>.<field>` columns, or `<step>.<repeat>.<field>` when repeated."""
+    columns: Dict[str, ExportKind] = {}
+
+    for step_key in step_keys:
+        for repeat_idx in range(max(repeats, 1)):
+            prefix = _result_column_prefix(
+                step_key=step_key,
+                repeat_idx=repeat_idx,
+                repeats=repeats,
+            )
+            for field in RESULT_EXPORT_FIELDS:
+                columns[f"{prefix}.{field}"] = "string"
+
+    return columns
+
+
+def export_metric_columns(
+    *,
+    metrics: List[Any],
+) -> Dict[str, ExportKind]:
+    """`<step>.<metric path>` columns, typed from the run-level metrics."""
+    columns: Dict[str, ExportKind] = {}
+
+    for metric in metrics:
+        for step_key, step_metrics in (metric.data or {}).items():
+            if not isinstance(step_metrics, dict):
+                continue
+
+            for path, stats in step_metrics.items():
+                metric_type = str((stats or {}).get("type") or "")
+
+                if metric_type.startswith("numeric"):
+                    kind: ExportKind = "float"
+                elif metric_type == "binary":
+                    kind = "bool"
+                else:
+                    kind = "string"
+
+                columns.setdefault(f"{step_key}.{path}", kind)
+
+    return columns
+
+
+def project_export_columns(
+    *,
+    columns: Dict[str, ExportKind],
+    projection: Optional[List[str]],
+) -> Dict[str, ExportKind]:
+    """Keep the columns named in `projection`, or nested under one of them.
+
+    A step key keeps all of that step's columns; `None` keeps everything.
+    """
+    if not projection:
+        return dict(columns)
+
+    return {
+        name: kind
+        for name, kind in columns.items()
+        if any(name == entry or name.startswith(f"{entry}.") for entry in projection)
+    }
+
+
+def _export_json(value: Any) -> str:
+    return orjson.dumps(value, default=str).decode("utf-8")
+
+
+def _export_metric_value(stats: Any, kind: ExportKind) -> Any:
+    """One scenario's metric value out of its (single-sample) stats."""
+    if not isinstance(stats, dict):
+        return None
+
+    if kind == "float":
+        mean = stats.get("mean")
+        return float(mean) if isinstance(mean, (int, float)) else None
+
+    freq = [
+        entry
+        for entry in stats.get("freq") or []
+        if isinstance(entry, dict) and entry.get("count")
+    ]
+
+    if kind == "bool":
+        if len(freq) == 1 and isinstance(freq[0].get("value"), bool):
+            return freq[0]["value"]
+        return None
+
+    if len(freq) == 1:
+        value = freq[0].get("value")
+        return value if isinstance(value, str) else _export_json(value)
+
+    return _export_json({k: v for k, v in stats.items() if k != "type"})
+
+
+def _export_result_value(result: Any, field: str) -> Optional[str]:
+    value = getattr(result, field, None)
+
+    if value is None:
+        return None
+    if field == "status":
+        return getattr(value, "value", str(value))
+    if field == "error":
+        return _export_json(value)
+
+    return str(value)
+
+
+def pivot_export_rows(
+    *,
+    scenarios: List[Any],
+    results: List[Any],
+    metrics: List[Any],
+    #
+    columns: Dict[str, ExportKind],
+    repeats: int,
+) -> List[Dict[str, Any]]:
+    """One row per scenario, one cell per result field and scenario metric.
+
+    Rows carry every name in `columns` (missing cells are None), so each batch
+    matches the export schema.
+    """
+    rows: Dict[UUID, Dict[str, Any]] = {}
+
+    for scenario in scenarios:
+        row: Dict[str, Any] = dict.fromkeys(columns)
+        row["scenario_id"] = str(scenario.id)
+        row["status"] = getattr(scenario.status, "value", scenario.status)
+        rows[scenario.id] = row
+
+    for result in results:
+        row = rows.get(result.scenario_id)
+        if row is None:
+            continue
+
+        prefix = _result_column_prefix(
+            step_key=result.step_key,
+            repeat_idx=result.repeat_idx or 0,
+            repeats=repeats,
+        )
+        for field in RESULT_EXPORT_FIELDS:
+            name = f"{prefix}.{field}"
+            if name in columns:
+                row[name] = _export_result_value(result, field)
+
+    # Later metrics (e.g. a refresh) override earlier ones
+    for metric in metrics:
+        row = rows.get(metric.scenario_id)
+        if row is None:
+            continue
+
+        for step_key, step_metrics in (metric.data or {}).items():
+            if not isinstance(step_metrics, dict):
+                continue
+
+            for path, stats in step_metrics.items():
+                name = f"{step_key}.{path}"
+                if name in columns:
+                    row[name] = _export_metric_value(stats, columns[name])
+
+    return list(rows.values())
+
+
 class TraceFetcher:
     """Owns the tracing service; per-call values are method params."""
 
@@ -420,42 +590,21 @@ class TraceFetcher:
 
         return None
 
-    async def fetch_traces_by_hash(
+    async def fetch_traces_by_hashes(
         self,
         *,
         project_id: UUID,
         #
-        hash_id: str,
+        hash_ids: List[str],
         limit: Optional[int] = None,
-    ) -> Traces:
-        if not hash_id:
-            return []
+    ) -> Dict[str, Traces]:
+        hash_ids = [hash_id for hash_id in dict.fromkeys(hash_ids) if hash_id]
+        if not hash_ids:
+            return {}
 
-        return await self.tracing_service.query_traces(
+        return await self.tracing_service.fetch_traces_by_hashes(
             project_id=project_id,
-            query=TracingQuery(
-                formatting=Formatting(
-                    focus=Focus.TRACE,
-                    format=Format.AGENTA,
-                ),
-                windowing=Windowing(
-                    limit=limit,
-                    order="descending",
-                ),
-                filtering=Filtering(
-                    operator=LogicalOperator.AND,
-                    conditions=[
-                        Condition(
-                            field=Fields.PARENT_ID,
-                            operator=ComparisonOperator.IS,
-                            value=None,
-                        ),
-                        Condition(
-                            field=Fields.HASHES,
-                            operator=ListOperator.IN,
-                            value=[{"id": hash_id}],
-                        ),
-                    ],
-                ),
-            ),
+            #
+            hash_ids=hash_ids,
+            limit=limit,
         )
@@ -0,0 +1,208 @@
+"""Per-process coalescing and sampling of read events.
+
+A UI list view or an SDK polling loop reads the same entities every few seconds, and
+each read used to become one event: an L1 quota check, a Redis publish, a pass through
+the events worker and a Postgres row — often costing more than the read itself.
+
+With a coalescing window, reads are buffered per (project, user, event type) — the
+event type names the entity family (`traces.queried`, `testsets.revisions.fetched`) —
+and each window ends with one event per key:
+
+- `count` is the sum of the reads' counts
+- `reads` is how many reads the event summarizes (absent on a lone read, which is
+  published exactly as it was built)
+- id lists (`trace_ids`, `testcase_ids`) and `references` are the union of the reads',
+  in first-seen order, capped at `MAX_REFERENCES`; single-id fields (`trace_id`)
+  fold into their list
+- other attributes are taken from the first read
+
+Sampling keeps a read with its event type's configured probability; events from a
+sampled type carry `sample_rate`, so consumers can scale counts back up.
+
+Buffered reads live in process memory. A crash loses at most one window of them;
+`flush` publishes what is buffered, and runs at API shutdown.
+"""
+
+import asyncio
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from orjson import OPT_SORT_KEYS, dumps
+
+from oss.src.core.events.types import EventType
+from oss.src.utils.logging import get_module_logger
+
+log = get_module_logger(__name__)
+
+
+# Beyond this many buffered keys, reads are published without waiting for the window.
+MAX_PENDING_KEYS = 10_000
+
+# Single-id attributes and the list attribute each folds into.
+_ID_LISTS = {
+    "trace_id": "trace_ids",
+    "testcase_id": "testcase_ids",
+}
+
+PublishRead = Callable[
+    [Optional[UUID], UUID, EventType, Dict[str, Any]],
+    Awaitable[None],
+]
+
+_Key = Tuple[Optional[UUID], UUID, Optional[str], EventType]
+
+
+class _Pending:
+    """The reads buffered for one key during the current window."""
+
+    __slots__ = ("first", "reads", "count", "ids", "references")
+
+    def __init__(self, attributes: Dict[str, Any]) -> None:
+        self.first = attributes
+        self.reads = 0
+        self.count = 0
+        self.ids: Dict[str, Dict[str, None]] = {}
+        self.references: Dict[bytes, Any] = {}
+
+    def add(self, attributes: Dict[str, Any], *, max_references: int) -> None:
+        self.reads += 1
+        self.count += attributes.get("count") or 0
+
+        for single, plural in _ID_LISTS.items():
+            values = list(attributes.get(plural) or [])
+            if attributes.get(single) is not None:
+                values.insert(0, attributes[single])
+            if not values:
+                continue
+            ids = self.ids.setdefault(plural, {})
+            for value in values:
+                if len(ids) >= max_references:
+                    break
+                ids.setdefault(value, None)
+
+        references = attributes.get("references")
+        if isinstance(references, dict):
+            references = [references]
+        for reference in references or []:
+            if len(self.references) >= max_references:
+                break
+            self.references.setdefault(
+                dumps(reference, option=OPT_SORT_KEYS), reference
+            )
+
+    def attributes(self) -> Dict[str, Any]:
+        if self.reads == 1:
+            return dict(self.first)
+
+        folded = set(_ID_LISTS) | set(_ID_LISTS.values()) | {"references"}
+        attributes = {k: v for k, v in self.first.items() if k not in folded}
+        attributes["count"] = self.count
+        attributes["reads"] = self.reads
+        for plural, ids in self.ids.items():
+            attributes[plural] = list(ids)
+        if self.references:
+            attributes["references"] = list(self.references.values())
+        return attributes
+
+
+class ReadEventCoalescer:
+    """Buffers read events per (project, user, event type) and flushes them per window."""
+
+    def __init__(
+        self,
+        *,
+        publish: PublishRead,
+        window_ms: int,
+        sampling: Dict[str, float],
+        max_references: int,
+    ) -> None:
+        self._publish = publish
+        self.window_ms = window_ms
+        self.sampling = sampling
+        self.max_references = max_references
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[_Key, _Pending] = {}
+        self._timer: Optional[asyncio.Task] = None
+
+    def _bind_loop(self) -> None:
+        # The flush timer belongs to the loop that started it
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = {}
+            self._timer = None
+
+    def _sample_rate(self, event_type: EventType) -> float:
+        try:
+            rate = float(self.sampling.get(event_type.value, 1.0))
+        except (TypeError, ValueError):
+            return 1.0
+        return min(max(rate, 0.0), 1.0)
+
+    async def submit(
+        self,
+        *,
+        organization_id: Optional[UUID],
+        project_id: UUID,
+        event_type: EventType,
+        attributes: Dict[str, Any],
+    ) -> None:
+        """Publish a read event now, or buffer it into the current window."""
+        rate = self._sample_rate(event_type)
+        if rate < 1.0:
+            if random.random() >= rate:
+                return
+            attributes = {**attributes, "sample_rate": rate}
+
+        if self.window_ms <= 0:
+            await self._publish(organization_id, project_id, event_type, attributes)
+            return
+
+        self._bind_loop()
+
+        key = (organization_id, project_id, attributes.get("user_id"), event_type)
+        pending = self._pending.get(key)
+
+        if pending is None:
+            if len(self._pending) >= MAX_PENDING_KEYS:
+                await self._publish(organization_id, project_id, event_type, attributes)
+                return
+            pending = self._pending[key] = _Pending(attributes)
+
+        pending.add(attributes, max_references=self.max_references)
+
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        try:
+            await asyncio.sleep(self.window_ms / 1000)
+        finally:
+            self._timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Publish every buffered key's event and start a new window."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self._publish(organization_id, project_id, event_type, p.attributes())
+                for (organization_id, project_id, _, event_type), p in pending.items()
+            ),
+            return_exceptions=True,
+        )
+
+        failures: List[BaseException] = [
+            result for result in results if isinstance(result, BaseException)
+        ]
+        if failures:
+            log.error(
+                "[EVENTS] Failed to publish %d coalesced read events",
+                len(failures),
+                exc_info=failures[0],
+            )
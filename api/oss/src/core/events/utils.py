@@ -105,6 +105,10 @@ Behavior:
 - Treat all references as partial identity objects — fields are included only
   when the DTO exposes them.
 - Log publish failures and never raise.
+- Route read events through the per-process `ReadEventCoalescer`
+  (`core/events/coalescing.py`): published at once by default, or coalesced
+  per window and sampled per event type when `agenta.events` says so. Commit
+  events always publish at once.
 """
 
 from datetime import datetime, timezone
@@ -113,11 +117,13 @@ from uuid import UUID
 
 import uuid_utils.compat as uuid_compat
 
+from oss.src.core.events.coalescing import ReadEventCoalescer
 from oss.src.core.events.dtos import Event
 from oss.src.core.events.streaming import publish_event
 from oss.src.core.events.types import EventType, RequestType
 from oss.src.utils.common import is_ee
 from oss.src.utils.context import AuthContextMissing, get_auth_scope
+from oss.src.utils.env import env
 from oss.src.utils.logging import get_module_logger
 
 log = get_module_logger(__name__)
@@ -336,6 +342,35 @@ async def _safe_publish(
         )
 
 
+async def _publish_read_event(
+    organization_id: Optional[UUID],
+    project_id: UUID,
+    event_type: EventType,
+    attributes: Dict[str, Any],
+) -> None:
+    await _safe_publish(
+        organization_id=organization_id,
+        project_id=project_id,
+        event=_build_event(
+            event_type=event_type,
+            attributes=attributes,
+        ),
+    )
+
+
+_read_events = ReadEventCoalescer(
+    publish=_publish_read_event,
+    window_ms=env.agenta.events.read_coalescing_window_ms,
+    sampling=env.agenta.events.read_sampling,
+    max_references=MAX_REFERENCES,
+)
+
+
+async def flush_read_events() -> None:
+    """Publish the read events still buffered in the current window."""
+    await _read_events.flush()
+
+
 def _str_or_none(value: Any) -> Optional[str]:
     if value is None:
         return None
@@ -396,13 +431,11 @@ async def publish_trace_fetched(
         trace_id=trace_id,
         trace_ids=trace_ids,
     )
-    await _safe_publish(
+    await _read_events.submit(
         organization_id=scope.organization_id,
         project_id=scope.project_id,  # type: ignore[arg-type]
-        event=_build_event(
-            event_type=EventType.TRACES_FETCHED,
-            attributes=attributes,
-        ),
+        event_type=EventType.TRACES_FETCHED,
+        attributes=attributes,
     )
 
 
@@ -422,13 +455,11 @@ async def publish_trace_queried(
         count=count,
         trace_ids=trace_ids,
     )
-    await _safe_publish(
+    await _read_events.submit(
         organization_id=scope.organization_id,
         project_id=scope.project_id,  # type: ignore[arg-type]
-        event=_build_event(
-            event_type=EventType.TRACES_QUERIED,
-            attributes=attributes,
-        ),
+        event_type=EventType.TRACES_QUERIED,
+        attributes=attributes,
     )
 
 
@@ -490,13 +521,11 @@ async def publish_testcase_fetched(
         testcase_id=testcase_id,
         testcase_ids=testcase_ids,
     )
-    await _safe_publish(
+    await _read_events.submit(
         organization_id=scope.organization_id,
         project_id=scope.project_id,  # type: ignore[arg-type]
-        event=_build_event(
-            event_type=EventType.TESTCASES_FETCHED,
-            attributes=attributes,
-        ),
+        event_type=EventType.TESTCASES_FETCHED,
+        attributes=attributes,
     )
 
 
@@ -516,13 +545,11 @@ async def publish_testcase_queried(
         count=count,
         testcase_ids=testcase_ids,
     )
-    await _safe_publish(
+    await _read_events.submit(
         organization_id=scope.organization_id,
         project_id=scope.project_id,  # type: ignore[arg-type]
-        event=_build_event(
-            event_type=EventType.TESTCASES_QUERIED,
-            attributes=attributes,
-        ),
+        event_type=EventType.TESTCASES_QUERIED,
+        attributes=attributes,
     )
 
 
@@ -798,13 +825,22 @@ async def publish_revision_event(
         extra=extra,
     )
 
-    await _safe_publish(
+    if action == "commit":
+        await _safe_publish(
+            organization_id=organization_id,
+            project_id=project_id,
+            event=_build_event(
+                event_type=event_type,
+                attributes=attributes,
+            ),
+        )
+        return
+
+    await _read_events.submit(
         organization_id=organization_id,
         project_id=project_id,
-        event=_build_event(
-            event_type=event_type,
-            attributes=attributes,
-        ),
+        event_type=event_type,
+        attributes=attributes,
     )
 
 
@@ -816,6 +852,7 @@ __all__ = [
     "build_testcase_fetched_attributes",
     "build_testcase_queried_attributes",
     "build_revision_event_attributes",
+    "flush_read_events",
     "publish_trace_fetched",
     "publish_trace_queried",
     "publish_testcase_fetched",
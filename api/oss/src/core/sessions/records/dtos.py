@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import Optional, Any, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Dict, List
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -43,6 +43,87 @@ class SessionRecord(Lifecycle):
     span_id: Optional[OTelSpanId] = None
 
 
+class SessionRecordCursor(BaseModel):
+    """A position in a session's record order, as `get_records` sorts it.
+
+    Reading `after` a cursor returns only the records past it. `record_id` is not part of
+    the conversation order; it only breaks exact ties so that no record is ever skipped
+    or read twice across pages.
+    """
+
+    timestamp: Optional[datetime] = None
+    created_at: datetime
+    record_index: Optional[int] = None
+    record_id: UUID
+
+    @classmethod
+    def of(cls, record: SessionRecord) -> "SessionRecordCursor":
+        return cls(
+            timestamp=record.timestamp,
+            created_at=record.created_at,
+            record_index=record.record_index,
+            record_id=record.record_id,
+        )
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def record_version(record: SessionRecord) -> int:
+    """A record's last write time in epoch microseconds (see `SessionRecordSnapshot`)."""
+    written_at = record.updated_at or record.created_at
+    if written_at is None:
+        return 0
+    return (written_at - _EPOCH) // timedelta(microseconds=1)
+
+
+class SessionRecordSnapshot(BaseModel):
+    """State folded from a session's records up to `cursor`, kept so the next fold
+    resumes there instead of replaying the whole session.
+
+    Records are upserted, and can land late (behind records already folded) or be
+    rewritten in place. `record_count` and `record_checksum` (the sum of `record_version`)
+    describe the records at or before the cursor when the state was folded; the DAO only
+    hands back a snapshot whose records still add up to both.
+
+    `kind` names what `state` holds, and its format: a fold that changes its state
+    changes its kind, and snapshots of the old kind are simply never read again.
+    """
+
+    project_id: UUID
+    session_id: str
+    kind: str
+
+    cursor: SessionRecordCursor
+    record_count: int
+    record_checksum: int
+
+    state: Dict[str, Any]
+
+    @classmethod
+    def fold(
+        cls,
+        *,
+        previous: Optional["SessionRecordSnapshot"],
+        project_id: UUID,
+        session_id: str,
+        kind: str,
+        records: List[SessionRecord],
+        state: Dict[str, Any],
+    ) -> "SessionRecordSnapshot":
+        """The snapshot after folding `records`, read past `previous` (or from the start)."""
+        return cls(
+            project_id=project_id,
+            session_id=session_id,
+            kind=kind,
+            cursor=SessionRecordCursor.of(records[-1]),
+            record_count=(previous.record_count if previous else 0) + len(records),
+            record_checksum=(previous.record_checksum if previous else 0)
+            + sum(record_version(record) for record in records),
+            state=state,
+        )
+
+
 class SessionMessagePreview(BaseModel):
     """The last thing said in a session, for a list row.
 
@@ -4,7 +4,9 @@ from uuid import UUID
 from oss.src.core.sessions.records.dtos import (
     SessionMessagePreview,
     SessionRecord,
+    SessionRecordCursor,
     SessionRecordEvent,
+    SessionRecordSnapshot,
 )
 
 
@@ -29,9 +31,27 @@ class RecordsDAOInterface:
         *,
         project_id: UUID,
         session_id: str,
+        after: Optional[SessionRecordCursor] = None,
+        limit: Optional[int] = None,
     ) -> List[SessionRecord]:
         raise NotImplementedError
 
+    async def get_snapshot(
+        self,
+        *,
+        project_id: UUID,
+        session_id: str,
+        kind: str,
+    ) -> Optional[SessionRecordSnapshot]:
+        raise NotImplementedError
+
+    async def put_snapshot(
+        self,
+        *,
+        snapshot: SessionRecordSnapshot,
+    ) -> None:
+        raise NotImplementedError
+
     async def get_event(
         self,
         *,
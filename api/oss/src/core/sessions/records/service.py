@@ -4,7 +4,9 @@ from uuid import UUID
 from oss.src.core.sessions.records.dtos import (
     SessionMessagePreview,
     SessionRecord,
+    SessionRecordCursor,
     SessionRecordEvent,
+    SessionRecordSnapshot,
 )
 from oss.src.core.sessions.records.interfaces import RecordsDAOInterface
 
@@ -33,12 +35,37 @@ class RecordsService:
         *,
         project_id: UUID,
         session_id: str,
+        after: Optional[SessionRecordCursor] = None,
+        limit: Optional[int] = None,
     ) -> List[SessionRecord]:
         return await self.records_dao.get_records(
             project_id=project_id,
             session_id=session_id,
+            after=after,
+            limit=limit,
         )
 
+    async def get_snapshot(
+        self,
+        *,
+        project_id: UUID,
+        session_id: str,
+        kind: str,
+    ) -> Optional[SessionRecordSnapshot]:
+        """The session's last `kind` snapshot, or None when it is missing or stale."""
+        return await self.records_dao.get_snapshot(
+            project_id=project_id,
+            session_id=session_id,
+            kind=kind,
+        )
+
+    async def put_snapshot(
+        self,
+        *,
+        snapshot: SessionRecordSnapshot,
+    ) -> None:
+        await self.records_dao.put_snapshot(snapshot=snapshot)
+
     async def get_event(
         self,
         *,
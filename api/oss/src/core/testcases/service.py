@@ -9,6 +9,10 @@ from oss.src.core.testcases.dtos import Testcase
 
 log = get_module_logger(__name__)
 
+# Testcases written per blobs DAO call; keeps each statement (and its existence
+# lookup) bounded when a large testset is uploaded.
+TESTCASES_BATCH_SIZE = 1_000
+
 
 class TestcasesService:
     def __init__(
@@ -26,19 +30,25 @@ class TestcasesService:
         #
         testcases: List[Testcase],
     ) -> List[Testcase]:
-        blob_creates = [
-            BlobCreate(
-                **testcase.model_dump(mode="json", exclude_none=True),
+        blobs = []
+
+        for start in range(0, len(testcases), TESTCASES_BATCH_SIZE):
+            blob_creates = [
+                BlobCreate(
+                    **testcase.model_dump(mode="json", exclude_none=True),
+                )
+                for testcase in testcases[start : start + TESTCASES_BATCH_SIZE]
+            ]
+
+            blobs.extend(
+                await self.testcases_dao.add_blobs(
+                    project_id=project_id,
+                    user_id=user_id,
+                    #
+                    blob_creates=blob_creates,
+                )
+                or []
             )
-            for testcase in testcases
-        ]
-
-        blobs = await self.testcases_dao.add_blobs(
-            project_id=project_id,
-            user_id=user_id,
-            #
-            blob_creates=blob_creates,
-        )
 
         if not blobs:
             return []
@@ -156,12 +156,47 @@ class TestsetVariantQuery(VariantQuery):
     flags: Optional[TestsetFlags] = None
 
 
+class TestsetRevisionDeltaColumns(BaseModel):
+    """Column-level operations applied to ALL testcases in the revision."""
+
+    # Add columns: array of column names to add
+    add: Optional[List[str]] = None
+    # Remove columns: array of column names to remove
+    remove: Optional[List[str]] = None
+    # Replace columns: array of (old column name, new column name) to replace
+    replace: Optional[List[Tuple[str, str]]] = None
+
+
+class TestsetChunk(BaseModel):
+    """An immutable, content-addressed run of testcase ids."""
+
+    id: UUID
+    testcase_ids: List[UUID]
+
+
+class TestsetManifestChunk(BaseModel):
+    id: UUID
+    count: int
+    # Column operations not yet applied to the chunk's testcases, oldest first
+    columns: Optional[List[TestsetRevisionDeltaColumns]] = None
+
+
+class TestsetManifest(BaseModel):
+    """The ordered chunks holding a revision's testcase ids."""
+
+    count: int = 0
+    chunks: List[TestsetManifestChunk] = Field(default_factory=list)
+
+
 class TestsetRevisionData(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     testcase_ids: Optional[List[UUID]] = None
     testcases: Optional[List[Testcase]] = None
 
+    # Persisted in place of testcase_ids; resolved into them when read
+    manifest: Optional[TestsetManifest] = Field(default=None, exclude=True)
+
 
 class TestsetRevision(
     Revision,
@@ -201,17 +236,6 @@ class TestsetRevisionQuery(RevisionQuery):
     flags: Optional[TestsetFlags] = None
 
 
-class TestsetRevisionDeltaColumns(BaseModel):
-    """Column-level operations applied to ALL testcases in the revision."""
-
-    # Add columns: array of column names to add
-    add: Optional[List[str]] = None
-    # Remove columns: array of column names to remove
-    remove: Optional[List[str]] = None
-    # Replace columns: array of (old column name, new column name) to replace
-    replace: Optional[List[Tuple[str, str]]] = None
-
-
 class TestsetRevisionDeltaRows(BaseModel):
     """Row-level operations applied to testcases in the revision."""
 
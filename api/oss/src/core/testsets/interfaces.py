@@ -0,0 +1,42 @@
+from typing import Dict, List
+from uuid import UUID
+from abc import ABC, abstractmethod
+
+from oss.src.core.testsets.dtos import TestsetChunk
+
+
+class TestsetChunksDAOInterface(ABC):
+    ## -- chunks -----------------------------------------------------------
+
+    @abstractmethod
+    async def add_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        testset_id: UUID,
+        chunks: List[TestsetChunk],
+    ) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fetch_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        chunk_ids: List[UUID],
+    ) -> Dict[UUID, List[UUID]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        chunk_ids: List[UUID],
+        testcase_ids: List[UUID],
+    ) -> Dict[UUID, List[UUID]]:
+        """Those of `chunk_ids` holding any of `testcase_ids`."""
+        raise NotImplementedError
@@ -29,6 +29,7 @@ from oss.src.core.git.dtos import (
     RevisionCommit,
 )
 from oss.src.core.testcases.dtos import Testcase
+from oss.src.core.testsets.interfaces import TestsetChunksDAOInterface
 from oss.src.core.testsets.dtos import (
     Testset,
     TestsetCreate,
@@ -48,12 +49,21 @@ from oss.src.core.testsets.dtos import (
     TestsetRevisionEdit,
     TestsetRevisionQuery,
     TestsetRevisionCommit,
+    TestsetRevisionDeltaColumns,
+    #
+    TestsetChunk,
+    TestsetManifest,
+    TestsetManifestChunk,
     #
     SimpleTestset,
     SimpleTestsetCreate,
     SimpleTestsetEdit,
 )
 from oss.src.core.testsets.utils import (
+    TESTSETS_CHUNK_SIZE,
+    apply_testset_columns,
+    compute_chunk_id,
+    compute_projected_chunk_id,
     json_array_to_json_object,
     validate_testset_limits,
 )
@@ -67,9 +77,12 @@ class TestsetsService:
         *,
         testsets_dao: GitDAOInterface,
         testcases_service: TestcasesService,
+        testset_chunks_dao: Optional[TestsetChunksDAOInterface] = None,
     ):
         self.testsets_dao = testsets_dao
         self.testcases_service = testcases_service
+        # Without it, revisions keep their testcase_ids inline
+        self.testset_chunks_dao = testset_chunks_dao
 
     @staticmethod
     def _sanitize_persisted_testset_revision_data(
@@ -145,11 +158,17 @@ class TestsetsService:
             return
 
         # Apply ID-based pagination for deterministic testcase ordering
-        ids = testset_revision.data.testcase_ids or []
-        ids = self._apply_ids_windowing(
-            ids=ids,
-            windowing=windowing,
-        )
+        if testset_revision.data.manifest is not None:
+            ids = await self._window_manifest(
+                project_id=project_id,
+                testset_revision=testset_revision,
+                windowing=windowing,
+            )
+        else:
+            ids = self._apply_ids_windowing(
+                ids=testset_revision.data.testcase_ids or [],
+                windowing=windowing,
+            )
 
         # [A.1] — IDs only
         if _include_ids and not _include_items:
@@ -198,6 +217,265 @@ class TestsetsService:
 
         return ordered
 
+    ## -- manifests ------------------------------------------------------------
+
+    async def _window_manifest(
+        self,
+        *,
+        project_id: UUID,
+        #
+        testset_revision: TestsetRevision,
+        #
+        windowing: Optional[Windowing] = None,
+    ) -> List[UUID]:
+        """Same window as _apply_ids_windowing, reading only the chunks it overlaps."""
+        if self.testset_chunks_dao is None:
+            log.warning(
+                f"Cannot read chunked testset revision {testset_revision.id}: no chunks DAO"
+            )
+            return []
+
+        manifest = testset_revision.data.manifest
+        descending = bool(windowing and windowing.order == "descending")
+
+        # Positions in reading order, which runs backwards when descending
+        start = 0
+        if windowing and windowing.next is not None:
+            position = await self._locate_in_manifest(
+                project_id=project_id,
+                manifest=manifest,
+                testcase_id=windowing.next,
+                descending=descending,
+            )
+            if position is None:
+                return []
+            start = position + 1
+
+        stop = manifest.count
+        if windowing and windowing.limit is not None:
+            stop = min(stop, start + windowing.limit)
+
+        if start >= stop:
+            return []
+
+        lower, upper = (
+            (manifest.count - stop, manifest.count - start)
+            if descending
+            else (start, stop)
+        )
+
+        overlapping: List[tuple[int, TestsetManifestChunk]] = []
+        offset = 0
+        for chunk in manifest.chunks:
+            if offset < upper and offset + chunk.count > lower:
+                overlapping.append((offset, chunk))
+            offset += chunk.count
+
+        resolved = await self._resolve_manifest_chunks(
+            project_id=project_id,
+            testset_revision=testset_revision,
+            chunks=[chunk for _, chunk in overlapping],
+        )
+
+        ids: List[UUID] = []
+        for offset, chunk in overlapping:
+            chunk_ids = resolved.get(compute_projected_chunk_id(chunk), [])
+            ids.extend(chunk_ids[max(lower - offset, 0) : upper - offset])
+
+        if descending:
+            ids.reverse()
+
+        return ids
+
+    async def _locate_in_manifest(
+        self,
+        *,
+        project_id: UUID,
+        #
+        manifest: TestsetManifest,
+        testcase_id: UUID,
+        #
+        descending: bool = False,
+    ) -> Optional[int]:
+        """The reading-order position of a testcase's first occurrence, if any."""
+        chunk_ids = [compute_projected_chunk_id(chunk) for chunk in manifest.chunks]
+
+        found = await self.testset_chunks_dao.find_chunks(
+            project_id=project_id,
+            #
+            chunk_ids=chunk_ids,
+            testcase_ids=[testcase_id],
+        )
+
+        chunks = list(zip(chunk_ids, manifest.chunks))
+        if descending:
+            chunks.reverse()
+
+        offset = 0
+        for chunk_id, chunk in chunks:
+            testcase_ids = found.get(chunk_id)
+            if testcase_ids and testcase_id in testcase_ids:
+                if descending:
+                    testcase_ids = testcase_ids[::-1]
+                return offset + testcase_ids.index(testcase_id)
+            offset += chunk.count
+
+        return None
+
+    async def _resolve_manifest_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        testset_revision: TestsetRevision,
+        chunks: List[TestsetManifestChunk],
+    ) -> Dict[UUID, List[UUID]]:
+        """Testcase ids per projected chunk id, applying pending columns on first read."""
+        if not chunks:
+            return {}
+
+        pending = {compute_projected_chunk_id(chunk): chunk for chunk in chunks}
+
+        resolved = await self.testset_chunks_dao.fetch_chunks(
+            project_id=project_id,
+            #
+            chunk_ids=list(pending),
+        )
+
+        pending = {
+            chunk_id: chunk
+            for chunk_id, chunk in pending.items()
+            if chunk_id not in resolved
+        }
+
+        if not pending:
+            return resolved
+
+        # Chunks with pending columns are stored once projected, so each is
+        # rewritten at most once, by whichever read reaches it first.
+        base_chunks = await self.testset_chunks_dao.fetch_chunks(
+            project_id=project_id,
+            #
+            chunk_ids=[chunk.id for chunk in pending.values()],
+        )
+
+        for chunk_id, chunk in pending.items():
+            base_ids = base_chunks.get(chunk.id)
+            if base_ids is None:
+                log.error(
+                    f"Testset chunk {chunk.id} of revision {testset_revision.id} not found"
+                )
+                continue
+
+            projected = await self._project_testcases(
+                project_id=project_id,
+                user_id=testset_revision.created_by_id,
+                #
+                testset_id=testset_revision.testset_id,
+                testcase_ids=base_ids,
+                columns=chunk.columns or [],
+            )
+            if projected is None:
+                continue
+
+            resolved[chunk_id] = [projected[id] for id in base_ids]
+
+            await self.testset_chunks_dao.add_chunks(
+                project_id=project_id,
+                #
+                testset_id=testset_revision.testset_id,
+                chunks=[TestsetChunk(id=chunk_id, testcase_ids=resolved[chunk_id])],
+            )
+
+        return resolved
+
+    async def _project_testcases(
+        self,
+        *,
+        project_id: UUID,
+        user_id: Optional[UUID],
+        #
+        testset_id: UUID,
+        testcase_ids: List[UUID],
+        columns: List[TestsetRevisionDeltaColumns],
+    ) -> Optional[Dict[UUID, UUID]]:
+        """Rewrite testcases with column operations applied; old id to new id."""
+        testcases = {
+            testcase.id: testcase
+            for testcase in await self.testcases_service.fetch_testcases(
+                project_id=project_id,
+                testcase_ids=list(dict.fromkeys(testcase_ids)),
+            )
+        }
+
+        if any(testcase_id not in testcases for testcase_id in testcase_ids):
+            log.error(f"Testcases of testset {testset_id} not found")
+            return None
+
+        projected_testcases = []
+        for testcase in testcases.values():
+            data = testcase.data
+            for operations in columns:
+                data = apply_testset_columns(data, operations)
+            projected_testcases.append(
+                Testcase(
+                    id=None,
+                    set_id=testset_id,
+                    data=data,
+                )
+            )
+
+        created = await self.testcases_service.create_testcases(
+            project_id=project_id,
+            user_id=user_id,
+            #
+            testcases=projected_testcases,
+        )
+
+        if len(created) != len(projected_testcases):
+            log.error(f"Failed to rewrite testcases of testset {testset_id}")
+            return None
+
+        return {
+            testcase_id: testcase.id
+            for testcase_id, testcase in zip(testcases, created)
+        }
+
+    async def _write_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        testset_id: UUID,
+        testcase_ids: List[UUID],
+    ) -> Optional[List[TestsetManifestChunk]]:
+        chunks = [
+            TestsetChunk(
+                id=compute_chunk_id(
+                    testset_id=testset_id,
+                    testcase_ids=testcase_ids[start : start + TESTSETS_CHUNK_SIZE],
+                ),
+                testcase_ids=testcase_ids[start : start + TESTSETS_CHUNK_SIZE],
+            )
+            for start in range(0, len(testcase_ids), TESTSETS_CHUNK_SIZE)
+        ]
+
+        if not await self.testset_chunks_dao.add_chunks(
+            project_id=project_id,
+            #
+            testset_id=testset_id,
+            chunks=chunks,
+        ):
+            return None
+
+        return [
+            TestsetManifestChunk(
+                id=chunk.id,
+                count=len(chunk.testcase_ids),
+            )
+            for chunk in chunks
+        ]
+
     ## -- testset --------------------------------------------------------------
 
     async def create_testset(
@@ -696,6 +974,40 @@ class TestsetsService:
         #
         windowing: Optional[Windowing] = None,
     ) -> Optional[TestsetRevision]:
+        testset_revision = await self._fetch_testset_revision(
+            project_id=project_id,
+            #
+            testset_ref=testset_ref,
+            testset_variant_ref=testset_variant_ref,
+            testset_revision_ref=testset_revision_ref,
+        )
+
+        if not testset_revision:
+            return None
+
+        await self._populate_testcases(
+            project_id,
+            #
+            testset_revision,
+            #
+            include_testcase_ids=include_testcase_ids,
+            include_testcases=include_testcases,
+            #
+            windowing=windowing,
+        )
+
+        return testset_revision
+
+    async def _fetch_testset_revision(
+        self,
+        *,
+        project_id: UUID,
+        #
+        testset_ref: Optional[Reference] = None,
+        testset_variant_ref: Optional[Reference] = None,
+        testset_revision_ref: Optional[Reference] = None,
+    ) -> Optional[TestsetRevision]:
+        """Resolve and fetch a revision, with its data as stored."""
         if not testset_ref and not testset_variant_ref and not testset_revision_ref:
             return None
 
@@ -782,17 +1094,6 @@ class TestsetsService:
             ),
         )
 
-        await self._populate_testcases(
-            project_id,
-            #
-            testset_revision,
-            #
-            include_testcase_ids=include_testcase_ids,
-            include_testcases=include_testcases,
-            #
-            windowing=windowing,
-        )
-
         return testset_revision
 
     async def retrieve_testset_revision(
@@ -997,6 +1298,7 @@ class TestsetsService:
         #
         initial: bool = False,
         #
+        include_testcase_ids: Optional[bool] = None,
         include_testcases: Optional[bool] = None,
     ) -> Optional[TestsetRevision]:
         if testset_revision_commit.delta and not testset_revision_commit.data:
@@ -1004,6 +1306,7 @@ class TestsetsService:
                 project_id=project_id,
                 user_id=user_id,
                 testset_revision_commit=testset_revision_commit,
+                include_testcase_ids=include_testcase_ids,
                 include_testcases=include_testcases,
             )
 
@@ -1025,6 +1328,56 @@ class TestsetsService:
 
             testset_revision_commit.data.testcases = None
 
+        manifest = None
+        if (
+            self.testset_chunks_dao is not None
+            and testset_revision_commit.testset_id
+            and testset_revision_commit.data
+            and testset_revision_commit.data.testcase_ids is not None
+        ):
+            testcase_ids = testset_revision_commit.data.testcase_ids
+            chunks = await self._write_chunks(
+                project_id=project_id,
+                #
+                testset_id=testset_revision_commit.testset_id,
+                testcase_ids=testcase_ids,
+            )
+
+            if chunks is None:
+                return None
+
+            manifest = TestsetManifest(
+                count=len(testcase_ids),
+                chunks=chunks,
+            )
+
+        return await self._commit_testset_revision(
+            project_id=project_id,
+            user_id=user_id,
+            #
+            testset_revision_commit=testset_revision_commit,
+            manifest=manifest,
+            #
+            initial=initial,
+            #
+            include_testcase_ids=include_testcase_ids,
+            include_testcases=include_testcases,
+        )
+
+    async def _commit_testset_revision(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        testset_revision_commit: TestsetRevisionCommit,
+        manifest: Optional[TestsetManifest] = None,
+        #
+        initial: bool = False,
+        #
+        include_testcase_ids: Optional[bool] = None,
+        include_testcases: Optional[bool] = None,
+    ) -> Optional[TestsetRevision]:
         if not testset_revision_commit.slug:
             testset_revision_commit.slug = uuid4().hex[-12:]
 
@@ -1034,6 +1387,10 @@ class TestsetsService:
                 exclude_none=True,
             )
         )
+        if manifest is not None:
+            revision_commit_payload["data"] = {
+                "manifest": manifest.model_dump(mode="json", exclude_none=True)
+            }
         revision_commit = RevisionCommit(**revision_commit_payload)
 
         revision = await self.testsets_dao.commit_revision(
@@ -1057,12 +1414,13 @@ class TestsetsService:
         await self._populate_testcases(
             project_id=project_id,
             testset_revision=testset_revision,
+            include_testcase_ids=include_testcase_ids,
             include_testcases=include_testcases,
         )
 
         # Write-action emission lives in the SERVICE layer (read actions live
         # in the router). Every caller of commit_testset_revision — direct
-        # commit route, simple-service create/edit, delta commits that re-enter
+        # commit route, simple-service create/edit, delta commits that end in
         # this method, etc. — therefore emits exactly one
         # `testsets.revisions.committed` event. See core/events/utils.py for
         # the read-vs-write split rationale.
@@ -1125,13 +1483,21 @@ class TestsetsService:
         #
         testset_revision_commit: TestsetRevisionCommit,
         #
+        include_testcase_ids: Optional[bool] = None,
         include_testcases: Optional[bool] = None,
     ) -> Optional[TestsetRevision]:
-        """Apply delta operations to a base revision and commit as a new revision."""
+        """Apply delta operations to a base revision and commit as a new revision.
+
+        Only the chunks holding replaced or removed rows are read and rewritten.
+        The other chunks are shared with the base revision, with any column
+        operations recorded on them and applied when they are next read.
+        """
+        testset_id = testset_revision_commit.testset_id
+
         # Get the base revision to patch
-        base_revision = await self.fetch_testset_revision(
+        base_revision = await self._fetch_testset_revision(
             project_id=project_id,
-            testset_ref=Reference(id=testset_revision_commit.testset_id),
+            testset_ref=Reference(id=testset_id),
             testset_revision_ref=(
                 Reference(id=testset_revision_commit.revision_id)
                 if testset_revision_commit.revision_id
@@ -1140,87 +1506,120 @@ class TestsetsService:
         )
 
         if not base_revision:
-            log.error(
-                f"Base revision not found for testset {testset_revision_commit.testset_id}"
-            )
+            log.error(f"Base revision not found for testset {testset_id}")
             return None
 
-        # Load all current testcases from the base revision, preserving order.
-        current_testcases: List[Testcase] = []
-        if base_revision.data and base_revision.data.testcases:
-            current_testcases = list(base_revision.data.testcases)
-
         operations = testset_revision_commit.delta
         if not operations:
             # No operations, just return the base revision
+            await self._populate_testcases(
+                project_id=project_id,
+                testset_revision=base_revision,
+                include_testcase_ids=include_testcase_ids,
+                include_testcases=include_testcases,
+            )
             return base_revision
 
-        # Apply column operations to ALL testcases first
-        # This ensures column changes are applied even to testcases not in update list
-        if operations.columns:
-            replace_map = {}
-            if operations.columns.replace:
-                replace_map = {old: new for old, new in operations.columns.replace}
-            remove_set = set(operations.columns.remove or [])
-            for tc in current_testcases:
-                if tc.data:
-                    # Preserve column order for replace/remove.
-                    updated_data: Dict[str, Any] = {}
-                    for key, value in tc.data.items():
-                        if key in remove_set:
-                            continue
-                        new_key = replace_map.get(key, key)
-                        updated_data[new_key] = value
-                    tc.data = updated_data
-
-                    # Apply column additions (initialize to empty string)
-                    if operations.columns.add:
-                        for col_name in operations.columns.add:
-                            if col_name not in tc.data:
-                                tc.data[col_name] = ""
-
-        # Build final testcases list, preserving base order.
-        remove_set: set[UUID] = (
-            set(operations.rows.remove or []) if operations.rows else set()
-        )
-        replace_map: Dict[UUID, Testcase] = {}
-        if operations.rows and operations.rows.replace:
-            replace_map = {
-                tc.id: tc for tc in operations.rows.replace if tc.id is not None
-            }
+        columns = (
+            [operations.columns]
+            if operations.columns
+            and (
+                operations.columns.add
+                or operations.columns.remove
+                or operations.columns.replace
+            )
+            else []
+        )
+        rows = operations.rows
+        removed = set(rows.remove or []) if rows else set()
+        replacements = (
+            {tc.id: tc for tc in rows.replace or [] if tc.id is not None}
+            if rows
+            else {}
+        )
 
-        # 1) Replace in place, 2) remove wherever it appears, 3) add at the end.
-        final_testcases: List[Testcase] = []
-        for tc in current_testcases:
-            if not tc.id:
-                continue
-            updated_tc = replace_map.get(tc.id)
-            if updated_tc is not None:
-                candidate = Testcase(
-                    id=None,
-                    set_id=testset_revision_commit.testset_id,
-                    data=updated_tc.data,
-                )
-            else:
-                candidate = Testcase(
-                    id=None,
-                    set_id=testset_revision_commit.testset_id,
-                    data=tc.data,
-                )
-            if tc.id in remove_set:
-                continue
-            final_testcases.append(candidate)
-
-        # 3) Add at the end.
-        if operations.rows and operations.rows.add:
-            for new_tc in operations.rows.add:
-                final_testcases.append(
-                    Testcase(
-                        id=None,
-                        set_id=testset_revision_commit.testset_id,
-                        data=new_tc.data,
-                    )
-                )
+        # Replaced and added rows are written as given, without column operations
+        replaced_ids = await self._create_delta_testcases(
+            project_id=project_id,
+            user_id=user_id,
+            #
+            testset_id=testset_id,
+            testcases=list(replacements.values()),
+        )
+        added_ids = await self._create_delta_testcases(
+            project_id=project_id,
+            user_id=user_id,
+            #
+            testset_id=testset_id,
+            testcases=(rows.add or []) if rows else [],
+        )
+
+        if replaced_ids is None or added_ids is None:
+            return None
+
+        replaced = dict(zip(replacements, replaced_ids))
+
+        base_data = base_revision.data or TestsetRevisionData()
+        manifest = base_data.manifest
+
+        if manifest is not None and self.testset_chunks_dao is None:
+            log.error(f"Cannot patch chunked testset {testset_id}: no chunks DAO")
+            return None
+
+        # Revisions from before chunking are chunked on their first delta
+        if manifest is None and self.testset_chunks_dao is not None:
+            base_ids = base_data.testcase_ids or []
+            chunks = await self._write_chunks(
+                project_id=project_id,
+                #
+                testset_id=testset_id,
+                testcase_ids=base_ids,
+            )
+
+            if chunks is None:
+                return None
+
+            manifest = TestsetManifest(
+                count=len(base_ids),
+                chunks=chunks,
+            )
+
+        data = None
+        if manifest is not None:
+            manifest = await self._apply_delta_to_manifest(
+                project_id=project_id,
+                user_id=user_id,
+                #
+                testset_id=testset_id,
+                manifest=manifest,
+                #
+                columns=columns,
+                removed=removed,
+                replaced=replaced,
+                added=added_ids,
+            )
+
+            if manifest is None:
+                return None
+        else:
+            testcase_ids = await self._apply_delta_to_ids(
+                project_id=project_id,
+                user_id=user_id,
+                #
+                testset_id=testset_id,
+                testcase_ids=base_data.testcase_ids or [],
+                #
+                columns=columns,
+                removed=removed,
+                replaced=replaced,
+            )
+
+            if testcase_ids is None:
+                return None
+
+            data = TestsetRevisionData(
+                testcase_ids=testcase_ids + added_ids,
+            )
 
         # Get variant_id from base revision (required for commit)
         variant_id = (
@@ -1231,30 +1630,198 @@ class TestsetsService:
         # Generate a unique slug for the new revision if missing
         revision_slug = testset_revision_commit.slug or uuid4().hex[-12:]
 
-        # Create commit request with full testcases data
-        # This will go through the regular commit flow
         testset_revision_commit = TestsetRevisionCommit(
             slug=revision_slug,
-            testset_id=testset_revision_commit.testset_id,
+            testset_id=testset_id,
             testset_variant_id=variant_id,
             message=testset_revision_commit.message or "Patched testset revision",
             description=(
                 testset_revision_commit.description or base_revision.description
             ),
             flags=testset_revision_commit.flags,
-            data=TestsetRevisionData(
-                testcases=final_testcases,
-            ),
+            data=data,
         )
 
-        # Use the regular commit flow - this handles testcase creation and deduplication
-        return await self.commit_testset_revision(
+        return await self._commit_testset_revision(
             project_id=project_id,
             user_id=user_id,
+            #
             testset_revision_commit=testset_revision_commit,
+            manifest=manifest,
+            #
+            include_testcase_ids=include_testcase_ids,
             include_testcases=include_testcases,
         )
 
+    async def _create_delta_testcases(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        testset_id: UUID,
+        testcases: List[Testcase],
+    ) -> Optional[List[UUID]]:
+        if not testcases:
+            return []
+
+        created = await self.testcases_service.create_testcases(
+            project_id=project_id,
+            user_id=user_id,
+            #
+            testcases=[
+                Testcase(
+                    id=None,
+                    set_id=testset_id,
+                    data=testcase.data,
+                )
+                for testcase in testcases
+            ],
+        )
+
+        if len(created) != len(testcases):
+            log.error(f"Failed to create testcases for testset {testset_id}")
+            return None
+
+        return [testcase.id for testcase in created]
+
+    async def _apply_delta_to_ids(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        testset_id: UUID,
+        testcase_ids: List[UUID],
+        #
+        columns: List[TestsetRevisionDeltaColumns],
+        removed: set[UUID],
+        replaced: Dict[UUID, UUID],
+    ) -> Optional[List[UUID]]:
+        """Replace in place, remove wherever it appears, and project the rest."""
+        projected: Dict[UUID, UUID] = {}
+
+        kept = [
+            testcase_id
+            for testcase_id in testcase_ids
+            if testcase_id not in removed and testcase_id not in replaced
+        ]
+        if columns and kept:
+            projected = await self._project_testcases(
+                project_id=project_id,
+                user_id=user_id,
+                #
+                testset_id=testset_id,
+                testcase_ids=kept,
+                columns=columns,
+            )
+
+            if projected is None:
+                return None
+
+        return [
+            replaced.get(testcase_id) or projected.get(testcase_id, testcase_id)
+            for testcase_id in testcase_ids
+            if testcase_id not in removed
+        ]
+
+    async def _apply_delta_to_manifest(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        testset_id: UUID,
+        manifest: TestsetManifest,
+        #
+        columns: List[TestsetRevisionDeltaColumns],
+        removed: set[UUID],
+        replaced: Dict[UUID, UUID],
+        added: List[UUID],
+    ) -> Optional[TestsetManifest]:
+        chunk_ids = [compute_projected_chunk_id(chunk) for chunk in manifest.chunks]
+
+        touched = await self.testset_chunks_dao.find_chunks(
+            project_id=project_id,
+            #
+            chunk_ids=chunk_ids,
+            testcase_ids=list(removed | set(replaced)),
+        )
+
+        chunks: List[TestsetManifestChunk] = []
+        for chunk_id, chunk in zip(chunk_ids, manifest.chunks):
+            testcase_ids = touched.get(chunk_id)
+
+            if testcase_ids is None:
+                chunks.append(
+                    chunk.model_copy(
+                        update={"columns": (chunk.columns or []) + columns},
+                    )
+                    if columns
+                    else chunk
+                )
+                continue
+
+            testcase_ids = await self._apply_delta_to_ids(
+                project_id=project_id,
+                user_id=user_id,
+                #
+                testset_id=testset_id,
+                testcase_ids=testcase_ids,
+                #
+                columns=columns,
+                removed=removed,
+                replaced=replaced,
+            )
+
+            if testcase_ids is None:
+                return None
+
+            rewritten = await self._write_chunks(
+                project_id=project_id,
+                #
+                testset_id=testset_id,
+                testcase_ids=testcase_ids,
+            )
+
+            if rewritten is None:
+                return None
+
+            chunks.extend(rewritten)
+
+        # Add at the end, topping up the last chunk when it has room
+        if added:
+            last = chunks[-1] if chunks else None
+            if last and not last.columns and last.count < TESTSETS_CHUNK_SIZE:
+                tail = (
+                    await self.testset_chunks_dao.fetch_chunks(
+                        project_id=project_id,
+                        #
+                        chunk_ids=[last.id],
+                    )
+                ).get(last.id)
+
+                if tail is not None:
+                    chunks.pop()
+                    added = tail + added
+
+            appended = await self._write_chunks(
+                project_id=project_id,
+                #
+                testset_id=testset_id,
+                testcase_ids=added,
+            )
+
+            if appended is None:
+                return None
+
+            chunks.extend(appended)
+
+        return TestsetManifest(
+            count=sum(chunk.count for chunk in chunks),
+            chunks=chunks,
+        )
+
     ## -------------------------------------------------------------------------
 
 
@@ -1,16 +1,24 @@
 from hashlib import blake2b as digest
 from json import dumps
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from oss.src.utils.logging import get_module_logger
 from oss.src.core.blobs.utils import compute_blob_id
+from oss.src.core.testsets.dtos import (
+    TestsetManifestChunk,
+    TestsetRevisionDeltaColumns,
+)
 
 log = get_module_logger(__name__)
 
 TESTSETS_COUNT_LIMIT = 10 * 1_000  # 10,000 testcases per testset
 TESTSETS_SIZE_LIMIT = 10 * 1024 * 1024  # 10 MB per testset
 
+# Testcase ids per manifest chunk: a delta commit rewrites only the chunks it
+# touches, and a window reads only the chunks it overlaps.
+TESTSETS_CHUNK_SIZE = 1_000
+
 TESTSETS_COUNT_WARNING = f"Testset exceeds the maximum count of {TESTSETS_COUNT_LIMIT} testcases per testset."
 TESTSETS_SIZE_WARNING = f"Testset exceeds the maximum size of {TESTSETS_SIZE_LIMIT // (1024 * 1024)} MB per testset."
 
@@ -82,3 +90,52 @@ def json_array_to_json_object(
         transformed_data[testcase_id] = testcase_data
 
     return transformed_data
+
+
+def compute_chunk_id(
+    *,
+    testset_id: Optional[UUID],
+    testcase_ids: List[UUID],
+) -> UUID:
+    return compute_blob_id(
+        blob_data={"testcase_ids": [str(id) for id in testcase_ids]},
+        set_id=testset_id,
+    )
+
+
+def compute_projected_chunk_id(chunk: TestsetManifestChunk) -> UUID:
+    """The id a manifest chunk is stored under once its pending columns are applied."""
+    if not chunk.columns:
+        return chunk.id
+
+    return compute_blob_id(
+        blob_data={
+            "chunk_id": str(chunk.id),
+            "columns": [columns.model_dump(mode="json") for columns in chunk.columns],
+        },
+    )
+
+
+def apply_testset_columns(
+    data: Optional[Dict[str, Any]],
+    columns: TestsetRevisionDeltaColumns,
+) -> Optional[Dict[str, Any]]:
+    if not data:
+        return data
+
+    replace_map = {old: new for old, new in columns.replace or []}
+    remove_set = set(columns.remove or [])
+
+    # Preserve column order for replace/remove.
+    updated_data: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key in remove_set:
+            continue
+        updated_data[replace_map.get(key, key)] = value
+
+    # Apply column additions (initialize to empty string)
+    for col_name in columns.add or []:
+        if col_name not in updated_data:
+            updated_data[col_name] = ""
+
+    return updated_data
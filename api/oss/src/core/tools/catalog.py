@@ -0,0 +1,408 @@
+"""Local mirror of provider tool catalogs.
+
+A periodic sync (``ToolsService.sync_catalog``, driven by the tools cron) copies a
+provider's integrations and actions, schemas included, into Postgres. Each API
+process keeps an in-memory ``CatalogSnapshot`` of those rows with a BM25 index
+over names, descriptions and categories, reloaded whenever a newer sync lands.
+
+Browse, lookup and the first pass of discovery are answered from here; the
+provider is only called when the catalog was never synced, or for what the
+mirror does not hold (the semantic re-rank in discovery).
+"""
+
+import asyncio
+import re
+from datetime import datetime
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from oss.src.utils.logging import get_module_logger
+
+from oss.src.core.tools.dtos import (
+    ToolCatalogAction,
+    ToolCatalogActionDetails,
+    ToolCatalogActionsPage,
+    ToolCatalogIntegration,
+    ToolCatalogIntegrationsPage,
+)
+from oss.src.core.tools.index import BM25Index
+from oss.src.core.tools.interfaces import ToolCatalogDAOInterface
+
+
+log = get_module_logger(__name__)
+
+# How often a process checks Postgres for a newer sync of a provider's catalog.
+CATALOG_REFRESH_INTERVAL = 60  # seconds
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 1000
+
+_CATEGORY_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _category_slug(name: str) -> str:
+    """'Developer Tools' -> 'developer-tools', the id Composio filters by."""
+    return _CATEGORY_SLUG_RE.sub("-", name.lower()).strip("-")
+
+
+def _page(
+    items: List[Any],
+    *,
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> Tuple[List[Any], Optional[str]]:
+    """Offset pagination; the cursor is the offset of the next page."""
+    page_limit = min(limit, MAX_PAGE_SIZE) if limit else DEFAULT_PAGE_SIZE
+    offset = int(cursor) if cursor and cursor.isdigit() else 0
+
+    page = items[offset : offset + page_limit]
+    next_offset = offset + page_limit
+
+    return page, str(next_offset) if next_offset < len(items) else None
+
+
+def is_local_cursor(cursor: Optional[str]) -> bool:
+    """Whether a cursor was issued by a snapshot, not by the provider."""
+    return cursor is None or cursor.isdigit()
+
+
+class CatalogSnapshot:
+    """One provider's catalog as of a sync, with its search indexes."""
+
+    def __init__(
+        self,
+        *,
+        synced_at: datetime,
+        integrations: List[ToolCatalogIntegration],
+        actions: Dict[str, List[ToolCatalogAction]],
+    ):
+        self.synced_at = synced_at
+        # In sync order, which is the provider's usage order
+        self.integrations = integrations
+        self.actions = actions
+
+        self._integrations = {i.key: i for i in integrations}
+
+        self._integrations_index: BM25Index[str] = BM25Index(
+            (
+                integration.key,
+                [
+                    (integration.name, 3),
+                    (integration.key, 3),
+                    (" ".join(integration.categories), 2),
+                    (integration.description, 1),
+                ],
+            )
+            for integration in integrations
+        )
+
+        self._actions_index: BM25Index[Tuple[str, str]] = BM25Index(
+            (
+                (integration_key, action.key),
+                [
+                    (action.name, 3),
+                    (action.key, 2),
+                    (" ".join(action.categories), 2),
+                    (action.description, 1),
+                    (self._integration_name(integration_key), 1),
+                ],
+            )
+            for integration_key, integration_actions in actions.items()
+            for action in integration_actions
+        )
+
+        self._actions = {
+            (integration_key, action.key): action
+            for integration_key, integration_actions in actions.items()
+            for action in integration_actions
+        }
+
+    def _integration_name(self, integration_key: str) -> str:
+        integration = self._integrations.get(integration_key)
+        return integration.name if integration else integration_key
+
+    # -----------------------------------------------------------------------
+    # Integrations
+    # -----------------------------------------------------------------------
+
+    def get_integration(
+        self,
+        *,
+        integration_key: str,
+    ) -> Optional[ToolCatalogIntegration]:
+        return self._integrations.get(integration_key)
+
+    def list_integrations(
+        self,
+        *,
+        search: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> ToolCatalogIntegrationsPage:
+        if search:
+            integrations = [
+                self._integrations[key]
+                for key, _ in self._integrations_index.search(search)
+            ]
+        elif sort_by == "alphabetically":
+            integrations = sorted(self.integrations, key=lambda i: i.name.lower())
+        else:
+            integrations = list(self.integrations)
+
+        if category:
+            wanted = category.lower()
+            integrations = [
+                integration
+                for integration in integrations
+                if any(
+                    wanted in (name.lower(), _category_slug(name))
+                    for name in integration.categories
+                )
+            ]
+
+        page, next_cursor = _page(integrations, limit=limit, cursor=cursor)
+
+        return ToolCatalogIntegrationsPage(
+            integrations=page,
+            next_cursor=next_cursor,
+            total=len(integrations),
+        )
+
+    # -----------------------------------------------------------------------
+    # Actions
+    # -----------------------------------------------------------------------
+
+    def list_actions(
+        self,
+        *,
+        integration_key: str,
+        query: Optional[str] = None,
+        categories: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> ToolCatalogActionsPage:
+        if query:
+            actions = [
+                self._actions[key]
+                for key, _ in self._actions_index.search(query)
+                if key[0] == integration_key
+            ]
+        else:
+            actions = list(self.actions.get(integration_key, []))
+
+        if categories:
+            wanted = {category.lower() for category in categories}
+            actions = [
+                action
+                for action in actions
+                if wanted & {category.lower() for category in action.categories}
+            ]
+
+        page, next_cursor = _page(actions, limit=limit, cursor=cursor)
+
+        return ToolCatalogActionsPage(
+            actions=page,
+            next_cursor=next_cursor,
+            total=len(actions),
+        )
+
+    def search_actions(
+        self,
+        query: str,
+        *,
+        limit: int,
+    ) -> List[Tuple[str, ToolCatalogAction]]:
+        """Best matching actions across integrations, as (integration_key, action)."""
+        return [
+            (key[0], self._actions[key])
+            for key, _ in self._actions_index.search(query, limit=limit)
+        ]
+
+
+class ToolCatalog:
+    """Serves catalog snapshots from Postgres and runs background syncs."""
+
+    def __init__(
+        self,
+        *,
+        catalog_dao: ToolCatalogDAOInterface,
+        refresh_interval: float = CATALOG_REFRESH_INTERVAL,
+    ):
+        self.catalog_dao = catalog_dao
+        self.refresh_interval = refresh_interval
+
+        self._snapshots: Dict[str, CatalogSnapshot] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+        self._syncs: Dict[str, "asyncio.Task[Any]"] = {}
+
+    # -----------------------------------------------------------------------
+    # Reads
+    # -----------------------------------------------------------------------
+
+    async def snapshot(
+        self,
+        *,
+        provider_key: str,
+    ) -> Optional[CatalogSnapshot]:
+        """The provider's latest synced catalog, or None if it was never synced."""
+        if not self._is_due(provider_key):
+            return self._snapshots.get(provider_key)
+
+        async with self._lock:
+            # Another lookup may have reloaded it while this one waited
+            if not self._is_due(provider_key):
+                return self._snapshots.get(provider_key)
+
+            synced_at = await self.catalog_dao.fetch_synced_at(
+                provider_key=provider_key,
+            )
+            self._checked_at[provider_key] = monotonic()
+
+            if synced_at is None:
+                self._snapshots.pop(provider_key, None)
+                return None
+
+            snapshot = self._snapshots.get(provider_key)
+            if snapshot is not None and snapshot.synced_at == synced_at:
+                return snapshot
+
+            integrations = await self.catalog_dao.fetch_integrations(
+                provider_key=provider_key,
+            )
+            actions = await self.catalog_dao.fetch_actions(
+                provider_key=provider_key,
+            )
+
+            # Tokenizing thousands of actions would stall the event loop
+            snapshot = await asyncio.to_thread(
+                CatalogSnapshot,
+                synced_at=synced_at,
+                integrations=integrations,
+                actions=actions,
+            )
+            self._snapshots[provider_key] = snapshot
+
+            log.info(
+                "[tools] catalog snapshot loaded provider=%s integrations=%d synced_at=%s",
+                provider_key,
+                len(integrations),
+                synced_at,
+            )
+
+            return snapshot
+
+    async def get_action(
+        self,
+        *,
+        provider_key: str,
+        integration_key: str,
+        action_key: str,
+    ) -> Optional[ToolCatalogActionDetails]:
+        details = await self.get_actions(
+            provider_key=provider_key,
+            action_refs=[(integration_key, action_key)],
+        )
+        return details.get((integration_key, action_key))
+
+    async def get_actions(
+        self,
+        *,
+        provider_key: str,
+        action_refs: List[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], ToolCatalogActionDetails]:
+        if not action_refs:
+            return {}
+
+        return await self.catalog_dao.fetch_action_details(
+            provider_key=provider_key,
+            action_refs=action_refs,
+        )
+
+    def _is_due(self, provider_key: str) -> bool:
+        checked_at = self._checked_at.get(provider_key)
+        return checked_at is None or monotonic() - checked_at >= self.refresh_interval
+
+    # -----------------------------------------------------------------------
+    # Writes (catalog sync)
+    # -----------------------------------------------------------------------
+
+    async def store_actions(
+        self,
+        *,
+        provider_key: str,
+        integration_key: str,
+        #
+        actions: List[ToolCatalogActionDetails],
+        synced_at: datetime,
+    ) -> bool:
+        return await self.catalog_dao.upsert_actions(
+            provider_key=provider_key,
+            integration_key=integration_key,
+            actions=actions,
+            synced_at=synced_at,
+        )
+
+    async def commit(
+        self,
+        *,
+        provider_key: str,
+        #
+        integrations: List[ToolCatalogIntegration],
+        started_at: datetime,
+        synced_at: datetime,
+        synced_integration_keys: List[str],
+    ) -> bool:
+        """Finish a sync: store the integrations, then drop what it did not see.
+
+        Integrations are written last, so their ``synced_at`` only moves (and
+        processes only reload) once every action of the sync is in place.
+        """
+        stored = await self.catalog_dao.upsert_integrations(
+            provider_key=provider_key,
+            integrations=integrations,
+            synced_at=synced_at,
+        )
+        if not stored:
+            return False
+
+        await self.catalog_dao.delete_stale(
+            provider_key=provider_key,
+            synced_before=started_at,
+            integration_keys=synced_integration_keys,
+        )
+
+        # This process picks the new catalog up on its next lookup
+        self._checked_at.pop(provider_key, None)
+
+        return True
+
+    def start_sync(
+        self,
+        *,
+        provider_key: str,
+        sync: Callable[[], Awaitable[Any]],
+    ) -> bool:
+        """Run ``sync`` in the background; False if one is already running."""
+        running = self._syncs.get(provider_key)
+        if running is not None and not running.done():
+            return False
+
+        task = asyncio.create_task(sync())
+        self._syncs[provider_key] = task
+        task.add_done_callback(lambda t: self._finish_sync(provider_key, t))
+
+        return True
+
+    def _finish_sync(self, provider_key: str, task: "asyncio.Task[Any]") -> None:
+        if self._syncs.get(provider_key) is task:
+            self._syncs.pop(provider_key, None)
+
+        if not task.cancelled() and task.exception() is not None:
+            log.error(
+                "[tools] catalog sync failed provider=%s",
+                provider_key,
+                exc_info=task.exception(),
+            )
@@ -11,7 +11,7 @@ The contract and the Composio→Agenta mapping are documented in
 """
 
 import re
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from oss.src.core.tools.dtos import (
     Capability,
@@ -26,6 +26,7 @@ from oss.src.core.tools.dtos import (
 from oss.src.core.tools.providers.composio.dtos import (
     ComposioSearchQueryResult,
     ComposioSearchResult,
+    ComposioToolSchema,
 )
 
 
@@ -210,6 +211,78 @@ def translate_search_result(
     )
 
 
+def rerank_local_matches(
+    use_cases: List[str],
+    local_matches: Dict[str, List[Tuple[str, str]]],
+    search: Optional[ComposioSearchResult],
+) -> ComposioSearchResult:
+    """Merge the local catalog's first pass with the provider's semantic ranking.
+
+    ``local_matches`` maps each use_case to its BM25 hits from the local catalog,
+    best first, as ``(integration, action)`` pairs. When the provider's semantic
+    search answered (``search``), its picks rank first and the local hits it did
+    not pick fill the alternatives after them; its plan, pitfalls and difficulty
+    are kept. Without it, the local ranking stands on its own.
+
+    Returns the same shape the provider's search does, so the translation above
+    is shared. Schemas for local hits are added by the caller.
+    """
+    remote: Dict[str, ComposioSearchQueryResult] = {}
+    if search is not None:
+        for index, result in enumerate(search.results):
+            remote.setdefault(result.use_case, result)
+            # Fall back to position when the provider rewrote the use_case text
+            if index < len(use_cases):
+                remote.setdefault(use_cases[index], result)
+
+    results: List[ComposioSearchQueryResult] = []
+    for use_case in use_cases:
+        matches = local_matches.get(use_case, [])
+        result = remote.get(use_case)
+
+        slugs = _dedupe(
+            (result.primary_tool_slugs + result.related_tool_slugs if result else [])
+            + [f"{integration.upper()}_{action}" for integration, action in matches]
+        )
+        toolkits = _dedupe(
+            (result.toolkits if result else [])
+            + [integration for integration, _ in matches]
+        )
+
+        results.append(
+            ComposioSearchQueryResult(
+                use_case=use_case,
+                primary_tool_slugs=slugs[:1],
+                related_tool_slugs=slugs[1:],
+                toolkits=toolkits,
+                recommended_plan_steps=result.recommended_plan_steps if result else [],
+                known_pitfalls=result.known_pitfalls if result else [],
+                difficulty=result.difficulty if result else None,
+            )
+        )
+
+    return ComposioSearchResult(
+        results=results,
+        tool_schemas=dict(search.tool_schemas) if search is not None else {},
+    )
+
+
+def local_tool_schema(
+    integration: str,
+    action: str,
+    *,
+    description: Optional[str],
+    input_schema: Optional[Dict[str, Any]],
+) -> ComposioToolSchema:
+    """A search ``tool_schemas`` entry for an action served by the local catalog."""
+    return ComposioToolSchema(
+        toolkit=integration,
+        tool_slug=f"{integration.upper()}_{action}",
+        description=description,
+        input_schema=input_schema,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Internals
 # ---------------------------------------------------------------------------
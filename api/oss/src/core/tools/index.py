@@ -0,0 +1,152 @@
+"""BM25 over the local tool catalog.
+
+An inverted index (term -> postings) built once per catalog snapshot, so a query
+only touches the documents sharing at least one of its terms. Fields are weighted
+by repeating their terms: a match in a name counts more than one in a description.
+
+No I/O; ``core/tools/catalog.py`` builds one index per provider from the rows the
+catalog sync stored in Postgres.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+
+# Okapi BM25 defaults.
+_K1 = 1.2
+_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = frozenset(
+    {
+        "a",
+        "an",
+        "and",
+        "any",
+        "as",
+        "at",
+        "by",
+        "for",
+        "from",
+        "in",
+        "into",
+        "is",
+        "it",
+        "its",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "via",
+        "with",
+    }
+)
+
+
+def _stem(word: str) -> str:
+    """Fold common English inflections, so 'issues' matches 'issue'."""
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif word.endswith("sses"):
+        word = word[:-2]
+    elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+
+    if len(word) > 5 and word.endswith("ing"):
+        word = word[:-3]
+    elif len(word) > 4 and word.endswith("ed"):
+        word = word[:-2]
+
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+
+    return word
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase, split on anything but letters and digits, drop stopwords, stem.
+
+    Slugs tokenize like prose: ``GITHUB_CREATE_AN_ISSUE`` -> github, creat, issu.
+    """
+    if not text:
+        return []
+
+    return [
+        _stem(token)
+        for token in _TOKEN_RE.findall(text.lower())
+        if token not in _STOPWORDS
+    ]
+
+
+class BM25Index(Generic[K]):
+    """Immutable BM25 index over weighted text fields, keyed by ``K``."""
+
+    def __init__(
+        self,
+        documents: Iterable[Tuple[K, Iterable[Tuple[Optional[str], int]]]],
+    ):
+        """``documents`` yields ``(key, [(text, weight), ...])`` pairs."""
+        self._postings: Dict[str, List[Tuple[K, int]]] = {}
+        self._lengths: Dict[K, int] = {}
+        self._positions: Dict[K, int] = {}
+
+        for key, fields in documents:
+            terms: Counter = Counter()
+            for text, weight in fields:
+                for token in tokenize(text):
+                    terms[token] += weight
+
+            self._lengths[key] = sum(terms.values())
+            self._positions[key] = len(self._positions)
+            for term, frequency in terms.items():
+                self._postings.setdefault(term, []).append((key, frequency))
+
+        self._average_length = (
+            sum(self._lengths.values()) / len(self._lengths) if self._lengths else 0.0
+        )
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def search(
+        self,
+        query: Optional[str],
+        *,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[K, float]]:
+        """Documents matching any query term, best first; ties keep index order."""
+        terms = set(tokenize(query))
+        if not terms or not self._lengths:
+            return []
+
+        count = len(self._lengths)
+        scores: Dict[K, float] = {}
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+
+            for key, frequency in postings:
+                norm = 1 - _B + _B * self._lengths[key] / self._average_length
+                scores[key] = scores.get(key, 0.0) + idf * (
+                    frequency * (_K1 + 1) / (frequency + _K1 * norm)
+                )
+
+        # Equal scores keep the order documents were indexed in
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1], self._positions[item[0]]),
+        )
+
+        return ranked[:limit] if limit is not None else ranked
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 from oss.src.core.tools.dtos import (
+    ToolCatalogAction,
     ToolCatalogActionDetails,
     ToolCatalogActionsPage,
     ToolCatalogIntegration,
@@ -67,3 +69,82 @@ class ToolsGatewayInterface(ABC):
     ) -> ToolExecutionResponse:
         """Execute a tool action."""
         ...
+
+
+class ToolCatalogDAOInterface(ABC):
+    """Storage for the local mirror of provider tool catalogs.
+
+    Rows are global (not project-scoped): the catalog is the same for everyone.
+    The catalog sync writes them; ``ToolCatalog`` reads them back to serve
+    browse, lookup and first-pass discovery without calling the provider.
+    """
+
+    @abstractmethod
+    async def upsert_integrations(
+        self,
+        *,
+        provider_key: str,
+        #
+        integrations: List[ToolCatalogIntegration],
+        synced_at: datetime,
+    ) -> bool: ...
+
+    @abstractmethod
+    async def upsert_actions(
+        self,
+        *,
+        provider_key: str,
+        integration_key: str,
+        #
+        actions: List[ToolCatalogActionDetails],
+        synced_at: datetime,
+    ) -> bool: ...
+
+    @abstractmethod
+    async def delete_stale(
+        self,
+        *,
+        provider_key: str,
+        #
+        synced_before: datetime,
+        integration_keys: List[str],
+    ) -> bool:
+        """Drop integrations not seen since ``synced_before``, and the stale
+        actions of ``integration_keys`` (those whose actions were re-synced)."""
+        ...
+
+    @abstractmethod
+    async def fetch_synced_at(
+        self,
+        *,
+        provider_key: str,
+    ) -> Optional[datetime]:
+        """When the provider's catalog last finished syncing; None if never."""
+        ...
+
+    @abstractmethod
+    async def fetch_integrations(
+        self,
+        *,
+        provider_key: str,
+    ) -> List[ToolCatalogIntegration]: ...
+
+    @abstractmethod
+    async def fetch_actions(
+        self,
+        *,
+        provider_key: str,
+    ) -> Dict[str, List[ToolCatalogAction]]:
+        """Every action without its schemas, grouped by integration key."""
+        ...
+
+    @abstractmethod
+    async def fetch_action_details(
+        self,
+        *,
+        provider_key: str,
+        #
+        action_refs: List[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], ToolCatalogActionDetails]:
+        """Actions with their schemas, keyed by ``(integration_key, action_key)``."""
+        ...
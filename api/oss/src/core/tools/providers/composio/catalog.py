@@ -8,14 +8,17 @@ The ``cursor`` value is Composio's native ``next_cursor`` string, passed through
 as-is between our API and Composio's API.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
+from agenta.sdk.models.workflows import JsonSchemas
+
 from oss.src.utils.logging import get_module_logger
 from oss.src.core.tools.dtos import (
     ToolAuthScheme,
     ToolCatalogAction,
+    ToolCatalogActionDetails,
     ToolCatalogActionsPage,
     ToolCatalogIntegration,
     ToolCatalogIntegrationsPage,
@@ -207,6 +210,57 @@ class ComposioCatalogClient:
             limit: Items per page (max 1000)
             cursor: Composio next_cursor from a previous response
         """
+        items_raw, next_cursor, total_items = await self._fetch_actions(
+            integration_key=integration_key,
+            query=query,
+            categories=categories,
+            limit=limit,
+            cursor=cursor,
+        )
+
+        items = [_parse_action(item, integration_key) for item in items_raw]
+
+        return ToolCatalogActionsPage(
+            actions=items,
+            next_cursor=next_cursor,
+            total=total_items,
+        )
+
+    async def list_action_details(
+        self,
+        *,
+        integration_key: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> ToolCatalogActionsPage:
+        """Like ``list_actions``, but keeps the input/output schemas of each action.
+
+        Composio already returns them in the /tools listing, so the catalog sync
+        mirrors a whole integration without one ``get_action`` call per action.
+        """
+        items_raw, next_cursor, total_items = await self._fetch_actions(
+            integration_key=integration_key,
+            limit=limit,
+            cursor=cursor,
+        )
+
+        items = [_parse_action_details(item, integration_key) for item in items_raw]
+
+        return ToolCatalogActionsPage(
+            actions=items,
+            next_cursor=next_cursor,
+            total=total_items,
+        )
+
+    async def _fetch_actions(
+        self,
+        *,
+        integration_key: str,
+        query: Optional[str] = None,
+        categories: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
         page_limit = min(limit, MAX_PAGE_SIZE) if limit else DEFAULT_PAGE_SIZE
 
         # The shared Composio base URL pins every adapter to v3.1. Do not add a
@@ -257,22 +311,16 @@ class ComposioCatalogClient:
         # Strip deprecated actions (belt-and-suspenders on top of the API param)
         items_raw = [item for item in items_raw if not item.get("is_deprecated")]
 
-        items = [_parse_action(item, integration_key) for item in items_raw]
-
         log.debug(
             "[composio] list_actions(%s) cursor=%s items=%d total=%d next=%s",
             integration_key,
             cursor,
-            len(items),
+            len(items_raw),
             total_items,
             next_cursor,
         )
 
-        return ToolCatalogActionsPage(
-            actions=items,
-            next_cursor=next_cursor,
-            total=total_items,
-        )
+        return items_raw, next_cursor, total_items
 
 
 # ---------------------------------------------------------------------------
@@ -403,3 +451,23 @@ def _parse_action(item: Dict[str, Any], integration_key: str) -> ToolCatalogActi
         categories=categories,
         read_only=_derive_read_only(raw_tags),
     )
+
+
+def _parse_action_details(
+    item: Dict[str, Any],
+    integration_key: str,
+) -> ToolCatalogActionDetails:
+    """Parse a /tools item (listing or ``GET /tools/{slug}``) with its schemas."""
+    input_params = item.get("input_parameters")
+    output_params = item.get("output_parameters")
+
+    return ToolCatalogActionDetails(
+        **_parse_action(item, integration_key).model_dump(),
+        schemas=JsonSchemas(
+            inputs=input_params,
+            outputs=output_params,
+        )
+        if input_params or output_params
+        else None,
+        scopes=item.get("scopes") or None,
+    )
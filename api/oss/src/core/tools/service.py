@@ -1,12 +1,22 @@
+import asyncio
 import re
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from oss.src.utils.logging import get_module_logger
 
 from oss.src.core.gateway.catalog.service import CatalogService
+from oss.src.core.gateway.connections.exceptions import (
+    AdapterError as ConnectionAdapterError,
+)
 from oss.src.core.gateway.connections.service import ConnectionsService
 
+from oss.src.core.tools.catalog import (
+    CatalogSnapshot,
+    ToolCatalog,
+    is_local_cursor,
+)
 from oss.src.core.tools.dtos import (
     BuiltinTool,
     CapabilitiesResult,
@@ -15,6 +25,7 @@ from oss.src.core.tools.dtos import (
     ConnectionRequirement,
     ResolvedTool,
     ToolAuthScheme,
+    ToolCatalogAction,
     ToolCatalogActionDetails,
     ToolCatalogActionsPage,
     ToolCatalogCategory,
@@ -31,12 +42,16 @@ from oss.src.core.tools.dtos import (
     ToolsResolution,
 )
 from oss.src.core.tools.discovery import (
+    local_tool_schema,
     looks_like_trigger,
     referenced_integrations,
+    rerank_local_matches,
+    split_composio_slug,
     translate_search_result,
 )
 from oss.src.core.tools.exceptions import (
     ActionNotFoundError,
+    AdapterError,
     ConnectionInactiveError,
     ConnectionInvalidError,
     ConnectionNotFoundError,
@@ -57,25 +72,37 @@ _SLUG_SEGMENT_RE = re.compile(r"^[a-zA-Z0-9-]+(?:_[a-zA-Z0-9-]+)*$")
 # connection-state join is project-scoped.
 _DISCOVERY_CACHE_NAMESPACE = "tools:discover"
 _DEFAULT_LIMIT_ALTERNATIVES = 3
+# Local BM25 hits kept per use_case as candidates for the semantic re-rank.
+_DISCOVERY_LOCAL_CANDIDATES = 10
+
+# Catalog sync: pages as large as the provider allows, a few integrations at once.
+_CATALOG_SYNC_PAGE_SIZE = 1000
+_CATALOG_SYNC_CONCURRENCY = 8
 
 
 class ToolsService:
+    # Optional: without a local catalog, every catalog read goes to the provider.
+    tool_catalog: Optional[ToolCatalog] = None
+
     def __init__(
         self,
         *,
         connections_service: ConnectionsService,
         catalog_service: CatalogService,
         adapter_registry: ToolsGatewayRegistry,
+        tool_catalog: Optional[ToolCatalog] = None,
     ):
         self.connections_service = connections_service
         self.catalog_service = catalog_service
         self.adapter_registry = adapter_registry
+        self.tool_catalog = tool_catalog
 
     # -----------------------------------------------------------------------
     # Catalog browse — providers + integrations come from the SHARED gateway
     # catalog service; this layer narrows them to the tools subclass DTOs so the
     # router only ever sees tools-domain types. Actions are the tools-specific
-    # leaf (via the tools adapter).
+    # leaf (via the tools adapter). Once a provider's catalog has been synced,
+    # integrations and actions are served from the local mirror instead.
     # -----------------------------------------------------------------------
 
     async def list_providers(self) -> List[ToolCatalogProvider]:
@@ -103,6 +130,16 @@ class ToolsService:
         limit: Optional[int] = None,
         cursor: Optional[str] = None,
     ) -> ToolCatalogIntegrationsPage:
+        snapshot = await self._catalog_snapshot(provider_key=provider_key)
+        if snapshot is not None and is_local_cursor(cursor):
+            return snapshot.list_integrations(
+                search=search,
+                sort_by=sort_by,
+                category=category,
+                limit=limit,
+                cursor=cursor,
+            )
+
         page = await self.catalog_service.list_integrations(
             provider_key=provider_key,
             search=search,
@@ -137,6 +174,12 @@ class ToolsService:
         provider_key: str,
         integration_key: str,
     ) -> Optional[ToolCatalogIntegration]:
+        snapshot = await self._catalog_snapshot(provider_key=provider_key)
+        if snapshot is not None:
+            integration = snapshot.get_integration(integration_key=integration_key)
+            if integration is not None:
+                return integration
+
         integration = await self.catalog_service.get_integration(
             provider_key=provider_key,
             integration_key=integration_key,
@@ -158,6 +201,21 @@ class ToolsService:
         cursor: Optional[str] = None,
     ) -> ToolCatalogActionsPage:
         """List actions for an integration with optional search and pagination."""
+        snapshot = await self._catalog_snapshot(provider_key=provider_key)
+        if (
+            snapshot is not None
+            and integration_key in snapshot.actions
+            and is_local_cursor(cursor)
+        ):
+            # ``important`` is reserved upstream too; not filtered on
+            return snapshot.list_actions(
+                integration_key=integration_key,
+                query=query,
+                categories=categories,
+                limit=limit,
+                cursor=cursor,
+            )
+
         adapter = self.adapter_registry.get(provider_key)
         return await adapter.list_actions(
             integration_key=integration_key,
@@ -176,12 +234,201 @@ class ToolsService:
         action_key: str,
     ) -> Optional[ToolCatalogActionDetails]:
         """Return full action detail including input/output schema, or None if not found."""
+        if self.tool_catalog is not None:
+            action = await self.tool_catalog.get_action(
+                provider_key=provider_key,
+                integration_key=integration_key,
+                action_key=action_key,
+            )
+            # Actions synced without schemas (or added since) still go upstream
+            if action is not None and action.schemas is not None:
+                return action
+
         adapter = self.adapter_registry.get(provider_key)
         return await adapter.get_action(
             integration_key=integration_key,
             action_key=action_key,
         )
 
+    async def _catalog_snapshot(
+        self,
+        *,
+        provider_key: str,
+    ) -> Optional[CatalogSnapshot]:
+        if self.tool_catalog is None:
+            return None
+        return await self.tool_catalog.snapshot(provider_key=provider_key)
+
+    # -----------------------------------------------------------------------
+    # Catalog sync — mirrors a provider's catalog into the local tool catalog
+    # -----------------------------------------------------------------------
+
+    async def refresh_catalog(
+        self,
+        *,
+        provider_key: str = ToolProviderKind.COMPOSIO.value,
+    ) -> bool:
+        """Start a background catalog sync; False if one is already running here."""
+        if self.tool_catalog is None:
+            return False
+
+        # Fail fast on an unknown or unconfigured provider
+        self.adapter_registry.get(provider_key)
+
+        return self.tool_catalog.start_sync(
+            provider_key=provider_key,
+            sync=lambda: self.sync_catalog(provider_key=provider_key),
+        )
+
+    async def sync_catalog(
+        self,
+        *,
+        provider_key: str,
+    ) -> bool:
+        """Copy the provider's integrations and actions into the local catalog.
+
+        An integration whose actions fail to sync keeps its previously synced
+        actions; the sync as a whole is only given up when integrations cannot be
+        listed at all.
+        """
+        if self.tool_catalog is None:
+            return False
+
+        tool_catalog = self.tool_catalog
+        adapter = self.adapter_registry.get(provider_key)
+        started_at = datetime.now(timezone.utc)
+
+        integrations = await self._crawl_integrations(provider_key=provider_key)
+
+        semaphore = asyncio.Semaphore(_CATALOG_SYNC_CONCURRENCY)
+
+        async def _sync_integration(
+            integration: ToolCatalogIntegration,
+        ) -> Tuple[ToolCatalogIntegration, bool]:
+            async with semaphore:
+                try:
+                    # The detail carries auth schemes the listing can miss
+                    detail = await self.catalog_service.get_integration(
+                        provider_key=provider_key,
+                        integration_key=integration.key,
+                    )
+                    actions = await self._crawl_actions(
+                        adapter=adapter,
+                        integration_key=integration.key,
+                    )
+                except (AdapterError, ConnectionAdapterError) as e:
+                    log.warning(
+                        "[tools] catalog sync skipped integration=%s: %s",
+                        integration.key,
+                        e,
+                    )
+                    return integration, False
+
+            stored = await tool_catalog.store_actions(
+                provider_key=provider_key,
+                integration_key=integration.key,
+                actions=actions,
+                synced_at=started_at,
+            )
+
+            if detail is not None:
+                integration = ToolCatalogIntegration.model_validate(detail.model_dump())
+
+            return integration, stored
+
+        synced = await asyncio.gather(
+            *(_sync_integration(integration) for integration in integrations)
+        )
+
+        committed = await tool_catalog.commit(
+            provider_key=provider_key,
+            integrations=[integration for integration, _ in synced],
+            started_at=started_at,
+            synced_at=datetime.now(timezone.utc),
+            synced_integration_keys=[
+                integration.key for integration, stored in synced if stored
+            ],
+        )
+
+        log.info(
+            "[tools] catalog sync provider=%s integrations=%d failed=%d committed=%s",
+            provider_key,
+            len(synced),
+            sum(1 for _, stored in synced if not stored),
+            committed,
+        )
+
+        return committed
+
+    async def _crawl_integrations(
+        self,
+        *,
+        provider_key: str,
+    ) -> List[ToolCatalogIntegration]:
+        integrations: Dict[str, ToolCatalogIntegration] = {}
+        cursor: Optional[str] = None
+        seen_cursors = set()
+
+        while True:
+            page = await self.catalog_service.list_integrations(
+                provider_key=provider_key,
+                sort_by="usage",
+                limit=_CATALOG_SYNC_PAGE_SIZE,
+                cursor=cursor,
+            )
+            for integration in page.integrations:
+                if integration.key:
+                    integrations.setdefault(
+                        integration.key,
+                        ToolCatalogIntegration.model_validate(integration.model_dump()),
+                    )
+
+            cursor = page.next_cursor
+            if not cursor or cursor in seen_cursors or not page.integrations:
+                break
+            seen_cursors.add(cursor)
+
+        return list(integrations.values())
+
+    async def _crawl_actions(
+        self,
+        *,
+        adapter: Any,
+        integration_key: str,
+    ) -> List[ToolCatalogActionDetails]:
+        # Adapters that list actions with their schemas save a get_action per action
+        list_fn = getattr(adapter, "list_action_details", None)
+
+        actions: List[ToolCatalogActionDetails] = []
+        cursor: Optional[str] = None
+        seen_cursors = set()
+
+        while True:
+            if list_fn is not None:
+                page = await list_fn(
+                    integration_key=integration_key,
+                    limit=_CATALOG_SYNC_PAGE_SIZE,
+                    cursor=cursor,
+                )
+            else:
+                page = await adapter.list_actions(
+                    integration_key=integration_key,
+                    limit=_CATALOG_SYNC_PAGE_SIZE,
+                    cursor=cursor,
+                )
+
+            actions.extend(
+                ToolCatalogActionDetails.model_validate(action.model_dump())
+                for action in page.actions
+            )
+
+            cursor = page.next_cursor
+            if not cursor or cursor in seen_cursors or not page.actions:
+                break
+            seen_cursors.add(cursor)
+
+        return actions
+
     # -----------------------------------------------------------------------
     # Connection management (delegated to ConnectionsService — one-way dep)
     # -----------------------------------------------------------------------
@@ -498,12 +745,24 @@ class ToolsService:
         semantic search) is cached project-agnostically; connection state is
         recomputed fresh from the project's ``gateway_connections`` rows every call,
         so it never goes stale when a user finishes connecting.
+
+        With a synced local catalog, candidates come from its BM25 index first and
+        the provider's search only re-ranks them (see ``rerank_local_matches``).
         """
-        search = await self._cached_search(
-            provider_key=provider_key,
-            project_id=project_id,
-            use_cases=use_cases,
-        )
+        snapshot = await self._catalog_snapshot(provider_key=provider_key)
+        if snapshot is not None:
+            search = await self._local_search(
+                snapshot=snapshot,
+                provider_key=provider_key,
+                project_id=project_id,
+                use_cases=use_cases,
+            )
+        else:
+            search = await self._cached_search(
+                provider_key=provider_key,
+                project_id=project_id,
+                use_cases=use_cases,
+            )
 
         states: Dict[str, ConnectionRequirement] = {}
         for integration in referenced_integrations(
@@ -524,6 +783,75 @@ class ToolsService:
             trigger_use_cases=trigger_use_cases,
         )
 
+    async def _local_search(
+        self,
+        *,
+        snapshot: CatalogSnapshot,
+        provider_key: str,
+        project_id: UUID,
+        use_cases: List[str],
+    ) -> ComposioSearchResult:
+        local_matches: Dict[str, List[Tuple[str, str]]] = {}
+        local_actions: Dict[Tuple[str, str], ToolCatalogAction] = {}
+        for use_case in use_cases:
+            matches = snapshot.search_actions(
+                use_case,
+                limit=_DISCOVERY_LOCAL_CANDIDATES,
+            )
+            local_matches[use_case] = [
+                (integration, action.key) for integration, action in matches
+            ]
+            for integration, action in matches:
+                local_actions[(integration, action.key)] = action
+
+        # The semantic re-rank is the only remote call; without it, the local
+        # ranking is served on its own rather than failing discovery.
+        remote: Optional[ComposioSearchResult] = None
+        try:
+            remote = await self._cached_search(
+                provider_key=provider_key,
+                project_id=project_id,
+                use_cases=use_cases,
+            )
+        except (AdapterError, DiscoveryUnsupportedError) as e:
+            log.warning(
+                "[tools] discovery re-rank unavailable provider=%s: %s",
+                provider_key,
+                e,
+            )
+
+        search = rerank_local_matches(use_cases, local_matches, remote)
+
+        # Fill in schemas for the surfaced tools the provider did not describe
+        missing: List[Tuple[str, str]] = []
+        for result in search.results:
+            for slug in result.primary_tool_slugs + result.related_tool_slugs:
+                if slug not in search.tool_schemas:
+                    missing.append(split_composio_slug(slug, result.toolkits))
+
+        details = await self.tool_catalog.get_actions(
+            provider_key=provider_key,
+            action_refs=missing,
+        )
+
+        for integration, action_key in missing:
+            action = details.get((integration, action_key)) or local_actions.get(
+                (integration, action_key)
+            )
+            if action is None:
+                continue
+
+            schemas = getattr(action, "schemas", None)
+            schema = local_tool_schema(
+                integration,
+                action_key,
+                description=action.description,
+                input_schema=schemas.inputs if schemas else None,
+            )
+            search.tool_schemas[schema.tool_slug] = schema
+
+        return search
+
     async def _cached_search(
         self,
         *,
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -31,6 +31,27 @@ class TracingDAOInterface(ABC):
     ) -> List[OTelLink]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def edit(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        span_dtos: List[OTelFlatSpan],
+    ) -> List[OTelLink]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def summarize(
+        self,
+        *,
+        project_id: UUID,
+        #
+        trace_ids: List[UUID],
+    ) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def query(
         self,
@@ -85,6 +106,17 @@ class TracingDAOInterface(ABC):
     ) -> List[OTelLink]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def query_trace_ids_by_hashes(
+        self,
+        *,
+        project_id: UUID,
+        #
+        hash_ids: List[UUID],
+        limit: Optional[int] = None,
+    ) -> Dict[UUID, List[UUID]]:
+        raise NotImplementedError
+
     ### SESSIONS AND USERS
 
     @abstractmethod
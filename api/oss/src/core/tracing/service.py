@@ -24,6 +24,7 @@ from oss.src.core.tracing.utils.trees import (
     calculate_and_propagate_metrics_by_trace,
     infer_and_propagate_trace_type_by_trace,
     promote_identity_by_trace,
+    reassemble_trace_rollups,
     trace_map_to_traces,
 )
 from oss.src.core.tracing.streaming import publish_spans
@@ -127,14 +128,16 @@ class TracingService:
             span_dtos=span_dtos,
         )
 
-    async def ingest_span_dtos(
+    def rollup_span_dtos(
         self,
-        *,
-        organization_id: UUID,
-        project_id: UUID,
-        user_id: UUID,
         span_dtos: List[OTelFlatSpan],
-    ) -> OTelLinks:
+    ) -> List[OTelFlatSpan]:
+        """Infer trace types, roll up metrics and promote identity, per trace.
+
+        Runs in the tracing worker over each batch it drains, so it only sees
+        the spans of that batch; `finalize_traces` settles the traces that
+        span several batches.
+        """
         try:
             span_dtos = infer_and_propagate_trace_type_by_trace(span_dtos)
         except Exception:  # pylint: disable=broad-exception-caught
@@ -159,6 +162,53 @@ class TracingService:
                 exc_info=True,
             )
 
+        return span_dtos
+
+    async def finalize_traces(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        trace_ids: List[UUID],
+    ) -> List[OTelLink]:
+        """Recompute trace types and rollups over stored traces; write what changed."""
+        span_dtos = await self.tracing_dao.fetch(
+            project_id=project_id,
+            #
+            trace_ids=trace_ids,
+        )
+
+        span_dtos = reassemble_trace_rollups(span_dtos)
+
+        links = await self.tracing_dao.edit(
+            project_id=project_id,
+            user_id=user_id,
+            #
+            span_dtos=span_dtos,
+        )
+
+        # Edits re-summarize their traces; the rest still get a summary over all of
+        # their spans, as batches writing one trace concurrently can each miss the other's.
+        edited = {UUID(str(span_dto.trace_id)) for span_dto in span_dtos}
+        await self.tracing_dao.summarize(
+            project_id=project_id,
+            #
+            trace_ids=[trace_id for trace_id in trace_ids if trace_id not in edited],
+        )
+
+        return links
+
+    async def ingest_span_dtos(
+        self,
+        *,
+        organization_id: UUID,
+        project_id: UUID,
+        user_id: UUID,
+        span_dtos: List[OTelFlatSpan],
+    ) -> OTelLinks:
+        # Rollups happen in the tracing worker (see rollup_span_dtos), off the
+        # request path and over whole traces rather than one export at a time.
         await publish_spans(
             organization_id=organization_id,
             project_id=project_id,
@@ -782,6 +832,47 @@ class TracingService:
             return trace_map_to_traces(traces)
         return []
 
+    async def fetch_traces_by_hashes(
+        self,
+        *,
+        project_id: UUID,
+        #
+        hash_ids: List[str],
+        limit: Optional[int] = None,
+    ) -> Dict[str, Traces]:
+        """The newest traces stored under each hash, newest first, in two queries."""
+        if not hash_ids:
+            return {}
+
+        trace_ids_by_hash = await self.tracing_dao.query_trace_ids_by_hashes(
+            project_id=project_id,
+            #
+            hash_ids=[UUID(hash_id) for hash_id in hash_ids],
+            limit=limit,
+        )
+
+        trace_ids = {
+            trace_id.hex
+            for trace_ids in trace_ids_by_hash.values()
+            for trace_id in trace_ids
+        }
+        traces = {
+            UUID(str(trace.trace_id)).hex: trace
+            for trace in await self.fetch_traces(
+                project_id=project_id,
+                trace_ids=list(trace_ids),
+            )
+        }
+
+        return {
+            hash_id: [
+                traces[trace_id.hex]
+                for trace_id in trace_ids_by_hash.get(UUID(hash_id), [])
+                if trace_id.hex in traces
+            ]
+            for hash_id in hash_ids
+        }
+
     async def fetch_trace(
         self,
         *,
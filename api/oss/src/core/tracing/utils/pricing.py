@@ -0,0 +1,178 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import litellm
+from litellm import cost_calculator
+
+
+# Distinct model names seen in spans whose resolution is remembered. Spans name a handful
+# of models in practice; the bound only matters for pathological, user-made names.
+PRICING_ALIASES_CACHE_SIZE = 4_096
+
+# Providers litellm prices with calculators of their own (implicit cache discounts,
+# per-request fees), which flat per-token rates would not reproduce.
+NON_FLAT_PRICING_PROVIDERS = frozenset({"fireworks_ai", "perplexity"})
+
+
+class ModelPrices(NamedTuple):
+    input: float
+    output: float
+    cache_read: float
+
+
+def _is_rate(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _flat_prices(entry: Dict[str, Any]) -> Optional[ModelPrices]:
+    """Per-token rates of a litellm cost map entry, if they alone price a call."""
+    input_cost = entry.get("input_cost_per_token")
+    output_cost = entry.get("output_cost_per_token")
+
+    if not _is_rate(input_cost) or not _is_rate(output_cost):
+        return None
+
+    if entry.get("litellm_provider") in NON_FLAT_PRICING_PROVIDERS:
+        return None
+
+    # Rates that change past a context size (`*_above_200k_tokens`) or by tier
+    if any("above_" in key or "tier" in key for key in entry):
+        return None
+
+    # Without a cache-read rate, litellm bills cached tokens as fresh input
+    cache_read_cost = entry.get("cache_read_input_token_cost")
+
+    return ModelPrices(
+        input=input_cost,
+        output=output_cost,
+        cache_read=cache_read_cost if _is_rate(cache_read_cost) else input_cost,
+    )
+
+
+class PricingIndex:
+    """
+    Flat per-token prices compiled from litellm's cost map, keyed by model name.
+
+    A model name resolves to its exact key, then case-insensitively, then with
+    its provider prefixes (`openai/`, `azure/`, ...) dropped one at a time.
+    Resolution is memoized per name, so a span costs one dict lookup.
+    """
+
+    def __init__(self, model_cost: Dict[str, Dict[str, Any]]):
+        self.prices: Dict[str, ModelPrices] = {}
+
+        for key, entry in model_cost.items():
+            if isinstance(entry, dict) and (prices := _flat_prices(entry)):
+                self.prices[key] = prices
+
+        # Lowercase keys claim their own alias before mixed-case ones
+        self.aliases: Dict[str, str] = {
+            key: key for key in self.prices if key.islower()
+        }
+        for key in self.prices:
+            self.aliases.setdefault(key.lower(), key)
+
+        self.resolve = lru_cache(maxsize=PRICING_ALIASES_CACHE_SIZE)(self._resolve)
+
+    def _resolve(self, model: str) -> Optional[str]:
+        name = model.strip()
+
+        while name:
+            if name in self.prices:
+                return name
+
+            if (key := self.aliases.get(name.lower())) is not None:
+                return key
+
+            _, _, name = name.partition("/")
+
+        return None
+
+    def lookup(self, model: Any) -> Optional[ModelPrices]:
+        if not isinstance(model, str):
+            return None
+
+        key = self.resolve(model)
+
+        return self.prices[key] if key is not None else None
+
+
+_pricing_index: Optional[PricingIndex] = None
+
+
+def refresh_pricing_index(
+    model_cost: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> PricingIndex:
+    """(Re)build the index, from litellm's current cost map unless given one."""
+    global _pricing_index
+
+    _pricing_index = PricingIndex(
+        model_cost if model_cost is not None else litellm.model_cost
+    )
+
+    return _pricing_index
+
+
+def get_pricing_index() -> PricingIndex:
+    return _pricing_index or refresh_pricing_index()
+
+
+def cost_per_token(
+    *,
+    model: Any,
+    prompt_tokens: float,
+    completion_tokens: float,
+    cache_read_input_tokens: Optional[int] = None,
+) -> Tuple[float, float]:
+    """
+    (prompt cost, completion cost) in USD, with litellm's semantics: `prompt_tokens`
+    includes the cached ones, which are priced at the cache-read rate.
+
+    Models the index cannot price go through litellm, which raises on unknown ones.
+    """
+    prices = get_pricing_index().lookup(model)
+
+    if prices is None:
+        # Forward the cached count only when there is one, as litellm 1.x releases
+        # predating the parameter reject it
+        cache_kwargs = (
+            {"cache_read_input_tokens": cache_read_input_tokens}
+            if cache_read_input_tokens
+            else {}
+        )
+
+        return cost_calculator.cost_per_token(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            **cache_kwargs,
+        )
+
+    cached_tokens = cache_read_input_tokens or 0
+
+    prompt_cost = (prompt_tokens - cached_tokens) * prices.input + (
+        cached_tokens * prices.cache_read
+    )
+    completion_cost = completion_tokens * prices.output
+
+    return prompt_cost, completion_cost
+
+
+def cost_for_spans(
+    requests: Iterable[Dict[str, Any]],
+) -> List[Optional[Tuple[float, float]]]:
+    """
+    Batch `cost_per_token`, one result per request (its keyword arguments).
+
+    A request that cannot be priced yields None instead of failing the batch.
+    """
+    costs: List[Optional[Tuple[float, float]]] = []
+
+    for request in requests:
+        try:
+            costs.append(cost_per_token(**request))
+
+        except Exception:  # pylint: disable=broad-except
+            costs.append(None)
+
+    return costs
@@ -1,8 +1,7 @@
 from collections import OrderedDict
+from copy import deepcopy
 from typing import Dict, List, Optional
 
-from litellm import cost_calculator
-
 from oss.src.utils.logging import get_module_logger
 from oss.src.core.shared.dtos import Trace, Traces
 from oss.src.core.tracing.dtos import (
@@ -13,6 +12,7 @@ from oss.src.core.tracing.dtos import (
     Span,
     TraceType,
 )
+from oss.src.core.tracing.utils.pricing import cost_for_spans
 
 log = get_module_logger(__name__)
 
@@ -31,8 +31,10 @@ def calculate_and_propagate_metrics(
     """
     Calculate and propagate costs/tokens/errors for a list of span DTOs.
 
-    This must be called BEFORE batching to ensure complete trace trees.
-    If called after batching, partial traces will fail to propagate correctly.
+    Spans whose parent is not in the list are left out of the tree, so a
+    trace split across batches only gets partial rollups here; the tracing
+    worker finalizes those with `reassemble_trace_rollups` once the trace is
+    stored whole.
 
     Args:
         span_dtos: List of span DTOs (should be from a complete trace)
@@ -119,25 +121,28 @@ def infer_and_propagate_trace_type_by_trace(
         trace_types_by_trace[trace_key] = inferred_trace_type
 
     for span in span_dtos:
-        inferred_trace_type = trace_types_by_trace[str(span.trace_id)]
-        span.trace_type = inferred_trace_type
+        _set_trace_type(span, trace_types_by_trace[str(span.trace_id)])
 
-        if span.attributes is None:
-            span.attributes = {}
+    return span_dtos
 
-        ag = span.attributes.setdefault("ag", {})
-        if not isinstance(ag, dict):
-            ag = {}
-            span.attributes["ag"] = ag
 
-        ag_type = ag.setdefault("type", {})
-        if not isinstance(ag_type, dict):
-            ag_type = {}
-            ag["type"] = ag_type
+def _set_trace_type(span: OTelFlatSpan, trace_type: TraceType) -> None:
+    span.trace_type = trace_type
 
-        ag_type["trace"] = inferred_trace_type.value
+    if span.attributes is None:
+        span.attributes = {}
 
-    return span_dtos
+    ag = span.attributes.setdefault("ag", {})
+    if not isinstance(ag, dict):
+        ag = {}
+        span.attributes["ag"] = ag
+
+    ag_type = ag.setdefault("type", {})
+    if not isinstance(ag_type, dict):
+        ag_type = {}
+        ag["type"] = ag_type
+
+    ag_type["trace"] = trace_type.value
 
 
 def promote_identity_by_trace(
@@ -172,6 +177,84 @@ def promote_identity_by_trace(
     return span_dtos
 
 
+def find_partial_traces(
+    span_dtos: List[OTelFlatSpan],
+) -> Dict[str, bool]:
+    """
+    Find the traces in a batch whose rollups the batch alone cannot settle.
+
+    A trace is partial when one of its spans points at a parent outside the
+    batch, or when the batch has no root for it: the rest of the trace was
+    (or will be) written by another batch. Returns trace_id -> whether the
+    batch holds the trace's root, for every partial trace.
+    """
+    spans_by_trace: Dict[str, List[OTelFlatSpan]] = {}
+
+    for span_dto in span_dtos:
+        spans_by_trace.setdefault(str(span_dto.trace_id), []).append(span_dto)
+
+    partial_traces: Dict[str, bool] = {}
+
+    for trace_key, trace_spans in spans_by_trace.items():
+        span_ids = {str(span.span_id) for span in trace_spans}
+
+        has_root = any(span.parent_id is None for span in trace_spans)
+        has_orphans = any(
+            span.parent_id is not None and str(span.parent_id) not in span_ids
+            for span in trace_spans
+        )
+
+        if has_orphans or not has_root:
+            partial_traces[trace_key] = has_root
+
+    return partial_traces
+
+
+def reassemble_trace_rollups(
+    span_dtos: List[OTelFlatSpan],
+) -> List[OTelFlatSpan]:
+    """
+    Recompute trace types and metric rollups over whole stored traces.
+
+    Returns only the spans whose attributes or trace type changed. Stored
+    spans no longer tell an absent `links` from an empty one, so a trace is
+    an annotation iff any of its spans was already written as one.
+    """
+    if not span_dtos:
+        return []
+
+    before = {
+        (str(span.trace_id), str(span.span_id)): (
+            span.trace_type,
+            deepcopy(span.attributes),
+        )
+        for span in span_dtos
+    }
+
+    annotation_traces = {
+        str(span.trace_id)
+        for span in span_dtos
+        if span.trace_type == TraceType.ANNOTATION
+    }
+
+    for span in span_dtos:
+        _set_trace_type(
+            span,
+            TraceType.ANNOTATION
+            if str(span.trace_id) in annotation_traces
+            else TraceType.INVOCATION,
+        )
+
+    span_dtos = calculate_and_propagate_metrics_by_trace(span_dtos)
+
+    return [
+        span
+        for span in span_dtos
+        if (span.trace_type, span.attributes)
+        != before[(str(span.trace_id), str(span.span_id))]
+    ]
+
+
 def parse_span_idx_to_span_id_tree(
     span_idx: Dict[str, OTelFlatSpan],
 ) -> OrderedDict:
@@ -584,6 +667,9 @@ CACHE_READ_TOKEN_KEYS = ("cache_read", "cached")
 
 
 def calculate_costs(span_idx: Dict[str, OTelFlatSpan]):
+    spans: List[OTelFlatSpan] = []
+    requests: List[dict] = []
+
     for span in span_idx.values():
         if (
             span.span_type
@@ -620,73 +706,77 @@ def calculate_costs(span_idx: Dict[str, OTelFlatSpan]):
                 0.0,
             )
 
-            try:
-                # litellm's convention is that `prompt_tokens` INCLUDES the cached tokens and
-                # that it prices the cached slice separately (it normalizes Anthropic-style
-                # usage, where the input count excludes them, on the way in). So the cached
-                # count is passed ALONGSIDE the prompt total and must not be subtracted from
-                # it first -- doing that would understate cost instead of overstating it.
-                #
-                # Passed only when non-zero so a span with no caching calls exactly the
-                # signature it always did: the SDK pins `litellm>=1,<2`, and on a 1.x old
-                # enough to lack the parameter an unconditional kwarg would raise TypeError,
-                # which the `except` below would swallow into "no costs at all" for EVERY span.
-                #
-                # int(), and not incidentally: litellm reads the cached slice back off
-                # `Usage.prompt_tokens_details.cached_tokens`, and its `Usage` model only
-                # derives that wrapper from an int. Hand it the float this metric is stored
-                # as and `prompt_tokens_details` comes back None, so the cached tokens are
-                # billed at the full input rate again -- silently, with no error to catch.
-                cache_kwargs = (
-                    {"cache_read_input_tokens": int(cache_read_tokens)}
-                    if cache_read_tokens
-                    else {}
-                )
-
-                costs = cost_calculator.cost_per_token(
-                    model=model,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
+            # litellm's convention is that `prompt_tokens` INCLUDES the cached tokens and
+            # that it prices the cached slice separately (it normalizes Anthropic-style
+            # usage, where the input count excludes them, on the way in). So the cached
+            # count is passed ALONGSIDE the prompt total and must not be subtracted from
+            # it first -- doing that would understate cost instead of overstating it.
+            #
+            # Passed only when non-zero so a span with no caching calls exactly the
+            # signature it always did: the SDK pins `litellm>=1,<2`, and on a 1.x old
+            # enough to lack the parameter an unconditional kwarg would raise TypeError,
+            # which would turn into "no costs at all" for EVERY span.
+            #
+            # int(), and not incidentally: litellm reads the cached slice back off
+            # `Usage.prompt_tokens_details.cached_tokens`, and its `Usage` model only
+            # derives that wrapper from an int. Hand it the float this metric is stored
+            # as and `prompt_tokens_details` comes back None, so the cached tokens are
+            # billed at the full input rate again -- silently, with no error to catch.
+            cache_kwargs = (
+                {"cache_read_input_tokens": int(cache_read_tokens)}
+                if cache_read_tokens
+                else {}
+            )
+
+            spans.append(span)
+            requests.append(
+                {
+                    "model": model,
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
                     **cache_kwargs,
-                )
-
-                if not costs:
-                    continue
-
-                prompt_cost, completion_cost = costs
-                total_cost = prompt_cost + completion_cost
-
-                if "ag" not in span.attributes or not isinstance(
-                    span.attributes["ag"],
-                    dict,
-                ):
-                    span.attributes["ag"] = {}
-                if "metrics" not in span.attributes["ag"] or not isinstance(
-                    span.attributes["ag"]["metrics"],
-                    dict,
-                ):
-                    span.attributes["ag"]["metrics"] = {}
-
-                if "costs" not in span.attributes["ag"]["metrics"] or not isinstance(
-                    span.attributes["ag"]["metrics"]["costs"],
-                    dict,
-                ):
-                    span.attributes["ag"]["metrics"]["costs"] = {}
-
-                span.attributes["ag"]["metrics"]["costs"]["incremental"] = {
-                    "prompt": prompt_cost,
-                    "completion": completion_cost,
-                    "total": total_cost,
                 }
+            )
+
+    # One pass over the pricing index for every LLM span in the tree
+    costs_per_span = cost_for_spans(requests)
+
+    for span, request, costs in zip(spans, requests, costs_per_span):
+        if not costs:
+            log.warn(
+                "Failed to calculate costs",
+                model=request["model"],
+                prompt_tokens=request["prompt_tokens"],
+                completion_tokens=request["completion_tokens"],
+                cache_read_tokens=request.get("cache_read_input_tokens", 0.0),
+            )
+            continue
+
+        prompt_cost, completion_cost = costs
+        total_cost = prompt_cost + completion_cost
 
-            except Exception:  # pylint: disable=bare-except
-                log.warn(
-                    "Failed to calculate costs",
-                    model=model,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    cache_read_tokens=cache_read_tokens,
-                )
+        if "ag" not in span.attributes or not isinstance(
+            span.attributes["ag"],
+            dict,
+        ):
+            span.attributes["ag"] = {}
+        if "metrics" not in span.attributes["ag"] or not isinstance(
+            span.attributes["ag"]["metrics"],
+            dict,
+        ):
+            span.attributes["ag"]["metrics"] = {}
+
+        if "costs" not in span.attributes["ag"]["metrics"] or not isinstance(
+            span.attributes["ag"]["metrics"]["costs"],
+            dict,
+        ):
+            span.attributes["ag"]["metrics"]["costs"] = {}
+
+        span.attributes["ag"]["metrics"]["costs"]["incremental"] = {
+            "prompt": prompt_cost,
+            "completion": completion_cost,
+            "total": total_cost,
+        }
 
 
 def trace_map_to_traces(trace_map: OTelTraceTree) -> Traces:
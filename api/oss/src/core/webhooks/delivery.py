@@ -3,7 +3,7 @@ import hmac
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 from uuid import UUID
 
@@ -14,6 +14,7 @@ from agenta.sdk.utils.resolvers import resolve_target_fields
 from oss.src.core.webhooks.types import (
     EVENT_CONTEXT_FIELDS,
     SUBSCRIPTION_CONTEXT_FIELDS,
+    WEBHOOK_BATCH_EVENT_TYPE,
     WEBHOOK_TIMEOUT,
     WebhookDeliveryData,
     WebhookEventType,
@@ -92,29 +93,67 @@ def _merge_headers(
     return merged
 
 
-def prepare_webhook_request(
+def _signed_headers(
     *,
-    project_id: UUID,
-    delivery_id: UUID,
-    event_id: UUID,
-    event_type: str,
-    url: str,
-    headers: dict,
-    payload_fields: Optional[Dict[str, Any]],
+    payload_json: str,
+    headers: Optional[dict],
     auth_mode: Optional[str],
-    event: Dict[str, Any],
-    subscription: Dict[str, Any],
     encrypted_secret: str,
-) -> PreparedWebhookRequest:
+    event_type: str,
+    delivery_id: UUID,
+    event_id: Optional[UUID],
+    extra_headers: Optional[dict[str, str]] = None,
+) -> dict[str, str]:
+    signing_secret = decrypt(encrypted_secret)
+    resolved_auth_mode = auth_mode or "signature"
+    timestamp = str(int(datetime.now(timezone.utc).timestamp()))
+
+    system_headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Agenta-Webhook/1.0",
+        "X-Agenta-Event-Type": event_type,
+        "X-Agenta-Delivery-Id": str(delivery_id),
+    }
+    if event_id is not None:
+        system_headers["X-Agenta-Event-Id"] = str(event_id)
+    system_headers["Idempotency-Key"] = str(delivery_id)
+    system_headers.update(extra_headers or {})
+
+    if resolved_auth_mode == "authorization":
+        system_headers["Authorization"] = signing_secret
+    else:
+        to_sign = f"{timestamp}.{payload_json}"
+        signature = hmac.new(
+            key=signing_secret.encode("utf-8"),
+            msg=to_sign.encode("utf-8"),
+            digestmod=hashlib.sha256,
+        ).hexdigest()
+        system_headers["X-Agenta-Signature"] = f"t={timestamp},v1={signature}"
+
+    return _merge_headers(
+        user_headers=headers,
+        system_headers=system_headers,
+    )
+
+
+def _typed_event_type(event_type: str) -> Optional[WebhookEventType]:
     try:
-        typed_event_type = WebhookEventType(event_type)
+        return WebhookEventType(event_type)
     except ValueError:
         log.warning(
             "[WEBHOOKS DELIVERY] Unrecognized event_type %r — storing None in delivery data",
             event_type,
         )
-        typed_event_type = None
+        return None
+
 
+def _resolve_payload(
+    *,
+    project_id: UUID,
+    payload_fields: Optional[Dict[str, Any]],
+    event: Dict[str, Any],
+    subscription: Dict[str, Any],
+) -> Any:
     context = {
         "event": {k: v for k, v in event.items() if k in EVENT_CONTEXT_FIELDS},
         "subscription": {
@@ -124,7 +163,31 @@ def prepare_webhook_request(
     }
 
     resolved_fields = payload_fields if payload_fields is not None else "$"
-    payload = resolve_target_fields(resolved_fields, context)
+    return resolve_target_fields(resolved_fields, context)
+
+
+def prepare_webhook_request(
+    *,
+    project_id: UUID,
+    delivery_id: UUID,
+    event_id: UUID,
+    event_type: str,
+    url: str,
+    headers: dict,
+    payload_fields: Optional[Dict[str, Any]],
+    auth_mode: Optional[str],
+    event: Dict[str, Any],
+    subscription: Dict[str, Any],
+    encrypted_secret: str,
+) -> PreparedWebhookRequest:
+    typed_event_type = _typed_event_type(event_type)
+
+    payload = _resolve_payload(
+        project_id=project_id,
+        payload_fields=payload_fields,
+        event=event,
+        subscription=subscription,
+    )
 
     base_data = WebhookDeliveryData(
         event_type=typed_event_type,
@@ -137,41 +200,16 @@ def prepare_webhook_request(
     except ValueError as exc:
         raise PreparedWebhookRequestError(str(exc), data=base_data) from exc
 
-    signing_secret = decrypt(encrypted_secret)
-    resolved_auth_mode = auth_mode or "signature"
     payload_json = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-    timestamp = str(int(datetime.now(timezone.utc).timestamp()))
 
-    if resolved_auth_mode == "authorization":
-        system_headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Agenta-Webhook/1.0",
-            "X-Agenta-Event-Type": event_type,
-            "X-Agenta-Delivery-Id": str(delivery_id),
-            "X-Agenta-Event-Id": str(event_id),
-            "Idempotency-Key": str(delivery_id),
-            "Authorization": signing_secret,
-        }
-    else:
-        to_sign = f"{timestamp}.{payload_json}"
-        signature = hmac.new(
-            key=signing_secret.encode("utf-8"),
-            msg=to_sign.encode("utf-8"),
-            digestmod=hashlib.sha256,
-        ).hexdigest()
-        system_headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Agenta-Webhook/1.0",
-            "X-Agenta-Event-Type": event_type,
-            "X-Agenta-Delivery-Id": str(delivery_id),
-            "X-Agenta-Event-Id": str(event_id),
-            "Idempotency-Key": str(delivery_id),
-            "X-Agenta-Signature": f"t={timestamp},v1={signature}",
-        }
-
-    request_headers = _merge_headers(
-        user_headers=headers,
-        system_headers=system_headers,
+    request_headers = _signed_headers(
+        payload_json=payload_json,
+        headers=headers,
+        auth_mode=auth_mode,
+        encrypted_secret=encrypted_secret,
+        event_type=event_type,
+        delivery_id=delivery_id,
+        event_id=event_id,
     )
 
     return PreparedWebhookRequest(
@@ -183,17 +221,126 @@ def prepare_webhook_request(
     )
 
 
+@dataclass
+class PreparedWebhookBatchItem:
+    delivery_id: UUID
+    event_id: UUID
+    data: WebhookDeliveryData
+
+
+@dataclass
+class PreparedWebhookBatchRequest:
+    items: List[PreparedWebhookBatchItem]
+    payload_json: str
+    request_headers: dict[str, str]
+    resolved_ip: str
+
+
+class PreparedWebhookBatchRequestError(ValueError):
+    def __init__(self, message: str, *, items: List[PreparedWebhookBatchItem]):
+        super().__init__(message)
+        self.items = items
+
+
+def prepare_webhook_batch_request(
+    *,
+    project_id: UUID,
+    batch_id: UUID,
+    deliveries: List[Dict[str, Any]],
+    url: str,
+    headers: dict,
+    payload_fields: Optional[Dict[str, Any]],
+    auth_mode: Optional[str],
+    subscription: Dict[str, Any],
+    encrypted_secret: str,
+) -> PreparedWebhookBatchRequest:
+    """One signed request carrying several events: ``{"events": [<payload>, ...]}``.
+
+    Each entry of ``deliveries`` holds ``delivery_id``, ``event_id``, ``event_type`` and
+    ``event``; each event is shaped by ``payload_fields`` exactly as it would be alone.
+    The request is identified by ``batch_id`` (``X-Agenta-Delivery-Id`` and
+    ``Idempotency-Key``), its ``X-Agenta-Event-Type`` is ``batch``, and it carries no
+    ``X-Agenta-Event-Id`` — the per-event ids travel in the payloads.
+    """
+    items = [
+        PreparedWebhookBatchItem(
+            delivery_id=UUID(str(delivery["delivery_id"])),
+            event_id=UUID(str(delivery["event_id"])),
+            data=WebhookDeliveryData(
+                event_type=_typed_event_type(delivery["event_type"]),
+                url=url,
+                payload=_resolve_payload(
+                    project_id=project_id,
+                    payload_fields=payload_fields,
+                    event=delivery["event"],
+                    subscription=subscription,
+                ),
+            ),
+        )
+        for delivery in deliveries
+    ]
+
+    try:
+        resolved_ip = resolve_validated_webhook_ip(url)
+    except ValueError as exc:
+        raise PreparedWebhookBatchRequestError(str(exc), items=items) from exc
+
+    payload_json = json.dumps(
+        {"events": [item.data.payload for item in items]},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+    request_headers = _signed_headers(
+        payload_json=payload_json,
+        headers=headers,
+        auth_mode=auth_mode,
+        encrypted_secret=encrypted_secret,
+        event_type=WEBHOOK_BATCH_EVENT_TYPE,
+        delivery_id=batch_id,
+        event_id=None,
+        extra_headers={"X-Agenta-Event-Count": str(len(items))},
+    )
+    redacted_headers = _redact_headers(request_headers)
+
+    for item in items:
+        item.data = item.data.model_copy(update={"headers": redacted_headers})
+
+    return PreparedWebhookBatchRequest(
+        items=items,
+        payload_json=payload_json,
+        request_headers=request_headers,
+        resolved_ip=resolved_ip,
+    )
+
+
+def webhook_destination(*, url: str, resolved_ip: str) -> Tuple[str, str, str, int]:
+    """The connection a request goes out on: scheme, pinned IP, SNI hostname, port.
+
+    Pooled connections are keyed on all four, never on the pinned IP alone — a TLS
+    connection negotiated for one hostname must not carry a request for another that
+    happens to resolve to the same address.
+    """
+    parsed = urlparse(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return parsed.scheme, resolved_ip, parsed.hostname or "", port
+
+
 async def send_webhook_request(
     *,
     url: str,
     resolved_ip: str,
     payload_json: str,
     headers: dict[str, str],
+    client: Optional[httpx.AsyncClient] = None,
 ) -> httpx.Response:
     """POST to the validated IP pinned at prepare-time, not a re-resolved hostname.
 
     Closes the validate/send TOCTOU: the URL's host is swapped for the literal IP
     (SNI + Host header keep the original hostname for TLS and routing).
+
+    ``client`` is a pooled keep-alive client for this exact ``webhook_destination``;
+    without one, the request opens and closes its own connection.
     """
     parsed = urlparse(url)
     host_literal = f"[{resolved_ip}]" if ":" in resolved_ip else resolved_ip
@@ -209,6 +356,14 @@ async def send_webhook_request(
 
     request_headers = {**headers, "Host": host_header}
 
+    if client is not None:
+        return await client.post(
+            pinned_url,
+            content=payload_json,
+            headers=request_headers,
+            extensions={"sni_hostname": parsed.hostname},
+        )
+
     async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT) as client:
         return await client.post(
             pinned_url,
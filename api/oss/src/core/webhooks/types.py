@@ -20,6 +20,22 @@ WEBHOOK_MAX_RETRIES = 5
 
 WEBHOOK_TIMEOUT = 10.0  # seconds per request
 
+# Delivery lanes: one per subscription in each worker process.
+WEBHOOK_LANE_INITIAL_CONCURRENCY = 2  # in-flight requests a lane starts with
+WEBHOOK_LANE_MAX_CONCURRENCY = 8  # ceiling the lane grows towards on success
+WEBHOOK_LANE_MAX_DEFERRALS = 3  # requeues of a delivery that found its lane full
+
+# Circuit breaker: consecutive failures that park an endpoint, and for how long.
+WEBHOOK_BREAKER_FAILURE_THRESHOLD = 5
+WEBHOOK_BREAKER_COOLDOWN = 30.0  # seconds, doubled on every failed probe
+WEBHOOK_BREAKER_MAX_COOLDOWN = 600.0  # seconds
+
+# Pooled keep-alive clients, one per destination, per worker process.
+WEBHOOK_MAX_POOLED_DESTINATIONS = 256
+
+WEBHOOK_MAX_BATCH_SIZE = 100
+WEBHOOK_BATCH_EVENT_TYPE = "batch"
+
 
 # --- CONTEXT ALLOWLISTS ----------------------------------------------------- #
 
@@ -126,6 +142,9 @@ class WebhookSubscriptionData(BaseModel):
 
     event_types: Optional[List[WebhookEventType]] = None
 
+    # Opt-in: deliver up to this many events in one request, `{"events": [...]}`.
+    batch_size: Optional[int] = Field(default=None, ge=1, le=WEBHOOK_MAX_BATCH_SIZE)
+
 
 class WebhookSubscription(Identifier, Lifecycle, Header, Metadata):
     data: WebhookSubscriptionData
@@ -139,6 +139,7 @@ from oss.src.core.embeds.utils import (
     find_object_embeds,
     find_snippet_embeds,
     find_string_embeds,
+    invalidate_resolved_configurations,
 )
 
 from oss.src.middlewares.auth import sign_secret_token
@@ -1532,6 +1533,11 @@ class WorkflowsService:
         if not revision:
             return None
 
+        await invalidate_resolved_configurations(
+            project_id=project_id,
+            ids=[revision.variant_id, revision.artifact_id],
+        )
+
         _workflow_revision = WorkflowRevision(
             **revision.model_dump(mode="json"),
         )
@@ -1972,6 +1978,11 @@ class WorkflowsService:
         if not revision:
             return None
 
+        await invalidate_resolved_configurations(
+            project_id=project_id,
+            ids=[revision.id],
+        )
+
         _workflow_revision = WorkflowRevision(
             **revision.model_dump(mode="json"),
         )
@@ -2401,6 +2412,11 @@ class WorkflowsService:
         if not revision:
             return None
 
+        await invalidate_resolved_configurations(
+            project_id=project_id,
+            ids=[revision.variant_id, revision.artifact_id],
+        )
+
         _workflow_revision = WorkflowRevision(
             **revision.model_dump(mode="json"),
         )
@@ -3060,6 +3076,7 @@ class WorkflowsService:
             max_embeds=max_embeds,
             error_policy=ErrorPolicy(error_policy),
             include_archived=include_archived,
+            revision_id=revision.id,
         )
 
         # Update revision with resolved configuration
@@ -0,0 +1,41 @@
+#!/bin/sh
+set -eu
+
+AGENTA_AUTH_KEY="${AGENTA_AUTH_KEY:-replace-me}"
+
+
+echo "--------------------------------------------------------"
+echo "[$(date)] tools.sh running from cron"
+
+# The API answers right away and syncs the tool catalog in the background, so
+# the timeout only bounds the request itself (mirrors triggers.sh).
+RESPONSE=$(curl \
+    --max-time 30 \
+    --connect-timeout 10 \
+    -s \
+    -w "\nHTTP_STATUS:%{http_code}\n" \
+    -X POST \
+    -H "Authorization: Access ${AGENTA_AUTH_KEY}" \
+    "http://api:8000/admin/tools/catalog/refresh?provider_key=composio" 2>&1) || CURL_EXIT=$?
+
+if [ -n "${CURL_EXIT:-}" ]; then
+    echo "❌ CURL failed with exit code: ${CURL_EXIT}"
+    case ${CURL_EXIT} in
+        6)  echo "   Could not resolve host" ;;
+        7)  echo "   Failed to connect to host" ;;
+        28) echo "   Operation timeout (exceeded 30s)" ;;
+        52) echo "   Empty reply from server" ;;
+        56) echo "   Failure in receiving network data" ;;
+        *)  echo "   Unknown curl error" ;;
+    esac
+else
+    echo "${RESPONSE}"
+    HTTP_CODE=$(echo "${RESPONSE}" | grep "HTTP_STATUS:" | cut -d: -f2)
+    if [ "${HTTP_CODE}" = "200" ]; then
+        echo "✅ Tool catalog sync started successfully"
+    else
+        echo "❌ Tool catalog sync failed with HTTP ${HTTP_CODE}"
+    fi
+fi
+
+echo "[$(date)] tools.sh done"
@@ -3,6 +3,7 @@ from uuid import UUID
 from datetime import datetime, timezone
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
 from oss.src.utils.logging import get_module_logger
 from oss.src.utils.exceptions import suppress_exceptions
@@ -27,6 +28,10 @@ log = get_module_logger(__name__)
 
 T = TypeVar("T")
 
+# Rows per INSERT / IN (...) in add_blobs, well under the 32767 bind-parameter
+# limit of the Postgres wire protocol.
+BLOBS_INSERT_BATCH_SIZE = 1_000
+
 
 class BlobsDAO(BlobsDAOInterface):
     def __init__(
@@ -113,7 +118,7 @@ class BlobsDAO(BlobsDAOInterface):
         #
         blob_id: UUID,
     ) -> Optional[Blob]:
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             stmt = select(self.BlobDBE).filter(
                 self.BlobDBE.project_id == project_id,  # type: ignore
             )
@@ -245,48 +250,78 @@ class BlobsDAO(BlobsDAOInterface):
 
         blob_ids = [blob.id for blob in blobs]
 
+        # Blob ids are content hashes, so a repeated row is the same blob
+        unique_blobs = list({blob.id: blob for blob in blobs}.values())
+
         try:
             async with self.engine.session() as session:
-                stmt = select(self.BlobDBE).filter(
-                    self.BlobDBE.project_id == project_id,  # type: ignore
-                )
+                blob_dbes = {}
+
+                if unique_blobs:
+                    # Existing blobs are left untouched and not returned.
+                    stmt = (
+                        insert(self.BlobDBE)
+                        .on_conflict_do_nothing()
+                        .returning(self.BlobDBE)
+                    )
 
-                stmt = stmt.filter(
-                    self.BlobDBE.id.in_(blob_ids),  # type: ignore
-                )
+                    # A list of parameter sets is sent as batched multi-row
+                    # INSERTs ("insertmanyvalues"), compiled only once.
+                    result = await session.execute(
+                        stmt,
+                        [
+                            dict(
+                                project_id=project_id,
+                                id=blob.id,
+                                created_at=blob.created_at,
+                                created_by_id=blob.created_by_id,
+                                flags=blob.flags,
+                                tags=blob.tags,
+                                meta=blob.meta,
+                                data=blob.data,
+                                set_id=blob.set_id,
+                            )
+                            for blob in unique_blobs
+                        ],
+                        execution_options={
+                            "insertmanyvalues_page_size": BLOBS_INSERT_BATCH_SIZE,
+                        },
+                    )
 
-                existing = await session.execute(stmt)
+                    for blob_dbe in result.scalars().all():
+                        blob_dbes[blob_dbe.id] = blob_dbe
 
-                existing_dbes = existing.scalars().all()
+                await session.commit()
 
-                existing_ids = {b.id for b in existing_dbes}  # type: ignore
+                existing_ids = [
+                    blob.id for blob in unique_blobs if blob.id not in blob_dbes
+                ]
 
-                new_blobs = list(
-                    {
-                        blob.id: blob for blob in blobs if blob.id not in existing_ids
-                    }.values()
-                )
+                for i in range(0, len(existing_ids), BLOBS_INSERT_BATCH_SIZE):
+                    stmt = select(self.BlobDBE).filter(
+                        self.BlobDBE.project_id == project_id,  # type: ignore
+                    )
 
-                blob_dbes = [
-                    map_dto_to_dbe(
-                        DBE=self.BlobDBE,  # type: ignore
-                        project_id=project_id,
-                        dto=blob,
+                    stmt = stmt.filter(
+                        self.BlobDBE.id.in_(  # type: ignore
+                            existing_ids[i : i + BLOBS_INSERT_BATCH_SIZE]
+                        ),
                     )
-                    for blob in new_blobs
-                ]
 
-                session.add_all(blob_dbes)
+                    result = await session.execute(stmt)
 
-                await session.commit()
+                    for blob_dbe in result.scalars().all():
+                        blob_dbes[blob_dbe.id] = blob_dbe
 
-                all_blobs = await self.fetch_blobs(
-                    project_id=project_id,
-                    #
-                    blob_ids=blob_ids,  # type: ignore
-                )
+                _blobs = {
+                    blob_id: map_dbe_to_dto(
+                        DTO=Blob,
+                        dbe=blob_dbe,  # type: ignore
+                    )
+                    for blob_id, blob_dbe in blob_dbes.items()
+                }
 
-                return all_blobs
+                return [_blobs[blob_id] for blob_id in blob_ids if blob_id in _blobs]
 
         except Exception as e:
             log.warn(f"Failed to add blobs: {e}")
@@ -302,7 +337,7 @@ class BlobsDAO(BlobsDAOInterface):
         #
         blob_ids: List[UUID],
     ) -> List[Blob]:
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             stmt = select(self.BlobDBE).filter(
                 self.BlobDBE.project_id == project_id,  # type: ignore
             )
@@ -429,7 +464,7 @@ class BlobsDAO(BlobsDAOInterface):
         #
         windowing: Optional[Windowing] = None,
     ) -> List[Blob]:
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             stmt = select(self.BlobDBE).filter(
                 self.BlobDBE.project_id == project_id,  # type: ignore
             )
@@ -1575,7 +1575,7 @@ class EvaluationsDAO(EvaluationsDAOInterface):
         #
         result_id: UUID,
     ) -> Optional[EvaluationResult]:
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             stmt = select(EvaluationResultDBE).filter(
                 EvaluationResultDBE.project_id == project_id,
             )
@@ -1608,7 +1608,7 @@ class EvaluationsDAO(EvaluationsDAOInterface):
         #
         result_ids: List[UUID],
     ) -> List[EvaluationResult]:
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             stmt = select(EvaluationResultDBE).filter(
                 EvaluationResultDBE.project_id == project_id,
             )
@@ -1739,7 +1739,7 @@ class EvaluationsDAO(EvaluationsDAOInterface):
         #
         windowing: Optional[Windowing] = None,
     ) -> List[EvaluationResult]:
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             stmt = select(EvaluationResultDBE).filter(
                 EvaluationResultDBE.project_id == project_id,
             )
@@ -1,7 +1,16 @@
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    TIMESTAMP,
+    cast,
+    func,
+    literal,
+    literal_column,
+)
+from sqlalchemy import select, tuple_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,17 +18,62 @@ from oss.src.core.sessions.records.dtos import (
     SESSION_MESSAGE_PREVIEW_TEXT_LIMIT,
     SessionMessagePreview,
     SessionRecord,
+    SessionRecordCursor,
     SessionRecordEvent,
+    SessionRecordSnapshot,
 )
 from oss.src.core.sessions.records.interfaces import RecordsDAOInterface
-from oss.src.dbs.postgres.sessions.records.dbes import RecordDBE
+from oss.src.dbs.postgres.sessions.records.dbes import RecordDBE, RecordSnapshotDBE
 from oss.src.dbs.postgres.sessions.records.mappings import (
     map_record_event_to_dbe,
     map_record_dbe_to_dto,
+    map_record_snapshot_dbe_to_dto,
+    map_record_snapshot_dto_to_values,
 )
 from oss.src.dbs.postgres.shared.engine import AnalyticsEngine, get_analytics_engine
 
 
+# Producer event time first: it is the only key that is monotonic across turns.
+# `record_index` restarts at 0 every turn, and the worker can batch records from two turns
+# into one write so they share `created_at` — the old (created_at, record_index) order then
+# sorted the NEXT turn's first record ahead of the PREVIOUS turn's later ones, interleaving
+# the conversation. Rows written before `timestamp` existed sort last within their ingest
+# batch: NULLs map to +infinity (NULLS LAST as plain ascending keys), so a row-value
+# comparison can seek past a cursor. `record_id` only breaks exact ties.
+#
+# Literals, not bind parameters: the planner only uses
+# ix_records_project_id_session_id_order when these match its expressions exactly.
+_TIMESTAMP_KEY = func.coalesce(
+    RecordDBE.timestamp,
+    literal_column("'infinity'::timestamptz"),
+)
+_RECORD_INDEX_KEY = func.coalesce(
+    RecordDBE.record_index,
+    literal_column("2147483647"),
+)
+_ORDER_KEYS = (
+    _TIMESTAMP_KEY,
+    RecordDBE.created_at,
+    _RECORD_INDEX_KEY,
+    RecordDBE.record_id,
+)
+
+
+def _cursor_keys(cursor: SessionRecordCursor):
+    return tuple_(
+        func.coalesce(
+            literal(cursor.timestamp, TIMESTAMP(timezone=True)),
+            literal_column("'infinity'::timestamptz"),
+        ),
+        literal(cursor.created_at, TIMESTAMP(timezone=True)),
+        func.coalesce(
+            literal(cursor.record_index, Integer),
+            literal_column("2147483647"),
+        ),
+        literal(cursor.record_id),
+    )
+
+
 class RecordsDAO(RecordsDAOInterface):
     def __init__(self, engine: AnalyticsEngine = None):
         if engine is None:
@@ -132,6 +186,8 @@ class RecordsDAO(RecordsDAOInterface):
                 "attributes": stmt.excluded.attributes,
                 "turn_id": stmt.excluded.turn_id,
                 "span_id": stmt.excluded.span_id,
+                # A rewrite changes what a replay snapshot folded (see get_snapshot)
+                "updated_at": func.current_timestamp(),
             },
         ).returning(RecordDBE)
 
@@ -140,7 +196,14 @@ class RecordsDAO(RecordsDAOInterface):
         *,
         project_id: UUID,
         session_id: str,
+        after: Optional[SessionRecordCursor] = None,
+        limit: Optional[int] = None,
     ) -> List[SessionRecord]:
+        """The session's records in conversation order (see `_ORDER_KEYS`).
+
+        `after` seeks past a cursor, so a reader that keeps the last record it saw pages
+        through, or catches up on, a session without re-reading what it already has.
+        """
         async with self.engine.session() as session:
             stmt = (
                 select(RecordDBE)
@@ -148,22 +211,93 @@ class RecordsDAO(RecordsDAOInterface):
                     RecordDBE.project_id == project_id,
                     RecordDBE.session_id == session_id,
                 )
-                # Producer event time first: it is the only key that is monotonic across
-                # turns. `record_index` restarts at 0 every turn, and the worker can batch
-                # records from two turns into one write so they share `created_at` — the old
-                # (created_at, record_index) order then sorted the NEXT turn's first record
-                # ahead of the PREVIOUS turn's later ones, interleaving the conversation.
-                # Rows written before `timestamp` existed sort last within their ingest batch.
-                .order_by(
-                    RecordDBE.timestamp.asc().nullslast(),
-                    RecordDBE.created_at.asc(),
-                    RecordDBE.record_index.asc(),
-                )
+                .order_by(*(key.asc() for key in _ORDER_KEYS))
             )
 
+            if after is not None:
+                stmt = stmt.where(tuple_(*_ORDER_KEYS) > _cursor_keys(after))
+
+            if limit is not None:
+                stmt = stmt.limit(limit)
+
             dbes = (await session.execute(stmt)).scalars().all()
             return [map_record_dbe_to_dto(dbe=dbe) for dbe in dbes]
 
+    async def get_snapshot(
+        self,
+        *,
+        project_id: UUID,
+        session_id: str,
+        kind: str,
+    ) -> Optional[SessionRecordSnapshot]:
+        """The session's `kind` snapshot, unless the records it folded have changed since.
+
+        Records at or before the cursor are counted and checksummed (index-only, off
+        ix_records_project_id_session_id_order); a late arrival behind the cursor, or a
+        rewrite of a record already folded, no longer matches and the snapshot is ignored.
+        """
+        async with self.engine.session() as session:
+            stmt = select(RecordSnapshotDBE).where(
+                RecordSnapshotDBE.project_id == project_id,
+                RecordSnapshotDBE.session_id == session_id,
+                RecordSnapshotDBE.snapshot_kind == kind,
+            )
+
+            dbe = (await session.execute(stmt)).scalars().first()
+            if dbe is None:
+                return None
+
+            snapshot = map_record_snapshot_dbe_to_dto(dbe=dbe)
+
+            # Epoch microseconds of each record's last write, as `record_version`
+            written_at = func.coalesce(RecordDBE.updated_at, RecordDBE.created_at)
+            stmt = select(
+                func.count(),
+                func.coalesce(
+                    func.sum(
+                        cast(
+                            func.extract("epoch", written_at) * 1_000_000,
+                            BigInteger,
+                        )
+                    ),
+                    0,
+                ),
+            ).where(
+                RecordDBE.project_id == project_id,
+                RecordDBE.session_id == session_id,
+                tuple_(*_ORDER_KEYS) <= _cursor_keys(snapshot.cursor),
+            )
+
+            count, checksum = (await session.execute(stmt)).one()
+
+        if count != snapshot.record_count or int(checksum) != snapshot.record_checksum:
+            return None
+
+        return snapshot
+
+    async def put_snapshot(
+        self,
+        *,
+        snapshot: SessionRecordSnapshot,
+    ) -> None:
+        values = map_record_snapshot_dto_to_values(snapshot=snapshot)
+
+        async with self.engine.session() as session:
+            stmt = insert(RecordSnapshotDBE).values(values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["project_id", "session_id", "snapshot_kind"],
+                set_={
+                    **{
+                        column: stmt.excluded[column]
+                        for column in values
+                        if column not in ("project_id", "session_id", "snapshot_kind")
+                    },
+                    "updated_at": func.current_timestamp(),
+                },
+            )
+            await session.execute(stmt)
+            await session.commit()
+
     async def latest_message_per_session(
         self,
         *,
@@ -1,6 +1,6 @@
 import uuid_utils.compat as uuid
 
-from sqlalchemy import Column, UUID, TIMESTAMP, String, Integer
+from sqlalchemy import Column, UUID, TIMESTAMP, String, Integer, Numeric
 from sqlalchemy.dialects.postgresql import JSONB
 
 
@@ -65,3 +65,52 @@ class RecordDBA:
         JSONB(none_as_null=True),
         nullable=True,
     )
+
+
+class RecordSnapshotDBA:
+    __abstract__ = True
+
+    session_id = Column(
+        String,
+        nullable=False,
+    )
+    # What `state` holds and in which format (see SessionRecordSnapshot.kind).
+    snapshot_kind = Column(
+        String,
+        nullable=False,
+    )
+
+    # The last record folded into `state`, as its order key (see get_records).
+    cursor_timestamp = Column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
+    cursor_created_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
+    cursor_record_index = Column(
+        Integer,
+        nullable=True,
+    )
+    cursor_record_id = Column(
+        UUID(as_uuid=True),
+        nullable=False,
+    )
+
+    # What the records at or before the cursor added up to when `state` was folded;
+    # a snapshot they no longer add up to is stale. The checksum is a sum of epoch
+    # microseconds, so it outgrows a bigint after a few thousand records.
+    record_count = Column(
+        Integer,
+        nullable=False,
+    )
+    record_checksum = Column(
+        Numeric,
+        nullable=False,
+    )
+
+    state = Column(
+        JSONB(none_as_null=True),
+        nullable=False,
+    )
@@ -1,7 +1,11 @@
-from sqlalchemy import PrimaryKeyConstraint, Index
+from sqlalchemy import PrimaryKeyConstraint, Index, text
 
 from oss.src.dbs.postgres.shared.base import Base
-from oss.src.dbs.postgres.sessions.records.dbas import RecordDBA, RecordTurnSpanDBA
+from oss.src.dbs.postgres.sessions.records.dbas import (
+    RecordDBA,
+    RecordSnapshotDBA,
+    RecordTurnSpanDBA,
+)
 from oss.src.dbs.postgres.shared.dbas import ProjectScopeDBA, LifecycleDBA
 
 
@@ -33,4 +37,29 @@ class RecordDBE(
             "session_id",
             "turn_id",
         ),
+        # The session order `get_records` reads and seeks by (see its sort keys).
+        # `updated_at` rides along so snapshot checks are index-only.
+        Index(
+            "ix_records_project_id_session_id_order",
+            "project_id",
+            "session_id",
+            text("coalesce(timestamp, 'infinity'::timestamptz)"),
+            "created_at",
+            text("coalesce(record_index, 2147483647)"),
+            "record_id",
+            postgresql_include=["updated_at"],
+        ),
+    )
+
+
+class RecordSnapshotDBE(
+    Base,
+    ProjectScopeDBA,
+    LifecycleDBA,
+    RecordSnapshotDBA,
+):
+    __tablename__ = "record_snapshots"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("project_id", "session_id", "snapshot_kind"),
     )
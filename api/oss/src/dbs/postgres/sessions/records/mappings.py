@@ -2,9 +2,11 @@ import uuid_utils.compat as uuid
 
 from oss.src.core.sessions.records.dtos import (
     SessionRecord,
+    SessionRecordCursor,
     SessionRecordEvent,
+    SessionRecordSnapshot,
 )
-from oss.src.dbs.postgres.sessions.records.dbes import RecordDBE
+from oss.src.dbs.postgres.sessions.records.dbes import RecordDBE, RecordSnapshotDBE
 
 
 def map_record_event_to_dbe(
@@ -41,4 +43,37 @@ def map_record_dbe_to_dto(*, dbe: RecordDBE) -> SessionRecord:
         turn_id=dbe.turn_id,
         span_id=dbe.span_id,
         created_at=dbe.created_at,
+        updated_at=dbe.updated_at,
+    )
+
+
+def map_record_snapshot_dto_to_values(*, snapshot: SessionRecordSnapshot) -> dict:
+    return {
+        "project_id": snapshot.project_id,
+        "session_id": snapshot.session_id,
+        "snapshot_kind": snapshot.kind,
+        "cursor_timestamp": snapshot.cursor.timestamp,
+        "cursor_created_at": snapshot.cursor.created_at,
+        "cursor_record_index": snapshot.cursor.record_index,
+        "cursor_record_id": snapshot.cursor.record_id,
+        "record_count": snapshot.record_count,
+        "record_checksum": snapshot.record_checksum,
+        "state": snapshot.state,
+    }
+
+
+def map_record_snapshot_dbe_to_dto(*, dbe: RecordSnapshotDBE) -> SessionRecordSnapshot:
+    return SessionRecordSnapshot(
+        project_id=dbe.project_id,
+        session_id=dbe.session_id,
+        kind=dbe.snapshot_kind,
+        cursor=SessionRecordCursor(
+            timestamp=dbe.cursor_timestamp,
+            created_at=dbe.cursor_created_at,
+            record_index=dbe.cursor_record_index,
+            record_id=dbe.cursor_record_id,
+        ),
+        record_count=dbe.record_count,
+        record_checksum=int(dbe.record_checksum),
+        state=dbe.state,
     )
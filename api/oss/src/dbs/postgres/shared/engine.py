@@ -1,8 +1,29 @@
+"""Postgres engines: the core (transactions) and tracing (analytics) databases.
+
+Each engine owns a pool on its database's primary and, when a replica DSN is set, a
+second pool on that replica. ``session()`` is always the primary. ``read_session()``
+is for heavy reads that tolerate a little staleness, and goes to the replica unless:
+
+- it runs outside a request's ``routing_scope()`` (workers, crons): their writes
+  happen in gathered child tasks that cannot pin the caller, so they always read
+  the primary, or
+- the replica lags the primary by more than ``replica_max_lag_ms``, or its lag could
+  not be measured recently (the lag is sampled in the background, at most every
+  ``replica_lag_check_ms``), or
+- the current request has written to this database (read-your-writes): a primary
+  session that inserted, updated or deleted pins the rest of the request, child
+  tasks included, to the primary.
+"""
+
+import asyncio
+import time
 from asyncio import current_task
-from typing import AsyncGenerator, Optional
-from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncGenerator, Iterator, Optional, Set
+from contextlib import asynccontextmanager, contextmanager
 from math import floor
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
@@ -10,8 +31,12 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     async_scoped_session,
 )
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from oss.src.utils.env import env
+from oss.src.utils.logging import get_module_logger
+
+log = get_module_logger(__name__)
 
 
 DATABASE_MEMORY = 32 * 1024 * 1024 * 1024  # 32 GB
@@ -25,6 +50,153 @@ POOL_SIZE = floor(NOF_CONNECTIONS * 0.25)
 MAX_OVERFLOW = NOF_CONNECTIONS - POOL_SIZE
 POOL_RECYCLE = 30 * 60  # 30 minutes
 
+# A lag sample older than this many check intervals no longer vouches for the replica.
+REPLICA_LAG_STALE_CHECKS = 3
+REPLICA_LAG_CHECK_TIMEOUT = 1.0  # seconds
+
+# Replication lag in milliseconds; 0 on a primary or a fully replayed standby.
+_REPLICA_LAG_STMT = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) * 1000,
+            0
+        )
+    END
+    """
+)
+
+
+# --- read-your-writes ------------------------------------------------------ #
+
+
+class _Routing:
+    """The databases the current request has written to."""
+
+    __slots__ = ("pinned",)
+
+    def __init__(self) -> None:
+        self.pinned: Set[str] = set()
+
+
+_routing: ContextVar[Optional[_Routing]] = ContextVar("postgres_routing", default=None)
+
+
+@contextmanager
+def routing_scope() -> Iterator[None]:
+    """Scope read-your-writes pinning to one request (shared by its child tasks)."""
+    token = _routing.set(_Routing())
+    try:
+        yield
+    finally:
+        _routing.reset(token)
+
+
+def _pin(database: str) -> None:
+    routing = _routing.get()
+    if routing is not None:
+        routing.pinned.add(database)
+
+
+def _pinned(database: str) -> bool:
+    """Whether reads must go to the primary: always, outside a request scope."""
+    routing = _routing.get()
+    return routing is None or database in routing.pinned
+
+
+class _TrackedSession(Session):
+    """Records in ``info`` whether it wrote, for read-your-writes routing."""
+
+
+@event.listens_for(_TrackedSession, "do_orm_execute")
+def _track_execute(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["wrote"] = True
+
+
+@event.listens_for(_TrackedSession, "after_flush")
+def _track_flush(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+# --- replicas -------------------------------------------------------------- #
+
+
+class _Replica:
+    """A streaming replica of one database, and its last measured lag."""
+
+    def __init__(self, uri: str) -> None:
+        self._engine: AsyncEngine = create_async_engine(
+            url=uri,
+            pool_pre_ping=True,
+            pool_recycle=POOL_RECYCLE,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+        )
+        self._session_maker = async_sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            bind=self._engine,
+        )
+        self.lag_ms: Optional[float] = None
+        self._measured_at = 0.0
+        self._checked_at = 0.0
+        self._check: Optional[asyncio.Task] = None
+
+    def fresh(self) -> bool:
+        now = time.monotonic()
+        interval = env.postgres.replica_lag_check_ms / 1000
+
+        if now - self._checked_at >= interval and (
+            self._check is None or self._check.done()
+        ):
+            self._checked_at = now
+            self._check = asyncio.create_task(self._measure_lag())
+
+        return (
+            self.lag_ms is not None
+            and self.lag_ms <= env.postgres.replica_max_lag_ms
+            and now - self._measured_at <= interval * REPLICA_LAG_STALE_CHECKS
+        )
+
+    async def _read_lag(self) -> float:
+        async with self._engine.connect() as connection:
+            lag = (await connection.execute(_REPLICA_LAG_STMT)).scalar()
+        return float(lag or 0)
+
+    async def _measure_lag(self) -> None:
+        try:
+            self.lag_ms = await asyncio.wait_for(
+                self._read_lag(),
+                timeout=REPLICA_LAG_CHECK_TIMEOUT,
+            )
+            self._measured_at = time.monotonic()
+        except Exception:  # pylint: disable=broad-exception-caught
+            if self.lag_ms is not None:
+                log.warning(
+                    "[POSTGRES] Replica lag check failed; reading from the primary",
+                    exc_info=True,
+                )
+            self.lag_ms = None
+
+    async def close(self) -> None:
+        if self._check is not None:
+            self._check.cancel()
+        await self._engine.dispose()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+        # Read-only: nothing to commit, closing ends the transaction
+        session: AsyncSession = self._session_maker()
+        try:
+            yield session
+        finally:
+            await session.close()
+
 
 class TransactionsEngine:
     """Postgres core DB — application data."""
@@ -37,10 +209,16 @@ class TransactionsEngine:
             pool_size=POOL_SIZE,
             max_overflow=MAX_OVERFLOW,
         )
+        self._replica: Optional[_Replica] = (
+            _Replica(env.postgres.uri_core_replica)
+            if env.postgres.uri_core_replica
+            else None
+        )
         _session_maker = async_sessionmaker(
             autocommit=False,
             autoflush=False,
             class_=AsyncSession,
+            sync_session_class=_TrackedSession if self._replica else Session,
             expire_on_commit=False,
             bind=self._engine,
         )
@@ -52,6 +230,8 @@ class TransactionsEngine:
     async def close(self) -> None:
         if self._engine is not None:
             await self._engine.dispose()
+        if self._replica is not None:
+            await self._replica.close()
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -59,12 +239,28 @@ class TransactionsEngine:
         try:
             yield session
             await session.commit()
+            if self._replica is not None and session.sync_session.info.pop(
+                "wrote", False
+            ):
+                _pin("core")
         except Exception as e:
             await session.rollback()
+            session.sync_session.info.pop("wrote", None)
             raise e
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """A session for heavy reads: the replica when fresh, else the primary."""
+        if self._replica is None or _pinned("core") or not self._replica.fresh():
+            async with self.session() as session:
+                yield session
+            return
+
+        async with self._replica.session() as session:
+            yield session
+
 
 class AnalyticsEngine:
     """Postgres tracing DB — observability data."""
@@ -77,10 +273,16 @@ class AnalyticsEngine:
             pool_size=POOL_SIZE,
             max_overflow=MAX_OVERFLOW,
         )
+        self._replica: Optional[_Replica] = (
+            _Replica(env.postgres.uri_tracing_replica)
+            if env.postgres.uri_tracing_replica
+            else None
+        )
         _session_maker = async_sessionmaker(
             autocommit=False,
             autoflush=False,
             class_=AsyncSession,
+            sync_session_class=_TrackedSession if self._replica else Session,
             expire_on_commit=False,
             bind=self._engine,
         )
@@ -92,6 +294,8 @@ class AnalyticsEngine:
     async def close(self) -> None:
         if self._engine is not None:
             await self._engine.dispose()
+        if self._replica is not None:
+            await self._replica.close()
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession, None]:
@@ -99,12 +303,28 @@ class AnalyticsEngine:
         try:
             yield session
             await session.commit()
+            if self._replica is not None and session.sync_session.info.pop(
+                "wrote", False
+            ):
+                _pin("tracing")
         except Exception as e:
             await session.rollback()
+            session.sync_session.info.pop("wrote", None)
             raise e
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """A session for heavy reads: the replica when fresh, else the primary."""
+        if self._replica is None or _pinned("tracing") or not self._replica.fresh():
+            async with self.session() as session:
+                yield session
+            return
+
+        async with self._replica.session() as session:
+            yield session
+
 
 _transactions_engine: Optional[TransactionsEngine] = None
 _analytics_engine: Optional[AnalyticsEngine] = None
@@ -0,0 +1,118 @@
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy import cast, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID, insert
+
+from oss.src.utils.logging import get_module_logger
+from oss.src.utils.exceptions import suppress_exceptions
+
+from oss.src.core.testsets.dtos import TestsetChunk
+from oss.src.core.testsets.interfaces import TestsetChunksDAOInterface
+
+from oss.src.dbs.postgres.shared.engine import (
+    TransactionsEngine,
+    get_transactions_engine,
+)
+from oss.src.dbs.postgres.testsets.dbes import TestsetChunkDBE
+
+
+log = get_module_logger(__name__)
+
+# Chunks per INSERT page in add_chunks; each chunk carries up to a thousand ids.
+CHUNKS_INSERT_BATCH_SIZE = 100
+
+
+class TestsetChunksDAO(TestsetChunksDAOInterface):
+    def __init__(
+        self,
+        *,
+        engine: TransactionsEngine = None,
+    ):
+        if engine is None:
+            engine = get_transactions_engine()
+        self.engine = engine
+
+    # ─ chunks ─────────────────────────────────────────────────────────────────
+
+    @suppress_exceptions(default=False)
+    async def add_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        testset_id: UUID,
+        chunks: List[TestsetChunk],
+    ) -> bool:
+        # Chunk ids are content hashes, so an existing chunk is the same chunk
+        unique_chunks = list({chunk.id: chunk for chunk in chunks}.values())
+
+        if not unique_chunks:
+            return True
+
+        async with self.engine.session() as session:
+            await session.execute(
+                insert(TestsetChunkDBE).on_conflict_do_nothing(),
+                [
+                    dict(
+                        project_id=project_id,
+                        id=chunk.id,
+                        set_id=testset_id,
+                        testcase_ids=chunk.testcase_ids,
+                    )
+                    for chunk in unique_chunks
+                ],
+                execution_options={
+                    "insertmanyvalues_page_size": CHUNKS_INSERT_BATCH_SIZE,
+                },
+            )
+
+            await session.commit()
+
+        return True
+
+    @suppress_exceptions(default={})
+    async def fetch_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        chunk_ids: List[UUID],
+    ) -> Dict[UUID, List[UUID]]:
+        if not chunk_ids:
+            return {}
+
+        async with self.engine.read_session() as session:
+            stmt = select(TestsetChunkDBE.id, TestsetChunkDBE.testcase_ids).filter(
+                TestsetChunkDBE.project_id == project_id,
+                TestsetChunkDBE.id.in_(set(chunk_ids)),
+            )
+
+            result = await session.execute(stmt)
+
+            return {row.id: list(row.testcase_ids) for row in result.all()}
+
+    @suppress_exceptions(default={})
+    async def find_chunks(
+        self,
+        *,
+        project_id: UUID,
+        #
+        chunk_ids: List[UUID],
+        testcase_ids: List[UUID],
+    ) -> Dict[UUID, List[UUID]]:
+        if not chunk_ids or not testcase_ids:
+            return {}
+
+        async with self.engine.read_session() as session:
+            stmt = select(TestsetChunkDBE.id, TestsetChunkDBE.testcase_ids).filter(
+                TestsetChunkDBE.project_id == project_id,
+                TestsetChunkDBE.id.in_(set(chunk_ids)),
+                TestsetChunkDBE.testcase_ids.overlap(
+                    cast(list(set(testcase_ids)), ARRAY(PG_UUID(as_uuid=True)))
+                ),
+            )
+
+            result = await session.execute(stmt)
+
+            return {row.id: list(row.testcase_ids) for row in result.all()}
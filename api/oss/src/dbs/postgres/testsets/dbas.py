@@ -0,0 +1,17 @@
+from sqlalchemy import Column, UUID
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from oss.src.dbs.postgres.shared.dbas import IdentifierDBA, LifecycleDBA
+
+
+class TestsetChunkDBA(IdentifierDBA, LifecycleDBA):
+    __abstract__ = True
+
+    set_id = Column(
+        UUID(as_uuid=True),
+        nullable=False,
+    )
+    testcase_ids = Column(
+        ARRAY(UUID(as_uuid=True)),
+        nullable=False,
+    )
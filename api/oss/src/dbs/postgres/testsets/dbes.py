@@ -9,6 +9,7 @@ from sqlalchemy import (
 from oss.src.dbs.postgres.shared.base import Base
 from oss.src.dbs.postgres.shared.dbas import ProjectScopeDBA
 from oss.src.dbs.postgres.git.dbas import VariantDBA, RevisionDBA, ArtifactDBA
+from oss.src.dbs.postgres.testsets.dbas import TestsetChunkDBA
 
 
 CASCADE_ALL_DELETE = "all, delete-orphan"
@@ -119,3 +120,34 @@ class TestsetRevisionDBE(Base, ProjectScopeDBA, RevisionDBA):
         "TestsetVariantDBE",
         viewonly=True,
     )
+
+
+class TestsetChunkDBE(Base, ProjectScopeDBA, TestsetChunkDBA):
+    __tablename__ = "testset_chunks"
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "project_id",
+            "id",
+        ),
+        ForeignKeyConstraint(
+            ["project_id"],
+            ["projects.id"],
+            ondelete="CASCADE",
+        ),
+        ForeignKeyConstraint(
+            ["project_id", "set_id"],
+            ["testset_artifacts.project_id", "testset_artifacts.id"],
+            ondelete="CASCADE",
+        ),
+        Index(
+            "ix_testset_chunks_project_id_set_id",
+            "project_id",
+            "set_id",
+        ),
+        Index(
+            "ix_testset_chunks_testcase_ids_gin",
+            "testcase_ids",
+            postgresql_using="gin",
+        ),
+    )
@@ -0,0 +1,282 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, exists, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from oss.src.utils.logging import get_module_logger
+from oss.src.utils.exceptions import suppress_exceptions
+
+from oss.src.core.tools.dtos import (
+    ToolCatalogAction,
+    ToolCatalogActionDetails,
+    ToolCatalogIntegration,
+)
+from oss.src.core.tools.interfaces import ToolCatalogDAOInterface
+
+from oss.src.dbs.postgres.shared.engine import (
+    TransactionsEngine,
+    get_transactions_engine,
+)
+from oss.src.dbs.postgres.tools.dbes import (
+    ToolCatalogActionDBE,
+    ToolCatalogIntegrationDBE,
+)
+from oss.src.dbs.postgres.tools.mappings import (
+    map_action_data_to_dto,
+    map_action_dbe_to_details_dto,
+    map_action_dto_to_dbe_upsert,
+    map_integration_dbe_to_dto,
+    map_integration_dto_to_dbe_upsert,
+)
+
+
+log = get_module_logger(__name__)
+
+# Rows per INSERT page in the upserts; an action row carries its schemas.
+CATALOG_UPSERT_BATCH_SIZE = 200
+
+
+class ToolCatalogDAO(ToolCatalogDAOInterface):
+    def __init__(
+        self,
+        *,
+        engine: TransactionsEngine = None,
+    ):
+        if engine is None:
+            engine = get_transactions_engine()
+        self.engine = engine
+
+    # ─ writes ─────────────────────────────────────────────────────────────────
+
+    @suppress_exceptions(default=False)
+    async def upsert_integrations(
+        self,
+        *,
+        provider_key: str,
+        #
+        integrations: List[ToolCatalogIntegration],
+        synced_at: datetime,
+    ) -> bool:
+        if not integrations:
+            return True
+
+        stmt = insert(ToolCatalogIntegrationDBE)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["provider_key", "key"],
+            set_={
+                "position": stmt.excluded.position,
+                "name": stmt.excluded.name,
+                "data": stmt.excluded.data,
+                "synced_at": stmt.excluded.synced_at,
+            },
+        )
+
+        async with self.engine.session() as session:
+            await session.execute(
+                stmt,
+                [
+                    map_integration_dto_to_dbe_upsert(
+                        provider_key=provider_key,
+                        position=position,
+                        synced_at=synced_at,
+                        integration=integration,
+                    )
+                    for position, integration in enumerate(integrations)
+                ],
+                execution_options={
+                    "insertmanyvalues_page_size": CATALOG_UPSERT_BATCH_SIZE,
+                },
+            )
+
+            await session.commit()
+
+        return True
+
+    @suppress_exceptions(default=False)
+    async def upsert_actions(
+        self,
+        *,
+        provider_key: str,
+        integration_key: str,
+        #
+        actions: List[ToolCatalogActionDetails],
+        synced_at: datetime,
+    ) -> bool:
+        # Composio pages can repeat an action across cursors; keep its first position
+        unique_actions = list({action.key: action for action in actions}.values())
+
+        if not unique_actions:
+            return True
+
+        stmt = insert(ToolCatalogActionDBE)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["provider_key", "integration_key", "key"],
+            set_={
+                "position": stmt.excluded.position,
+                "name": stmt.excluded.name,
+                "data": stmt.excluded.data,
+                "schemas": stmt.excluded.schemas,
+                "synced_at": stmt.excluded.synced_at,
+            },
+        )
+
+        async with self.engine.session() as session:
+            await session.execute(
+                stmt,
+                [
+                    map_action_dto_to_dbe_upsert(
+                        provider_key=provider_key,
+                        integration_key=integration_key,
+                        position=position,
+                        synced_at=synced_at,
+                        action=action,
+                    )
+                    for position, action in enumerate(unique_actions)
+                ],
+                execution_options={
+                    "insertmanyvalues_page_size": CATALOG_UPSERT_BATCH_SIZE,
+                },
+            )
+
+            await session.commit()
+
+        return True
+
+    @suppress_exceptions(default=False)
+    async def delete_stale(
+        self,
+        *,
+        provider_key: str,
+        #
+        synced_before: datetime,
+        integration_keys: List[str],
+    ) -> bool:
+        async with self.engine.session() as session:
+            await session.execute(
+                delete(ToolCatalogIntegrationDBE).where(
+                    ToolCatalogIntegrationDBE.provider_key == provider_key,
+                    ToolCatalogIntegrationDBE.synced_at < synced_before,
+                )
+            )
+
+            if integration_keys:
+                await session.execute(
+                    delete(ToolCatalogActionDBE).where(
+                        ToolCatalogActionDBE.provider_key == provider_key,
+                        ToolCatalogActionDBE.integration_key.in_(integration_keys),
+                        ToolCatalogActionDBE.synced_at < synced_before,
+                    )
+                )
+
+            # Actions of integrations the provider no longer lists
+            await session.execute(
+                delete(ToolCatalogActionDBE).where(
+                    ToolCatalogActionDBE.provider_key == provider_key,
+                    ~exists().where(
+                        ToolCatalogIntegrationDBE.provider_key == provider_key,
+                        ToolCatalogIntegrationDBE.key
+                        == ToolCatalogActionDBE.integration_key,
+                    ),
+                )
+            )
+
+            await session.commit()
+
+        return True
+
+    # ─ reads ──────────────────────────────────────────────────────────────────
+
+    @suppress_exceptions(default=None)
+    async def fetch_synced_at(
+        self,
+        *,
+        provider_key: str,
+    ) -> Optional[datetime]:
+        async with self.engine.read_session() as session:
+            stmt = select(func.max(ToolCatalogIntegrationDBE.synced_at)).where(
+                ToolCatalogIntegrationDBE.provider_key == provider_key,
+            )
+
+            result = await session.execute(stmt)
+
+            return result.scalar()
+
+    @suppress_exceptions(default=[])
+    async def fetch_integrations(
+        self,
+        *,
+        provider_key: str,
+    ) -> List[ToolCatalogIntegration]:
+        async with self.engine.read_session() as session:
+            stmt = (
+                select(ToolCatalogIntegrationDBE)
+                .where(ToolCatalogIntegrationDBE.provider_key == provider_key)
+                .order_by(ToolCatalogIntegrationDBE.position)
+            )
+
+            result = await session.execute(stmt)
+
+            return [
+                map_integration_dbe_to_dto(integration_dbe=integration_dbe)
+                for integration_dbe in result.scalars().all()
+            ]
+
+    @suppress_exceptions(default={})
+    async def fetch_actions(
+        self,
+        *,
+        provider_key: str,
+    ) -> Dict[str, List[ToolCatalogAction]]:
+        async with self.engine.read_session() as session:
+            # Schemas are most of each row and are not needed to browse or search
+            stmt = (
+                select(
+                    ToolCatalogActionDBE.integration_key,
+                    ToolCatalogActionDBE.data,
+                )
+                .where(ToolCatalogActionDBE.provider_key == provider_key)
+                .order_by(
+                    ToolCatalogActionDBE.integration_key,
+                    ToolCatalogActionDBE.position,
+                )
+            )
+
+            result = await session.execute(stmt)
+
+            actions: Dict[str, List[ToolCatalogAction]] = {}
+            for row in result.all():
+                actions.setdefault(row.integration_key, []).append(
+                    map_action_data_to_dto(data=row.data)
+                )
+
+            return actions
+
+    @suppress_exceptions(default={})
+    async def fetch_action_details(
+        self,
+        *,
+        provider_key: str,
+        #
+        action_refs: List[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], ToolCatalogActionDetails]:
+        if not action_refs:
+            return {}
+
+        async with self.engine.read_session() as session:
+            stmt = select(ToolCatalogActionDBE).where(
+                ToolCatalogActionDBE.provider_key == provider_key,
+                tuple_(
+                    ToolCatalogActionDBE.integration_key,
+                    ToolCatalogActionDBE.key,
+                ).in_(list(set(action_refs))),
+            )
+
+            result = await session.execute(stmt)
+
+            return {
+                (action_dbe.integration_key, action_dbe.key): (
+                    map_action_dbe_to_details_dto(action_dbe=action_dbe)
+                )
+                for action_dbe in result.scalars().all()
+            }
@@ -0,0 +1,88 @@
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    PrimaryKeyConstraint,
+    String,
+    TIMESTAMP,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from oss.src.dbs.postgres.shared.base import Base
+
+
+class ToolCatalogIntegrationDBE(Base):
+    __tablename__ = "tool_catalog_integrations"
+
+    __table_args__ = (
+        PrimaryKeyConstraint("provider_key", "key"),
+        Index(
+            "ix_tool_catalog_integrations_provider_key_synced_at",
+            "provider_key",
+            "synced_at",
+        ),
+    )
+
+    provider_key = Column(
+        String,
+        nullable=False,
+    )
+    key = Column(
+        String,
+        nullable=False,
+    )
+    position = Column(
+        Integer,
+        nullable=False,
+    )
+    name = Column(
+        String,
+        nullable=False,
+    )
+    data = Column(
+        JSONB(none_as_null=True),
+        nullable=False,
+    )
+    synced_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
+
+
+class ToolCatalogActionDBE(Base):
+    __tablename__ = "tool_catalog_actions"
+
+    __table_args__ = (PrimaryKeyConstraint("provider_key", "integration_key", "key"),)
+
+    provider_key = Column(
+        String,
+        nullable=False,
+    )
+    integration_key = Column(
+        String,
+        nullable=False,
+    )
+    key = Column(
+        String,
+        nullable=False,
+    )
+    position = Column(
+        Integer,
+        nullable=False,
+    )
+    name = Column(
+        String,
+        nullable=False,
+    )
+    data = Column(
+        JSONB(none_as_null=True),
+        nullable=False,
+    )
+    schemas = Column(
+        JSONB(none_as_null=True),
+        nullable=True,
+    )
+    synced_at = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
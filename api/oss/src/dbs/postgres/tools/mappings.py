@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Any, Dict
+
+from agenta.sdk.models.workflows import JsonSchemas
+
+from oss.src.core.tools.dtos import (
+    ToolCatalogAction,
+    ToolCatalogActionDetails,
+    ToolCatalogIntegration,
+)
+from oss.src.dbs.postgres.tools.dbes import (
+    ToolCatalogActionDBE,
+    ToolCatalogIntegrationDBE,
+)
+
+
+def map_integration_dto_to_dbe_upsert(
+    *,
+    provider_key: str,
+    position: int,
+    synced_at: datetime,
+    #
+    integration: ToolCatalogIntegration,
+) -> Dict[str, Any]:
+    return {
+        "provider_key": provider_key,
+        "key": integration.key,
+        "position": position,
+        "name": integration.name,
+        "data": integration.model_dump(mode="json", exclude_none=True),
+        "synced_at": synced_at,
+    }
+
+
+def map_integration_dbe_to_dto(
+    *,
+    integration_dbe: ToolCatalogIntegrationDBE,
+) -> ToolCatalogIntegration:
+    return ToolCatalogIntegration.model_validate(integration_dbe.data)
+
+
+def map_action_dto_to_dbe_upsert(
+    *,
+    provider_key: str,
+    integration_key: str,
+    position: int,
+    synced_at: datetime,
+    #
+    action: ToolCatalogActionDetails,
+) -> Dict[str, Any]:
+    return {
+        "provider_key": provider_key,
+        "integration_key": integration_key,
+        "key": action.key,
+        "position": position,
+        "name": action.name,
+        "data": action.model_dump(
+            mode="json",
+            exclude_none=True,
+            exclude={"schemas"},
+        ),
+        "schemas": (
+            action.schemas.model_dump(mode="json", exclude_none=True)
+            if action.schemas
+            else None
+        ),
+        "synced_at": synced_at,
+    }
+
+
+def map_action_data_to_dto(
+    *,
+    data: Dict[str, Any],
+) -> ToolCatalogAction:
+    return ToolCatalogAction.model_validate(data)
+
+
+def map_action_dbe_to_details_dto(
+    *,
+    action_dbe: ToolCatalogActionDBE,
+) -> ToolCatalogActionDetails:
+    return ToolCatalogActionDetails(
+        **action_dbe.data,
+        schemas=(
+            JsonSchemas.model_validate(action_dbe.schemas)
+            if action_dbe.schemas
+            else None
+        ),
+    )
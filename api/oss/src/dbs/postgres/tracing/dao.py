@@ -3,13 +3,13 @@ from uuid import UUID
 from traceback import format_exc
 from datetime import datetime, timezone
 
-from sqlalchemy import cast, func, select, text
+from sqlalchemy import bindparam, cast, delete, func, select, text, true, update
 from sqlalchemy.types import Numeric, BigInteger
 from sqlalchemy.sql import Select, and_, or_
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql.elements import ColumnElement
-from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy.dialects.postgresql import ARRAY, BIT, UUID as PG_UUID
 
 from oss.src.utils.logging import get_module_logger
 from oss.src.utils.exceptions import suppress_exceptions
@@ -31,7 +31,7 @@ from oss.src.core.tracing.dtos import (
 
 from oss.src.dbs.postgres.shared.utils import apply_windowing
 from oss.src.dbs.postgres.shared.engine import AnalyticsEngine, get_analytics_engine
-from oss.src.dbs.postgres.tracing.dbes import SpanDBE
+from oss.src.dbs.postgres.tracing.dbes import SpanDBE, TraceDBE, TraceHashDBE
 from oss.src.dbs.postgres.tracing.mappings import (
     map_span_dbe_to_link_dto,
     map_span_dto_to_span_dbe,
@@ -51,6 +51,7 @@ from oss.src.dbs.postgres.tracing.utils import (
     build_extract_cte,
     build_type_flags,
     build_statistics_stmt,
+    build_trace_summary_stmt,
     #
     compute_range,
     parse_pcts,
@@ -131,10 +132,112 @@ class TracingDAO(TracingDAOInterface):
                 link_dto = map_span_dbe_to_link_dto(span_dbe=span_dbe)
                 link_dtos.append(link_dto)
 
+            await session.execute(
+                build_trace_summary_stmt(
+                    project_id=project_id,
+                    trace_ids=sorted({UUID(str(dto.trace_id)) for dto in span_dtos}),
+                )
+            )
+
+            # Root span hashes index the trace for reuse lookups
+            hash_values = [
+                {
+                    "project_id": project_id,
+                    "hash_id": hash_dto.id,
+                    "trace_id": UUID(str(span_dto.trace_id)),
+                    "start_time": span_dto.start_time,
+                }
+                for span_dto in span_dtos
+                if span_dto.parent_id is None and span_dto.hashes
+                for hash_dto in span_dto.hashes
+                if hash_dto.id
+            ]
+
+            if hash_values:
+                await session.execute(
+                    insert(TraceHashDBE)
+                    .values(hash_values)
+                    .on_conflict_do_nothing(
+                        index_elements=["project_id", "hash_id", "trace_id"],
+                    )
+                )
+
             await session.commit()
 
             return link_dtos
 
+    async def edit(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        span_dtos: List[OTelFlatSpan],
+    ) -> List[OTelLink]:
+        """Overwrite trace types and attributes of stored spans, in one bulk UPDATE."""
+        if not span_dtos:
+            return []
+
+        now = datetime.now(timezone.utc)
+
+        values = [
+            dict(
+                project_id=project_id,
+                trace_id=UUID(str(span_dto.trace_id)),
+                span_id=UUID(str(span_dto.span_id)),
+                #
+                trace_type=span_dto.trace_type,
+                attributes=span_dto.attributes,
+                #
+                updated_at=now,
+                updated_by_id=user_id,
+            )
+            for span_dto in span_dtos
+        ]
+
+        async with self.engine.session() as session:
+            # A list of primary-keyed rows makes this an ORM bulk UPDATE by
+            # primary key: one executemany, and no INSERT for unknown spans.
+            await session.execute(update(SpanDBE), values)
+
+            await session.execute(
+                build_trace_summary_stmt(
+                    project_id=project_id,
+                    trace_ids=sorted({value["trace_id"] for value in values}),
+                )
+            )
+
+            await session.commit()
+
+        return [
+            OTelLink(
+                trace_id=value["trace_id"].hex,
+                span_id=value["span_id"].hex[16:],
+            )
+            for value in values
+        ]
+
+    async def summarize(
+        self,
+        *,
+        project_id: UUID,
+        #
+        trace_ids: List[UUID],
+    ) -> None:
+        """Recompute the trace summaries of the given traces from their stored spans."""
+        if not trace_ids:
+            return
+
+        async with self.engine.session() as session:
+            await session.execute(
+                build_trace_summary_stmt(
+                    project_id=project_id,
+                    trace_ids=sorted(trace_ids),
+                )
+            )
+
+            await session.commit()
+
     @suppress_exceptions(default=[])
     async def query(
         self,
@@ -161,7 +264,7 @@ class TracingDAO(TracingDAOInterface):
         # ---------
 
         try:
-            async with self.engine.session() as session:
+            async with self.engine.read_session() as session:
                 # TIMEOUT
                 await session.execute(TIMEOUT_STMT)
                 # -------
@@ -196,6 +299,8 @@ class TracingDAO(TracingDAOInterface):
                 # ---------
 
                 # WINDOWING
+                sampled = None
+
                 if rate is not None:
                     percent = max(0, min(int(rate * 100.0), 100))
 
@@ -203,7 +308,7 @@ class TracingDAO(TracingDAOInterface):
                         return []
 
                     if percent < 100:
-                        base = base.where(
+                        sampled = (
                             cast(
                                 text("concat('x', left(cast(trace_id as varchar), 8))"),
                                 BIT(32),
@@ -211,10 +316,61 @@ class TracingDAO(TracingDAOInterface):
                             % 100
                             < percent
                         )
+                        base = base.where(sampled)
                 # ---------
 
                 # GROUPING
-                if focus == Focus.TRACE:
+                if focus == Focus.TRACE and not (operator and conditions):
+                    # Unfiltered trace lists page over the trace summaries,
+                    # one row per trace, instead of grouping every span.
+                    uniq = select(TraceDBE.trace_id).filter(
+                        TraceDBE.project_id == project_id
+                    )
+
+                    if sampled is not None:
+                        uniq = uniq.where(sampled)
+
+                    # WINDOWING
+                    if newest:
+                        if next:
+                            uniq = uniq.filter(TraceDBE.latest_start_time <= newest)
+                        else:
+                            uniq = uniq.filter(TraceDBE.latest_start_time < newest)
+                    if oldest:
+                        uniq = uniq.filter(TraceDBE.latest_start_time >= oldest)
+                    # ---------
+
+                    if next and newest:
+                        uniq = uniq.filter(
+                            or_(
+                                TraceDBE.latest_start_time < newest,
+                                and_(
+                                    TraceDBE.latest_start_time == newest,
+                                    TraceDBE.trace_id < next,
+                                ),
+                            )
+                        )
+
+                    uniq = uniq.order_by(
+                        TraceDBE.latest_start_time.desc(),
+                        TraceDBE.trace_id.desc(),
+                    )
+
+                    if limit:
+                        uniq = uniq.limit(limit)
+
+                    stmt = (
+                        select(SpanDBE)
+                        .filter(SpanDBE.project_id == project_id)
+                        .filter(SpanDBE.trace_id.in_(uniq))
+                        .order_by(
+                            func.max(SpanDBE.start_time)
+                            .over(partition_by=SpanDBE.trace_id)
+                            .desc(),
+                            SpanDBE.start_time.asc(),
+                        )
+                    )
+                elif focus == Focus.TRACE:
                     # WINDOWING
                     if newest:
                         if next:
@@ -416,7 +572,7 @@ class TracingDAO(TracingDAOInterface):
         # log.trace(str(statistics_stmt.compile(**DEBUG_ARGS)).replace("\n", " "))
         # ---------
 
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             await session.execute(TIMEOUT_STMT)
 
             rows = (await session.execute(select(statistics_stmt))).mappings().all()
@@ -547,7 +703,7 @@ class TracingDAO(TracingDAOInterface):
         ) = parse_windowing(query.windowing)
 
         try:
-            async with self.engine.session() as session:
+            async with self.engine.read_session() as session:
                 await session.execute(TIMEOUT_STMT)
 
                 # BASE QUERY HELPERS
@@ -811,10 +967,86 @@ class TracingDAO(TracingDAOInterface):
             for span_dbe in span_dbes:
                 await session.delete(span_dbe)
 
+            await session.execute(
+                delete(TraceDBE).filter(
+                    TraceDBE.project_id == project_id,
+                    TraceDBE.trace_id.in_(trace_ids),
+                )
+            )
+            await session.execute(
+                delete(TraceHashDBE).filter(
+                    TraceHashDBE.project_id == project_id,
+                    TraceHashDBE.trace_id.in_(trace_ids),
+                )
+            )
+
             await session.commit()
 
             return link_dtos
 
+    @suppress_exceptions(default={})
+    async def query_trace_ids_by_hashes(
+        self,
+        *,
+        project_id: UUID,
+        #
+        hash_ids: List[UUID],
+        limit: Optional[int] = None,
+    ) -> Dict[UUID, List[UUID]]:
+        """Find the newest traces whose root span carries each hash, in one query."""
+        if not hash_ids:
+            return {}
+
+        hashes = (
+            func.unnest(
+                bindparam(
+                    "hash_ids",
+                    value=list(dict.fromkeys(hash_ids)),
+                    type_=ARRAY(PG_UUID(as_uuid=True)),
+                )
+            )
+            .table_valued("hash_id")
+            .render_derived()
+        )
+
+        newest = (
+            select(TraceHashDBE.trace_id, TraceHashDBE.start_time)
+            .filter(
+                TraceHashDBE.project_id == project_id,
+                TraceHashDBE.hash_id == hashes.c.hash_id,
+            )
+            .order_by(
+                TraceHashDBE.start_time.desc(),
+                TraceHashDBE.trace_id.desc(),
+            )
+        )
+
+        if limit:
+            newest = newest.limit(limit)
+
+        newest = newest.lateral("newest")
+
+        stmt = (
+            select(hashes.c.hash_id, newest.c.trace_id)
+            .select_from(hashes)
+            .join(newest, true())
+            .order_by(
+                hashes.c.hash_id,
+                newest.c.start_time.desc(),
+                newest.c.trace_id.desc(),
+            )
+        )
+
+        async with self.engine.read_session() as session:
+            rows = (await session.execute(stmt)).all()
+
+        trace_ids_by_hash: Dict[UUID, List[UUID]] = {}
+
+        for hash_id, trace_id in rows:
+            trace_ids_by_hash.setdefault(hash_id, []).append(trace_id)
+
+        return trace_ids_by_hash
+
     ### SESSIONS AND USERS
 
     @suppress_exceptions(default=([], None))
@@ -877,7 +1109,7 @@ class TracingDAO(TracingDAOInterface):
             realtime: If True, use last_active (mutable, shows recent activity but unstable cursors).
                      If False/None, use first_active (immutable, stable cursors but doesn't reflect new activity).
         """
-        async with self.engine.session() as session:
+        async with self.engine.read_session() as session:
             # TIMEOUT
             await session.execute(TIMEOUT_STMT)
 
@@ -889,18 +1121,23 @@ class TracingDAO(TracingDAOInterface):
 
             # BASE QUERY: Use DISTINCT ON pattern (like query() does for traces)
             # DISTINCT ON picks one row per identifier based on ORDER BY
-            # TODO(WP0.7, deferred): SpanDBE.session_id/user_id are now indexed
-            # root-only columns (see migration oss000000003) — this JSONB path
-            # scan can become a column scan. Left as-is; not blocking.
-            id_column = SpanDBE.attributes["ag"][group]["id"].as_string()
+            # Scans the trace summaries (one row per trace, indexed by
+            # project, identifier and start time) rather than every span.
+            id_column = getattr(TraceDBE, f"{group}_id")
+            # Activity is the trace's latest span start in realtime mode (its
+            # last activity), its start otherwise. The same column filters,
+            # picks, orders and pages, so cursors line up with the order.
+            activity_column = (
+                TraceDBE.latest_start_time if realtime else TraceDBE.start_time
+            )
             base = (
                 select(
                     id_column.label(f"{group}_id"),
-                    SpanDBE.start_time,
+                    activity_column.label("activity"),
                 )
                 .distinct(id_column)
-                .filter(SpanDBE.project_id == project_id)
-                .filter(SpanDBE.attributes["ag"][group].has_key("id"))
+                .filter(TraceDBE.project_id == project_id)
+                .filter(id_column.isnot(None))
             )
 
             # Apply time-range filters on base query (before deduplication)
@@ -909,21 +1146,21 @@ class TracingDAO(TracingDAOInterface):
                 if order_direction == "ascending":
                     # ASC: Moving forward in time
                     if windowing.newest:
-                        base = base.filter(SpanDBE.start_time <= windowing.newest)
+                        base = base.filter(activity_column <= windowing.newest)
                     if windowing.oldest:
                         if windowing.next:
-                            base = base.filter(SpanDBE.start_time >= windowing.oldest)
+                            base = base.filter(activity_column >= windowing.oldest)
                         else:
-                            base = base.filter(SpanDBE.start_time > windowing.oldest)
+                            base = base.filter(activity_column > windowing.oldest)
                 else:
                     # DESC: Moving backward in time
                     if windowing.newest:
                         if windowing.next:
-                            base = base.filter(SpanDBE.start_time <= windowing.newest)
+                            base = base.filter(activity_column <= windowing.newest)
                         else:
-                            base = base.filter(SpanDBE.start_time < windowing.newest)
+                            base = base.filter(activity_column < windowing.newest)
                     if windowing.oldest:
-                        base = base.filter(SpanDBE.start_time >= windowing.oldest)
+                        base = base.filter(activity_column >= windowing.oldest)
 
             # ORDER BY for DISTINCT ON: identifier first, then start_time
             # This determines which row to pick per identifier
@@ -932,13 +1169,13 @@ class TracingDAO(TracingDAOInterface):
                 # Realtime mode: Pick latest activity (unstable but shows recent activity)
                 base = base.order_by(
                     id_column,
-                    SpanDBE.start_time.desc(),
+                    activity_column.desc(),
                 )
             else:
                 # Stable mode: Pick earliest activity (stable cursor)
                 base = base.order_by(
                     id_column,
-                    SpanDBE.start_time.asc(),
+                    activity_column.asc(),
                 )
 
             # Create subquery (like query() does with inner/uniq pattern)
@@ -949,15 +1186,15 @@ class TracingDAO(TracingDAOInterface):
             activity_label = "last_active" if realtime else "first_active"
             uniq = select(
                 getattr(inner.c, f"{group}_id").label(f"{group}_id"),
-                inner.c.start_time.label(activity_label),
+                inner.c.activity.label(activity_label),
             )
 
             # Order the unique identifiers by their activity time
             # (regardless of realtime mode, order by the picked timestamp)
             if order_direction == "ascending":
-                uniq = uniq.order_by(inner.c.start_time.asc())
+                uniq = uniq.order_by(inner.c.activity.asc())
             else:
-                uniq = uniq.order_by(inner.c.start_time.desc())
+                uniq = uniq.order_by(inner.c.activity.desc())
 
             # Apply limit (no additional cursor filtering needed here)
             # Time-range filtering already applied in base query via oldest/newest
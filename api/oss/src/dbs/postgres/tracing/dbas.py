@@ -1,5 +1,5 @@
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy import Column, UUID, TIMESTAMP, Enum as ENUM, VARCHAR
+from sqlalchemy import Column, UUID, TIMESTAMP, Enum as ENUM, VARCHAR, FLOAT, INTEGER
 
 from oss.src.core.tracing.dtos import TraceType, SpanType
 from oss.src.core.tracing.dtos import OTelStatusCode as StatusCode
@@ -59,7 +59,7 @@ class SpanDBA:
     )
 
     # Root-span-only (parent_id IS NULL); promoted from ag.session/user/agent
-    # attributes at ingest_span_dtos. Nullable — children never populate these.
+    # attributes by the tracing worker. Nullable — children never populate these.
     session_id = Column(
         VARCHAR,
         nullable=True,
@@ -95,3 +95,96 @@ class SpanDBA:
         JSONB(none_as_null=True),
         nullable=True,
     )
+
+
+class TraceDBA:
+    __abstract__ = True
+
+    trace_id = Column(
+        UUID,
+        nullable=False,
+    )
+
+    # From the root span; NULL until the root arrives.
+    trace_type = Column(
+        ENUM(TraceType),
+        nullable=True,
+    )
+    span_name = Column(
+        VARCHAR,
+        nullable=True,
+    )
+    status_code = Column(
+        ENUM(StatusCode),
+        nullable=True,
+    )
+
+    start_time = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
+    end_time = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
+    # Start of the trace's latest span: what trace lists order and page by.
+    latest_start_time = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
+    duration_ms = Column(
+        FLOAT,
+        nullable=True,
+    )
+
+    # From any span carrying ag.session/user/agent ids.
+    session_id = Column(
+        VARCHAR,
+        nullable=True,
+    )
+    user_id = Column(
+        VARCHAR,
+        nullable=True,
+    )
+    agent_id = Column(
+        VARCHAR,
+        nullable=True,
+    )
+
+    span_count = Column(
+        INTEGER,
+        nullable=False,
+    )
+    # Cumulative rollups of the root span.
+    tokens = Column(
+        FLOAT,
+        nullable=True,
+    )
+    costs = Column(
+        FLOAT,
+        nullable=True,
+    )
+
+    references = Column(
+        JSONB(none_as_null=True),
+        nullable=True,
+    )
+
+
+class TraceHashDBA:
+    __abstract__ = True
+
+    hash_id = Column(
+        UUID,
+        nullable=False,
+    )
+    trace_id = Column(
+        UUID,
+        nullable=False,
+    )
+
+    # The root span's start: newest reusable traces first.
+    start_time = Column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+    )
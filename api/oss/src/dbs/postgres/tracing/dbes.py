@@ -1,7 +1,7 @@
 from sqlalchemy import PrimaryKeyConstraint, Index, desc, text
 
 from oss.src.dbs.postgres.shared.base import Base
-from oss.src.dbs.postgres.tracing.dbas import SpanDBA
+from oss.src.dbs.postgres.tracing.dbas import SpanDBA, TraceDBA, TraceHashDBA
 from oss.src.dbs.postgres.shared.dbas import ProjectScopeDBA, LifecycleDBA
 
 # TODO: Add OrganizationScopeDBA, WorkspaceScopeDBA, and UserScopeDBA
@@ -101,3 +101,65 @@ class SpanDBE(
             postgresql_using="gin",
         ),  # for full-text search on events
     )
+
+
+class TraceDBE(
+    Base,
+    ProjectScopeDBA,
+    LifecycleDBA,
+    TraceDBA,
+):
+    __tablename__ = "traces"
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "project_id",
+            "trace_id",
+        ),  # for uniqueness
+        Index(
+            "ix_traces_project_id_latest_start_time",
+            "project_id",
+            "latest_start_time",
+        ),  # for sorting and scrolling
+        Index(
+            "ix_traces_project_id_session_id_start_time",
+            "project_id",
+            "session_id",
+            "start_time",
+        ),  # for session listing
+        Index(
+            "ix_traces_project_id_user_id_start_time",
+            "project_id",
+            "user_id",
+            "start_time",
+        ),  # for user listing
+        Index(
+            "ix_traces_references_gin",
+            "references",
+            postgresql_using="gin",
+            postgresql_ops={"references": "jsonb_path_ops"},
+        ),  # for filtering
+    )
+
+
+class TraceHashDBE(
+    Base,
+    ProjectScopeDBA,
+    TraceHashDBA,
+):
+    __tablename__ = "trace_hashes"
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "project_id",
+            "hash_id",
+            "trace_id",
+        ),  # for uniqueness
+        Index(
+            "ix_trace_hashes_project_id_hash_id_start_time",
+            "project_id",
+            "hash_id",
+            "start_time",
+            "trace_id",
+        ),  # for reuse lookups, newest first
+    )
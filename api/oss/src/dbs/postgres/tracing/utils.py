@@ -15,10 +15,11 @@ from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.selectable import FromClause
 from sqlalchemy.dialects.postgresql import dialect, ARRAY, TEXT, JSONB, BIT
 from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from oss.src.utils.logging import get_module_logger
 
-from oss.src.dbs.postgres.tracing.dbes import SpanDBE
+from oss.src.dbs.postgres.tracing.dbes import SpanDBE, TraceDBE
 
 from oss.src.core.tracing.dtos import (
     Filtering,
@@ -2145,3 +2146,97 @@ def compute_uniq(
     value["uniq"] = uniq
 
     return value
+
+
+# TRACES
+
+
+def _root_value(
+    expression: ColumnElement,
+) -> ColumnElement:
+    return func.array_agg(expression).filter(SpanDBE.parent_id.is_(None))[1]
+
+
+def _numeric_value(
+    attribute: ColumnElement,
+) -> ColumnElement:
+    return case(
+        (func.jsonb_typeof(attribute) == "number", attribute.as_float()),
+        else_=None,
+    )
+
+
+def _identity_value(
+    group: str,
+) -> ColumnElement:
+    column = getattr(SpanDBE, f"{group}_id")
+    return func.max(
+        func.coalesce(column, SpanDBE.attributes["ag"][group]["id"].as_string())
+    )
+
+
+def build_trace_summary_stmt(
+    *,
+    project_id: UUID,
+    trace_ids: List[UUID],
+) -> ClauseElement:
+    """Upsert the `traces` rows of the given traces from all of their stored spans.
+
+    Recomputing from the spans, rather than folding in the spans just written, keeps
+    a summary right however its trace was split across ingest batches.
+    """
+    metrics = SpanDBE.attributes["ag"]["metrics"]
+
+    summary = (
+        select(
+            SpanDBE.project_id,
+            SpanDBE.trace_id,
+            _root_value(SpanDBE.trace_type).label("trace_type"),
+            _root_value(SpanDBE.span_name).label("span_name"),
+            _root_value(SpanDBE.status_code).label("status_code"),
+            func.min(SpanDBE.start_time).label("start_time"),
+            func.max(SpanDBE.end_time).label("end_time"),
+            func.max(SpanDBE.start_time).label("latest_start_time"),
+            (
+                func.extract(
+                    "epoch",
+                    func.max(SpanDBE.end_time) - func.min(SpanDBE.start_time),
+                )
+                * 1000
+            ).label("duration_ms"),
+            _identity_value("session").label("session_id"),
+            _identity_value("user").label("user_id"),
+            _identity_value("agent").label("agent_id"),
+            func.count().label("span_count"),
+            _root_value(_numeric_value(metrics["tokens"]["cumulative"]["total"])).label(
+                "tokens"
+            ),
+            _root_value(_numeric_value(metrics["costs"]["cumulative"]["total"])).label(
+                "costs"
+            ),
+            _root_value(SpanDBE.references).label("references"),
+        )
+        .filter(
+            SpanDBE.project_id == project_id,
+            SpanDBE.trace_id.in_(trace_ids),
+        )
+        .group_by(SpanDBE.project_id, SpanDBE.trace_id)
+        # Concurrent writers lock trace rows in the same order
+        .order_by(SpanDBE.trace_id)
+    )
+
+    columns = [column.name for column in summary.selected_columns]
+
+    stmt = pg_insert(TraceDBE).from_select(columns, summary)
+
+    return stmt.on_conflict_do_update(
+        index_elements=["project_id", "trace_id"],
+        set_={
+            **{
+                name: stmt.excluded[name]
+                for name in columns
+                if name not in ("project_id", "trace_id")
+            },
+            "updated_at": func.current_timestamp(),
+        },
+    )
@@ -11,6 +11,8 @@ Key namespace — every key is project-scoped:
   owner:<project_id>:session:<session_id>      — which replica currently owns this session
   displaced:<project_id>:session:<session_id>  — pub/sub for attach-steal notifications
   watch:<project_id>:session:<session_id>      — pub/sub for the live relay (SSE watch)
+  watch:<project_id>:session:<session_id>:log  — stream: that channel's last events, for
+                                                 `Last-Event-ID` replay (project channels too)
   superseded:<project_id>:session:<session_id>:turn:<turn_id>
                                                — tombstone: this turn lost the nest and is
                                                  dead forever (API-side only; the runner
@@ -123,6 +125,11 @@ def project_watch_channel(project_id: str) -> str:
     return f"watch:{project_id}:project"
 
 
+def watch_log_key(channel: str) -> str:
+    """The replay log of a watch channel (API-side only, like the channel itself)."""
+    return f"{channel}:log"
+
+
 def make_watch_records_changed_payload(*, session_id: str) -> dict:
     return {"type": WATCH_EVENT_RECORDS_CHANGED, "session_id": session_id}
 
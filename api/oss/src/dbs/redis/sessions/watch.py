@@ -7,11 +7,17 @@ because of the relay. PUBLISH to zero subscribers is an O(1) Redis no-op.
 
 Plane: durable Redis — the SSE endpoint subscribes there via
 ``get_streams_engine()``; publisher and subscriber must share one plane.
+
+Each event carries an ``event_id`` and, unless replay is disabled, is also appended to
+the channel's short replay log (``watch_log_key``) in the same MULTI as the PUBLISH, so
+the log holds events in exactly the order subscribers saw them. A client reconnecting
+with ``Last-Event-ID`` is caught up from that log (``read_watch_log``).
 """
 
 import asyncio
 import json
-from typing import TYPE_CHECKING, Optional
+import uuid
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from oss.src.dbs.redis.sessions.contract import (
     make_watch_entity_changed_payload,
@@ -20,8 +26,10 @@ from oss.src.dbs.redis.sessions.contract import (
     make_watch_records_changed_payload,
     project_watch_channel,
     watch_channel,
+    watch_log_key,
 )
 from oss.src.dbs.redis.shared.engine import get_streams_engine
+from oss.src.utils.env import env
 from oss.src.utils.logging import get_module_logger
 
 if TYPE_CHECKING:
@@ -50,15 +58,13 @@ class SessionsWatchPublisher:
         project_id: str,
         payload: dict,
     ) -> None:
+        message = json.dumps({**payload, "event_id": uuid.uuid4().hex}).encode()
         try:
             # Bounded: the streams client has no socket timeouts, and these publishes
             # sit on turn-lifecycle/interaction write paths — a black-holed Redis must
             # cost at most 1s, never a TCP timeout.
             await asyncio.wait_for(
-                self._client().publish(
-                    channel,
-                    json.dumps(payload).encode(),
-                ),
+                self._send(channel=channel, message=message),
                 timeout=1.0,
             )
         except Exception:
@@ -70,6 +76,23 @@ class SessionsWatchPublisher:
                 event_type=payload.get("type"),
             )
 
+    async def _send(self, *, channel: str, message: bytes) -> None:
+        if not env.sessions.watch_replay_enabled:
+            await self._client().publish(channel, message)
+            return
+
+        log_key = watch_log_key(channel)
+        pipeline = self._client().pipeline(transaction=True)
+        pipeline.xadd(
+            log_key,
+            {"message": message},
+            maxlen=env.sessions.watch_replay_maxlen,
+            approximate=True,
+        )
+        pipeline.expire(log_key, env.sessions.watch_replay_ttl_seconds)
+        pipeline.publish(channel, message)
+        await pipeline.execute()
+
     async def records_changed(self, *, project_id: str, session_id: str) -> None:
         await self._publish(
             channel=watch_channel(project_id, session_id),
@@ -111,3 +134,31 @@ class SessionsWatchPublisher:
             project_id=project_id,
             payload=make_watch_entity_changed_payload(entity=entity, id=id),
         )
+
+
+def _event_id(message: Any) -> Optional[str]:
+    try:
+        event_id = json.loads(message).get("event_id")
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return event_id if isinstance(event_id, str) else None
+
+
+async def read_watch_log(
+    redis: "Redis",
+    *,
+    channel: str,
+    last_event_id: str,
+) -> Optional[List[bytes]]:
+    """The messages published on ``channel`` after ``last_event_id``, oldest first.
+
+    None when the log no longer holds that event (trimmed, expired, never logged): the
+    caller cannot know what was missed and must fall back to a full revalidation.
+    """
+    entries = await redis.xrange(watch_log_key(channel))
+
+    for position, (_, fields) in enumerate(entries):
+        if _event_id(fields.get(b"message")) == last_event_id:
+            return [fields[b"message"] for _, fields in entries[position + 1 :]]
+
+    return None
@@ -0,0 +1,106 @@
+"""Trace assembly queue — traces whose rollups wait on spans from other batches.
+
+The tracing worker rolls up costs, tokens and errors over the spans of one
+batch. A trace split across batches (several exports of one long trace, or a
+batch boundary falling inside a trace) is recorded here, and finalized over
+its stored spans once its root has arrived or the trace has gone quiet.
+
+One sorted set on the durable plane; members are
+``<project_id>:<user_id>:<trace_id>`` (hex) and scores are the unix time from
+which the trace is due. Any worker replica may claim a due trace: ZREM decides
+which one finalizes it.
+"""
+
+import time
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+TRACE_ASSEMBLY_KEY = "assembly:traces"
+
+
+def _member(project_id: UUID, user_id: UUID, trace_id: UUID) -> str:
+    return f"{project_id.hex}:{user_id.hex}:{trace_id.hex}"
+
+
+def _parse_member(member: bytes | str) -> Tuple[UUID, UUID, UUID]:
+    if isinstance(member, bytes):
+        member = member.decode()
+    project_id, user_id, trace_id = member.split(":")
+    return UUID(hex=project_id), UUID(hex=user_id), UUID(hex=trace_id)
+
+
+class TraceAssemblyQueue:
+    def __init__(self, *, redis_client: "Redis"):
+        self.redis = redis_client
+
+    async def mark(
+        self,
+        *,
+        project_id: UUID,
+        user_id: UUID,
+        #
+        partial_traces: Dict[UUID, bool],
+        root_trace_ids: Iterable[UUID] = (),
+        quiet_seconds: float,
+    ) -> None:
+        """Queue partial traces, and make queued traces whose root arrived due.
+
+        A partial trace is due now if the batch held its root, else once
+        quiet; one marked again is pushed back, so a long trace is finalized
+        after its last export rather than after each one. A trace in
+        `root_trace_ids` is only touched if already queued.
+        """
+        now = time.time()
+
+        root_members = {
+            _member(project_id, user_id, trace_id): now
+            for trace_id in root_trace_ids
+            if trace_id not in partial_traces
+        }
+
+        if not partial_traces and not root_members:
+            return
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if partial_traces:
+                pipe.zadd(
+                    TRACE_ASSEMBLY_KEY,
+                    {
+                        _member(project_id, user_id, trace_id): (
+                            now if has_root else now + quiet_seconds
+                        )
+                        for trace_id, has_root in partial_traces.items()
+                    },
+                )
+            if root_members:
+                pipe.zadd(TRACE_ASSEMBLY_KEY, root_members, xx=True)
+            await pipe.execute()
+
+    async def claim(self, *, limit: int) -> List[Tuple[UUID, UUID, UUID]]:
+        """Take up to `limit` due traces as (project_id, user_id, trace_id)."""
+        members = await self.redis.zrangebyscore(
+            TRACE_ASSEMBLY_KEY,
+            "-inf",
+            time.time(),
+            start=0,
+            num=limit,
+        )
+
+        if not members:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for member in members:
+                pipe.zrem(TRACE_ASSEMBLY_KEY, member)
+            removed = await pipe.execute()
+
+        # Another replica may have claimed some of them in between.
+        return [
+            _parse_member(member)
+            for member, was_removed in zip(members, removed)
+            if was_removed
+        ]
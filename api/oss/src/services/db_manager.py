@@ -24,6 +24,7 @@ from oss.src.utils.helpers import get_slug_from_name_and_id
 from oss.src.dbs.postgres.blobs.dao import BlobsDAO
 from oss.src.dbs.postgres.git.dao import GitDAO
 from oss.src.dbs.postgres.testcases.dbes import TestcaseBlobDBE
+from oss.src.dbs.postgres.testsets.dao import TestsetChunksDAO
 from oss.src.dbs.postgres.testsets.dbes import (
     TestsetArtifactDBE,
     TestsetVariantDBE,
@@ -280,6 +281,7 @@ async def add_default_simple_testsets(
     testsets_service = TestsetsService(
         testsets_dao=testsets_dao,
         testcases_service=testcases_service,
+        testset_chunks_dao=TestsetChunksDAO(),
     )
     simple_testsets_service = SimpleTestsetsService(
         testsets_service=testsets_service,
@@ -2,7 +2,8 @@
 
 For a ``user_approval`` interaction the dispatcher composes the runner-visible
 resume conversation SERVER-SIDE (mobile approvals plan, M2.1): it replays the
-session's durable records into wire messages and appends the approval envelope
+session's durable records into wire messages (resuming the replay it persisted last
+time, see ``WireReplay``) and appends the approval envelope
 ``{approved, interactionToken}`` as a ``tool_result`` block bound to the gated
 ``toolCallId`` — the exact shape the runner's decision map reads
 (``services/runner/src/responder.ts`` ``storedApprovalDecisionOf`` /
@@ -27,7 +28,7 @@ from oss.src.core.sessions.interactions.dtos import (
     SessionInteractionData,
     SessionInteractionKind,
 )
-from oss.src.core.sessions.records.dtos import SessionRecord
+from oss.src.core.sessions.records.dtos import SessionRecord, SessionRecordSnapshot
 from oss.src.core.sessions.records.service import RecordsService
 from oss.src.core.sessions.interactions.service import SessionInteractionsService
 from oss.src.core.workflows.dtos import (
@@ -40,6 +41,9 @@ from oss.src.utils.logging import get_module_logger
 
 log = get_module_logger(__name__)
 
+# Records read per page while catching a replay up. Bounds one read, not the replay.
+REPLAY_PAGE_SIZE = 500
+
 
 def _user_attachment_blocks(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Attachment blocks for one user record, in the runner's wire shape.
@@ -67,92 +71,145 @@ def _user_attachment_blocks(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
     return blocks
 
 
-def build_wire_messages(records: List[SessionRecord]) -> List[Dict[str, Any]]:
-    """Replay durable session records into runner wire messages.
+class WireReplay:
+    """Durable session records replayed into runner wire messages, resumable.
 
     Mirrors the frontend's ``transcriptToMessages`` grouping: a ``user`` record opens a
     user message; a contiguous run of agent records folds into one assistant message whose
     content blocks carry text and resolved tool turns. Non-conversation records (thoughts,
     usage, errors, interaction bookkeeping) are skipped — they are renderable history, not
-    replayable conversation.
+    replayable conversation — except that ``interaction_request`` records are indexed by
+    event id, for the gated call's id and shape.
+
+    The whole state is JSON (``state``), so a replay persists as a records snapshot and the
+    next one extends it with only the records written since, instead of replaying every
+    record in the session on every approval.
     """
-    messages: List[Dict[str, Any]] = []
-    assistant_blocks: Optional[List[Dict[str, Any]]] = None
-    # A tool_result record stores only the call id, but the runner's cold replay renders each
-    # result as "[<toolName> returned: ...]" and matches approval nudges by tool name
-    # (`approvalRenderHints`). Carry the name forward from the call, exactly as the runner's own
-    # `reconstructMessages` does — without it every replayed result is an anonymous "tool".
-    call_names: Dict[str, str] = {}
-
-    def close_assistant() -> None:
-        nonlocal assistant_blocks
-        assistant_blocks = None
-
-    def assistant() -> List[Dict[str, Any]]:
-        nonlocal assistant_blocks
-        if assistant_blocks is None:
-            assistant_blocks = []
-            messages.append({"role": "assistant", "content": assistant_blocks})
-        return assistant_blocks
-
-    for record in records:
-        attributes = record.attributes or {}
-        record_type = record.record_type or attributes.get("type")
-
-        if record.record_source == "user":
-            raw_text = attributes.get("text")
-            text = raw_text if isinstance(raw_text, str) else ""
-            attachments = _user_attachment_blocks(attributes)
-            if not text and not attachments:
+
+    # The records snapshot kind (see SessionRecordSnapshot.kind): bump it whenever `state`
+    # changes shape, or what `extend` builds from a record changes.
+    KIND = "wire_messages.v1"
+
+    def __init__(self, state: Optional[Dict[str, Any]] = None) -> None:
+        state = state or {}
+        self.messages: List[Dict[str, Any]] = state.get("messages", [])
+        # Whether the last message is an assistant message agent records still fold into.
+        self.assistant_open: bool = state.get("assistant_open", False)
+        # A tool_result record stores only the call id, but the runner's cold replay renders
+        # each result as "[<toolName> returned: ...]" and matches approval nudges by tool name
+        # (`approvalRenderHints`). Carry the name forward from the call, exactly as the
+        # runner's own `reconstructMessages` does — without it every replayed result is an
+        # anonymous "tool".
+        self.call_names: Dict[str, str] = state.get("call_names", {})
+        # interaction_request records by event id (the interaction token): the first valid
+        # `tool_call_id`, and the first call `shape` ({name, args}), across its records.
+        self.gates: Dict[str, Dict[str, Any]] = state.get("gates", {})
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        return {
+            "messages": self.messages,
+            "assistant_open": self.assistant_open,
+            "call_names": self.call_names,
+            "gates": self.gates,
+        }
+
+    def _assistant(self) -> List[Dict[str, Any]]:
+        if not self.assistant_open:
+            self.assistant_open = True
+            self.messages.append({"role": "assistant", "content": []})
+        return self.messages[-1]["content"]
+
+    def _index_gate(self, attributes: Dict[str, Any]) -> None:
+        token = attributes.get("id")
+        if not isinstance(token, str):
+            return
+        gate = self.gates.setdefault(token, {})
+        payload = attributes.get("payload") or {}
+
+        tool_call_id = payload.get("toolCallId")
+        if (
+            "tool_call_id" not in gate
+            and isinstance(tool_call_id, str)
+            and tool_call_id
+        ):
+            gate["tool_call_id"] = tool_call_id
+
+        tool_call = payload.get("toolCall") or {}
+        name = tool_call.get("resolvedName") or tool_call.get("title")
+        args = tool_call.get("rawInput")
+        if "shape" not in gate and (name or args is not None):
+            gate["shape"] = {"name": name, "args": args}
+
+    def extend(self, records: List[SessionRecord]) -> "WireReplay":
+        for record in records:
+            attributes = record.attributes or {}
+            record_type = record.record_type or attributes.get("type")
+
+            if record_type == "interaction_request":
+                self._index_gate(attributes)
+
+            if record.record_source == "user":
+                raw_text = attributes.get("text")
+                text = raw_text if isinstance(raw_text, str) else ""
+                attachments = _user_attachment_blocks(attributes)
+                if not text and not attachments:
+                    continue
+                self.assistant_open = False
+                # Attachments ride the user record and rebuild as blocks followed by exactly
+                # one text block, matching `services/runner/src/sessions/reconstruct.ts`. A
+                # turn that was only files still replays: dropping it would hand the model a
+                # different context than the one the human approved against.
+                content: Any = (
+                    [*attachments, {"type": "text", "text": text}]
+                    if attachments
+                    else text
+                )
+                self.messages.append({"role": "user", "content": content})
                 continue
-            close_assistant()
-            # Attachments ride the user record and rebuild as blocks followed by exactly one
-            # text block, matching `services/runner/src/sessions/reconstruct.ts`. A turn that
-            # was only files still replays: dropping it would hand the model a different
-            # context than the one the human approved against.
-            content: Any = (
-                [*attachments, {"type": "text", "text": text}] if attachments else text
-            )
-            messages.append({"role": "user", "content": content})
-            continue
 
-        if record_type == "message":
-            text = attributes.get("text")
-            if isinstance(text, str) and text:
-                assistant().append({"type": "text", "text": text})
-        elif record_type == "tool_call":
-            block: Dict[str, Any] = {"type": "tool_call"}
-            if attributes.get("id"):
-                block["toolCallId"] = attributes["id"]
-            if attributes.get("name"):
-                block["toolName"] = attributes["name"]
+            if record_type == "message":
+                text = attributes.get("text")
+                if isinstance(text, str) and text:
+                    self._assistant().append({"type": "text", "text": text})
+            elif record_type == "tool_call":
+                block: Dict[str, Any] = {"type": "tool_call"}
                 if attributes.get("id"):
-                    call_names[attributes["id"]] = attributes["name"]
-            if attributes.get("input") is not None:
-                block["input"] = attributes["input"]
-            assistant().append(block)
-        elif record_type == "tool_result":
-            block = {"type": "tool_result"}
-            if attributes.get("id"):
-                block["toolCallId"] = attributes["id"]
-                if attributes["id"] in call_names:
-                    block["toolName"] = call_names[attributes["id"]]
-            output = attributes.get("data")
-            if output is None:
-                output = attributes.get("output")
-            if output is not None:
-                block["output"] = output
-            if attributes.get("isError") is not None:
-                block["isError"] = attributes["isError"]
-            assistant().append(block)
-        # Everything else (thought, usage, error, done, data, file, interaction_request,
-        # interaction_response) is not part of the replayable conversation.
+                    block["toolCallId"] = attributes["id"]
+                if attributes.get("name"):
+                    block["toolName"] = attributes["name"]
+                    if attributes.get("id"):
+                        self.call_names[attributes["id"]] = attributes["name"]
+                if attributes.get("input") is not None:
+                    block["input"] = attributes["input"]
+                self._assistant().append(block)
+            elif record_type == "tool_result":
+                block = {"type": "tool_result"}
+                if attributes.get("id"):
+                    block["toolCallId"] = attributes["id"]
+                    if attributes["id"] in self.call_names:
+                        block["toolName"] = self.call_names[attributes["id"]]
+                output = attributes.get("data")
+                if output is None:
+                    output = attributes.get("output")
+                if output is not None:
+                    block["output"] = output
+                if attributes.get("isError") is not None:
+                    block["isError"] = attributes["isError"]
+                self._assistant().append(block)
+            # Everything else (thought, usage, error, done, data, file, interaction_request,
+            # interaction_response) is not part of the replayable conversation.
+
+        return self
 
-    return messages
+
+def build_wire_messages(records: List[SessionRecord]) -> List[Dict[str, Any]]:
+    """Replay durable session records into runner wire messages (see ``WireReplay``)."""
+    return WireReplay().extend(records).messages
 
 
 def resolve_gated_tool_call_id(
-    records: List[SessionRecord],
+    replay: WireReplay,
     interaction: SessionInteraction,
     answer: Dict[str, Any],
 ) -> str:
@@ -174,17 +231,9 @@ def resolve_gated_tool_call_id(
     if isinstance(explicit, str) and explicit:
         return explicit
 
-    for record in records:
-        attributes = record.attributes or {}
-        record_type = record.record_type or attributes.get("type")
-        if record_type != "interaction_request":
-            continue
-        if attributes.get("id") != interaction.token:
-            continue
-        payload = attributes.get("payload") or {}
-        tool_call_id = payload.get("toolCallId")
-        if isinstance(tool_call_id, str) and tool_call_id:
-            return tool_call_id
+    tool_call_id = replay.gates.get(interaction.token, {}).get("tool_call_id")
+    if tool_call_id:
+        return tool_call_id
 
     stored_request = getattr(interaction.data, "request", None)
     stored = getattr(stored_request, "tool_call_id", None)
@@ -195,22 +244,13 @@ def resolve_gated_tool_call_id(
 
 
 def _gated_call_shape(
-    records: List[SessionRecord],
+    replay: WireReplay,
     interaction: SessionInteraction,
 ) -> Dict[str, Any]:
     """Recover the gated call's name+args (the runner's cold-replay anchor)."""
-    for record in records:
-        attributes = record.attributes or {}
-        record_type = record.record_type or attributes.get("type")
-        if record_type != "interaction_request":
-            continue
-        if attributes.get("id") != interaction.token:
-            continue
-        tool_call = (attributes.get("payload") or {}).get("toolCall") or {}
-        name = tool_call.get("resolvedName") or tool_call.get("title")
-        args = tool_call.get("rawInput")
-        if name or args is not None:
-            return {"name": name, "args": args}
+    shape = replay.gates.get(interaction.token, {}).get("shape")
+    if shape:
+        return shape
 
     data: Optional[SessionInteractionData] = interaction.data
     request = data.request if data else None
@@ -220,7 +260,7 @@ def _gated_call_shape(
 
 
 def compose_approval_messages(
-    records: List[SessionRecord],
+    replay: WireReplay,
     interaction: SessionInteraction,
     answer: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
@@ -240,9 +280,11 @@ def compose_approval_messages(
     Fingerprint parity therefore makes the note undeliverable in the common case; mobile's
     steer control stays flag-gated off until the runner can carry a redirect in-band with the
     denial (#5444). The note is still persisted as a user record either way.
+
+    The replay is left as it was: the tail message is copied, not extended in place.
     """
-    messages = build_wire_messages(records)
-    gated_id = resolve_gated_tool_call_id(records, interaction, answer)
+    messages = list(replay.messages)
+    gated_id = resolve_gated_tool_call_id(replay, interaction, answer)
 
     gated_call = next(
         (
@@ -255,7 +297,7 @@ def compose_approval_messages(
         None,
     )
     has_gated_call = gated_call is not None
-    shape = _gated_call_shape(records, interaction)
+    shape = _gated_call_shape(replay, interaction)
     if not has_gated_call:
         # No durable tool_call record (e.g. records unavailable): synthesize the anchor the
         # runner's call-shape index needs to bind the envelope to name+args.
@@ -287,7 +329,7 @@ def compose_approval_messages(
         and tail.get("role") == "assistant"
         and isinstance(tail.get("content"), list)
     ):
-        tail["content"].append(envelope)
+        messages[-1] = {**tail, "content": [*tail["content"], envelope]}
     else:
         messages.append({"role": "assistant", "content": [envelope]})
 
@@ -326,10 +368,10 @@ class InteractionsDispatcher:
             and isinstance(answer, dict)
             and isinstance(answer.get("approved"), bool)
         ):
-            records: List[SessionRecord] = []
+            replay = WireReplay()
             if self.records_service is not None:
                 try:
-                    records = await self.records_service.get_records(
+                    replay = await self._replay(
                         project_id=project_id,
                         session_id=interaction.session_id,
                     )
@@ -338,10 +380,72 @@ class InteractionsDispatcher:
                         "[interactions] records replay unavailable for "
                         f"session={interaction.session_id}: {e}"
                     )
-            return {"messages": compose_approval_messages(records, interaction, answer)}
+            return {"messages": compose_approval_messages(replay, interaction, answer)}
 
         return answer if isinstance(answer, dict) else {"value": answer}
 
+    async def _replay(
+        self,
+        *,
+        project_id: UUID,
+        session_id: str,
+    ) -> WireReplay:
+        """The session's replay, resumed from its snapshot and caught up on new records.
+
+        Only records past the snapshot's cursor are read, a page at a time, so an approval
+        in a long session costs what was written since the last one. Without a snapshot, or
+        with a stale one, this is the full replay, which then becomes the snapshot.
+        """
+        assert self.records_service is not None
+
+        snapshot: Optional[SessionRecordSnapshot] = None
+        try:
+            snapshot = await self.records_service.get_snapshot(
+                project_id=project_id,
+                session_id=session_id,
+                kind=WireReplay.KIND,
+            )
+        except Exception as e:  # a snapshot only saves work: replay from the start
+            log.warning(
+                f"[interactions] replay snapshot unavailable for session={session_id}: {e}"
+            )
+
+        replay = WireReplay(snapshot.state if snapshot else None)
+        folded = snapshot
+
+        while True:
+            records = await self.records_service.get_records(
+                project_id=project_id,
+                session_id=session_id,
+                after=folded.cursor if folded else None,
+                limit=REPLAY_PAGE_SIZE,
+            )
+            if not records:
+                break
+
+            replay.extend(records)
+            folded = SessionRecordSnapshot.fold(
+                previous=folded,
+                project_id=project_id,
+                session_id=session_id,
+                kind=WireReplay.KIND,
+                records=records,
+                state=replay.state,
+            )
+
+            if len(records) < REPLAY_PAGE_SIZE:
+                break
+
+        if folded is not None and folded is not snapshot:
+            try:
+                await self.records_service.put_snapshot(snapshot=folded)
+            except Exception as e:
+                log.warning(
+                    f"[interactions] replay snapshot not saved for session={session_id}: {e}"
+                )
+
+        return replay
+
     async def respond(
         self,
         *,
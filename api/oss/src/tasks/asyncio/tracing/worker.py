@@ -3,6 +3,10 @@ TracingWorker - consumes from streams:otlp.
 
 Replaces the in-memory asyncio.Queue worker from PR #1223 with Redis Streams.
 Keeps the same batching, grouping, and entitlements logic.
+
+Also hosts trace assembly: per-trace rollups (trace type, costs, tokens,
+errors) run here rather than in the OTLP request, and traces split across
+batches are finalized over their stored spans once complete.
 """
 
 import asyncio
@@ -15,6 +19,8 @@ from oss.src.core.tracing.dtos import OTelFlatSpan
 from oss.src.utils.logging import get_module_logger
 from oss.src.utils.common import is_ee
 from oss.src.core.tracing.streaming import deserialize_span
+from oss.src.core.tracing.utils.trees import find_partial_traces
+from oss.src.dbs.redis.tracing.assembly import TraceAssemblyQueue
 from oss.src.tasks.asyncio.shared.consumer import StreamConsumer
 
 log = get_module_logger(__name__)
@@ -39,8 +45,13 @@ class TracingWorker(StreamConsumer):
     2. Deserialize spans from bytes
     3. Group by organization_id → (project_id, user_id)
     4. Check entitlements per org (Layer 2 - authoritative)
-    5. Bulk create spans per project/user if allowed
-    6. ACK + DEL messages — StreamConsumer
+    5. Roll up and bulk create spans per project/user if allowed
+    6. Queue traces the batch only held part of for assembly
+    7. ACK + DEL messages — StreamConsumer
+
+    Alongside, the assembly loop finalizes queued traces: due as soon as
+    their root has been written, or after `assembly_quiet_ms` without new
+    spans otherwise.
     """
 
     log_prefix = "[INGEST]"
@@ -56,6 +67,9 @@ class TracingWorker(StreamConsumer):
         max_block_ms: int = 5000,  # 5 seconds
         max_delay_ms: int = 250,  # 250 milliseconds
         max_batch_mb: int = 50,  # 50 MB
+        assembly_quiet_ms: int = 10_000,  # 10 seconds
+        assembly_interval_ms: int = 1_000,  # 1 second
+        assembly_batch_size: int = 100,  # 100 traces
     ):
         super().__init__(
             redis_client=redis_client,
@@ -68,6 +82,10 @@ class TracingWorker(StreamConsumer):
             max_batch_mb=max_batch_mb,
         )
         self.service = service
+        self.assembly = TraceAssemblyQueue(redis_client=redis_client)
+        self.assembly_quiet_ms = assembly_quiet_ms
+        self.assembly_interval_ms = assembly_interval_ms
+        self.assembly_batch_size = assembly_batch_size
 
     async def process_batch(
         self, batch: List[Tuple[bytes, Dict[bytes, bytes]]]
@@ -169,9 +187,11 @@ class TracingWorker(StreamConsumer):
                     # On error, drop batch to be safe
                     continue
 
-            # 3. Create spans per project/user
+            # 3. Roll up and create spans per project/user
             for (project_id, user_id), span_dtos in spans_by_proj_user.items():
                 try:
+                    span_dtos = self.service.rollup_span_dtos(span_dtos)
+
                     await self.service.ingest(
                         project_id=project_id,
                         user_id=user_id,
@@ -189,6 +209,89 @@ class TracingWorker(StreamConsumer):
                     )
                     # Sleep briefly to avoid hammering DB on errors
                     await asyncio.sleep(0.05)
+                    continue
+
+                # 4. Queue traces split across batches for assembly
+                try:
+                    await self.assembly.mark(
+                        project_id=project_id,
+                        user_id=user_id,
+                        partial_traces={
+                            UUID(trace_id): has_root
+                            for trace_id, has_root in find_partial_traces(
+                                span_dtos
+                            ).items()
+                        },
+                        root_trace_ids={
+                            UUID(str(span_dto.trace_id))
+                            for span_dto in span_dtos
+                            if span_dto.parent_id is None
+                        },
+                        quiet_seconds=self.assembly_quiet_ms / 1000,
+                    )
+
+                except Exception as e:
+                    # The spans are written; only their cross-batch rollups are lost
+                    log.error(
+                        "[INGEST] Failed to queue traces for assembly",
+                        project_id=str(project_id),
+                        error=str(e),
+                    )
 
         # Return count and message IDs for ACK/DEL
         return (processed_count, processed_message_ids)
+
+    async def assemble(self) -> int:
+        """Finalize due traces, grouped per project/user. Returns the count."""
+        claimed = await self.assembly.claim(limit=self.assembly_batch_size)
+
+        trace_ids_by_proj_user: Dict[Tuple[UUID, UUID], List[UUID]] = {}
+        for project_id, user_id, trace_id in claimed:
+            trace_ids_by_proj_user.setdefault((project_id, user_id), []).append(
+                trace_id
+            )
+
+        for (project_id, user_id), trace_ids in trace_ids_by_proj_user.items():
+            try:
+                await self.service.finalize_traces(
+                    project_id=project_id,
+                    user_id=user_id,
+                    trace_ids=trace_ids,
+                )
+
+            except Exception as e:
+                log.error(
+                    "[INGEST] Failed to finalize traces",
+                    project_id=str(project_id),
+                    user_id=str(user_id),
+                    traces=len(trace_ids),
+                    error=str(e),
+                    exc_info=True,
+                )
+                # Retry once the traces are quiet again
+                await self.assembly.mark(
+                    project_id=project_id,
+                    user_id=user_id,
+                    partial_traces={trace_id: False for trace_id in trace_ids},
+                    quiet_seconds=self.assembly_quiet_ms / 1000,
+                )
+
+        return len(claimed)
+
+    async def run_assembly(self):
+        """Assembly loop: finalize due traces, draining the backlog before sleeping."""
+        while True:
+            try:
+                if await self.assemble() >= self.assembly_batch_size:
+                    continue
+
+            except Exception:
+                log.error(
+                    "[INGEST] Error in assembly loop",
+                    exc_info=True,
+                )
+
+            await asyncio.sleep(self.assembly_interval_ms / 1000)
+
+    async def run(self):
+        await asyncio.gather(super().run(), self.run_assembly())
@@ -2,14 +2,16 @@
 
 Reads grouped EventMessages (already parsed by the events worker), finds
 matching active subscriptions for each project (from cache or Postgres),
-and enqueues one TaskIQ delivery task per (event, subscription) pair.
+and enqueues one TaskIQ delivery task per (event, subscription) pair — or,
+for a subscription with a ``batch_size``, one task per up to that many of
+the batch's events.
 
 The dispatcher is intentionally self-contained so it can be extracted into
 its own consumer process later without changing its internal logic.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID, uuid5, NAMESPACE_DNS
 
 from oss.src.core.secrets.services import VaultService
@@ -44,12 +46,17 @@ def _delivery_id(*, event_id: UUID, subscription_id: UUID) -> UUID:
     return uuid5(_DELIVERY_NAMESPACE, f"{event_id}:{subscription_id}")
 
 
+def _batch_id(*, delivery_ids: List[str]) -> UUID:
+    return uuid5(_DELIVERY_NAMESPACE, f"batch:{','.join(delivery_ids)}")
+
+
 class WebhooksDispatcher:
     """Dispatches webhook delivery tasks for a batch of ingested events.
 
     Constructed once at worker startup and injected into EventsWorker.
     The deliver_task parameter is the registered TaskIQ task callable
-    (supports .kiq() for async enqueuing).
+    (supports .kiq() for async enqueuing); deliver_batch_task is its batched
+    counterpart, and without it every subscription is delivered per event.
     """
 
     def __init__(
@@ -58,10 +65,12 @@ class WebhooksDispatcher:
         subscriptions_dao: WebhooksDAOInterface,
         vault_service: VaultService,
         deliver_task: Any,
+        deliver_batch_task: Optional[Any] = None,
     ):
         self.subscriptions_dao = subscriptions_dao
         self.vault_service = vault_service
         self.deliver_task = deliver_task
+        self.deliver_batch_task = deliver_batch_task
 
     # --- internal helpers ---------------------------------------------------- #
 
@@ -179,6 +188,65 @@ class WebhooksDispatcher:
 
         return result
 
+    async def _enqueue_batches(
+        self,
+        *,
+        project_id: UUID,
+        #
+        subscription: WebhookSubscription,
+        deliveries: List[Dict[str, Any]],
+    ) -> int:
+        """Enqueue a subscription's deliveries, ``batch_size`` at a time.
+
+        Returns the number of deliveries that failed to enqueue.
+        """
+        failures = 0
+        batch_size = subscription.data.batch_size
+
+        for start in range(0, len(deliveries), batch_size):
+            chunk = deliveries[start : start + batch_size]
+            batch_id = _batch_id(
+                delivery_ids=[delivery["delivery_id"] for delivery in chunk]
+            )
+
+            try:
+                await asyncio.wait_for(
+                    self.deliver_batch_task.kiq(
+                        project_id=str(project_id),
+                        #
+                        batch_id=str(batch_id),
+                        subscription_id=str(subscription.id),
+                        deliveries=chunk,
+                        #
+                        url=str(subscription.data.url),
+                        headers=subscription.data.headers or {},
+                        payload_fields=subscription.data.payload_fields,
+                        auth_mode=subscription.data.auth_mode,
+                        #
+                        subscription=subscription.model_dump(
+                            mode="json",
+                            exclude_none=True,
+                            exclude={"secret", "secret_id"},
+                        ),
+                        #
+                        encrypted_secret=encrypt(subscription.secret),
+                    ),
+                    timeout=_ENQUEUE_TIMEOUT_SECONDS,
+                )
+                log.info(
+                    f"[WEBHOOKS DISPATCHER] Enqueued batch "
+                    f"batch={batch_id} events={len(chunk)} "
+                    f"subscription={subscription.id}"
+                )
+            except Exception as e:
+                log.error(
+                    f"[WEBHOOKS DISPATCHER] Failed to enqueue batch "
+                    f"for subscription {subscription.id}: {e}"
+                )
+                failures += len(chunk)
+
+        return failures
+
     # --- public API ---------------------------------------------------------- #
 
     async def dispatch(
@@ -217,6 +285,9 @@ class WebhooksDispatcher:
             if not subscriptions:
                 continue
 
+            # subscription id -> (subscription, its deliveries in this batch)
+            batched: Dict[str, Tuple[WebhookSubscription, List[Dict[str, Any]]]] = {}
+
             for msg in project_batch["events"]:
                 event = msg.event
                 event_type = event.event_type.value
@@ -280,6 +351,30 @@ class WebhooksDispatcher:
                         )
                         continue
 
+                    # A targeted test event always goes out on its own
+                    if (
+                        self.deliver_batch_task is not None
+                        and target_subscription_id is None
+                        and (sub.data.batch_size or 1) > 1
+                    ):
+                        batched.setdefault(str(sub.id), (sub, []))[1].append(
+                            {
+                                "delivery_id": str(
+                                    _delivery_id(
+                                        event_id=event.event_id,
+                                        subscription_id=sub.id,
+                                    )
+                                ),
+                                "event_id": str(event.event_id),
+                                "event_type": event_type,
+                                "event": event.model_dump(
+                                    mode="json",
+                                    exclude_none=True,
+                                ),
+                            }
+                        )
+                        continue
+
                     try:
                         delivery_id = _delivery_id(
                             event_id=event.event_id,
@@ -328,6 +423,13 @@ class WebhooksDispatcher:
                         )
                         enqueue_failures += 1
 
+            for sub, deliveries in batched.values():
+                enqueue_failures += await self._enqueue_batches(
+                    project_id=project_id,
+                    subscription=sub,
+                    deliveries=deliveries,
+                )
+
         if enqueue_failures > 0:
             # Raise so the events worker skips ACK/DEL and retries the whole batch. Without this
             # the batch is acked and the failed deliveries are dropped for good. Redelivery is
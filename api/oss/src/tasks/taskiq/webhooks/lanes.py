@@ -0,0 +1,232 @@
+"""Per-subscription delivery lanes for the webhooks worker.
+
+Every delivery task shares one pool of worker slots (``max_async_tasks``), and a task
+holds its slot for as long as its receiver takes to answer — up to ``WEBHOOK_TIMEOUT``.
+Without lanes, a burst of events to one slow endpoint fills every slot and stalls the
+deliveries of every other subscription behind it. A lane bounds what one subscription
+can hold:
+
+  - concurrency: at most ``limit`` requests in flight, plus as many waiting. The limit
+    adapts (AIMD): it grows by one after a full window of successes, up to
+    ``WEBHOOK_LANE_MAX_CONCURRENCY``, and halves on every failure. A delivery that finds
+    both full is requeued behind the rest of the queue instead of taking a slot.
+  - circuit breaker: ``WEBHOOK_BREAKER_FAILURE_THRESHOLD`` consecutive failures park the
+    endpoint for a cooldown. Parked deliveries are recorded as failed at once, without a
+    request. After the cooldown, a single probe goes out. If it succeeds, the lane closes;
+    if it fails, the endpoint is parked again for twice as long.
+
+Lanes also hold one pooled keep-alive ``httpx.AsyncClient`` per destination, so a
+steady stream of deliveries to one receiver reuses its connections instead of paying a
+TCP + TLS handshake per event.
+
+State is per worker process: N worker replicas run N lanes per subscription. That is a
+bound on what one process gives one endpoint, not a global rate limit.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import AsyncIterator, Dict, Optional, Set, Tuple
+
+import httpx
+
+from oss.src.core.webhooks.types import (
+    WEBHOOK_BREAKER_COOLDOWN,
+    WEBHOOK_BREAKER_FAILURE_THRESHOLD,
+    WEBHOOK_BREAKER_MAX_COOLDOWN,
+    WEBHOOK_LANE_INITIAL_CONCURRENCY,
+    WEBHOOK_LANE_MAX_CONCURRENCY,
+    WEBHOOK_MAX_POOLED_DESTINATIONS,
+    WEBHOOK_TIMEOUT,
+)
+
+# Idle lanes beyond this are dropped, oldest first; a dropped lane starts over.
+_MAX_LANES = 1024
+
+# How long an idle pooled connection is kept open.
+_KEEPALIVE_EXPIRY = 30.0
+
+
+class LaneAdmission(str, Enum):
+    ADMITTED = "admitted"
+    FULL = "full"
+    PARKED = "parked"
+
+
+class WebhookLane:
+    """Concurrency limit and circuit breaker for one subscription's endpoint."""
+
+    def __init__(self) -> None:
+        self.limit = WEBHOOK_LANE_INITIAL_CONCURRENCY
+        self.in_flight = 0
+        self.waiting = 0
+        self.failures = 0
+        self.successes = 0
+        self.cooldown = WEBHOOK_BREAKER_COOLDOWN
+        self.parked_until: Optional[float] = None
+        self.probing = False
+        self._condition = asyncio.Condition()
+
+    @property
+    def idle(self) -> bool:
+        return (
+            self.in_flight == 0
+            and self.waiting == 0
+            and self.parked_until is None
+            and self.failures == 0
+        )
+
+    def _parked(self, now: float) -> bool:
+        if self.parked_until is None:
+            return False
+        # Half-open once the cooldown is over, but with one probe at a time
+        return now < self.parked_until or self.probing
+
+    async def acquire(self, *, always_wait: bool = False) -> LaneAdmission:
+        """Take an in-flight slot, waiting for one when the lane is at its limit.
+
+        Waiting is bounded: a lane lets at most ``limit`` deliveries wait, and reports
+        FULL beyond that, so one subscription never holds more than twice its limit in
+        worker slots. ``always_wait`` is for a delivery that cannot be requeued again.
+        """
+        async with self._condition:
+            if self._parked(time.monotonic()):
+                return LaneAdmission.PARKED
+
+            if self.in_flight >= self.limit:
+                if not always_wait and self.waiting >= self.limit:
+                    return LaneAdmission.FULL
+
+                self.waiting += 1
+                try:
+                    await self._condition.wait_for(lambda: self.in_flight < self.limit)
+                finally:
+                    self.waiting -= 1
+
+                # The breaker may have opened while this delivery waited
+                if self._parked(time.monotonic()):
+                    return LaneAdmission.PARKED
+
+            if self.parked_until is not None:
+                self.probing = True
+            self.in_flight += 1
+            return LaneAdmission.ADMITTED
+
+    async def release(self, *, ok: bool) -> None:
+        """Return the slot, and adapt the lane to the outcome of its request.
+
+        ``ok`` is whether the endpoint is healthy — any answer it gave on purpose,
+        including a 4xx, rather than a 5xx, a timeout or a connection error.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+
+            if ok:
+                self.failures = 0
+                self.parked_until = None
+                self.probing = False
+                self.cooldown = WEBHOOK_BREAKER_COOLDOWN
+                self.successes += 1
+                if self.successes >= self.limit:
+                    self.successes = 0
+                    self.limit = min(self.limit + 1, WEBHOOK_LANE_MAX_CONCURRENCY)
+            else:
+                self.successes = 0
+                self.failures += 1
+                self.limit = max(1, self.limit // 2)
+
+                if self.probing:
+                    self.probing = False
+                    self.cooldown = min(self.cooldown * 2, WEBHOOK_BREAKER_MAX_COOLDOWN)
+                    self.parked_until = time.monotonic() + self.cooldown
+                elif (
+                    self.parked_until is None
+                    and self.failures >= WEBHOOK_BREAKER_FAILURE_THRESHOLD
+                ):
+                    self.parked_until = time.monotonic() + self.cooldown
+
+            self._condition.notify_all()
+
+
+Destination = Tuple[str, str, str, int]
+
+
+class WebhookLanes:
+    """The worker process's lanes, by subscription, and pooled clients, by destination."""
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lanes: "OrderedDict[str, WebhookLane]" = OrderedDict()
+        self._clients: "OrderedDict[Destination, httpx.AsyncClient]" = OrderedDict()
+        self._in_use: Dict[Destination, int] = {}
+        self._closing: Set[asyncio.Task] = set()
+
+    def _bind_loop(self) -> None:
+        # Lanes' conditions and pooled connections belong to the loop that made them
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lanes = OrderedDict()
+            self._clients = OrderedDict()
+            self._in_use = {}
+            self._closing = set()
+
+    def lane(self, subscription_id: str) -> WebhookLane:
+        self._bind_loop()
+
+        lane = self._lanes.get(subscription_id)
+        if lane is None:
+            lane = self._lanes[subscription_id] = WebhookLane()
+            self._evict_lanes()
+        self._lanes.move_to_end(subscription_id)
+        return lane
+
+    def _evict_lanes(self) -> None:
+        for subscription_id in list(self._lanes):
+            if len(self._lanes) <= _MAX_LANES:
+                return
+            if self._lanes[subscription_id].idle:
+                del self._lanes[subscription_id]
+
+    @asynccontextmanager
+    async def client(
+        self, destination: Destination
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """The pooled client for ``destination``, held for the duration of one request."""
+        self._bind_loop()
+
+        client = self._clients.get(destination)
+        if client is None or client.is_closed:
+            client = self._clients[destination] = httpx.AsyncClient(
+                timeout=WEBHOOK_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=WEBHOOK_LANE_MAX_CONCURRENCY,
+                    max_keepalive_connections=WEBHOOK_LANE_MAX_CONCURRENCY,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY,
+                ),
+            )
+        self._clients.move_to_end(destination)
+        self._in_use[destination] = self._in_use.get(destination, 0) + 1
+
+        try:
+            self._evict_clients()
+            yield client
+        finally:
+            self._in_use[destination] -= 1
+            if not self._in_use[destination]:
+                del self._in_use[destination]
+
+    def _evict_clients(self) -> None:
+        # Closing a client tears down its connections at once, so only clients no
+        # request is using are evicted, least recently used first.
+        for destination in list(self._clients):
+            if len(self._clients) <= WEBHOOK_MAX_POOLED_DESTINATIONS:
+                return
+            if destination in self._in_use:
+                continue
+            evicted = self._clients.pop(destination)
+            task = asyncio.create_task(evicted.aclose())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
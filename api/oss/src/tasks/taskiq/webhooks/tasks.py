@@ -10,29 +10,45 @@ Retry policy (enforced by TaskIQ):
                             (receiver understood; no retry makes sense)
   - 5xx / timeout / error → raise exception so TaskIQ retries
   - retries exhausted     → failure delivery record, re-raise
+
+Requests go through the subscription's lane (see ``lanes``):
+  - lane full             → the delivery is requeued (``defer``), up to
+                            WEBHOOK_LANE_MAX_DEFERRALS times, then waits its turn
+  - endpoint parked       → failure delivery record, no request, no retry
+
+A batched delivery (``deliver_webhook_batch``) follows the same policy with one
+request for all of its events, and records the outcome once per event.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 
 import httpx
 
 from oss.src.core.shared.dtos import Status
 from oss.src.core.webhooks.delivery import (
+    PreparedWebhookBatchItem,
+    PreparedWebhookBatchRequestError,
     PreparedWebhookRequestError,
+    prepare_webhook_batch_request,
     prepare_webhook_request,
     send_webhook_request,
+    webhook_destination,
 )
 from oss.src.core.webhooks.types import (
+    WEBHOOK_LANE_MAX_DEFERRALS,
     WEBHOOK_MAX_RETRIES,
     WebhookDeliveryCreate,
     WebhookDeliveryResponseInfo,
 )
 from oss.src.core.webhooks.interfaces import WebhooksDAOInterface
+from oss.src.tasks.taskiq.webhooks.lanes import LaneAdmission, WebhookLanes
 from oss.src.utils.logging import get_module_logger
 
 log = get_module_logger(__name__)
 
+PARKED_ERROR = "Endpoint parked after repeated failures; delivery not attempted"
+
 
 def _is_retryable(status_code: int) -> bool:
     return status_code >= 500
@@ -71,67 +87,113 @@ def _log_response(
         )
 
 
-async def deliver_webhook(
+async def _record(
     *,
     project_id: UUID,
-    #
-    delivery_id: UUID,
     subscription_id: UUID,
-    event_id: UUID,
-    #
-    event_type: str,
-    #
-    url: str,
-    headers: dict,
-    payload_fields: Optional[Dict[str, Any]],
-    auth_mode: Optional[str],
     #
-    event: Dict[str, Any],
-    subscription: Dict[str, Any],
+    items: List[PreparedWebhookBatchItem],
     #
-    encrypted_secret: str,
-    #
-    retry_count: int,
+    code: str,
+    message: str,
+    update: Dict[str, Any],
     #
     dao: WebhooksDAOInterface,
 ) -> None:
-    """Deliver a webhook payload to a single subscriber endpoint."""
-    try:
-        prepared = prepare_webhook_request(
-            project_id=project_id,
-            delivery_id=delivery_id,
-            event_id=event_id,
-            event_type=event_type,
-            url=url,
-            headers=headers,
-            payload_fields=payload_fields,
-            auth_mode=auth_mode,
-            event=event,
-            subscription=subscription,
-            encrypted_secret=encrypted_secret,
-        )
-    except PreparedWebhookRequestError as e:
+    for item in items:
         await dao.create_delivery(
             project_id=project_id,
             user_id=None,
             delivery=WebhookDeliveryCreate(
-                id=delivery_id,
+                id=item.delivery_id,
                 subscription_id=subscription_id,
-                event_id=event_id,
-                status=Status(code="400", message="failed"),
-                data=e.data.model_copy(update={"error": str(e)}),
+                event_id=item.event_id,
+                status=Status(code=code, message=message),
+                data=item.data.model_copy(update=update),
             ),
         )
-        return
 
-    try:
-        response = await send_webhook_request(
-            url=url,
-            resolved_ip=prepared.resolved_ip,
-            payload_json=prepared.payload_json,
-            headers=prepared.request_headers,
+
+async def _deliver(
+    *,
+    project_id: UUID,
+    subscription_id: UUID,
+    #
+    delivery_id: UUID,
+    items: List[PreparedWebhookBatchItem],
+    #
+    url: str,
+    resolved_ip: str,
+    payload_json: str,
+    request_headers: Dict[str, str],
+    #
+    retry_count: int,
+    #
+    dao: WebhooksDAOInterface,
+    lanes: Optional[WebhookLanes],
+    defer: Optional[Callable[[], Awaitable[None]]],
+    deferrals: int,
+) -> None:
+    lane = lanes.lane(str(subscription_id)) if lanes is not None else None
+
+    if lane is not None:
+        admission = await lane.acquire(
+            always_wait=defer is None or deferrals >= WEBHOOK_LANE_MAX_DEFERRALS,
         )
 
+        if admission is LaneAdmission.PARKED:
+            log.warning(
+                "[WEBHOOKS TASK] Endpoint parked subscription=%s delivery=%s",
+                subscription_id,
+                delivery_id,
+            )
+            await _record(
+                project_id=project_id,
+                subscription_id=subscription_id,
+                items=items,
+                code="0",
+                message="failed",
+                update={"error": PARKED_ERROR},
+                dao=dao,
+            )
+            return
+
+        if admission is LaneAdmission.FULL:
+            # Behind the rest of the queue, rather than in a worker slot
+            log.info(
+                "[WEBHOOKS TASK] Lane full, requeued subscription=%s delivery=%s "
+                "deferrals=%d",
+                subscription_id,
+                delivery_id,
+                deferrals + 1,
+            )
+            await defer()
+            return
+
+    is_last_attempt = retry_count >= WEBHOOK_MAX_RETRIES
+    endpoint_ok = False
+
+    try:
+        if lanes is not None:
+            destination = webhook_destination(url=url, resolved_ip=resolved_ip)
+            async with lanes.client(destination) as client:
+                response = await send_webhook_request(
+                    url=url,
+                    resolved_ip=resolved_ip,
+                    payload_json=payload_json,
+                    headers=request_headers,
+                    client=client,
+                )
+        else:
+            response = await send_webhook_request(
+                url=url,
+                resolved_ip=resolved_ip,
+                payload_json=payload_json,
+                headers=request_headers,
+            )
+
+        endpoint_ok = not _is_retryable(response.status_code)
+
         response_info = WebhookDeliveryResponseInfo(
             status_code=response.status_code,
             body=response.text[:2000],
@@ -139,69 +201,55 @@ async def deliver_webhook(
 
         _log_response(response, delivery_id=delivery_id, url=url)
 
-        final_data = prepared.data.model_copy(update={"response": response_info})
-
         if response.is_success:
             # 2xx — record success, task done
-            await dao.create_delivery(
+            await _record(
                 project_id=project_id,
-                user_id=None,
-                delivery=WebhookDeliveryCreate(
-                    id=delivery_id,
-                    subscription_id=subscription_id,
-                    event_id=event_id,
-                    status=Status(code=str(response.status_code), message="success"),
-                    data=final_data,
-                ),
+                subscription_id=subscription_id,
+                items=items,
+                code=str(response.status_code),
+                message="success",
+                update={"response": response_info},
+                dao=dao,
             )
             return
 
         if _is_retryable(response.status_code):
             # 5xx — retry; record only on final attempt
-            is_last_attempt = retry_count >= WEBHOOK_MAX_RETRIES
-
             if is_last_attempt:
-                await dao.create_delivery(
+                await _record(
                     project_id=project_id,
-                    user_id=None,
-                    delivery=WebhookDeliveryCreate(
-                        id=delivery_id,
-                        subscription_id=subscription_id,
-                        event_id=event_id,
-                        status=Status(code=str(response.status_code), message="failed"),
-                        data=final_data,
-                    ),
+                    subscription_id=subscription_id,
+                    items=items,
+                    code=str(response.status_code),
+                    message="failed",
+                    update={"response": response_info},
+                    dao=dao,
                 )
             response.raise_for_status()  # triggers TaskIQ retry
 
         else:
             # 1xx / 3xx / 4xx — permanent failure, no retry
-            await dao.create_delivery(
+            await _record(
                 project_id=project_id,
-                user_id=None,
-                delivery=WebhookDeliveryCreate(
-                    id=delivery_id,
-                    subscription_id=subscription_id,
-                    event_id=event_id,
-                    status=Status(code=str(response.status_code), message="failed"),
-                    data=final_data,
-                ),
+                subscription_id=subscription_id,
+                items=items,
+                code=str(response.status_code),
+                message="failed",
+                update={"response": response_info},
+                dao=dao,
             )
 
     except httpx.TimeoutException as e:
-        is_last_attempt = retry_count >= WEBHOOK_MAX_RETRIES
-
         if is_last_attempt:
-            await dao.create_delivery(
+            await _record(
                 project_id=project_id,
-                user_id=None,
-                delivery=WebhookDeliveryCreate(
-                    id=delivery_id,
-                    subscription_id=subscription_id,
-                    event_id=event_id,
-                    status=Status(code="0", message="failed"),
-                    data=prepared.data.model_copy(update={"error": f"Timeout: {e}"}),
-                ),
+                subscription_id=subscription_id,
+                items=items,
+                code="0",
+                message="failed",
+                update={"error": f"Timeout: {e}"},
+                dao=dao,
             )
 
         raise
@@ -211,19 +259,172 @@ async def deliver_webhook(
         raise
 
     except Exception as e:
-        is_last_attempt = retry_count >= WEBHOOK_MAX_RETRIES
-
         if is_last_attempt:
-            await dao.create_delivery(
+            await _record(
                 project_id=project_id,
-                user_id=None,
-                delivery=WebhookDeliveryCreate(
-                    id=delivery_id,
-                    subscription_id=subscription_id,
-                    event_id=event_id,
-                    status=Status(code="0", message="failed"),
-                    data=prepared.data.model_copy(update={"error": str(e)}),
-                ),
+                subscription_id=subscription_id,
+                items=items,
+                code="0",
+                message="failed",
+                update={"error": str(e)},
+                dao=dao,
             )
 
         raise
+
+    finally:
+        if lane is not None:
+            await lane.release(ok=endpoint_ok)
+
+
+async def deliver_webhook(
+    *,
+    project_id: UUID,
+    #
+    delivery_id: UUID,
+    subscription_id: UUID,
+    event_id: UUID,
+    #
+    event_type: str,
+    #
+    url: str,
+    headers: dict,
+    payload_fields: Optional[Dict[str, Any]],
+    auth_mode: Optional[str],
+    #
+    event: Dict[str, Any],
+    subscription: Dict[str, Any],
+    #
+    encrypted_secret: str,
+    #
+    retry_count: int,
+    #
+    dao: WebhooksDAOInterface,
+    lanes: Optional[WebhookLanes] = None,
+    defer: Optional[Callable[[], Awaitable[None]]] = None,
+    deferrals: int = 0,
+) -> None:
+    """Deliver a webhook payload to a single subscriber endpoint."""
+    try:
+        prepared = prepare_webhook_request(
+            project_id=project_id,
+            delivery_id=delivery_id,
+            event_id=event_id,
+            event_type=event_type,
+            url=url,
+            headers=headers,
+            payload_fields=payload_fields,
+            auth_mode=auth_mode,
+            event=event,
+            subscription=subscription,
+            encrypted_secret=encrypted_secret,
+        )
+    except PreparedWebhookRequestError as e:
+        await dao.create_delivery(
+            project_id=project_id,
+            user_id=None,
+            delivery=WebhookDeliveryCreate(
+                id=delivery_id,
+                subscription_id=subscription_id,
+                event_id=event_id,
+                status=Status(code="400", message="failed"),
+                data=e.data.model_copy(update={"error": str(e)}),
+            ),
+        )
+        return
+
+    await _deliver(
+        project_id=project_id,
+        subscription_id=subscription_id,
+        #
+        delivery_id=delivery_id,
+        items=[
+            PreparedWebhookBatchItem(
+                delivery_id=delivery_id,
+                event_id=event_id,
+                data=prepared.data,
+            )
+        ],
+        #
+        url=url,
+        resolved_ip=prepared.resolved_ip,
+        payload_json=prepared.payload_json,
+        request_headers=prepared.request_headers,
+        #
+        retry_count=retry_count,
+        #
+        dao=dao,
+        lanes=lanes,
+        defer=defer,
+        deferrals=deferrals,
+    )
+
+
+async def deliver_webhook_batch(
+    *,
+    project_id: UUID,
+    #
+    batch_id: UUID,
+    subscription_id: UUID,
+    deliveries: List[Dict[str, Any]],
+    #
+    url: str,
+    headers: dict,
+    payload_fields: Optional[Dict[str, Any]],
+    auth_mode: Optional[str],
+    #
+    subscription: Dict[str, Any],
+    #
+    encrypted_secret: str,
+    #
+    retry_count: int,
+    #
+    dao: WebhooksDAOInterface,
+    lanes: Optional[WebhookLanes] = None,
+    defer: Optional[Callable[[], Awaitable[None]]] = None,
+    deferrals: int = 0,
+) -> None:
+    """Deliver several events to one subscriber endpoint in a single signed request."""
+    try:
+        prepared = prepare_webhook_batch_request(
+            project_id=project_id,
+            batch_id=batch_id,
+            deliveries=deliveries,
+            url=url,
+            headers=headers,
+            payload_fields=payload_fields,
+            auth_mode=auth_mode,
+            subscription=subscription,
+            encrypted_secret=encrypted_secret,
+        )
+    except PreparedWebhookBatchRequestError as e:
+        await _record(
+            project_id=project_id,
+            subscription_id=subscription_id,
+            items=e.items,
+            code="400",
+            message="failed",
+            update={"error": str(e)},
+            dao=dao,
+        )
+        return
+
+    await _deliver(
+        project_id=project_id,
+        subscription_id=subscription_id,
+        #
+        delivery_id=batch_id,
+        items=prepared.items,
+        #
+        url=url,
+        resolved_ip=prepared.resolved_ip,
+        payload_json=prepared.payload_json,
+        request_headers=prepared.request_headers,
+        #
+        retry_count=retry_count,
+        #
+        dao=dao,
+        lanes=lanes,
+        defer=defer,
+        deferrals=deferrals,
+    )
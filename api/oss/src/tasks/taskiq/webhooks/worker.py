@@ -1,22 +1,36 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from taskiq import AsyncBroker, Context, TaskiqDepends
 
 from oss.src.dbs.postgres.webhooks.dao import WebhooksDAO
+from oss.src.tasks.taskiq.webhooks.lanes import WebhookLanes
 from oss.src.tasks.taskiq.webhooks.tasks import deliver_webhook as deliver_webhook_impl
+from oss.src.tasks.taskiq.webhooks.tasks import (
+    deliver_webhook_batch as deliver_webhook_batch_impl,
+)
 from oss.src.core.webhooks.types import WEBHOOK_MAX_RETRIES
 from oss.src.utils.logging import get_module_logger
 
 log = get_module_logger(__name__)
 
 
+def _label_count(context: Context, label: str) -> int:
+    raw = context.message.labels.get(label, 0) or 0
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return 0
+
+
 class WebhooksWorker:
-    """Registers and owns the TaskIQ webhook delivery task.
+    """Registers and owns the TaskIQ webhook delivery tasks.
 
-    The deliver_webhook task receives all delivery data inline (no DB reads)
-    and writes a single delivery record only on final success or failure.
-    Retry count is read from TaskIQ's internal _taskiq_retry_count label.
+    The deliver tasks receive all delivery data inline (no DB reads)
+    and write a delivery record only on final success or failure.
+    Retry count is read from TaskIQ's internal _taskiq_retry_count label,
+    and how many times a delivery was requeued by its lane from
+    webhooks_deferrals. All tasks in the process share one set of lanes.
     """
 
     def __init__(
@@ -27,6 +41,7 @@ class WebhooksWorker:
     ):
         self.broker = broker
         self.webhooks_dao = webhooks_dao
+        self.lanes = WebhookLanes()
 
         self._register_tasks()
 
@@ -59,11 +74,8 @@ class WebhooksWorker:
             #
             context: Context = TaskiqDepends(),
         ) -> None:
-            retry_count_raw = context.message.labels.get("_taskiq_retry_count", 0) or 0
-            try:
-                retry_count = int(retry_count_raw)
-            except (TypeError, ValueError):
-                retry_count = 0
+            retry_count = _label_count(context, "_taskiq_retry_count")
+            deferrals = _label_count(context, "webhooks_deferrals")
 
             log.info(
                 f"[TASK] webhooks.deliver "
@@ -71,6 +83,29 @@ class WebhooksWorker:
                 f"attempt={retry_count}/{WEBHOOK_MAX_RETRIES}"
             )
 
+            async def defer() -> None:
+                await (
+                    deliver_webhook.kicker()
+                    .with_labels(
+                        _taskiq_retry_count=retry_count,
+                        webhooks_deferrals=deferrals + 1,
+                    )
+                    .kiq(
+                        project_id=project_id,
+                        delivery_id=delivery_id,
+                        subscription_id=subscription_id,
+                        event_id=event_id,
+                        url=url,
+                        headers=headers,
+                        payload_fields=payload_fields,
+                        auth_mode=auth_mode,
+                        event_type=event_type,
+                        subscription=subscription,
+                        event=event,
+                        encrypted_secret=encrypted_secret,
+                    )
+                )
+
             await deliver_webhook_impl(
                 project_id=UUID(project_id),
                 #
@@ -93,6 +128,89 @@ class WebhooksWorker:
                 retry_count=retry_count,
                 #
                 dao=self.webhooks_dao,
+                lanes=self.lanes,
+                defer=defer,
+                deferrals=deferrals,
+            )
+
+        @self.broker.task(
+            task_name="webhooks.deliver_batch",
+            retry_on_error=True,
+            max_retries=WEBHOOK_MAX_RETRIES,
+        )
+        async def deliver_webhook_batch(
+            *,
+            project_id: str,
+            #
+            batch_id: str,
+            subscription_id: str,
+            deliveries: List[Dict[str, Any]],
+            #
+            url: str,
+            headers: Dict[str, str],
+            payload_fields: Optional[Dict[str, Any]] = None,
+            auth_mode: Optional[str] = None,
+            #
+            subscription: Dict[str, Any],
+            #
+            encrypted_secret: str,
+            #
+            context: Context = TaskiqDepends(),
+        ) -> None:
+            retry_count = _label_count(context, "_taskiq_retry_count")
+            deferrals = _label_count(context, "webhooks_deferrals")
+
+            log.info(
+                f"[TASK] webhooks.deliver_batch "
+                f"batch={batch_id} subscription={subscription_id} "
+                f"events={len(deliveries)} "
+                f"attempt={retry_count}/{WEBHOOK_MAX_RETRIES}"
+            )
+
+            async def defer() -> None:
+                await (
+                    deliver_webhook_batch.kicker()
+                    .with_labels(
+                        _taskiq_retry_count=retry_count,
+                        webhooks_deferrals=deferrals + 1,
+                    )
+                    .kiq(
+                        project_id=project_id,
+                        batch_id=batch_id,
+                        subscription_id=subscription_id,
+                        deliveries=deliveries,
+                        url=url,
+                        headers=headers,
+                        payload_fields=payload_fields,
+                        auth_mode=auth_mode,
+                        subscription=subscription,
+                        encrypted_secret=encrypted_secret,
+                    )
+                )
+
+            await deliver_webhook_batch_impl(
+                project_id=UUID(project_id),
+                #
+                batch_id=UUID(batch_id),
+                subscription_id=UUID(subscription_id),
+                deliveries=deliveries,
+                #
+                url=url,
+                headers=headers,
+                payload_fields=payload_fields,
+                auth_mode=auth_mode,
+                #
+                subscription=subscription,
+                #
+                encrypted_secret=encrypted_secret,
+                #
+                retry_count=retry_count,
+                #
+                dao=self.webhooks_dao,
+                lanes=self.lanes,
+                defer=defer,
+                deferrals=deferrals,
             )
 
         self.deliver_webhook = deliver_webhook
+        self.deliver_webhook_batch = deliver_webhook_batch
@@ -9,6 +9,8 @@ Layer 1 (Scripts): Raw Redis Lua execution
     Methods:
     - execute_tbra(key, capacity, rate)
     - execute_gcra(key, interval, tolerance)
+    - execute_tbra_lease(key, capacity, rate, count)
+    - execute_gcra_lease(key, interval, tolerance, count)
     Details:
     - All time values in milliseconds
     - Computes current time internally
@@ -36,10 +38,22 @@ Usage (with dict key):
 
 Usage (with multiple dimensions):
     result = await check_throttle({"ep": endpoint, "org": org_id}, ...)
+
+Modes (``ThrottleMode``, default from ``env.agenta.api.throttling.mode``):
+    - STRICT (default): one script execution per key per check.
+    - LEASE: each process reserves a block of tokens per key in one script execution
+      and spends it locally, reserving the next block in the background once half of
+      it is spent. A reservation never takes more than the bucket holds, so leasing
+      never over-admits; its error is under-admission, bounded by the tokens a process
+      holds unspent: at most ``lease_error`` x capacity per key. Blocks double while
+      reservations are granted in full and shrink to what the bucket had left when
+      they are not, so near the limit every check goes back to Redis.
 """
 
 from typing import Optional, Callable, Awaitable, Any, Union, TypeVar
+import asyncio
 import time
+from collections import OrderedDict
 from enum import Enum
 
 from pydantic import BaseModel
@@ -65,6 +79,9 @@ _SCALE = 1000
 # TTL: 60 minutes
 _TTL_MS = 3600000
 
+# Lease mode: keys with a local lease kept per process (least recently used dropped)
+_LEASE_MAX_KEYS = 4096
+
 # Redis client
 _redis: Optional[Redis] = None
 
@@ -169,22 +186,118 @@ redis.call('SET', key, new_tat, 'PX', 3600000)
 return {allow, remaining, retry}
 """
 
+# Lease variants: take up to ARGV[4] requests' worth at once and return how many were
+# granted. A denial (0 granted) leaves the bucket as it was.
+
+_LUA_TBRA_LEASE = """
+local key = KEYS[1]
+local max_cap = tonumber(ARGV[1])
+local rate_per_min = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local count = tonumber(ARGV[4])
+
+local val = redis.call('GET', key)
+local tokens, last
+
+if val then
+    local sep = string.find(val, '|')
+    tokens = tonumber(string.sub(val, 1, sep - 1))
+    last = tonumber(string.sub(val, sep + 1))
+else
+    tokens = max_cap
+    last = now
+end
+
+local elapsed = now - last
+if elapsed > 0 then
+    tokens = tokens + (elapsed * rate_per_min) / 60000
+    if tokens > max_cap then tokens = max_cap end
+end
+
+local granted = math.floor(tokens / 1000)
+if granted > count then granted = count end
+if granted < 0 then granted = 0 end
+
+tokens = tokens - granted * 1000
+
+local retry = 0
+if granted == 0 then
+    retry = math.ceil(((1000 - tokens) * 60000) / rate_per_min)
+end
+
+redis.call('SET', key, tokens .. '|' .. now, 'PX', 3600000)
+
+return {granted, tokens, retry}
+"""
+
+_LUA_GCRA_LEASE = """
+local key = KEYS[1]
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local count = tonumber(ARGV[4])
+
+local tat = tonumber(redis.call('GET', key)) or now
+local base = tat > now and tat or now
+
+-- Each granted request i (from 0) is allowed when base + i * interval - tolerance <= now
+local granted = math.floor((now + tolerance - base) / interval) + 1
+if granted > count then granted = count end
+if granted < 0 then granted = 0 end
+
+local retry, new_tat, remaining
+
+if granted == 0 then
+    retry = tat - tolerance - now
+    new_tat = tat
+    remaining = 0
+else
+    retry = 0
+    new_tat = base + granted * interval
+    local used = new_tat - now
+    if used < tolerance then
+        remaining = math.floor((tolerance - used) / interval)
+    else
+        remaining = 0
+    end
+end
+
+redis.call('SET', key, new_tat, 'PX', 3600000)
+
+return {granted, remaining, retry}
+"""
+
 _sha_tbra: Optional[str] = None
 _sha_gcra: Optional[str] = None
+_sha_tbra_lease: Optional[str] = None
+_sha_gcra_lease: Optional[str] = None
 
 
 async def _ensure_scripts() -> tuple[str, str]:
-    global _sha_tbra, _sha_gcra
+    global _sha_tbra, _sha_gcra, _sha_tbra_lease, _sha_gcra_lease
 
     r = _get_redis()
 
-    if _sha_tbra is None or _sha_gcra is None:
+    if (
+        _sha_tbra is None
+        or _sha_gcra is None
+        or _sha_tbra_lease is None
+        or _sha_gcra_lease is None
+    ):
         _sha_tbra = await r.script_load(_LUA_TBRA)
         _sha_gcra = await r.script_load(_LUA_GCRA)
+        _sha_tbra_lease = await r.script_load(_LUA_TBRA_LEASE)
+        _sha_gcra_lease = await r.script_load(_LUA_GCRA_LEASE)
 
     return str(_sha_tbra), str(_sha_gcra)
 
 
+async def _ensure_lease_scripts() -> tuple[str, str]:
+    await _ensure_scripts()
+
+    return str(_sha_tbra_lease), str(_sha_gcra_lease)
+
+
 T = TypeVar("T")
 
 
@@ -205,7 +318,7 @@ async def _with_script_retry(
     Raises:
         Exception: Re-raises non-NOSCRIPT exceptions
     """
-    global _sha_tbra, _sha_gcra
+    global _sha_tbra, _sha_gcra, _sha_tbra_lease, _sha_gcra_lease
 
     try:
         return await operation()
@@ -214,6 +327,7 @@ async def _with_script_retry(
         # Handle NOSCRIPT error (Redis script not loaded/evicted)
         if "NOSCRIPT" in str(e):
             _sha_tbra, _sha_gcra = None, None
+            _sha_tbra_lease, _sha_gcra_lease = None, None
 
             log.info(
                 f"[throttle] [{operation_name}] NOSCRIPT detected, reloading scripts and retrying"
@@ -292,6 +406,64 @@ async def execute_gcra(
     return bool(allow), float(tokens_remaining), int(retry_ms)
 
 
+async def execute_tbra_lease(
+    key: str,
+    capacity: int,
+    rate: int,
+    count: int,
+) -> tuple[int, float, int]:
+    """
+    Layer 1: Execute TBRA lease script.
+
+    Args:
+        key: Full Redis key
+        capacity: capacity * 1000 (scaled tokens)
+        rate: refill_rate * 1000 (scaled tokens per minute)
+        count: Most tokens to reserve
+
+    Returns:
+        (granted, tokens_remaining, retry_ms)
+    """
+    sha_tbra_lease, _ = await _ensure_lease_scripts()
+
+    now_ms = _now_ms()
+
+    result = await _exec_script(sha_tbra_lease, key, capacity, rate, now_ms, count)
+
+    granted, tokens_scaled, retry_ms = result
+
+    return int(granted), tokens_scaled / _SCALE, int(retry_ms)
+
+
+async def execute_gcra_lease(
+    key: str,
+    interval: int,
+    tolerance: int,
+    count: int,
+) -> tuple[int, float, int]:
+    """
+    Layer 1: Execute GCRA lease script.
+
+    Args:
+        key: Full Redis key
+        interval: Milliseconds between requests at steady rate
+        tolerance: Burst tolerance in milliseconds
+        count: Most requests to reserve
+
+    Returns:
+        (granted, tokens_remaining, retry_ms)
+    """
+    _, sha_gcra_lease = await _ensure_lease_scripts()
+
+    now_ms = _now_ms()
+
+    result = await _exec_script(sha_gcra_lease, key, interval, tolerance, now_ms, count)
+
+    granted, tokens_remaining, retry_ms = result
+
+    return int(granted), float(tokens_remaining), int(retry_ms)
+
+
 # =============================================================================
 # Layer 2: Library API
 # =============================================================================
@@ -307,6 +479,11 @@ class FailureMode(Enum):
     CLOSED = "closed"
 
 
+class ThrottleMode(Enum):
+    STRICT = "strict"
+    LEASE = "lease"
+
+
 class ThrottleResult(BaseModel):
     key: str
     allow: bool
@@ -433,12 +610,183 @@ def _failure_result(key: str, failure_mode: FailureMode) -> ThrottleResult:
     )
 
 
+def _configured_mode() -> ThrottleMode:
+    try:
+        return ThrottleMode(env.agenta.api.throttling.mode)
+    except ValueError:
+        return ThrottleMode.STRICT
+
+
+def _lease_max_size(max_capacity: int) -> int:
+    """
+    Largest block one process may reserve for a key.
+
+    Args:
+        max_capacity: Burst size (tokens)
+
+    Returns:
+        Block size bound; below 2, leasing saves nothing and the key stays strict
+    """
+    return int(max_capacity * env.agenta.api.throttling.lease_error)
+
+
+# =============================================================================
+# Layer 2: Leases
+# =============================================================================
+
+
+class _Lease:
+    """Tokens this process reserved from one bucket and has not spent yet."""
+
+    def __init__(self) -> None:
+        self.tokens = 0
+        self.size = 1
+        self.remaining: Optional[float] = None
+        self.retry_ms = 0
+        self.refill: Optional[asyncio.Task] = None
+
+
+LeaseKey = tuple[str, Algorithm, int, int]
+
+
+class _Leases:
+    """This process's leases, by (full_key, algorithm, max_capacity, refill_rate)."""
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._leases: "OrderedDict[LeaseKey, _Lease]" = OrderedDict()
+
+    def _bind_loop(self) -> None:
+        # Refill tasks belong to the loop that started them
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._leases = OrderedDict()
+
+    def _lease(self, lease_key: LeaseKey) -> _Lease:
+        self._bind_loop()
+
+        lease = self._leases.get(lease_key)
+        if lease is None:
+            lease = self._leases[lease_key] = _Lease()
+            self._evict()
+        self._leases.move_to_end(lease_key)
+        return lease
+
+    def _evict(self) -> None:
+        # Dropping a lease strands its tokens until the bucket refills; that stays
+        # within the error bound, since a lease never holds more than one block.
+        for lease_key in list(self._leases):
+            if len(self._leases) <= _LEASE_MAX_KEYS:
+                return
+            if self._leases[lease_key].refill is None:
+                del self._leases[lease_key]
+
+    def _start_refill(
+        self,
+        lease: _Lease,
+        lease_key: LeaseKey,
+        max_size: int,
+    ) -> asyncio.Task:
+        task = asyncio.create_task(self._reserve(lease, lease_key, max_size))
+        lease.refill = task
+        task.add_done_callback(_log_refill_failure)
+        return task
+
+    async def _reserve(
+        self,
+        lease: _Lease,
+        lease_key: LeaseKey,
+        max_size: int,
+    ) -> int:
+        full_key, algorithm, max_capacity, refill_rate = lease_key
+
+        # Top the lease up to one block, never beyond
+        count = max(1, lease.size - lease.tokens)
+
+        try:
+            if algorithm == Algorithm.TBRA:
+                max_cap_s, refill_s = _to_tbra_params(max_capacity, refill_rate)
+                granted, remaining, retry_ms = await execute_tbra_lease(
+                    full_key, max_cap_s, refill_s, count
+                )
+            else:
+                interval, tolerance = _to_gcra_params(max_capacity, refill_rate)
+                granted, remaining, retry_ms = await execute_gcra_lease(
+                    full_key, interval, tolerance, count
+                )
+        finally:
+            lease.refill = None
+
+        lease.tokens += granted
+        lease.remaining = max(0.0, remaining)
+        lease.retry_ms = retry_ms
+
+        if granted >= count:
+            # Demand drained a whole block: reserve bigger ones
+            lease.size = min(lease.size * 2, max_size)
+        else:
+            # The bucket is running out: hand back to (near) per-request checks
+            lease.size = max(1, granted)
+
+        return granted
+
+    async def check(
+        self,
+        full_key: str,
+        key_str: str,
+        max_capacity: int,
+        refill_rate: int,
+        algorithm: Algorithm,
+        max_size: int,
+    ) -> ThrottleResult:
+        lease_key = (full_key, algorithm, max_capacity, refill_rate)
+        lease = self._lease(lease_key)
+
+        while lease.tokens <= 0:
+            refill = lease.refill or self._start_refill(lease, lease_key, max_size)
+
+            # Shielded: a cancelled request must not cancel a refill others await
+            if not await asyncio.shield(refill):
+                return ThrottleResult(
+                    allow=False,
+                    tokens_remaining=lease.remaining,
+                    retry_after_ms=lease.retry_ms,
+                    key=key_str,
+                )
+
+        lease.tokens -= 1
+
+        if lease.refill is None and lease.tokens <= lease.size // 2:
+            self._start_refill(lease, lease_key, max_size)
+
+        return ThrottleResult(
+            allow=True,
+            tokens_remaining=(lease.remaining or 0.0) + lease.tokens,
+            retry_after_ms=0,
+            key=key_str,
+        )
+
+
+def _log_refill_failure(task: asyncio.Task) -> None:
+    # Requests awaiting the refill see its error; a background refill has no one to
+    # tell, and the next request that finds the lease empty tries again.
+    if task.cancelled():
+        return
+    if task.exception() is not None:
+        log.warning("[throttle] [lease] Background reservation failed")
+
+
+_leases = _Leases()
+
+
 async def check_throttle(
     key: Union[str, dict],
     max_capacity: int,
     refill_rate: int,
     algorithm: Algorithm = Algorithm.TBRA,
     failure_mode: FailureMode = FailureMode.OPEN,
+    mode: Optional[ThrottleMode] = None,
 ) -> ThrottleResult:
     """
     Layer 2: Check rate limit and consume one token.
@@ -451,6 +799,7 @@ async def check_throttle(
         refill_rate: Tokens per minute (must be > 0)
         algorithm: TBRA or GCRA
         failure_mode: OPEN (allow) or CLOSED (deny) on Redis failure
+        mode: STRICT or LEASE (defaults to the configured mode)
 
     Returns:
         ThrottleResult with decision and timing
@@ -467,7 +816,22 @@ async def check_throttle(
     full_key = _build_key(key)
     key_str = _key_to_str(key)
 
+    mode = mode or _configured_mode()
+
     try:
+        if mode == ThrottleMode.LEASE and algorithm in (Algorithm.TBRA, Algorithm.GCRA):
+            max_size = _lease_max_size(max_capacity)
+
+            if max_size > 1:
+                return await _leases.check(
+                    full_key,
+                    key_str,
+                    max_capacity,
+                    refill_rate,
+                    algorithm,
+                    max_size,
+                )
+
         if algorithm == Algorithm.TBRA:
             max_cap_s, refill_s = _to_tbra_params(
                 max_capacity,
@@ -597,6 +961,7 @@ async def check_throttles(
     checks: list[tuple[Union[str, dict], int, int]],
     algorithm: Algorithm = Algorithm.TBRA,
     failure_mode: FailureMode = FailureMode.OPEN,
+    mode: Optional[ThrottleMode] = None,
 ) -> list[ThrottleResult]:
     """
     Check multiple rate limits in a pipeline.
@@ -605,6 +970,7 @@ async def check_throttles(
         checks: List of (key, max_capacity, refill_rate) where key is str or dict
         algorithm: TBRA or GCRA
         failure_mode: OPEN or CLOSED on failure
+        mode: STRICT or LEASE (defaults to the configured mode)
 
     Returns:
         List of ThrottleResult
@@ -612,16 +978,31 @@ async def check_throttles(
     if not checks:
         return []
 
+    mode = mode or _configured_mode()
+
     if algorithm not in (Algorithm.TBRA, Algorithm.GCRA):
         log.warning("[throttle] [batch] Unknown algorithm", algorithm=algorithm)
 
         return [_failure_result(_key_to_str(key), failure_mode) for key, _, _ in checks]
 
+    # Leases are spent locally; only the keys that need a reservation reach Redis
+    if mode == ThrottleMode.LEASE:
+        return list(
+            await asyncio.gather(
+                *(
+                    check_throttle(
+                        key, max_capacity, refill_rate, algorithm, failure_mode, mode
+                    )
+                    for key, max_capacity, refill_rate in checks
+                )
+            )
+        )
+
     # Optimization: Single check bypasses pipeline
     if len(checks) == 1:
         key, max_capacity, refill_rate = checks[0]
         result = await check_throttle(
-            key, max_capacity, refill_rate, algorithm, failure_mode
+            key, max_capacity, refill_rate, algorithm, failure_mode, mode
         )
         return [result]
 
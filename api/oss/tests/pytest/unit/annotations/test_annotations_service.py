@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 import types
 from unittest.mock import AsyncMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -12,12 +12,15 @@ sys.modules.setdefault("genson", types.SimpleNamespace(SchemaBuilder=object))
 from oss.src.core.annotations.service import AnnotationsService  # noqa: E402
 from oss.src.core.annotations.types import (  # noqa: E402
     Annotation,
+    AnnotationBulkEdit,
     AnnotationChannel,
+    AnnotationCreate,
     AnnotationEdit,
     AnnotationKind,
     AnnotationOrigin,
 )
 from oss.src.core.shared.dtos import Link  # noqa: E402
+from oss.src.core.tracing.dtos import OTelLink  # noqa: E402
 
 
 @pytest.mark.asyncio
@@ -80,3 +83,177 @@ async def test_edit_returns_updated_references_and_links():
     assert result is not None
     assert result.references.evaluator.slug == "new-evaluator"
     assert result.links["scope"].trace_id == "scope-trace"
+
+
+def _bulk_service():
+    evaluators_service = AsyncMock()
+    evaluators_service.retrieve_evaluator_revision.return_value = (
+        SimpleNamespace(
+            evaluator_id=None,
+            id=uuid4(),
+            data=SimpleNamespace(schemas=SimpleNamespace(outputs={})),
+        ),
+        None,  # environment_references
+        None,  # retrieval_info
+    )
+
+    async def ingest_spans(*, spans, **kwargs):
+        return [
+            OTelLink(trace_id=UUID(span.trace_id).hex, span_id=span.span_id)
+            for span in spans
+        ]
+
+    tracing_service = AsyncMock()
+    tracing_service.ingest_spans.side_effect = ingest_spans
+
+    return AnnotationsService(
+        evaluators_service=evaluators_service,
+        simple_evaluators_service=AsyncMock(),
+        tracing_service=tracing_service,
+    )
+
+
+def _reject_bad_scores(data, schema):
+    if data.get("score") == "bad":
+        raise ValueError("score must be a number")
+
+
+@pytest.mark.asyncio
+async def test_create_bulk_resolves_each_evaluator_once_and_ingests_once():
+    service = _bulk_service()
+
+    annotation_creates = [
+        AnnotationCreate(
+            data={"score": score},
+            references={"evaluator": {"slug": slug}},
+            links={"invocation": Link(trace_id=uuid4().hex, span_id="a" * 16)},
+        )
+        for slug, score in [
+            ("quality", 1),
+            ("quality", "bad"),
+            ("tone", 2),
+            ("quality", 3),
+        ]
+    ]
+
+    with patch(
+        "oss.src.core.annotations.service.validate_data_against_schema",
+        side_effect=_reject_bad_scores,
+    ):
+        results = await service.create_bulk(
+            organization_id=uuid4(),
+            project_id=uuid4(),
+            user_id=uuid4(),
+            annotation_creates=annotation_creates,
+        )
+
+    assert service.evaluators_service.retrieve_evaluator_revision.await_count == 2
+    service.tracing_service.ingest_spans.assert_awaited_once()
+    spans = service.tracing_service.ingest_spans.await_args.kwargs["spans"]
+    assert len(spans) == 3
+    assert len({span.trace_id for span in spans}) == 3
+
+    assert results[1].annotation_link is None
+    assert results[1].error == "score must be a number"
+    assert [
+        result.annotation_link.trace_id for i, result in enumerate(results) if i != 1
+    ] == [span.trace_id for span in spans]
+
+
+@pytest.mark.asyncio
+async def test_edit_bulk_fetches_once_and_reports_missing_annotations():
+    service = _bulk_service()
+    trace_id = uuid4().hex
+    service._query_annotation = AsyncMock(
+        return_value=[
+            Annotation(
+                trace_id=str(UUID(trace_id)),
+                span_id="b" * 16,
+                data={"score": 1},
+                references={"evaluator": {"slug": "quality"}},
+                links={},
+            )
+        ]
+    )
+
+    with patch(
+        "oss.src.core.annotations.service.validate_data_against_schema",
+        return_value=None,
+    ):
+        results = await service.edit_bulk(
+            organization_id=uuid4(),
+            project_id=uuid4(),
+            user_id=uuid4(),
+            annotation_edits=[
+                AnnotationBulkEdit(trace_id=trace_id, data={"score": 2}),
+                AnnotationBulkEdit(trace_id=uuid4().hex, data={"score": 3}),
+            ],
+        )
+
+    service._query_annotation.assert_awaited_once()
+    service.tracing_service.ingest_spans.assert_awaited_once()
+    (span,) = service.tracing_service.ingest_spans.await_args.kwargs["spans"]
+    assert span.span_id == "b" * 16
+
+    assert results[0].annotation_link.trace_id == trace_id
+    assert results[0].annotation_link.span_id == "b" * 16
+    assert results[1].error == "Annotation not found"
+
+
+@pytest.mark.asyncio
+async def test_edit_bulk_skips_annotations_whose_span_does_not_match():
+    service = _bulk_service()
+    trace_id = uuid4().hex
+    service._query_annotation = AsyncMock(
+        return_value=[
+            Annotation(
+                trace_id=trace_id,
+                span_id="b" * 16,
+                data={"score": 1},
+                references={"evaluator": {"slug": "quality"}},
+                links={},
+            )
+        ]
+    )
+
+    with patch(
+        "oss.src.core.annotations.service.validate_data_against_schema",
+        return_value=None,
+    ):
+        results = await service.edit_bulk(
+            organization_id=uuid4(),
+            project_id=uuid4(),
+            user_id=uuid4(),
+            annotation_edits=[
+                AnnotationBulkEdit(
+                    trace_id=trace_id, span_id="c" * 16, data={"score": 2}
+                ),
+                AnnotationBulkEdit(
+                    trace_id=trace_id, span_id="0x" + "b" * 16, data={"score": 3}
+                ),
+            ],
+        )
+
+    assert results[0].error == "Annotation not found"
+    assert results[1].annotation_link.span_id == "b" * 16
+
+
+@pytest.mark.asyncio
+async def test_create_bulk_resolves_reference_less_items_one_by_one():
+    service = _bulk_service()
+
+    with patch(
+        "oss.src.core.annotations.service.validate_data_against_schema",
+        return_value=None,
+    ):
+        await service.create_bulk(
+            organization_id=uuid4(),
+            project_id=uuid4(),
+            user_id=uuid4(),
+            annotation_creates=[
+                AnnotationCreate(data={"score": score}, references={}, links={})
+                for score in (1, 2)
+            ],
+        )
+
+    assert service.evaluators_service.retrieve_evaluator_revision.await_count == 2
@@ -8,6 +8,7 @@ from oss.src.apis.fastapi.applications import router as applications_router_modu
 from oss.src.apis.fastapi.applications.models import (
     ApplicationRevisionDeployRequest,
     ApplicationRevisionRetrieveRequest,
+    ApplicationRevisionResponse,
 )
 from oss.src.apis.fastapi.applications.router import ApplicationsRouter
 from oss.src.core.applications.dtos import ApplicationRevision
@@ -184,13 +185,16 @@ async def test_retrieve_application_revision_returns_environment_retrieval_info(
             state=SimpleNamespace(
                 project_id=str(project_id),
                 user_id=str(uuid4()),
-            )
+            ),
+            headers={},
         ),
         application_revision_retrieve_request=ApplicationRevisionRetrieveRequest(
             application_ref=Reference(slug="demo-app"),
             environment_ref=Reference(slug="production"),
         ),
     )
+    assert response.headers["etag"]
+    response = ApplicationRevisionResponse.model_validate_json(response.body)
 
     assert response.retrieval_info is not None
     assert response.retrieval_info.selector == {"key": "demo-app.revision"}
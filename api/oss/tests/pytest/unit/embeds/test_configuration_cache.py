@@ -0,0 +1,188 @@
+"""Unit tests for caching resolved configurations by revision id.
+
+The cache is an in-memory dict; the workflows service is a fake that counts
+fetches, so the tests can tell a cached resolution from a fresh one.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+import oss.src.core.embeds.utils as embeds_utils
+from oss.src.core.embeds.dtos import ErrorPolicy
+from oss.src.core.embeds.service import EmbedsService
+from oss.src.core.embeds.utils import (
+    AG_EMBED_KEY,
+    AG_REFERENCES_KEY,
+    EMBEDS_CONFIGURATION_CACHE_NAMESPACE,
+    configuration_cache_key,
+    fetch_resolved_configuration,
+    invalidate_resolved_configurations,
+)
+from oss.src.core.workflows.dtos import WorkflowRevision, WorkflowRevisionData
+
+
+class _WorkflowsService:
+    def __init__(self):
+        self.artifact_id = uuid4()
+        self.variant_id = uuid4()
+        self.pinned_id = uuid4()
+        self.latest_id = uuid4()
+        self.prompt = "v1"
+        self.fetches = 0
+        self.on_fetch = None
+
+    async def fetch_workflow_revision(
+        self, *, workflow_revision_ref=None, workflow_variant_ref=None, **_
+    ):
+        self.fetches += 1
+        pinned = workflow_revision_ref is not None
+        revision = WorkflowRevision(
+            id=self.pinned_id if pinned else self.latest_id,
+            workflow_id=self.artifact_id,
+            workflow_variant_id=self.variant_id,
+            data=WorkflowRevisionData(
+                parameters={"prompt": "pinned" if pinned else self.prompt}
+            ),
+        )
+        if self.on_fetch is not None:
+            await self.on_fetch()
+        return revision
+
+    async def commit(self, project_id, prompt):
+        self.prompt = prompt
+        self.latest_id = uuid4()
+        await invalidate_resolved_configurations(
+            project_id=project_id, ids=[self.variant_id, self.artifact_id]
+        )
+
+
+@pytest.fixture(autouse=True)
+def _store(monkeypatch):
+    store = {}
+
+    async def _get_cache(*, namespace, project_id, key, **_):
+        return store.get((namespace, project_id, key))
+
+    async def _set_cache(*, namespace, project_id, key, value, ttl):
+        store[(namespace, project_id, key)] = value
+
+    async def _invalidate_cache(*, namespace, project_id, key):
+        store.pop((namespace, project_id, key), None)
+
+    monkeypatch.setattr(embeds_utils, "get_cache", _get_cache)
+    monkeypatch.setattr(embeds_utils, "set_cache", _set_cache)
+    monkeypatch.setattr(embeds_utils, "invalidate_cache", _invalidate_cache)
+
+    return store
+
+
+def _embed(**references):
+    return {
+        AG_EMBED_KEY: {
+            AG_REFERENCES_KEY: {
+                entity_type: {"id": str(id)} for entity_type, id in references.items()
+            }
+        }
+    }
+
+
+async def _resolve(service, project_id, revision_id, configuration):
+    resolved, _ = await service.resolve_configuration(
+        project_id=project_id,
+        configuration=configuration,
+        revision_id=revision_id,
+    )
+    return resolved
+
+
+async def test_resolution_is_cached_until_an_embedded_variant_moves():
+    workflows = _WorkflowsService()
+    service = EmbedsService(workflows_service=workflows)
+    project_id, revision_id = uuid4(), uuid4()
+    configuration = {"latest": _embed(workflow_variant=workflows.variant_id)}
+
+    # The latest revision is only known once fetched, so it is stamped and
+    # fetched again before the result is cached
+    first = await _resolve(service, project_id, revision_id, configuration)
+    assert first == await _resolve(service, project_id, revision_id, configuration)
+    assert workflows.fetches == 2
+
+    # A commit elsewhere in the project leaves the result alone
+    await invalidate_resolved_configurations(project_id=project_id, ids=[uuid4()])
+    await _resolve(service, project_id, revision_id, configuration)
+    assert workflows.fetches == 2
+
+    await workflows.commit(project_id, "v2")
+    second = await _resolve(service, project_id, revision_id, configuration)
+    assert workflows.fetches == 4
+    assert second["latest"]["parameters"]["prompt"] == "v2"
+
+
+async def test_a_commit_racing_the_resolution_keeps_the_stale_result_out():
+    workflows = _WorkflowsService()
+    service = EmbedsService(workflows_service=workflows)
+    project_id, revision_id = uuid4(), uuid4()
+    configuration = {"latest": _embed(workflow_variant=workflows.variant_id)}
+
+    async def commit_after_last_read():
+        if workflows.fetches == 2:
+            await workflows.commit(project_id, "v2")
+
+    # The variant moves after its old revision was read for the last time
+    workflows.on_fetch = commit_after_last_read
+    stale = await _resolve(service, project_id, revision_id, configuration)
+    assert stale["latest"]["parameters"]["prompt"] == "v1"
+    workflows.on_fetch = None
+
+    fresh = await _resolve(service, project_id, revision_id, configuration)
+    assert fresh["latest"]["parameters"]["prompt"] == "v2"
+
+
+async def test_pinned_embeds_ignore_commits_but_not_edits(_store):
+    workflows = _WorkflowsService()
+    service = EmbedsService(workflows_service=workflows)
+    project_id, revision_id = uuid4(), uuid4()
+    configuration = {"pinned": _embed(workflow_revision=workflows.pinned_id)}
+
+    await _resolve(service, project_id, revision_id, configuration)
+    (stamps,) = [
+        value["stamps"]
+        for (namespace, *_), value in _store.items()
+        if namespace == EMBEDS_CONFIGURATION_CACHE_NAMESPACE
+    ]
+    assert list(stamps) == [str(workflows.pinned_id)]
+
+    key = configuration_cache_key(
+        revision_id=revision_id,
+        include_archived=True,
+        max_depth=10,
+        max_embeds=100,
+        error_policy=ErrorPolicy.EXCEPTION,
+    )
+    await invalidate_resolved_configurations(
+        project_id=project_id, ids=[workflows.variant_id, workflows.artifact_id]
+    )
+    assert await fetch_resolved_configuration(project_id=project_id, key=key)
+
+    await invalidate_resolved_configurations(
+        project_id=project_id, ids=[workflows.pinned_id]
+    )
+    assert await fetch_resolved_configuration(project_id=project_id, key=key) is None
+
+
+async def test_inline_and_archive_excluding_resolutions_are_not_cached(_store):
+    workflows = _WorkflowsService()
+    service = EmbedsService(workflows_service=workflows)
+    configuration = {"latest": _embed(workflow_variant=workflows.variant_id)}
+
+    # Inline configurations have no revision id to key them by
+    await _resolve(service, uuid4(), None, configuration)
+    # Nor are lookups that exclude archived entities cached
+    await service.resolve_configuration(
+        project_id=uuid4(),
+        configuration=configuration,
+        revision_id=uuid4(),
+        include_archived=False,
+    )
+    assert _store == {}
@@ -8,14 +8,19 @@ Tests cover:
 - Cycle detection
 - Depth and count limits
 - Error policies (EXCEPTION, PLACEHOLDER, KEEP)
+- Memoized, concurrent fetching and subtree rescans
 """
 
+import asyncio
+
 import pytest
 from uuid import uuid4
 from typing import Dict
 
+from oss.src.core.embeds import utils as embeds_utils
 from oss.src.core.embeds.utils import (
     resolve_embeds,
+    create_universal_resolver,
     find_object_embeds,
     find_string_embeds,
     find_snippet_embeds,
@@ -28,6 +33,8 @@ from oss.src.core.embeds.utils import (
     SNIPPET_DEFAULT_PATH,
     _find_snippet_tokens,
     _parse_snippet_token,
+    _find_embeds,
+    _revision_cache_key,
 )
 from oss.src.core.embeds.dtos import (
     ErrorPolicy,
@@ -1185,3 +1192,212 @@ class TestSnippetEmbedResolution:
         )
         assert result_config["a"] == "snippet-value"
         assert result_config["b"] == "classic-value"
+
+
+class TestMemoizedResolution:
+    """Tests for reference deduplication, concurrency and subtree rescans."""
+
+    async def test_shared_snippet_fetched_once(self):
+        """A snippet embedded in many messages costs one fetch per reference."""
+        calls = []
+        env_data = {
+            "data": {"references": {"tip": {"workflow_revision": {"slug": "wf-v1"}}}}
+        }
+        workflow_data = {
+            "data": {"parameters": {"prompt": {"messages": [{"content": "shared"}]}}}
+        }
+
+        async def resolver(references: Dict[str, Reference]):
+            calls.append(sorted(references))
+            if "environment" in references:
+                return env_data
+            return workflow_data
+
+        config = {
+            "messages": [
+                {"content": f"#{i}: @{{{{environment.slug=prod, key=tip}}}}"}
+                for i in range(20)
+            ]
+        }
+        result_config, info = await resolve_embeds(
+            configuration=config,
+            resolver_callback=resolver,
+        )
+
+        assert [m["content"] for m in result_config["messages"]] == [
+            f"#{i}: shared" for i in range(20)
+        ]
+        assert info.embeds_resolved == 20
+        assert calls == [["environment"], ["workflow_revision"]]
+
+    async def test_memoized_values_are_not_shared(self):
+        """Inlined copies of the same reference are independent objects."""
+        ref_id = str(uuid4())
+        embed = {
+            AG_EMBED_KEY: {AG_REFERENCES_KEY: {"workflow_revision": {"id": ref_id}}}
+        }
+
+        async def resolver(references: Dict[str, Reference]):
+            return {"data": {"value": [1]}}
+
+        result_config, _ = await resolve_embeds(
+            configuration={"a": dict(embed), "b": dict(embed)},
+            resolver_callback=resolver,
+        )
+
+        result_config["a"]["value"].append(2)
+        assert result_config["b"] == {"value": [1]}
+
+    async def test_level_is_fetched_concurrently(self):
+        """Distinct references at one level are in flight together."""
+        in_flight = 0
+        peak = 0
+
+        async def resolver(references: Dict[str, Reference]):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"data": {"value": "resolved"}}
+
+        config = {
+            f"embed{i}": {
+                AG_EMBED_KEY: {
+                    AG_REFERENCES_KEY: {"workflow_revision": {"id": str(uuid4())}}
+                }
+            }
+            for i in range(5)
+        }
+        result_config, info = await resolve_embeds(
+            configuration=config,
+            resolver_callback=resolver,
+        )
+
+        assert all(v == {"value": "resolved"} for v in result_config.values())
+        assert info.embeds_resolved == 5
+        assert peak == 5
+
+    async def test_memoized_error_honours_policy(self):
+        """A failing reference fails every embed that uses it, once fetched."""
+        calls = 0
+
+        async def resolver(references: Dict[str, Reference]):
+            nonlocal calls
+            calls += 1
+            raise ValueError("Resolver failed")
+
+        token = "@ag.embed[@ag.references[workflow_revision.version=v1]]"
+        result_config, info = await resolve_embeds(
+            configuration={"a": token, "b": token},
+            resolver_callback=resolver,
+            error_policy=ErrorPolicy.PLACEHOLDER,
+        )
+
+        assert result_config == {
+            "a": "<error:ValueError>",
+            "b": "<error:ValueError>",
+        }
+        assert len(info.errors) == 2
+        assert calls == 1
+
+    def test_subtree_scan_matches_full_scan(self):
+        """Rescanning modified locations yields the same embeds as a full scan."""
+        ref = {AG_REFERENCES_KEY: {"workflow_revision": {"id": str(uuid4())}}}
+        config = {
+            "untouched": "@ag.embed[@ag.references[workflow_revision.version=v9]]",
+            "inlined": {
+                "object": {AG_EMBED_KEY: ref},
+                "list": ["@{{workflow.slug=wf, path=system}}"],
+            },
+            "messages": [
+                {"content": "@ag.embed[@ag.references[workflow_revision.version=v1]]"}
+            ],
+        }
+
+        full = _find_embeds(config=config)
+        subtree = _find_embeds(
+            config=config,
+            locations=["inlined", "inlined.list.0", "messages.0.content"],
+        )
+
+        assert [e.location for e in subtree[0]] == ["inlined.object"]
+        assert [e.location for e in subtree[1]] == ["messages.0.content"]
+        assert [e.location for e in subtree[2]] == ["inlined.list.0"]
+        assert [e.location for e in full[0]] == [e.location for e in subtree[0]]
+        assert [e.location for e in full[2]] == [e.location for e in subtree[2]]
+        assert len(full[1]) == 2
+
+
+class TestRevisionCache:
+    """Tests for sharing immutable revisions across resolutions."""
+
+    def test_only_revisions_by_id_are_cacheable(self):
+        revision = Reference(id=uuid4())
+
+        assert _revision_cache_key(
+            references={"workflow_revision": revision},
+            include_archived=True,
+        )
+        assert _revision_cache_key(
+            references={
+                "workflow_variant": Reference(slug="default"),
+                "workflow_revision": revision,
+            },
+            include_archived=True,
+        )
+        assert not _revision_cache_key(
+            references={"workflow_revision": Reference(slug="wf", version="v1")},
+            include_archived=True,
+        )
+        assert not _revision_cache_key(
+            references={"workflow_variant": Reference(id=uuid4())},
+            include_archived=True,
+        )
+        assert not _revision_cache_key(
+            references={"workflow_revision": revision},
+            include_archived=False,
+        )
+
+    async def test_cached_revision_skips_the_service(self, monkeypatch):
+        store = {}
+
+        async def _get_cache(*, namespace, project_id, key, **_kwargs):
+            return store.get((namespace, project_id, key))
+
+        async def _set_cache(*, namespace, project_id, key, value, ttl):
+            store[(namespace, project_id, key)] = value
+
+        monkeypatch.setattr(embeds_utils, "get_cache", _get_cache)
+        monkeypatch.setattr(embeds_utils, "set_cache", _set_cache)
+
+        fetches = 0
+
+        class _Revision:
+            data = {"parameters": {"value": "resolved"}}
+
+            def model_dump(self, mode):
+                return {"data": self.data}
+
+        class _EnvironmentsService:
+            async def fetch_environment_revision(self, **_kwargs):
+                nonlocal fetches
+                fetches += 1
+                return _Revision()
+
+        resolver = create_universal_resolver(
+            project_id=uuid4(),
+            include_archived=True,
+            environments_service=_EnvironmentsService(),
+        )
+
+        by_id = {"environment_revision": Reference(id=uuid4())}
+        by_slug = {"environment": Reference(slug="production")}
+
+        assert await resolver(by_id) == await resolver(by_id)
+        assert fetches == 1
+
+        await resolver(by_slug)
+        await resolver(by_slug)
+        assert fetches == 3
+        assert len(store) == 1
@@ -13,7 +13,6 @@ from oss.src.core.evaluations.utils import (
     select_traces_for_reuse,
 )
 from oss.src.core.shared.dtos import Reference
-from oss.src.core.tracing.dtos import Fields, ListOperator
 
 
 def test_make_hash_normalizes_reference_objects_and_ignores_extra_fields():
@@ -147,30 +146,24 @@ def test_reuse_selection_skips_invalid_cached_traces_and_keeps_later_valid_ones(
 
 
 @pytest.mark.asyncio
-async def test_fetch_traces_by_hash_wrapper_delegates_to_tracing_service():
-    expected_traces = [SimpleNamespace(trace_id="trace-1")]
+async def test_fetch_traces_by_hashes_wrapper_delegates_to_tracing_service():
+    expected_traces = {"hash-1": [SimpleNamespace(trace_id="trace-1")]}
 
     class DummyTracingService:
-        async def query_traces(self, *, project_id, query):
+        async def fetch_traces_by_hashes(self, *, project_id, hash_ids, limit):
             assert project_id == uuid_project_id
-            assert query.windowing is not None
-            assert query.windowing.limit == 2
-            assert query.windowing.order == "descending"
-            assert query.filtering is not None
-            assert len(query.filtering.conditions) == 2
-            hash_condition = query.filtering.conditions[1]
-            assert hash_condition.field == Fields.HASHES
-            assert hash_condition.operator == ListOperator.IN
-            assert hash_condition.value == [{"id": "hash-1"}]
+            # Cells sharing a hash share its lookup
+            assert hash_ids == ["hash-1", "hash-2"]
+            assert limit == 2
             return expected_traces
 
     uuid_project_id = uuid4()
 
     traces = await TraceFetcher(
         tracing_service=DummyTracingService(),
-    ).fetch_traces_by_hash(
+    ).fetch_traces_by_hashes(
         project_id=uuid_project_id,
-        hash_id="hash-1",
+        hash_ids=["hash-1", "hash-2", "hash-1"],
         limit=2,
     )
 
@@ -0,0 +1,236 @@
+"""Unit tests for the columnar results export (POST /evaluations/results/export).
+
+- EvaluationsService.export_results pivots results + scenario metrics into
+  one row per scenario, paging scenarios and projecting columns
+- export_rows_to_file_chunks encodes the pages as Arrow IPC / Parquet
+"""
+
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from oss.src.apis.fastapi.evaluations.utils import export_rows_to_file_chunks
+from oss.src.core.evaluations.service import EvaluationsService
+from oss.src.core.evaluations.types import (
+    EvaluationMetrics,
+    EvaluationResult,
+    EvaluationRun,
+    EvaluationRunData,
+    EvaluationRunDataStep,
+    EvaluationScenario,
+    EvaluationStatus,
+)
+
+
+def _run(run_id, repeats=1):
+    return EvaluationRun(
+        id=run_id,
+        data=EvaluationRunData(
+            steps=[
+                EvaluationRunDataStep(
+                    key=key,
+                    type=type_,
+                    origin="custom",
+                    references={},
+                )
+                for key, type_ in (
+                    ("testset", "input"),
+                    ("app", "invocation"),
+                    ("judge", "annotation"),
+                )
+            ],
+            repeats=repeats,
+        ),
+    )
+
+
+def _metrics(run_id, scenario_id, score, passed):
+    return EvaluationMetrics(
+        run_id=run_id,
+        scenario_id=scenario_id,
+        data={
+            "judge": {
+                "attributes.ag.data.outputs.score": {
+                    "type": "numeric/continuous",
+                    "mean": score,
+                },
+                "attributes.ag.data.outputs.passed": {
+                    "type": "binary",
+                    "freq": [
+                        {"value": True, "count": int(passed)},
+                        {"value": False, "count": int(not passed)},
+                    ],
+                },
+            }
+        },
+    )
+
+
+def _service(*, run, scenarios, results, metrics):
+    dao = MagicMock()
+    dao.fetch_run = AsyncMock(return_value=run)
+
+    async def query_scenarios(*, project_id, scenario, windowing):
+        start = 0
+        if windowing.next is not None:
+            start = [s.id for s in scenarios].index(windowing.next) + 1
+        return scenarios[start : start + windowing.limit]
+
+    async def query_results(*, project_id, result, windowing):
+        return [
+            r
+            for r in results
+            if r.scenario_id in result.scenario_ids and r.step_key in result.step_keys
+        ]
+
+    async def query_metrics(*, project_id, metric, windowing):
+        if metric.scenario_ids is False:
+            return [_metrics(run.id, None, 0.5, True)]
+        return [m for m in metrics if m.scenario_id in metric.scenario_ids]
+
+    dao.query_scenarios = AsyncMock(side_effect=query_scenarios)
+    dao.query_results = AsyncMock(side_effect=query_results)
+    dao.query_metrics = AsyncMock(side_effect=query_metrics)
+
+    return EvaluationsService(
+        evaluations_dao=dao,
+        tracing_service=MagicMock(),
+        queries_service=MagicMock(),
+        testsets_service=MagicMock(),
+        evaluators_service=MagicMock(),
+    )
+
+
+def _fixture(count=5):
+    run_id = uuid4()
+    scenarios = [
+        EvaluationScenario(id=uuid4(), run_id=run_id, status=EvaluationStatus.SUCCESS)
+        for _ in range(count)
+    ]
+    results = [
+        EvaluationResult(
+            run_id=run_id,
+            scenario_id=scenario.id,
+            step_key=step_key,
+            repeat_idx=0,
+            status=EvaluationStatus.SUCCESS,
+            trace_id=f"{step_key}-{index}",
+        )
+        for index, scenario in enumerate(scenarios)
+        for step_key in ("testset", "app", "judge")
+    ]
+    metrics = [
+        _metrics(run_id, scenario.id, float(index), index % 2 == 0)
+        for index, scenario in enumerate(scenarios)
+    ]
+    return _run(run_id), scenarios, results, metrics
+
+
+async def _collect(service, **kwargs):
+    columns, batches = await service.export_results(project_id=uuid4(), **kwargs)
+    pages = [rows async for rows in batches]
+    return columns, pages
+
+
+@pytest.mark.asyncio
+async def test_export_pivots_one_row_per_scenario_in_pages():
+    run, scenarios, results, metrics = _fixture(count=5)
+    service = _service(run=run, scenarios=scenarios, results=results, metrics=metrics)
+
+    columns, pages = await _collect(service, run_id=run.id, batch_size=2)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+
+    rows = [row for page in pages for row in page]
+    assert [row["scenario_id"] for row in rows] == [str(s.id) for s in scenarios]
+    assert all(set(row) == set(columns) for row in rows)
+
+    assert rows[3]["app.trace_id"] == "app-3"
+    assert rows[3]["judge.status"] == "success"
+    assert rows[3]["judge.attributes.ag.data.outputs.score"] == 3.0
+    assert rows[3]["judge.attributes.ag.data.outputs.passed"] is False
+    assert columns["judge.attributes.ag.data.outputs.score"] == "float"
+    assert columns["judge.attributes.ag.data.outputs.passed"] == "bool"
+
+
+@pytest.mark.asyncio
+async def test_export_projects_columns_and_skips_unprojected_steps():
+    run, scenarios, results, metrics = _fixture(count=3)
+    service = _service(run=run, scenarios=scenarios, results=results, metrics=metrics)
+
+    columns, _ = await _collect(
+        service,
+        run_id=run.id,
+        columns=["app.trace_id", "judge.attributes.ag.data.outputs.score"],
+    )
+
+    assert list(columns) == [
+        "scenario_id",
+        "status",
+        "app.trace_id",
+        "judge.attributes.ag.data.outputs.score",
+    ]
+
+    result_query = service.evaluations_dao.query_results.call_args.kwargs["result"]
+    assert result_query.step_keys == ["app", "judge"]
+
+
+@pytest.mark.asyncio
+async def test_export_names_repeat_columns_when_repeated():
+    run, scenarios, results, metrics = _fixture(count=1)
+    run.data.repeats = 2
+    service = _service(run=run, scenarios=scenarios, results=results, metrics=metrics)
+
+    columns, pages = await _collect(service, run_id=run.id, columns=["app"])
+
+    assert "app.0.trace_id" in columns and "app.1.trace_id" in columns
+    assert pages[0][0]["app.0.trace_id"] == "app-0"
+    assert pages[0][0]["app.1.trace_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_export_of_a_missing_run_is_none():
+    service = _service(run=None, scenarios=[], results=[], metrics=[])
+
+    assert await service.export_results(project_id=uuid4(), run_id=uuid4()) is None
+
+
+async def _pages(*pages):
+    for page in pages:
+        yield page
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_type", ["arrow", "parquet"])
+async def test_export_encodes_pages_as_arrow_or_parquet(file_type):
+    columns = {"scenario_id": "string", "judge.score": "float", "judge.ok": "bool"}
+    pages = [
+        [{"scenario_id": "a", "judge.score": 1.0, "judge.ok": True}],
+        [
+            {"scenario_id": "b", "judge.score": None, "judge.ok": None},
+            {"scenario_id": "c", "judge.score": 0.5, "judge.ok": False},
+        ],
+    ]
+
+    chunks = [
+        chunk
+        async for chunk in export_rows_to_file_chunks(
+            columns=columns,
+            batches=_pages(*pages),
+            file_type=file_type,
+        )
+    ]
+    data = b"".join(chunks)
+
+    if file_type == "arrow":
+        table = pa.ipc.open_stream(data).read_all()
+    else:
+        table = pq.read_table(BytesIO(data))
+        assert pq.ParquetFile(BytesIO(data)).num_row_groups == 2
+
+    assert table.schema.field("judge.score").type == pa.float64()
+    assert table.to_pylist() == [row for page in pages for row in page]
@@ -436,8 +436,14 @@ async def test_cache_resolver_skips_lookup_when_disabled_and_fetches_when_enable
     project_id = uuid4()
 
     class DummyTracingService:
-        async def query_traces(self, *, project_id, query):
-            return [SimpleNamespace(trace_id="trace-1"), SimpleNamespace(trace_id=None)]
+        async def fetch_traces_by_hashes(self, *, project_id, hash_ids, limit):
+            return {
+                hash_id: [
+                    SimpleNamespace(trace_id="trace-1"),
+                    SimpleNamespace(trace_id=None),
+                ]
+                for hash_id in hash_ids
+            }
 
     disabled = await RunnableCacheResolver(
         tracing_service=DummyTracingService()
@@ -464,7 +470,7 @@ async def test_cache_resolver_skips_lookup_when_disabled_and_fetches_when_enable
 
 @pytest.mark.asyncio
 async def test_cache_resolver_zero_required_count_does_not_query_traces():
-    tracing_service = SimpleNamespace(query_traces=AsyncMock())
+    tracing_service = SimpleNamespace(fetch_traces_by_hashes=AsyncMock())
 
     resolution = await RunnableCacheResolver(tracing_service=tracing_service).resolve(
         project_id=uuid4(),
@@ -475,7 +481,7 @@ async def test_cache_resolver_zero_required_count_does_not_query_traces():
 
     assert resolution.reusable_traces == []
     assert resolution.missing_count == 0
-    tracing_service.query_traces.assert_not_awaited()
+    tracing_service.fetch_traces_by_hashes.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -1363,8 +1369,12 @@ async def test_backend_cached_runner_preserves_partial_hit_order():
     project_id = uuid4()
     user_id = uuid4()
     cached_trace = SimpleNamespace(trace_id="cached-trace")
+
+    async def fetch_traces_by_hashes(*, project_id, hash_ids, limit):
+        return {hash_ids[0]: [cached_trace], hash_ids[1]: []}
+
     tracing_service = SimpleNamespace(
-        query_traces=AsyncMock(side_effect=[[cached_trace], []])
+        fetch_traces_by_hashes=AsyncMock(side_effect=fetch_traces_by_hashes)
     )
 
     class BatchRunner:
@@ -1414,6 +1424,8 @@ async def test_backend_cached_runner_preserves_partial_hit_order():
     )
 
     assert [result.trace_id for result in results] == ["cached-trace", "fresh-trace"]
+    # Both cells' hashes are looked up at once
+    tracing_service.fetch_traces_by_hashes.assert_awaited_once()
     assert len(batch_runner.requests) == 1
     assert [request.cell.repeat_idx for request in batch_runner.requests[0]] == [1]
 
@@ -0,0 +1,216 @@
+"""Unit tests for core/events/coalescing.py.
+
+These cover:
+- Reads in one window become one event per (project, user, event type)
+- Counts are summed and id lists / references are unioned and capped
+- A lone read is published unchanged
+- Sampling drops or tags reads per event type
+- Commits through publish_revision_event are never coalesced
+"""
+
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from oss.src.core.events import utils as events_utils
+from oss.src.core.events.coalescing import ReadEventCoalescer
+from oss.src.core.events.types import EventType
+from oss.src.core.events.utils import publish_revision_event
+
+PROJECT_ID = UUID("11111111-1111-1111-1111-111111111111")
+ORGANIZATION_ID = UUID("33333333-3333-3333-3333-333333333333")
+
+
+def _coalescer(captured: List[dict], **overrides: Any) -> ReadEventCoalescer:
+    async def _publish(organization_id, project_id, event_type, attributes):
+        captured.append(
+            {
+                "organization_id": organization_id,
+                "project_id": project_id,
+                "event_type": event_type,
+                "attributes": attributes,
+            }
+        )
+
+    return ReadEventCoalescer(
+        publish=_publish,
+        window_ms=overrides.get("window_ms", 60_000),
+        sampling=overrides.get("sampling", {}),
+        max_references=overrides.get("max_references", 1000),
+    )
+
+
+async def _submit(
+    coalescer: ReadEventCoalescer,
+    *,
+    event_type: EventType = EventType.TRACES_FETCHED,
+    **attributes: Any,
+) -> None:
+    await coalescer.submit(
+        organization_id=ORGANIZATION_ID,
+        project_id=PROJECT_ID,
+        event_type=event_type,
+        attributes={"user_id": "u-1", **attributes},
+    )
+
+
+@pytest.mark.asyncio
+async def test_reads_in_one_window_become_one_summarized_event():
+    captured: List[dict] = []
+    coalescer = _coalescer(captured)
+
+    await _submit(coalescer, count=1, trace_id="t-1")
+    await _submit(coalescer, count=2, trace_ids=["t-2", "t-1"])
+    await _submit(coalescer, count=1, trace_id="t-3")
+    assert captured == []
+
+    await coalescer.flush()
+
+    assert len(captured) == 1
+    attributes = captured[0]["attributes"]
+    assert attributes == {
+        "user_id": "u-1",
+        "count": 4,
+        "reads": 3,
+        "trace_ids": ["t-1", "t-2", "t-3"],
+    }
+    assert captured[0]["organization_id"] == ORGANIZATION_ID
+
+
+@pytest.mark.asyncio
+async def test_keys_are_per_user_and_event_type():
+    captured: List[dict] = []
+    coalescer = _coalescer(captured)
+
+    await _submit(coalescer, count=1)
+    await _submit(coalescer, count=1, user_id="u-2")
+    await _submit(coalescer, event_type=EventType.TRACES_QUERIED, count=5)
+
+    await coalescer.flush()
+
+    assert sorted(
+        (c["event_type"].value, c["attributes"]["user_id"]) for c in captured
+    ) == [
+        ("traces.fetched", "u-1"),
+        ("traces.fetched", "u-2"),
+        ("traces.queried", "u-1"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_a_lone_read_is_published_unchanged():
+    captured: List[dict] = []
+    coalescer = _coalescer(captured)
+
+    await _submit(coalescer, count=1, trace_id="t-1")
+    await coalescer.flush()
+
+    assert captured[0]["attributes"] == {
+        "user_id": "u-1",
+        "count": 1,
+        "trace_id": "t-1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_references_are_unioned_and_capped():
+    captured: List[dict] = []
+    coalescer = _coalescer(captured, max_references=2)
+    a = {"workflow_revision": {"id": "r-1"}}
+    b = {"workflow_revision": {"id": "r-2"}}
+    c = {"workflow_revision": {"id": "r-3"}}
+
+    await _submit(
+        coalescer,
+        event_type=EventType.WORKFLOWS_REVISIONS_FETCHED,
+        count=1,
+        references=a,
+    )
+    await _submit(
+        coalescer,
+        event_type=EventType.WORKFLOWS_REVISIONS_FETCHED,
+        count=3,
+        references=[a, b, c],
+    )
+    await coalescer.flush()
+
+    attributes = captured[0]["attributes"]
+    assert attributes["count"] == 4
+    assert attributes["references"] == [a, b]
+
+
+@pytest.mark.asyncio
+async def test_without_a_window_reads_publish_at_once():
+    captured: List[dict] = []
+    coalescer = _coalescer(captured, window_ms=0)
+
+    await _submit(coalescer, count=1)
+    await _submit(coalescer, count=1)
+
+    assert len(captured) == 2
+
+
+@pytest.mark.asyncio
+async def test_sampling_drops_or_tags_reads():
+    captured: List[dict] = []
+    coalescer = _coalescer(
+        captured,
+        window_ms=0,
+        sampling={"traces.fetched": 0, "traces.queried": 0.25},
+    )
+
+    await _submit(coalescer, count=1)
+    assert captured == []
+
+    with patch("oss.src.core.events.coalescing.random.random", return_value=0.5):
+        await _submit(coalescer, event_type=EventType.TRACES_QUERIED, count=1)
+    assert captured == []
+
+    with patch("oss.src.core.events.coalescing.random.random", return_value=0.1):
+        await _submit(coalescer, event_type=EventType.TRACES_QUERIED, count=1)
+    assert captured[0]["attributes"]["sample_rate"] == 0.25
+
+
+@pytest.mark.asyncio
+async def test_revision_commits_are_never_coalesced(monkeypatch):
+    captured: List[dict] = []
+    coalescer = _coalescer(captured)
+    monkeypatch.setattr(events_utils, "_read_events", coalescer)
+
+    published: List[dict] = []
+
+    async def _capture(**kwargs):
+        published.append(kwargs)
+        return True
+
+    request = SimpleNamespace(
+        state=SimpleNamespace(
+            project_id=str(PROJECT_ID),
+            user_id="22222222-2222-2222-2222-222222222222",
+            organization_id=str(ORGANIZATION_ID),
+        )
+    )
+    revision = SimpleNamespace(id="r-1", slug="v1", version=1, workflow_id="w-1")
+
+    with patch("oss.src.core.events.utils.publish_event", new=_capture):
+        for action in ("fetch", "commit", "fetch"):
+            await publish_revision_event(
+                request=request,
+                domain="workflow",
+                action=action,
+                revision=revision,
+            )
+
+        assert [m["event"].event_type for m in published] == [
+            EventType.WORKFLOWS_REVISIONS_COMMITTED
+        ]
+
+    await coalescer.flush()
+
+    assert len(captured) == 1
+    assert captured[0]["event_type"] == EventType.WORKFLOWS_REVISIONS_FETCHED
+    assert captured[0]["attributes"]["reads"] == 2
+    assert captured[0]["attributes"]["count"] == 2
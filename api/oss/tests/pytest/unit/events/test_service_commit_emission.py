@@ -218,6 +218,7 @@ async def test_testsets_service_commit_emits_event_once():
     )
     svc = TestsetsService.__new__(TestsetsService)
     svc.testsets_dao = testsets_dao
+    svc.testset_chunks_dao = None
     # _populate_testcases is a no-op when nothing to populate
     svc._populate_testcases = AsyncMock(return_value=None)
 
@@ -499,24 +500,28 @@ async def test_testsets_service_delta_commit_emits_event_once():
         )
     )
 
+    base_testcase = Testcase(id=uuid4(), set_id=artifact_id, data={"prompt": "hello"})
+
     svc = TestsetsService.__new__(TestsetsService)
     svc.testsets_dao = testsets_dao
+    svc.testset_chunks_dao = None
     svc.testcases_service = SimpleNamespace(
+        fetch_testcases=AsyncMock(return_value=[base_testcase]),
         create_testcases=AsyncMock(
             return_value=[
-                Testcase(id=uuid4(), set_id=artifact_id, data={"prompt": "hello"})
+                Testcase(
+                    id=uuid4(),
+                    set_id=artifact_id,
+                    data={"prompt": "hello", "expected": ""},
+                )
             ]
-        )
+        ),
     )
-    svc.fetch_testset_revision = AsyncMock(
+    svc._fetch_testset_revision = AsyncMock(
         return_value=SimpleNamespace(
             testset_variant_id=variant_id,
             description="Base revision",
-            data=TestsetRevisionData(
-                testcases=[
-                    Testcase(id=uuid4(), set_id=artifact_id, data={"prompt": "hello"})
-                ]
-            ),
+            data=TestsetRevisionData(testcase_ids=[base_testcase.id]),
         )
     )
     svc._populate_testcases = AsyncMock(return_value=None)
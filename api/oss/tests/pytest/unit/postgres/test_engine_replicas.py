@@ -0,0 +1,128 @@
+"""Read routing between a database's primary and its replica.
+
+Which pool `read_session()` hands out is decided without a database: the replica's
+lag is set by hand. The tests that write, and the lag query itself, need a real
+Postgres; there, the "replica" is the primary under a second DSN, which reports no lag.
+"""
+
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, insert, text
+
+from oss.src.dbs.postgres.shared import engine as engine_module
+from oss.src.dbs.postgres.shared.engine import TransactionsEngine, routing_scope
+from oss.src.utils.env import env
+
+_PROBE = Table("routing_probe", MetaData(), Column("id", Integer))
+
+
+@pytest.fixture
+async def engine(monkeypatch):
+    monkeypatch.setattr(env.postgres, "uri_core_replica", env.postgres.uri_core)
+    instance = TransactionsEngine()
+    try:
+        yield instance
+    finally:
+        await instance.close()
+
+
+def _set_lag(engine: TransactionsEngine, lag_ms, *, measured_ago: float = 0.0):
+    now = time.monotonic()
+    replica = engine._replica
+    replica.lag_ms = lag_ms
+    replica._measured_at = now - measured_ago
+    # Keep the background check from running in the middle of the test
+    replica._checked_at = now
+
+
+async def _bind(engine: TransactionsEngine):
+    with routing_scope():
+        async with engine.read_session() as session:
+            return session.bind
+
+
+@pytest.mark.asyncio
+async def test_without_a_replica_reads_use_the_primary(monkeypatch):
+    monkeypatch.setattr(env.postgres, "uri_core_replica", None)
+    instance = TransactionsEngine()
+    try:
+        assert await _bind(instance) is instance._engine
+    finally:
+        await instance.close()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_a_fresh_replica(engine):
+    _set_lag(engine, 0)
+    assert await _bind(engine) is engine._replica._engine
+
+
+@pytest.mark.asyncio
+async def test_reads_outside_a_request_scope_use_the_primary(engine):
+    _set_lag(engine, 0)
+
+    async with engine.read_session() as session:
+        assert session.bind is engine._engine
+
+
+@pytest.mark.asyncio
+async def test_writes_in_child_tasks_pin_the_request(engine):
+    _set_lag(engine, 0)
+
+    async def _child():
+        engine_module._pin("core")
+
+    with routing_scope():
+        await asyncio.gather(_child())
+        async with engine.read_session() as session:
+            assert session.bind is engine._engine
+
+
+@pytest.mark.asyncio
+async def test_a_lagging_or_unmeasured_replica_falls_back_to_the_primary(engine):
+    _set_lag(engine, env.postgres.replica_max_lag_ms + 1)
+    assert await _bind(engine) is engine._engine
+
+    _set_lag(engine, None)
+    assert await _bind(engine) is engine._engine
+
+    stale = (
+        env.postgres.replica_lag_check_ms / 1000
+    ) * engine_module.REPLICA_LAG_STALE_CHECKS + 1
+    _set_lag(engine, 0, measured_ago=stale)
+    assert await _bind(engine) is engine._engine
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_a_write_pins_the_rest_of_the_request_to_the_primary(engine):
+    _set_lag(engine, 0)
+
+    async def _read_bind():
+        async with engine.read_session() as session:
+            return session.bind
+
+    with routing_scope():
+        async with engine.session() as session:
+            await session.execute(text("SELECT 1"))
+        assert await _read_bind() is engine._replica._engine
+
+        async with engine.session() as session:
+            await session.execute(
+                text("CREATE TEMP TABLE routing_probe (id int) ON COMMIT DROP")
+            )
+            await session.execute(insert(_PROBE).values(id=1))
+        assert await _read_bind() is engine._engine
+
+    assert await _bind(engine) is engine._replica._engine
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_the_lag_check_measures_the_server(engine):
+    await engine._replica._measure_lag()
+
+    assert engine._replica.lag_ms == 0
+    assert engine._replica.fresh()
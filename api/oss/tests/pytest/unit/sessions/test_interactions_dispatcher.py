@@ -1,6 +1,7 @@
 """Unit tests for InteractionsDispatcher — blocking and detached dispatch paths,
 plus the M2 approval-answer composition (records replay -> runner-visible envelope)."""
 
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from uuid import uuid4
 
@@ -8,11 +9,13 @@ from unittest.mock import AsyncMock, MagicMock
 
 from oss.src.apis.fastapi.sessions.models import SessionInteractionCreateRequest
 from oss.src.core.sessions.interactions.dtos import SessionInteractionKind
-from oss.src.core.sessions.records.dtos import SessionRecord
+from oss.src.core.sessions.records.dtos import SessionRecord, SessionRecordSnapshot
 
 from oss.src.tasks.asyncio.sessions.interactions_dispatcher import (
     InteractionsDispatcher,
+    WireReplay,
     build_wire_messages,
+    compose_approval_messages,
 )
 
 
@@ -56,6 +59,7 @@ def _record(project_id, *, source="agent", rtype, attributes, index=0):
         record_type=rtype,
         record_source=source,
         attributes=attributes,
+        created_at=datetime.now(timezone.utc),
     )
 
 
@@ -106,6 +110,8 @@ def _dispatcher_with(interaction, records, dispatch_fn):
     interactions_service.fetch_interaction = AsyncMock(return_value=interaction)
     records_service = MagicMock()
     records_service.get_records = AsyncMock(return_value=records)
+    records_service.get_snapshot = AsyncMock(return_value=None)
+    records_service.put_snapshot = AsyncMock()
     return InteractionsDispatcher(
         workflows_service=MagicMock(),
         interactions_service=interactions_service,
@@ -270,6 +276,54 @@ async def test_approval_respond_composes_resume_messages_from_records():
     assert sum(1 for m in messages if m["role"] == "user") == 1
 
 
+async def test_approval_resumes_the_replay_snapshot_from_its_cursor():
+    """A later approval reads only the records past the persisted replay, and composes
+    exactly what a full replay would have; the extended replay is persisted again."""
+    project_id = uuid4()
+    interaction = _make_interaction(kind=SessionInteractionKind.user_approval)
+    records = _approval_records(project_id)
+    answer = {"approved": True}
+
+    full = _dispatcher_with(interaction, records, AsyncMock())
+    await full._compose_inputs(
+        project_id=project_id, interaction=interaction, answer=answer
+    )
+    snapshot = full.records_service.put_snapshot.await_args.kwargs["snapshot"]
+    assert snapshot.kind == WireReplay.KIND
+    assert snapshot.record_count == 3
+
+    # Persisted after the first two records; the gate record landed since
+    resumed_snapshot = SessionRecordSnapshot.fold(
+        previous=None,
+        project_id=project_id,
+        session_id="sess-test-1",
+        kind=WireReplay.KIND,
+        records=records[:2],
+        state=WireReplay().extend(records[:2]).state,
+    )
+    resumed = _dispatcher_with(interaction, records[2:], AsyncMock())
+    resumed.records_service.get_snapshot = AsyncMock(return_value=resumed_snapshot)
+
+    inputs = await resumed._compose_inputs(
+        project_id=project_id, interaction=interaction, answer=answer
+    )
+
+    assert (
+        resumed.records_service.get_records.await_args.kwargs["after"]
+        == resumed_snapshot.cursor
+    )
+    assert inputs == {
+        "messages": compose_approval_messages(
+            WireReplay().extend(records), interaction, answer
+        )
+    }
+    extended = resumed.records_service.put_snapshot.await_args.kwargs["snapshot"]
+    assert extended.record_count == 3
+    assert extended.cursor.record_id == records[-1].record_id
+    # Composing the envelope left the persisted replay as it was
+    assert extended.state == WireReplay().extend(records).state
+
+
 async def test_denial_with_message_appends_a_trailing_user_note():
     project_id = uuid4()
     interaction = _make_interaction(kind=SessionInteractionKind.user_approval)
@@ -0,0 +1,194 @@
+"""Integration-style tests for cursor reads and replay snapshots against a real Postgres.
+
+Requires the tracing_oss migration chain applied (through
+oss000000005_add_records_order_and_snapshots) and POSTGRES_URI_TRACING pointed at that
+database.
+
+Verifies:
+  - reading `after` a cursor, a page at a time, returns exactly the full read, in order,
+    including rows with no producer timestamp and exact ties on the order keys;
+  - a snapshot is handed back while the records it folded are unchanged;
+  - a record landing behind the cursor, or a folded record being rewritten, makes it stale;
+  - records landing past the cursor do not.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from oss.src.core.sessions.records.dtos import (
+    SessionRecordCursor,
+    SessionRecordEvent,
+    SessionRecordSnapshot,
+)
+from oss.src.dbs.postgres.sessions.records.dao import RecordsDAO
+import oss.src.dbs.postgres.shared.engine as engine_module
+from oss.src.dbs.postgres.shared.engine import get_analytics_engine
+
+
+pytestmark = pytest.mark.integration
+
+_KIND = "test.v1"
+_T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_engine_per_test():
+    engine_module._analytics_engine = None
+    yield
+    if engine_module._analytics_engine is not None:
+        await engine_module._analytics_engine.close()
+        engine_module._analytics_engine = None
+
+
+def _ids():
+    return uuid.uuid4(), f"records-keyset-test-{uuid.uuid4().hex[:8]}"
+
+
+def _event(project_id, session_id, *, index, timestamp=None, text="hi", record_id=None):
+    return SessionRecordEvent(
+        project_id=project_id,
+        session_id=session_id,
+        record_id=record_id,
+        record_index=index,
+        timestamp=timestamp,
+        record_type="message",
+        record_source="agent",
+        attributes={"text": text},
+    )
+
+
+async def _snapshot_of(dao, project_id, session_id):
+    records = await dao.get_records(project_id=project_id, session_id=session_id)
+    snapshot = SessionRecordSnapshot.fold(
+        previous=None,
+        project_id=project_id,
+        session_id=session_id,
+        kind=_KIND,
+        records=records,
+        state={"count": len(records)},
+    )
+    await dao.put_snapshot(snapshot=snapshot)
+    return snapshot
+
+
+async def test_paging_after_a_cursor_matches_the_full_read():
+    project_id, session_id = _ids()
+    dao = RecordsDAO(engine=get_analytics_engine())
+
+    await dao.append_many(
+        events=[
+            # Two turns in one ingest batch, a shared timestamp, and pre-`timestamp` rows
+            *[
+                _event(project_id, session_id, index=i, timestamp=_T0 + timedelta(i))
+                for i in range(4)
+            ],
+            _event(project_id, session_id, index=0, timestamp=_T0),
+            _event(project_id, session_id, index=7),
+            _event(project_id, session_id, index=None),
+        ]
+    )
+
+    full = await dao.get_records(project_id=project_id, session_id=session_id)
+
+    paged = []
+    after = None
+    while True:
+        page = await dao.get_records(
+            project_id=project_id,
+            session_id=session_id,
+            after=after,
+            limit=2,
+        )
+        if not page:
+            break
+        paged.extend(page)
+        after = SessionRecordCursor.of(page[-1])
+
+    assert len(full) == 7
+    assert [r.record_id for r in paged] == [r.record_id for r in full]
+    # NULL timestamps last, NULL indexes last among them
+    assert [r.record_index for r in full[-2:]] == [7, None]
+
+
+async def test_snapshot_survives_records_past_its_cursor():
+    project_id, session_id = _ids()
+    dao = RecordsDAO(engine=get_analytics_engine())
+    await dao.append_many(
+        events=[
+            _event(project_id, session_id, index=i, timestamp=_T0 + timedelta(i))
+            for i in range(3)
+        ]
+    )
+    snapshot = await _snapshot_of(dao, project_id, session_id)
+
+    await dao.append(
+        event=_event(project_id, session_id, index=3, timestamp=_T0 + timedelta(3))
+    )
+
+    stored = await dao.get_snapshot(
+        project_id=project_id, session_id=session_id, kind=_KIND
+    )
+    assert stored == snapshot
+
+    newer = await dao.get_records(
+        project_id=project_id, session_id=session_id, after=stored.cursor
+    )
+    assert [r.record_index for r in newer] == [3]
+
+
+async def test_a_late_record_behind_the_cursor_makes_the_snapshot_stale():
+    project_id, session_id = _ids()
+    dao = RecordsDAO(engine=get_analytics_engine())
+    await dao.append_many(
+        events=[
+            _event(project_id, session_id, index=i, timestamp=_T0 + timedelta(i))
+            for i in range(3)
+        ]
+    )
+    await _snapshot_of(dao, project_id, session_id)
+
+    await dao.append(
+        event=_event(project_id, session_id, index=9, timestamp=_T0 - timedelta(1))
+    )
+
+    assert (
+        await dao.get_snapshot(project_id=project_id, session_id=session_id, kind=_KIND)
+        is None
+    )
+
+
+async def test_rewriting_a_folded_record_makes_the_snapshot_stale():
+    project_id, session_id = _ids()
+    dao = RecordsDAO(engine=get_analytics_engine())
+    record_id = uuid.uuid4()
+    await dao.append(
+        event=_event(
+            project_id, session_id, index=0, timestamp=_T0, record_id=record_id
+        )
+    )
+    await _snapshot_of(dao, project_id, session_id)
+
+    # The runner re-sends a record id: a partial frame, then the completed one
+    await dao.append(
+        event=_event(
+            project_id,
+            session_id,
+            index=0,
+            timestamp=_T0,
+            record_id=record_id,
+            text="hi there",
+        )
+    )
+
+    assert (
+        await dao.get_snapshot(project_id=project_id, session_id=session_id, kind=_KIND)
+        is None
+    )
+    assert (
+        await dao.get_snapshot(
+            project_id=project_id, session_id=session_id, kind="other.v1"
+        )
+        is None
+    )
@@ -1,9 +1,9 @@
 """M3 live relay — SSE watch endpoint (T2).
 
-`GET /sessions/streams/watch` bridges one durable-Redis pubsub subscription into
-`text/event-stream` frames: known payloads become named SSE events, idle windows
-become `: heartbeat` comments, and closing the generator (client disconnect)
-tears the subscription down. RBAC mirrors `query_records` (VIEW_SESSIONS).
+`GET /sessions/streams/watch` bridges durable-Redis pub/sub, shared through a
+`WatchHub`, into `text/event-stream` frames: known payloads become named SSE events,
+idle windows become `: heartbeat` comments, and closing the generator (client
+disconnect) tears the subscription down. RBAC mirrors `query_records` (VIEW_SESSIONS).
 """
 
 import asyncio
@@ -18,18 +18,22 @@ from oss.src.apis.fastapi.sessions.router import SessionStreamsRouter
 from oss.src.core.access.permissions.types import Permission
 from oss.src.apis.fastapi.sessions.watch import (
     HEARTBEAT_FRAME,
+    WatchHub,
     format_watch_frame,
     ready_frame,
     retry_frame,
     watch_event_stream,
 )
 from oss.src.dbs.redis.sessions.contract import project_watch_channel, watch_channel
-from oss.src.dbs.redis.sessions.watch import SessionsWatchPublisher
+from oss.src.dbs.redis.sessions.watch import SessionsWatchPublisher, read_watch_log
 from oss.src.utils.env import env
 
 
 class _FakePubSub:
-    """Scripted pubsub: returns queued messages, then None (idle) forever."""
+    """Scripted pubsub: returns queued messages, then None (idle) forever.
+
+    Messages without a channel are stamped with the last subscribed one, as Redis would.
+    """
 
     def __init__(self, messages):
         self.messages = list(messages)
@@ -41,8 +45,9 @@ class _FakePubSub:
         self.subscribed.append(channel)
 
     async def get_message(self, *, ignore_subscribe_messages=False, timeout=None):
-        if self.messages:
-            return self.messages.pop(0)
+        if self.messages and self.subscribed:
+            return {"channel": self.subscribed[-1], **self.messages.pop(0)}
+        await asyncio.sleep(0.001)
         return None
 
     async def unsubscribe(self, channel):
@@ -67,7 +72,7 @@ async def test_stream_yields_event_frames_then_heartbeats():
     )
     stream = watch_event_stream(
         channel="watch:p:session:s1",
-        pubsub_factory=lambda: pubsub,
+        hub=WatchHub(pubsub_factory=lambda: pubsub),
         heartbeat_seconds=0.01,
         retry_milliseconds=5000,
     )
@@ -107,7 +112,7 @@ async def test_stream_terminates_on_server_shutdown_signal():
     pubsub = _FakePubSub([])
     stream = watch_event_stream(
         channel="watch:p:session:s1",
-        pubsub_factory=lambda: pubsub,
+        hub=WatchHub(pubsub_factory=lambda: pubsub),
         heartbeat_seconds=0.01,
         retry_milliseconds=5000,
     )
@@ -154,7 +159,7 @@ async def test_stream_cleans_up_subscription_on_close():
     pubsub = _FakePubSub([])
     stream = watch_event_stream(
         channel="watch:p:session:s1",
-        pubsub_factory=lambda: pubsub,
+        hub=WatchHub(pubsub_factory=lambda: pubsub),
         heartbeat_seconds=0.01,
         retry_milliseconds=5000,
     )
@@ -180,7 +185,7 @@ async def test_stream_skips_malformed_and_unknown_payloads():
     )
     stream = watch_event_stream(
         channel="watch:p:session:s1",
-        pubsub_factory=lambda: pubsub,
+        hub=WatchHub(pubsub_factory=lambda: pubsub),
         heartbeat_seconds=0.01,
         retry_milliseconds=5000,
     )
@@ -199,7 +204,7 @@ async def test_stream_preamble_pins_the_clients_reconnect_delay():
     pubsub = _FakePubSub([])
     stream = watch_event_stream(
         channel="watch:p:session:s1",
-        pubsub_factory=lambda: pubsub,
+        hub=WatchHub(pubsub_factory=lambda: pubsub),
         heartbeat_seconds=0.01,
         retry_milliseconds=7500,
     )
@@ -242,7 +247,7 @@ async def test_stream_delivers_publisher_events_end_to_end():
 
     stream = watch_event_stream(
         channel=channel,
-        pubsub_factory=lambda: redis.pubsub(),
+        hub=WatchHub(pubsub_factory=lambda: redis.pubsub()),
         heartbeat_seconds=0.05,
         retry_milliseconds=5000,
     )
@@ -266,6 +271,160 @@ async def test_stream_delivers_publisher_events_end_to_end():
     assert json.loads(frame.split("data: ")[1])["session_id"] == "sess-e2e"
 
 
+async def _next_event_frame(stream):
+    while True:
+        frame = await stream.__anext__()
+        if frame != HEARTBEAT_FRAME:
+            return frame
+
+
+@pytest.mark.asyncio
+async def test_hub_shares_one_subscription_across_streams():
+    pubsub = _FakePubSub([])
+    opened = []
+
+    def _factory():
+        opened.append(pubsub)
+        return pubsub
+
+    hub = WatchHub(pubsub_factory=_factory)
+    streams = [
+        watch_event_stream(
+            channel="watch:p:session:s1",
+            hub=hub,
+            heartbeat_seconds=0.01,
+            retry_milliseconds=5000,
+        )
+        for _ in range(2)
+    ]
+    for stream in streams:
+        assert await stream.__anext__() == retry_frame(5000)
+        assert await stream.__anext__() == ready_frame()
+
+    pubsub.messages.append(_msg({"type": "records-changed", "session_id": "s1"}))
+    frames = [
+        await asyncio.wait_for(_next_event_frame(stream), timeout=2)
+        for stream in streams
+    ]
+    assert all(frame.startswith("event: records-changed\n") for frame in frames)
+    assert len(opened) == 1
+    assert pubsub.subscribed == ["watch:p:session:s1"]
+
+    # The channel stays subscribed while any stream still watches it.
+    await streams[0].aclose()
+    assert pubsub.unsubscribed == []
+    assert pubsub.closed is False
+
+    await streams[1].aclose()
+    assert pubsub.unsubscribed == ["watch:p:session:s1"]
+    assert pubsub.closed is True
+    assert hub.channels == {}
+
+
+@pytest.mark.asyncio
+async def test_hub_evicts_a_stream_that_falls_behind():
+    pubsub = _FakePubSub([])
+    hub = WatchHub(pubsub_factory=lambda: pubsub, buffer_size=2)
+    stream = watch_event_stream(
+        channel="watch:p:session:s1",
+        hub=hub,
+        heartbeat_seconds=0.01,
+        retry_milliseconds=5000,
+    )
+    assert await stream.__anext__() == retry_frame(5000)
+    assert await stream.__anext__() == ready_frame()
+
+    # Not iterated while five events land: the buffer overflows and the stream ends,
+    # so its client reconnects rather than the hub buffering for it without bound.
+    pubsub.messages.extend(
+        _msg({"type": "records-changed", "session_id": "s1"}) for _ in range(5)
+    )
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+    assert pubsub.closed is True
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_missed_events_after_last_event_id():
+    import fakeredis
+
+    redis = fakeredis.FakeAsyncRedis()
+    project_id = str(uuid4())
+    channel = watch_channel(project_id, "sess-replay")
+    publisher = SessionsWatchPublisher(redis_client=redis)
+
+    await publisher.lifecycle(
+        project_id=project_id, session_id="sess-replay", state="running"
+    )
+    (seen,) = await redis.xrange(f"{channel}:log")
+    last_event_id = json.loads(seen[1][b"message"])["event_id"]
+    # Published while the client was away
+    await publisher.records_changed(project_id=project_id, session_id="sess-replay")
+    await publisher.lifecycle(
+        project_id=project_id, session_id="sess-replay", state="ended"
+    )
+
+    async def _replay(channel, last_event_id):
+        return await read_watch_log(redis, channel=channel, last_event_id=last_event_id)
+
+    stream = watch_event_stream(
+        channel=channel,
+        hub=WatchHub(pubsub_factory=lambda: redis.pubsub()),
+        heartbeat_seconds=0.05,
+        retry_milliseconds=5000,
+        last_event_id=last_event_id,
+        replay=_replay,
+    )
+    frames = [await stream.__anext__() for _ in range(4)]
+    await stream.aclose()
+
+    assert frames[0] == retry_frame(5000)
+    assert frames[1].startswith("event: records-changed\nid: ")
+    assert frames[2].startswith("event: lifecycle\nid: ")
+    assert '"state": "ended"' in frames[2]
+    assert "event_id" not in frames[2]
+    assert frames[3] == ready_frame(replayed=True)
+    assert frames[3] == 'event: ready\ndata: {"replayed": true}\n\n'
+
+
+@pytest.mark.asyncio
+async def test_stream_falls_back_to_revalidation_for_an_unknown_last_event_id():
+    async def _replay(channel, last_event_id):
+        return None
+
+    stream = watch_event_stream(
+        channel="watch:p:session:s1",
+        hub=WatchHub(pubsub_factory=lambda: _FakePubSub([])),
+        heartbeat_seconds=0.01,
+        retry_milliseconds=5000,
+        last_event_id="trimmed",
+        replay=_replay,
+    )
+    assert await stream.__anext__() == retry_frame(5000)
+    assert await stream.__anext__() == ready_frame()
+    await stream.aclose()
+
+
+def test_format_watch_frame_moves_the_event_id_to_the_sse_id_field():
+    frame = format_watch_frame(
+        json.dumps(
+            {"type": "records-changed", "session_id": "s", "event_id": "abc123"}
+        ).encode()
+    )
+    assert frame == (
+        'event: records-changed\nid: abc123\ndata: {"type": "records-changed", "session_id": "s"}\n\n'
+    )
+    # An id that could break out of its field is not echoed
+    frame = format_watch_frame(
+        json.dumps(
+            {"type": "records-changed", "session_id": "s", "event_id": "a\nid: b"}
+        ).encode()
+    )
+    assert "\nid:" not in frame
+
+
 def _make_authed_request(
     app: FastAPI,
     project_id,
@@ -372,7 +531,7 @@ async def test_ready_is_not_emitted_before_the_subscription_is_live():
     pubsub = _FakePubSub([])
     stream = watch_event_stream(
         channel="watch:p:session:s1",
-        pubsub_factory=lambda: pubsub,
+        hub=WatchHub(pubsub_factory=lambda: pubsub),
         heartbeat_seconds=0.01,
         retry_milliseconds=5000,
     )
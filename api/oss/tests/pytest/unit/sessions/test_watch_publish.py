@@ -10,7 +10,7 @@ DB write is already committed and must not be re-driven by relay errors).
 import json
 import zlib
 from inspect import Parameter, signature
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -26,6 +26,7 @@ from oss.src.core.workflows.service import WorkflowsService
 from oss.src.dbs.redis.sessions.contract import project_watch_channel, watch_channel
 from oss.src.dbs.redis.sessions.watch import SessionsWatchPublisher
 from oss.src.tasks.asyncio.sessions.records_worker import RecordsWorker
+from oss.src.utils.env import env
 
 
 def _payload(*, project_id, session_id, record_index=0):
@@ -176,23 +177,45 @@ async def test_publisher_publishes_on_watch_channel():
 
     message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
     assert message is not None
-    assert json.loads(message["data"]) == {
+    payload = json.loads(message["data"])
+    assert payload.pop("event_id")
+    assert payload == {
         "type": "records-changed",
         "session_id": "sess-1",
     }
+    # The same message lands in the channel's replay log, in the same MULTI
+    (logged,) = await redis.xrange(f"{channel}:log")
+    assert logged[1][b"message"] == message["data"]
+    assert 0 < await redis.ttl(f"{channel}:log") <= 300
 
 
 @pytest.mark.asyncio
 async def test_publisher_swallows_redis_failure():
-    broken = AsyncMock()
-    broken.publish = AsyncMock(side_effect=ConnectionError("redis gone"))
+    broken = MagicMock()
+    broken.pipeline.return_value.execute = AsyncMock(
+        side_effect=ConnectionError("redis gone")
+    )
 
     publisher = SessionsWatchPublisher(redis_client=broken)
     # Must not raise — the relay is strictly best-effort.
     await publisher.records_changed(project_id="p", session_id="s")
     await publisher.lifecycle(project_id="p", session_id="s", state="running")
     await publisher.interaction(project_id="p", session_id="s", status="pending")
-    assert broken.publish.await_count == 3
+    assert broken.pipeline.return_value.execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_publisher_only_publishes_when_replay_is_disabled():
+    import fakeredis
+
+    redis = fakeredis.FakeAsyncRedis()
+    channel = watch_channel("p", "s")
+
+    publisher = SessionsWatchPublisher(redis_client=redis)
+    with patch.object(env.sessions, "watch_replay_enabled", False):
+        await publisher.records_changed(project_id="p", session_id="s")
+
+    assert await redis.exists(f"{channel}:log") == 0
 
 
 @pytest.mark.asyncio
@@ -211,7 +234,9 @@ async def test_publisher_publishes_entity_change_on_project_channel():
 
     message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1)
     assert message is not None
-    assert json.loads(message["data"]) == {
+    payload = json.loads(message["data"])
+    assert payload.pop("event_id")
+    assert payload == {
         "type": "session-changed",
         "entity": "session",
         "id": "session-1",
@@ -0,0 +1,48 @@
+"""Unit tests for strong ETags on revision retrieval responses."""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from oss.src.apis.fastapi.environments.models import EnvironmentRevisionResponse
+from oss.src.apis.fastapi.shared.utils import etag_response
+
+
+def _client(count):
+    app = FastAPI()
+
+    @app.post("/retrieve")
+    async def retrieve(request: Request):
+        return etag_response(
+            request=request,
+            content=EnvironmentRevisionResponse(count=count),
+        )
+
+    return TestClient(app)
+
+
+def test_matching_if_none_match_returns_304():
+    client = _client(1)
+
+    response = client.post("/retrieve")
+    etag = response.headers["etag"]
+
+    assert response.status_code == 200
+    assert response.json() == {"count": 1}
+    assert etag.startswith('"') and etag.endswith('"')
+
+    revalidated = client.post("/retrieve", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert revalidated.content == b""
+
+    listed = client.post("/retrieve", headers={"If-None-Match": f'"x", W/{etag}'})
+    assert listed.status_code == 304
+
+
+def test_changed_response_gets_a_new_etag():
+    etag = _client(1).post("/retrieve").headers["etag"]
+
+    response = _client(0).post("/retrieve", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,145 @@
+"""Unit tests for BlobsDAO.add_blobs bulk inserts.
+
+No live DB: a fake AsyncSession plays Postgres, answering the bulk
+INSERT ... ON CONFLICT DO NOTHING RETURNING with the blobs it did not already
+hold, and the follow-up SELECT with the ones it did.
+"""
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert
+
+from oss.src.core.blobs.dtos import BlobCreate
+from oss.src.core.blobs.utils import compute_blob_id
+from oss.src.dbs.postgres.blobs import dao as blobs_dao
+from oss.src.dbs.postgres.blobs.dao import BlobsDAO
+from oss.src.dbs.postgres.testcases.dbes import TestcaseBlobDBE
+
+
+class _FakeScalars:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return _FakeScalars(self._rows)
+
+
+class _FakeSession:
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def execute(self, stmt, params=None, execution_options=None):
+        self._engine.executed.append((stmt, params, execution_options))
+
+        if isinstance(stmt, Insert):
+            inserted = [row for row in params if row["id"] not in self._engine.rows]
+            for row in inserted:
+                self._engine.rows[row["id"]] = row
+            return _FakeResult([TestcaseBlobDBE(**row) for row in inserted])
+
+        ids = stmt.compile().params["id_1"]
+        return _FakeResult([TestcaseBlobDBE(**self._engine.rows[id]) for id in ids])
+
+    async def commit(self):
+        pass
+
+
+class _FakeEngine:
+    def __init__(self):
+        self.executed: list = []
+        self.rows: dict = {}
+
+    @asynccontextmanager
+    async def session(self):
+        yield _FakeSession(self)
+
+
+def _creates(n, offset=0):
+    return [BlobCreate(data={"row": i}) for i in range(offset, offset + n)]
+
+
+@pytest.mark.asyncio
+async def test_add_blobs_inserts_new_blobs_in_one_bulk_statement():
+    engine = _FakeEngine()
+    dao = BlobsDAO(BlobDBE=TestcaseBlobDBE, engine=engine)
+
+    blobs = await dao.add_blobs(
+        project_id=uuid4(),
+        user_id=uuid4(),
+        blob_creates=_creates(3),
+    )
+
+    assert [blob.data for blob in blobs] == [{"row": 0}, {"row": 1}, {"row": 2}]
+    assert [blob.id for blob in blobs] == [
+        compute_blob_id(blob_data={"row": i}) for i in range(3)
+    ]
+
+    # One INSERT, and no SELECT since every blob came back from RETURNING
+    assert len(engine.executed) == 1
+    stmt, params, execution_options = engine.executed[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT DO NOTHING" in sql
+    assert "RETURNING" in sql
+    assert len(params) == 3
+    assert execution_options == {
+        "insertmanyvalues_page_size": blobs_dao.BLOBS_INSERT_BATCH_SIZE,
+    }
+
+
+@pytest.mark.asyncio
+async def test_add_blobs_fetches_only_existing_blobs(monkeypatch):
+    monkeypatch.setattr(blobs_dao, "BLOBS_INSERT_BATCH_SIZE", 2)
+    engine = _FakeEngine()
+    dao = BlobsDAO(BlobDBE=TestcaseBlobDBE, engine=engine)
+    project_id = uuid4()
+
+    await dao.add_blobs(
+        project_id=project_id,
+        user_id=uuid4(),
+        blob_creates=_creates(3),
+    )
+    engine.executed.clear()
+
+    # Rows 0-2 exist, 3-4 are new, and row 3 and row 1 are repeated
+    creates = _creates(5) + _creates(1, offset=3) + _creates(1, offset=1)
+    blobs = await dao.add_blobs(
+        project_id=project_id,
+        user_id=uuid4(),
+        blob_creates=creates,
+    )
+
+    assert [blob.data["row"] for blob in blobs] == [0, 1, 2, 3, 4, 3, 1]
+
+    insert_stmt, insert_params, _ = engine.executed[0]
+    assert isinstance(insert_stmt, Insert)
+    assert [row["data"]["row"] for row in insert_params] == [0, 1, 2, 3, 4]
+
+    # The 3 existing blobs are looked up in IN (...) batches of 2
+    selected = [
+        [compute_blob_id(blob_data={"row": i}) for i in rows] for rows in ([0, 1], [2])
+    ]
+    assert [stmt.compile().params["id_1"] for stmt, _, _ in engine.executed[1:]] == (
+        selected
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_blobs_with_no_blobs_executes_nothing():
+    engine = _FakeEngine()
+    dao = BlobsDAO(BlobDBE=TestcaseBlobDBE, engine=engine)
+
+    blobs = await dao.add_blobs(project_id=uuid4(), user_id=uuid4(), blob_creates=[])
+
+    assert blobs == []
+    assert engine.executed == []
@@ -0,0 +1,117 @@
+"""Unit tests for testset file upload parsing and download encoding.
+
+Uploads are parsed incrementally from the spooled upload and bounded by the
+testset size limit; downloads are encoded chunk by chunk for StreamingResponse.
+"""
+
+import csv
+from io import BytesIO, StringIO
+
+import orjson
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from oss.src.apis.fastapi.testsets import utils as testsets_utils
+from oss.src.apis.fastapi.testsets.utils import (
+    TESTSETS_FILE_TYPES,
+    file_to_json_array,
+    json_array_to_file_chunks,
+)
+
+
+ROWS = [
+    {"country": "France", "capital": "Paris", "rank": 1},
+    {"country": "Japan", "capital": "Tokyo", "rank": 2, "notes": {"big": True}},
+    {"country": "Chile", "capital": "Santiago\nde Chile", "rank": 3},
+]
+
+
+def _upload(content: bytes) -> UploadFile:
+    # No size: what a chunked (Content-Length-less) upload looks like
+    return UploadFile(file=BytesIO(content), filename="testset")
+
+
+def _download(rows, file_type) -> bytes:
+    return b"".join(json_array_to_file_chunks(rows, file_type))
+
+
+@pytest.mark.asyncio
+async def test_csv_upload_is_parsed_with_multiline_fields():
+    text = StringIO()
+    writer = csv.DictWriter(text, fieldnames=["country", "capital"])
+    writer.writeheader()
+    writer.writerows([{k: r[k] for k in ("country", "capital")} for r in ROWS])
+
+    rows = await file_to_json_array(
+        _upload(b"\xef\xbb\xbf" + text.getvalue().encode("utf-8")),
+        "csv",
+    )
+
+    assert rows == [{k: r[k] for k in ("country", "capital")} for r in ROWS]
+
+
+@pytest.mark.asyncio
+async def test_jsonl_upload_skips_blank_lines_and_reports_bad_ones():
+    content = b"\n".join(orjson.dumps(row) for row in ROWS) + b"\n\n"
+
+    assert await file_to_json_array(_upload(content), "jsonl") == ROWS
+
+    with pytest.raises(ValueError, match="line 2"):
+        await file_to_json_array(_upload(b'{"a": 1}\n{"a": '), "jsonl")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_type", ["json", "jsonl", "parquet"])
+async def test_download_round_trips_through_upload(file_type, monkeypatch):
+    monkeypatch.setattr(testsets_utils, "TESTSETS_WRITE_BATCH_SIZE", 2)
+
+    rows = await file_to_json_array(_upload(_download(ROWS, file_type)), file_type)
+
+    if file_type == "parquet":
+        # Missing cells come back as nulls; nested values as JSON strings
+        assert [row["country"] for row in rows] == ["France", "Japan", "Chile"]
+        assert [row["rank"] for row in rows] == [1, 2, 3]
+        assert rows[0]["notes"] is None
+        assert orjson.loads(rows[1]["notes"]) == {"big": True}
+    else:
+        assert rows == ROWS
+
+
+def test_json_download_matches_a_single_dump(monkeypatch):
+    monkeypatch.setattr(testsets_utils, "TESTSETS_WRITE_BATCH_SIZE", 2)
+
+    assert _download(ROWS, "json") == orjson.dumps(ROWS)
+    assert _download([], "json") == b"[]"
+
+
+def test_csv_download_streams_header_once(monkeypatch):
+    monkeypatch.setattr(testsets_utils, "TESTSETS_WRITE_BATCH_SIZE", 1)
+    rows = [{"b": "2", "a": "1"}, {"a": "3", "c": "4"}]
+
+    chunks = list(json_array_to_file_chunks(rows, "csv"))
+
+    assert len(chunks) == 2
+    assert b"".join(chunks).decode("utf-8").splitlines() == ["a,b,c", "1,2,", "3,,4"]
+    assert _download([], "csv") == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_type", TESTSETS_FILE_TYPES)
+async def test_oversized_upload_without_size_is_rejected(file_type, monkeypatch):
+    monkeypatch.setattr(testsets_utils, "TESTSETS_SIZE_LIMIT", 1024)
+    content = _download([{"text": f"row {i} " * 20} for i in range(50)], file_type)
+    assert len(content) > 1024
+
+    with pytest.raises(HTTPException) as exc_info:
+        await file_to_json_array(_upload(content), file_type)
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_unknown_file_type_is_rejected():
+    with pytest.raises(HTTPException):
+        await file_to_json_array(_upload(b""), "xlsx")
+
+    with pytest.raises(HTTPException):
+        json_array_to_file_chunks(ROWS, "xlsx")
@@ -0,0 +1,304 @@
+"""Unit tests for chunked testset revision manifests.
+
+The revisions, chunks and testcases live in memory; each fake records what it
+was asked to read or write, so the tests can check that a delta commit or a
+window touches only the chunks it needs.
+"""
+
+from itertools import product
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+import oss.src.core.testsets.service as service_module
+from oss.src.core.blobs.utils import compute_blob_id
+from oss.src.core.git.dtos import Revision
+from oss.src.core.shared.dtos import Reference, Windowing
+from oss.src.core.testcases.dtos import Testcase
+from oss.src.core.testsets.dtos import (
+    TestsetRevisionCommit,
+    TestsetRevisionData,
+    TestsetRevisionDelta,
+    TestsetRevisionDeltaColumns,
+    TestsetRevisionDeltaRows,
+)
+from oss.src.core.testsets.interfaces import TestsetChunksDAOInterface
+from oss.src.core.testsets.service import TestsetsService
+
+
+class _Revisions:
+    def __init__(self):
+        self.revisions = {}
+
+    async def commit_revision(self, *, project_id, user_id, revision_commit, **_):
+        revision = Revision(
+            id=uuid4(),
+            slug=revision_commit.slug,
+            artifact_id=revision_commit.artifact_id,
+            variant_id=revision_commit.variant_id,
+            data=revision_commit.data,
+            created_by_id=user_id,
+        )
+        self.revisions[revision.id] = revision
+        return revision
+
+    async def fetch_revision(self, *, project_id, variant_ref=None, revision_ref=None):
+        return self.revisions.get(revision_ref.id)
+
+
+class _Chunks(TestsetChunksDAOInterface):
+    def __init__(self):
+        self.chunks = {}
+        self.added = []
+        self.fetched = []
+
+    async def add_chunks(self, *, project_id, testset_id, chunks):
+        for chunk in chunks:
+            self.chunks.setdefault(chunk.id, list(chunk.testcase_ids))
+            self.added.append(chunk.id)
+        return True
+
+    async def fetch_chunks(self, *, project_id, chunk_ids):
+        self.fetched.extend(chunk_ids)
+        return {id: list(self.chunks[id]) for id in chunk_ids if id in self.chunks}
+
+    async def find_chunks(self, *, project_id, chunk_ids, testcase_ids):
+        wanted = set(testcase_ids)
+        return {
+            id: list(self.chunks[id])
+            for id in chunk_ids
+            if id in self.chunks and wanted & set(self.chunks[id])
+        }
+
+
+class _Testcases:
+    def __init__(self):
+        self.blobs = {}
+        self.created = []
+        self.fetched = []
+
+    async def create_testcases(self, *, project_id, user_id, testcases):
+        created = []
+        for testcase in testcases:
+            blob = Testcase(
+                id=compute_blob_id(blob_data=testcase.data, set_id=testcase.set_id),
+                set_id=testcase.set_id,
+                data=testcase.data,
+            )
+            self.blobs[blob.id] = blob
+            created.append(blob)
+        self.created.extend(created)
+        return created
+
+    async def fetch_testcases(self, *, project_id, testcase_ids=None):
+        self.fetched.extend(testcase_ids)
+        return [
+            self.blobs[id].model_copy(deep=True)
+            for id in testcase_ids
+            if id in self.blobs
+        ]
+
+
+@pytest.fixture(autouse=True)
+def _small_chunks(monkeypatch):
+    monkeypatch.setattr(service_module, "TESTSETS_CHUNK_SIZE", 4)
+    monkeypatch.setattr(service_module, "publish_revision_event", AsyncMock())
+
+
+def _service(*, chunked=True):
+    return TestsetsService(
+        testsets_dao=_Revisions(),
+        testcases_service=_Testcases(),
+        testset_chunks_dao=_Chunks() if chunked else None,
+    )
+
+
+async def _commit(service, testset_id, **commit):
+    return await service.commit_testset_revision(
+        project_id=uuid4(),
+        user_id=uuid4(),
+        testset_revision_commit=TestsetRevisionCommit(
+            testset_id=testset_id,
+            testset_variant_id=uuid4(),
+            **commit,
+        ),
+        include_testcase_ids=False,
+        include_testcases=False,
+    )
+
+
+async def _commit_rows(service, testset_id, count):
+    return await _commit(
+        service,
+        testset_id,
+        data=TestsetRevisionData(
+            testcases=[Testcase(data={"q": f"question {i}"}) for i in range(count)]
+        ),
+    )
+
+
+async def _read(service, revision, *, testcases=False, windowing=None):
+    return (
+        await service.fetch_testset_revision(
+            project_id=uuid4(),
+            testset_revision_ref=Reference(id=revision.id),
+            include_testcases=testcases,
+            windowing=windowing,
+        )
+    ).data
+
+
+async def test_windows_match_the_inline_list_and_read_only_overlapping_chunks():
+    service = _service()
+    revision = await _commit_rows(service, uuid4(), 10)
+    ids = (await _read(service, revision)).testcase_ids
+
+    assert len(ids) == 10
+    assert service.testsets_dao.revisions[revision.id].data["manifest"]["count"] == 10
+
+    for order, limit, cursor in product(
+        ("ascending", "descending"),
+        (None, 1, 3, 20),
+        (None, 0, 3, 4, 9),
+    ):
+        windowing = Windowing(
+            order=order,
+            limit=limit,
+            next=ids[cursor] if cursor is not None else None,
+        )
+        window = (await _read(service, revision, windowing=windowing)).testcase_ids
+        assert window == TestsetsService._apply_ids_windowing(
+            ids=ids, windowing=windowing
+        )
+
+    service.testset_chunks_dao.fetched.clear()
+    await _read(service, revision, windowing=Windowing(next=ids[4], limit=2))
+    assert len(service.testset_chunks_dao.fetched) == 1
+
+
+async def test_editing_one_row_rewrites_one_chunk():
+    service = _service()
+    testset_id = uuid4()
+    base = await _commit_rows(service, testset_id, 10)
+    base_ids = (await _read(service, base)).testcase_ids
+    base_manifest = service.testsets_dao.revisions[base.id].data["manifest"]
+
+    service.testset_chunks_dao.added.clear()
+    service.testcases_service.fetched.clear()
+
+    patched = await _commit(
+        service,
+        testset_id,
+        revision_id=base.id,
+        delta=TestsetRevisionDelta(
+            rows=TestsetRevisionDeltaRows(
+                replace=[Testcase(id=base_ids[5], data={"q": "edited"})],
+                remove=[base_ids[9]],
+            )
+        ),
+    )
+
+    manifest = service.testsets_dao.revisions[patched.id].data["manifest"]
+    assert [chunk["count"] for chunk in manifest["chunks"]] == [4, 4, 1]
+    # The first chunk is shared with the base revision
+    assert manifest["chunks"][0] == base_manifest["chunks"][0]
+    assert len(service.testset_chunks_dao.added) == 2
+    # Row edits only rewrite ids: no testcase is read back
+    assert service.testcases_service.fetched == []
+
+    data = await _read(service, patched, testcases=True)
+    assert [tc.data["q"] for tc in data.testcases] == [
+        *(f"question {i}" for i in range(5)),
+        "edited",
+        *(f"question {i}" for i in range(6, 9)),
+    ]
+
+
+async def test_column_operations_are_applied_when_chunks_are_read():
+    service = _service()
+    testset_id = uuid4()
+    base = await _commit_rows(service, testset_id, 10)
+
+    service.testcases_service.created.clear()
+    patched = await _commit(
+        service,
+        testset_id,
+        revision_id=base.id,
+        delta=TestsetRevisionDelta(
+            columns=TestsetRevisionDeltaColumns(replace=[("q", "question")])
+        ),
+    )
+    assert service.testcases_service.created == []
+
+    window = await _read(service, patched, testcases=True, windowing=Windowing(limit=2))
+    assert [tc.data for tc in window.testcases] == [
+        {"question": "question 0"},
+        {"question": "question 1"},
+    ]
+    # Only the first chunk was projected, under the ids an eager rewrite gives
+    assert len(service.testcases_service.created) == 4
+    assert window.testcase_ids[0] == compute_blob_id(
+        blob_data={"question": "question 0"}, set_id=testset_id
+    )
+
+    service.testcases_service.created.clear()
+    await _read(service, patched, windowing=Windowing(limit=2))
+    assert service.testcases_service.created == []
+
+    # Adding rows tops up the last chunk only when it has nothing pending
+    service.testcases_service.fetched.clear()
+    added = await _commit(
+        service,
+        testset_id,
+        revision_id=patched.id,
+        delta=TestsetRevisionDelta(
+            rows=TestsetRevisionDeltaRows(add=[Testcase(data={"question": "new"})])
+        ),
+    )
+    manifest = service.testsets_dao.revisions[added.id].data["manifest"]
+    assert [chunk["count"] for chunk in manifest["chunks"]] == [4, 4, 2, 1]
+    assert service.testcases_service.fetched == []
+
+    data = await _read(service, added, testcases=True)
+    assert [tc.data for tc in data.testcases][-2:] == [
+        {"question": "question 9"},
+        {"question": "new"},
+    ]
+
+
+async def test_inline_revisions_patch_the_same_with_or_without_chunks():
+    delta = TestsetRevisionDelta(
+        columns=TestsetRevisionDeltaColumns(add=["expected"], remove=["q"]),
+        rows=TestsetRevisionDeltaRows(add=[Testcase(data={"expected": "x"})]),
+    )
+    results = []
+
+    for chunked in (False, True):
+        service = _service(chunked=chunked)
+        testset_id = uuid4()
+        # A revision committed before chunking keeps its ids inline
+        inline = _service(chunked=False)
+        inline.testsets_dao = service.testsets_dao
+        inline.testcases_service = service.testcases_service
+        base = await _commit_rows(inline, testset_id, 6)
+        assert "testcase_ids" in service.testsets_dao.revisions[base.id].data
+
+        base_ids = (await _read(service, base)).testcase_ids
+        patched = await _commit(
+            service,
+            testset_id,
+            revision_id=base.id,
+            delta=delta.model_copy(
+                update={"rows": delta.rows.model_copy(update={"remove": [base_ids[0]]})}
+            ),
+        )
+
+        stored = service.testsets_dao.revisions[patched.id].data
+        assert ("manifest" in stored) is chunked
+
+        data = await _read(service, patched, testcases=True)
+        results.append([tc.data for tc in data.testcases])
+
+    assert results[0] == results[1]
+    assert results[0] == [{"expected": ""}] * 5 + [{"expected": "x"}]
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from agenta.sdk.models.workflows import JsonSchemas
+
+from oss.src.core.gateway.catalog.dtos import (
+    CatalogIntegration,
+    CatalogIntegrationsPage,
+)
+from oss.src.core.tools.catalog import CatalogSnapshot, ToolCatalog
+from oss.src.core.tools.dtos import (
+    ToolCatalogAction,
+    ToolCatalogActionDetails,
+    ToolCatalogActionsPage,
+    ToolCatalogIntegration,
+)
+from oss.src.core.tools.exceptions import AdapterError
+from oss.src.core.tools.index import BM25Index, tokenize
+from oss.src.core.tools.interfaces import ToolCatalogDAOInterface
+from oss.src.core.tools.providers.composio.dtos import (
+    ComposioSearchQueryResult,
+    ComposioSearchResult,
+)
+from oss.src.core.tools.service import ToolsService
+
+
+INTEGRATIONS = [
+    CatalogIntegration(
+        key="github",
+        name="GitHub",
+        description="Code hosting, pull requests and issues.",
+        categories=["Developer Tools"],
+    ),
+    CatalogIntegration(
+        key="slack",
+        name="Slack",
+        description="Team messaging in channels and threads.",
+        categories=["Communication"],
+    ),
+    CatalogIntegration(
+        key="gmail",
+        name="Gmail",
+        description="Email by Google.",
+        categories=["Communication"],
+    ),
+]
+
+ACTIONS = {
+    "github": [
+        ("CREATE_AN_ISSUE", "Create an issue", "Create a new issue in a repository."),
+        ("LIST_PULL_REQUESTS", "List pull requests", "List the pull requests."),
+    ],
+    "slack": [
+        ("SEND_MESSAGE", "Send message", "Post a message to a channel."),
+        ("REPLY_IN_THREAD", "Reply in thread", "Reply to a message in a thread."),
+    ],
+    "gmail": [
+        ("SEND_EMAIL", "Send email", "Send an email message."),
+    ],
+}
+
+
+def _action(key, name, description) -> ToolCatalogActionDetails:
+    return ToolCatalogActionDetails(
+        key=key,
+        name=name,
+        description=description,
+        schemas=JsonSchemas(inputs={"type": "object", "title": key}),
+    )
+
+
+class _MemoryCatalogDAO(ToolCatalogDAOInterface):
+    def __init__(self):
+        self.integrations: Dict[Tuple[str, str], Tuple[int, datetime, dict]] = {}
+        self.actions: Dict[Tuple[str, str, str], Tuple[int, datetime, dict]] = {}
+
+    async def upsert_integrations(self, *, provider_key, integrations, synced_at):
+        for position, integration in enumerate(integrations):
+            self.integrations[(provider_key, integration.key)] = (
+                position,
+                synced_at,
+                integration.model_dump(),
+            )
+        return True
+
+    async def upsert_actions(
+        self, *, provider_key, integration_key, actions, synced_at
+    ):
+        for position, action in enumerate(actions):
+            self.actions[(provider_key, integration_key, action.key)] = (
+                position,
+                synced_at,
+                action.model_dump(),
+            )
+        return True
+
+    async def delete_stale(self, *, provider_key, synced_before, integration_keys):
+        self.integrations = {
+            k: v
+            for k, v in self.integrations.items()
+            if k[0] != provider_key or v[1] >= synced_before
+        }
+        self.actions = {
+            k: v
+            for k, v in self.actions.items()
+            if k[0] != provider_key
+            or (
+                (provider_key, k[1]) in self.integrations
+                and (k[1] not in integration_keys or v[1] >= synced_before)
+            )
+        }
+        return True
+
+    async def fetch_synced_at(self, *, provider_key) -> Optional[datetime]:
+        stamps = [v[1] for k, v in self.integrations.items() if k[0] == provider_key]
+        return max(stamps) if stamps else None
+
+    async def fetch_integrations(self, *, provider_key):
+        rows = sorted(
+            (v for k, v in self.integrations.items() if k[0] == provider_key),
+            key=lambda v: v[0],
+        )
+        return [ToolCatalogIntegration.model_validate(v[2]) for v in rows]
+
+    async def fetch_actions(self, *, provider_key):
+        actions: Dict[str, List[ToolCatalogAction]] = {}
+        for (provider, integration_key, _), (position, _, data) in sorted(
+            self.actions.items(), key=lambda item: (item[0][1], item[1][0])
+        ):
+            if provider == provider_key:
+                actions.setdefault(integration_key, []).append(
+                    ToolCatalogAction.model_validate(data)
+                )
+        return actions
+
+    async def fetch_action_details(self, *, provider_key, action_refs):
+        return {
+            (integration_key, key): ToolCatalogActionDetails.model_validate(
+                self.actions[(provider_key, integration_key, key)][2]
+            )
+            for integration_key, key in action_refs
+            if (provider_key, integration_key, key) in self.actions
+        }
+
+
+class _Provider:
+    """Stands in for the Composio catalog + tools adapter, counting calls."""
+
+    def __init__(self):
+        self.calls: Dict[str, int] = {}
+        self.integrations = list(INTEGRATIONS)
+        self.broken: set = set()
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    # catalog service
+    async def list_integrations(self, *, provider_key, limit=None, cursor=None, **_):
+        self._count("list_integrations")
+        # Two pages, to exercise the cursor loop
+        offset = int(cursor or 0)
+        page = self.integrations[offset : offset + 2]
+        next_offset = offset + 2
+        return CatalogIntegrationsPage(
+            integrations=page,
+            next_cursor=str(next_offset)
+            if next_offset < len(self.integrations)
+            else None,
+            total=len(self.integrations),
+        )
+
+    async def get_integration(self, *, provider_key, integration_key):
+        self._count("get_integration")
+        return next(i for i in self.integrations if i.key == integration_key)
+
+    # tools adapter
+    async def list_action_details(self, *, integration_key, limit=None, cursor=None):
+        self._count("list_action_details")
+        if integration_key in self.broken:
+            raise AdapterError(provider_key="composio", operation="list_actions")
+        return ToolCatalogActionsPage(
+            actions=[_action(*a) for a in ACTIONS.get(integration_key, [])]
+        )
+
+    async def list_actions(self, **_):
+        self._count("list_actions")
+        return ToolCatalogActionsPage()
+
+    async def get_action(self, **_):
+        self._count("get_action")
+        return None
+
+
+def _service(provider: _Provider, dao: _MemoryCatalogDAO) -> ToolsService:
+    return ToolsService(
+        connections_service=SimpleNamespace(),
+        catalog_service=provider,
+        adapter_registry=SimpleNamespace(get=lambda _key: provider),
+        tool_catalog=ToolCatalog(catalog_dao=dao, refresh_interval=0),
+    )
+
+
+def _snapshot() -> CatalogSnapshot:
+    return CatalogSnapshot(
+        synced_at=datetime.now(),
+        integrations=[
+            ToolCatalogIntegration.model_validate(i.model_dump()) for i in INTEGRATIONS
+        ],
+        actions={
+            key: [_action(*a) for a in actions] for key, actions in ACTIONS.items()
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+def test_tokenize_folds_slugs_and_inflections():
+    assert tokenize("GITHUB_CREATE_AN_ISSUE") == tokenize("github creating issues")
+    assert tokenize("the of and") == []
+
+
+def test_bm25_ranks_rarer_and_heavier_matches_first():
+    index = BM25Index(
+        [
+            ("name", [("send email", 3), ("deliver a message", 1)]),
+            ("description", [("archive", 3), ("send an email later", 1)]),
+            ("other", [("create issue", 3)]),
+        ]
+    )
+
+    assert [key for key, _ in index.search("send email")] == ["name", "description"]
+    assert index.search("unknown words") == []
+    assert len(index.search("send email", limit=1)) == 1
+
+
+# ---------------------------------------------------------------------------
+# Snapshot
+# ---------------------------------------------------------------------------
+
+
+def test_snapshot_lists_integrations_by_search_category_and_page():
+    snapshot = _snapshot()
+
+    assert [i.key for i in snapshot.list_integrations(search="email").integrations][
+        0
+    ] == "gmail"
+
+    page = snapshot.list_integrations(category="communication")
+    assert [i.key for i in page.integrations] == ["slack", "gmail"]
+    # Composio category ids are slugs of the names
+    page = snapshot.list_integrations(category="developer-tools")
+    assert [i.key for i in page.integrations] == ["github"]
+
+    first = snapshot.list_integrations(limit=2)
+    assert first.total == 3 and first.next_cursor == "2"
+    second = snapshot.list_integrations(limit=2, cursor=first.next_cursor)
+    assert [i.key for i in second.integrations] == ["gmail"]
+    assert second.next_cursor is None
+
+
+def test_snapshot_searches_actions_within_and_across_integrations():
+    snapshot = _snapshot()
+
+    page = snapshot.list_actions(integration_key="slack", query="reply thread")
+    assert [a.key for a in page.actions] == ["REPLY_IN_THREAD"]
+
+    hits = snapshot.search_actions("create a github issue", limit=3)
+    assert hits[0][0] == "github" and hits[0][1].key == "CREATE_AN_ISSUE"
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+
+async def test_reads_go_to_the_provider_until_the_catalog_is_synced():
+    provider, dao = _Provider(), _MemoryCatalogDAO()
+    service = _service(provider, dao)
+
+    await service.list_actions(provider_key="composio", integration_key="slack")
+    assert provider.calls["list_actions"] == 1
+
+    assert await service.sync_catalog(provider_key="composio")
+    assert provider.calls["list_integrations"] == 2
+
+    page = await service.list_actions(provider_key="composio", integration_key="slack")
+    assert [a.key for a in page.actions] == ["SEND_MESSAGE", "REPLY_IN_THREAD"]
+
+    action = await service.get_action(
+        provider_key="composio",
+        integration_key="github",
+        action_key="CREATE_AN_ISSUE",
+    )
+    assert action.schemas.inputs["title"] == "CREATE_AN_ISSUE"
+
+    integrations = await service.list_integrations(
+        provider_key="composio", search="messaging"
+    )
+    assert integrations.integrations[0].key == "slack"
+
+    # Everything above after the sync was served locally
+    assert provider.calls["list_actions"] == 1
+    assert "get_action" not in provider.calls
+
+
+async def test_resync_keeps_actions_of_failed_integrations_and_drops_removed_ones():
+    provider, dao = _Provider(), _MemoryCatalogDAO()
+    service = _service(provider, dao)
+    await service.sync_catalog(provider_key="composio")
+
+    provider.integrations = INTEGRATIONS[:2]  # gmail removed upstream
+    provider.broken = {"slack"}  # slack's actions fail to list
+    await service.sync_catalog(provider_key="composio")
+
+    snapshot = await service.tool_catalog.snapshot(provider_key="composio")
+    assert [i.key for i in snapshot.integrations] == ["github", "slack"]
+    assert [a.key for a in snapshot.actions["slack"]] == [
+        "SEND_MESSAGE",
+        "REPLY_IN_THREAD",
+    ]
+    assert "gmail" not in snapshot.actions
+
+
+async def test_discovery_serves_local_matches_reranked_by_the_provider(monkeypatch):
+    provider, dao = _Provider(), _MemoryCatalogDAO()
+    service = _service(provider, dao)
+    await service.sync_catalog(provider_key="composio")
+
+    async def _connection_state(*, project_id, provider_key, integration_key):
+        return SimpleNamespace(state="needs_auth", slug=None)
+
+    monkeypatch.setattr(service, "_discovery_connection_state", _connection_state)
+    monkeypatch.setattr(
+        "oss.src.core.tools.service.translate_search_result",
+        lambda search, states, **_: search,
+    )
+
+    remote = {"search": None}
+
+    async def _cached_search(*, provider_key, project_id, use_cases):
+        if remote["search"] is None:
+            raise AdapterError(provider_key="composio", operation="search")
+        return remote["search"]
+
+    monkeypatch.setattr(service, "_cached_search", _cached_search)
+
+    use_case = "reply to a message in a slack thread"
+
+    # Provider search down: the local ranking is served, with local schemas
+    search = await service.discover_capabilities(
+        project_id=uuid4(), use_cases=[use_case]
+    )
+    result = search.results[0]
+    assert result.primary_tool_slugs == ["SLACK_REPLY_IN_THREAD"]
+    assert "SLACK_SEND_MESSAGE" in result.related_tool_slugs
+    assert search.tool_schemas["SLACK_REPLY_IN_THREAD"].input_schema == {
+        "type": "object",
+        "title": "REPLY_IN_THREAD",
+    }
+
+    # Provider search up: its pick ranks first, local hits follow
+    remote["search"] = ComposioSearchResult(
+        results=[
+            ComposioSearchQueryResult(
+                use_case=use_case,
+                primary_tool_slugs=["SLACK_SEND_MESSAGE"],
+                toolkits=["slack"],
+                known_pitfalls=["Threads need the parent ts."],
+            )
+        ]
+    )
+    search = await service.discover_capabilities(
+        project_id=uuid4(), use_cases=[use_case]
+    )
+    result = search.results[0]
+    assert result.primary_tool_slugs == ["SLACK_SEND_MESSAGE"]
+    assert result.related_tool_slugs[0] == "SLACK_REPLY_IN_THREAD"
+    assert result.known_pitfalls == ["Threads need the parent ts."]
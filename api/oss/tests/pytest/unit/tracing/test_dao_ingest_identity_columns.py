@@ -73,7 +73,9 @@ async def test_ingest_root_span_persists_identity_columns(anyio_backend):
 
     await dao.ingest(project_id=uuid4(), user_id=uuid4(), span_dtos=[root])
 
-    assert len(engine.executed) == 1
+    # The span upsert, then its trace's summary
+    assert len(engine.executed) == 2
+    assert engine.executed[1].table.name == "traces"
     values = engine.executed[0].compile().params
 
     assert values["session_id"] == "sess-1"
@@ -0,0 +1,125 @@
+"""Integration tests for the `trace_hashes` index against a real Postgres.
+
+Requires the tracing_oss migration chain applied (through oss000000007_add_trace_hashes)
+and POSTGRES_URI_TRACING pointed at that database.
+
+Verifies:
+  - ingest indexes root span hashes, and only those;
+  - one lookup answers many hashes, newest traces first, capped per hash;
+  - the service hands back whole traces per hash;
+  - deleting a trace drops it from the index.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from oss.src.core.tracing.dtos import OTelFlatSpan, OTelHash
+from oss.src.core.tracing.service import TracingService
+from oss.src.dbs.postgres.tracing.dao import TracingDAO
+import oss.src.dbs.postgres.shared.engine as engine_module
+from oss.src.dbs.postgres.shared.engine import get_analytics_engine
+
+
+pytestmark = pytest.mark.integration
+
+_T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_engine_per_test():
+    engine_module._analytics_engine = None
+    yield
+    if engine_module._analytics_engine is not None:
+        await engine_module._analytics_engine.close()
+        engine_module._analytics_engine = None
+
+
+def _trace(hash_id, *, offset=0, child_hash_id=None):
+    trace_id = uuid.uuid4()
+    root = OTelFlatSpan(
+        trace_id=trace_id.hex,
+        span_id=uuid.uuid4().hex,
+        span_name="invoke",
+        start_time=_T0 + timedelta(seconds=offset),
+        end_time=_T0 + timedelta(seconds=offset + 1),
+        attributes={"ag": {"type": {"trace": "invocation"}}},
+        hashes=[OTelHash(id=hash_id)],
+    )
+    child = OTelFlatSpan(
+        trace_id=trace_id.hex,
+        span_id=uuid.uuid4().hex,
+        parent_id=root.span_id,
+        span_name="llm",
+        start_time=root.start_time,
+        end_time=root.end_time,
+        attributes={"ag": {"type": {"span": "llm"}}},
+        hashes=[OTelHash(id=child_hash_id)] if child_hash_id else None,
+    )
+    return trace_id, [root, child]
+
+
+async def _ingest(dao, project_id, traces):
+    await dao.ingest(
+        project_id=project_id,
+        user_id=uuid.uuid4(),
+        span_dtos=[span for _, spans in traces for span in spans],
+    )
+
+
+async def test_one_lookup_answers_many_hashes_newest_first():
+    project_id = uuid.uuid4()
+    a, b, child_only, unknown = (uuid.uuid4() for _ in range(4))
+    dao = TracingDAO(engine=get_analytics_engine())
+
+    older_a = _trace(a, offset=0, child_hash_id=child_only)
+    newer_a = _trace(a, offset=10)
+    newest_a = _trace(a, offset=20)
+    only_b = _trace(b, offset=5)
+    await _ingest(dao, project_id, [older_a, newer_a, newest_a, only_b])
+
+    found = await dao.query_trace_ids_by_hashes(
+        project_id=project_id,
+        hash_ids=[a, b, child_only, unknown],
+        limit=2,
+    )
+
+    assert found == {
+        a: [newest_a[0], newer_a[0]],
+        b: [only_b[0]],
+    }
+
+
+async def test_service_returns_whole_traces_per_hash():
+    project_id = uuid.uuid4()
+    a, b = uuid.uuid4(), uuid.uuid4()
+    service = TracingService(tracing_dao=TracingDAO(engine=get_analytics_engine()))
+
+    trace_a = _trace(a)
+    await _ingest(service.tracing_dao, project_id, [trace_a])
+
+    traces = await service.fetch_traces_by_hashes(
+        project_id=project_id,
+        hash_ids=[a.hex, b.hex],
+        limit=1,
+    )
+
+    assert list(traces) == [a.hex, b.hex]
+    assert [uuid.UUID(trace.trace_id) for trace in traces[a.hex]] == [trace_a[0]]
+    assert len(traces[a.hex][0].spans) == 1  # the root, with its child nested
+    assert traces[b.hex] == []
+
+
+async def test_deleted_traces_leave_the_index():
+    project_id, hash_id = uuid.uuid4(), uuid.uuid4()
+    dao = TracingDAO(engine=get_analytics_engine())
+
+    trace = _trace(hash_id)
+    await _ingest(dao, project_id, [trace])
+    await dao.delete(project_id=project_id, trace_ids=[trace[0]])
+
+    assert (
+        await dao.query_trace_ids_by_hashes(project_id=project_id, hash_ids=[hash_id])
+        == {}
+    )
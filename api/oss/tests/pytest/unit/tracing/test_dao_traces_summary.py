@@ -0,0 +1,192 @@
+"""Integration tests for the `traces` summary table against a real Postgres.
+
+Requires the tracing_oss migration chain applied (through oss000000006_add_traces)
+and POSTGRES_URI_TRACING pointed at that database.
+
+Verifies:
+  - ingest upserts one summary per trace, from all of its stored spans, including
+    spans written by an earlier batch;
+  - unfiltered trace lists page over the summaries by their latest span;
+  - session lookups read the summaries;
+  - deleting a trace deletes its summary.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from oss.src.core.shared.dtos import Windowing
+from oss.src.core.tracing.dtos import (
+    Focus,
+    Formatting,
+    OTelFlatSpan,
+    TracingQuery,
+)
+from oss.src.dbs.postgres.tracing.dao import TracingDAO
+from oss.src.dbs.postgres.tracing.dbes import TraceDBE
+import oss.src.dbs.postgres.shared.engine as engine_module
+from oss.src.dbs.postgres.shared.engine import get_analytics_engine
+
+
+pytestmark = pytest.mark.integration
+
+_T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_engine_per_test():
+    engine_module._analytics_engine = None
+    yield
+    if engine_module._analytics_engine is not None:
+        await engine_module._analytics_engine.close()
+        engine_module._analytics_engine = None
+
+
+def _span(
+    trace_id,
+    *,
+    parent_id=None,
+    name="span",
+    offset=0,
+    seconds=1,
+    attributes=None,
+):
+    return OTelFlatSpan(
+        trace_id=trace_id.hex,
+        span_id=uuid.uuid4().hex,
+        parent_id=parent_id,
+        span_name=name,
+        start_time=_T0 + timedelta(seconds=offset),
+        end_time=_T0 + timedelta(seconds=offset + seconds),
+        attributes=attributes,
+    )
+
+
+async def _ingest(dao, project_id, span_dtos):
+    await dao.ingest(project_id=project_id, user_id=uuid.uuid4(), span_dtos=span_dtos)
+
+
+async def _summary(dao, project_id, trace_id):
+    async with dao.engine.session() as session:
+        return (
+            await session.execute(
+                select(TraceDBE).filter(
+                    TraceDBE.project_id == project_id,
+                    TraceDBE.trace_id == trace_id,
+                )
+            )
+        ).scalar_one_or_none()
+
+
+async def test_ingest_summarizes_each_trace_across_batches():
+    project_id, trace_id = uuid.uuid4(), uuid.uuid4()
+    dao = TracingDAO(engine=get_analytics_engine())
+
+    root = _span(
+        trace_id,
+        name="agent",
+        seconds=10,
+        attributes={
+            "ag": {
+                "metrics": {
+                    "tokens": {"cumulative": {"total": 30}},
+                    "costs": {"cumulative": {"total": 0.5}},
+                }
+            }
+        },
+    )
+    child = _span(
+        trace_id,
+        parent_id=root.span_id,
+        offset=4,
+        seconds=8,
+        attributes={"ag": {"session": {"id": "session-1"}}},
+    )
+
+    # The child lands first: no root yet
+    await _ingest(dao, project_id, [child])
+    summary = await _summary(dao, project_id, trace_id)
+    assert summary.span_name is None
+    assert summary.span_count == 1
+    assert summary.session_id == "session-1"
+
+    await _ingest(dao, project_id, [root])
+    summary = await _summary(dao, project_id, trace_id)
+    assert summary.span_name == "agent"
+    assert summary.span_count == 2
+    assert summary.start_time == _T0
+    assert summary.end_time == _T0 + timedelta(seconds=12)
+    assert summary.latest_start_time == _T0 + timedelta(seconds=4)
+    assert summary.duration_ms == 12_000
+    assert summary.tokens == 30
+    assert summary.costs == 0.5
+    assert summary.session_id == "session-1"
+
+
+async def test_unfiltered_trace_lists_page_by_latest_span():
+    project_id = uuid.uuid4()
+    dao = TracingDAO(engine=get_analytics_engine())
+
+    # Started in order a, b, c; c's last span is the earliest of all, a's the latest
+    trace_ids = [uuid.uuid4() for _ in range(3)]
+    for trace_id, latest in zip(trace_ids, (30, 20, 10)):
+        root = _span(trace_id)
+        await _ingest(
+            dao,
+            project_id,
+            [root, _span(trace_id, parent_id=root.span_id, offset=latest)],
+        )
+
+    def _query(**windowing):
+        return TracingQuery(
+            formatting=Formatting(focus=Focus.TRACE),
+            windowing=Windowing(limit=2, **windowing),
+        )
+
+    first = await dao.query(project_id=project_id, query=_query())
+    assert [uuid.UUID(span.trace_id) for span in first[::2]] == trace_ids[:2]
+
+    second = await dao.query(
+        project_id=project_id,
+        query=_query(newest=_T0 + timedelta(seconds=20), next=trace_ids[1]),
+    )
+    assert {uuid.UUID(span.trace_id) for span in second} == {trace_ids[2]}
+
+
+async def test_sessions_read_the_summaries():
+    project_id = uuid.uuid4()
+    dao = TracingDAO(engine=get_analytics_engine())
+
+    for offset, session_id in ((0, "older"), (60, "newer"), (120, "older")):
+        await _ingest(
+            dao,
+            project_id,
+            [
+                _span(
+                    uuid.uuid4(),
+                    offset=offset,
+                    attributes={"ag": {"session": {"id": session_id}}},
+                )
+            ],
+        )
+
+    session_ids, cursor = await dao.sessions(project_id=project_id)
+    assert session_ids == ["newer", "older"]
+    assert cursor == _T0
+
+    session_ids, cursor = await dao.sessions(project_id=project_id, realtime=True)
+    assert session_ids == ["older", "newer"]
+    assert cursor == _T0 + timedelta(seconds=60)
+
+
+async def test_delete_removes_the_summary():
+    project_id, trace_id = uuid.uuid4(), uuid.uuid4()
+    dao = TracingDAO(engine=get_analytics_engine())
+
+    await _ingest(dao, project_id, [_span(trace_id)])
+    assert await _summary(dao, project_id, trace_id) is not None
+
+    await dao.delete(project_id=project_id, trace_ids=[trace_id])
+    assert await _summary(dao, project_id, trace_id) is None
@@ -0,0 +1,222 @@
+"""Unit tests for trace assembly in the tracing worker.
+
+A trace whose spans land in different worker batches is rolled up per batch,
+queued in Redis, and finalized over its stored spans by the assembly loop.
+fakeredis stands in for the durable plane; an in-memory TracingDAO stand-in
+stores what the worker writes.
+"""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from oss.src.core.tracing.dtos import OTelFlatSpan, SpanType, TraceType
+from oss.src.core.tracing.service import TracingService
+from oss.src.core.tracing.streaming import serialize_span
+from oss.src.dbs.redis.tracing.assembly import TRACE_ASSEMBLY_KEY
+from oss.src.tasks.asyncio.tracing.worker import TracingWorker
+
+
+ORGANIZATION_ID = uuid4()
+PROJECT_ID = uuid4()
+USER_ID = uuid4()
+
+
+class _FakeTracingDAO:
+    def __init__(self):
+        self.spans = {}
+        self.edits = []
+        self.summarized = []
+
+    async def ingest(self, *, project_id, user_id, span_dtos):
+        for span_dto in span_dtos:
+            self.spans[span_dto.span_id] = span_dto.model_copy(deep=True)
+        return []
+
+    async def fetch(self, *, project_id, trace_ids=None, span_ids=None):
+        trace_ids = {str(trace_id) for trace_id in trace_ids}
+        return [
+            span_dto.model_copy(deep=True)
+            for span_dto in self.spans.values()
+            if span_dto.trace_id in trace_ids
+        ]
+
+    async def edit(self, *, project_id, user_id, span_dtos):
+        self.edits.append([span_dto.span_id for span_dto in span_dtos])
+        for span_dto in span_dtos:
+            self.spans[span_dto.span_id] = span_dto
+        return []
+
+    async def summarize(self, *, project_id, trace_ids):
+        self.summarized.extend(trace_ids)
+
+
+def _span(*, trace_id, span_id, parent_id=None, prompt_tokens=0, offset=0):
+    return OTelFlatSpan(
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_id=parent_id,
+        span_name="span",
+        span_type=SpanType.TASK,
+        start_time=datetime(2024, 1, 1, 0, 0, offset, tzinfo=timezone.utc),
+        attributes={
+            "ag": {
+                "metrics": {
+                    "tokens": {
+                        "incremental": {
+                            "prompt": prompt_tokens,
+                            "completion": 0,
+                            "total": prompt_tokens,
+                        }
+                    }
+                }
+            }
+        },
+    )
+
+
+def _batch(span_dtos):
+    return [
+        (
+            f"{i}-0".encode(),
+            {
+                b"data": serialize_span(
+                    organization_id=ORGANIZATION_ID,
+                    project_id=PROJECT_ID,
+                    user_id=USER_ID,
+                    span_dto=span_dto,
+                )
+            },
+        )
+        for i, span_dto in enumerate(span_dtos)
+    ]
+
+
+def _worker(dao, redis, **kwargs):
+    return TracingWorker(
+        service=TracingService(tracing_dao=dao),
+        redis_client=redis,
+        stream_name="streams:spans",
+        consumer_group="worker-spans",
+        **kwargs,
+    )
+
+
+def _tokens(span_dto):
+    return span_dto.attributes["ag"]["metrics"]["tokens"]["cumulative"]["prompt"]
+
+
+@pytest.mark.asyncio
+async def test_trace_split_across_batches_is_finalized_once_its_root_arrives():
+    dao = _FakeTracingDAO()
+    redis = fakeredis.FakeAsyncRedis()
+    worker = _worker(dao, redis)
+
+    trace_id = str(uuid4())
+    root_id, child_id, grandchild_id = (str(uuid4()) for _ in range(3))
+
+    # Leaves end first and are exported first: no root, so not due yet
+    await worker.process_batch(
+        _batch(
+            [
+                _span(
+                    trace_id=trace_id,
+                    span_id=grandchild_id,
+                    parent_id=child_id,
+                    prompt_tokens=100,
+                    offset=2,
+                ),
+            ]
+        )
+    )
+    assert await redis.zcard(TRACE_ASSEMBLY_KEY) == 1
+    assert await worker.assemble() == 0
+
+    await worker.process_batch(
+        _batch(
+            [
+                _span(
+                    trace_id=trace_id,
+                    span_id=child_id,
+                    parent_id=root_id,
+                    prompt_tokens=10,
+                    offset=1,
+                ),
+                _span(trace_id=trace_id, span_id=root_id, prompt_tokens=1),
+            ]
+        )
+    )
+    # Per batch, the root only saw its own child
+    assert _tokens(dao.spans[root_id]) == 11
+    assert dao.spans[root_id].trace_type == TraceType.INVOCATION
+
+    assert await worker.assemble() == 1
+
+    # One bulk edit; the grandchild had no rollup at all as an orphan
+    assert len(dao.edits) == 1
+    assert set(dao.edits[0]) == {root_id, child_id, grandchild_id}
+    assert _tokens(dao.spans[root_id]) == 111
+    assert _tokens(dao.spans[child_id]) == 110
+    assert _tokens(dao.spans[grandchild_id]) == 100
+    # The edit re-summarized the trace; nothing was left to summarize
+    assert dao.summarized == []
+    assert await redis.zcard(TRACE_ASSEMBLY_KEY) == 0
+
+
+@pytest.mark.asyncio
+async def test_self_contained_traces_are_not_queued():
+    dao = _FakeTracingDAO()
+    redis = fakeredis.FakeAsyncRedis()
+    worker = _worker(dao, redis)
+
+    trace_id = str(uuid4())
+    root_id = str(uuid4())
+
+    await worker.process_batch(
+        _batch(
+            [
+                _span(trace_id=trace_id, span_id=root_id, prompt_tokens=1),
+                _span(
+                    trace_id=trace_id,
+                    span_id=str(uuid4()),
+                    parent_id=root_id,
+                    prompt_tokens=2,
+                    offset=1,
+                ),
+            ]
+        )
+    )
+
+    assert _tokens(dao.spans[root_id]) == 3
+    assert await redis.zcard(TRACE_ASSEMBLY_KEY) == 0
+
+
+@pytest.mark.asyncio
+async def test_rootless_trace_is_finalized_once_quiet():
+    dao = _FakeTracingDAO()
+    redis = fakeredis.FakeAsyncRedis()
+    worker = _worker(dao, redis, assembly_quiet_ms=0)
+
+    trace_id = str(uuid4())
+    parent_id = str(uuid4())
+
+    for offset in range(2):
+        await worker.process_batch(
+            _batch(
+                [
+                    _span(
+                        trace_id=trace_id,
+                        span_id=str(uuid4()),
+                        parent_id=parent_id,
+                        prompt_tokens=5,
+                        offset=offset,
+                    ),
+                ]
+            )
+        )
+
+    # Both batches queue the same trace; it is finalized once
+    assert await worker.assemble() == 1
+    assert await worker.assemble() == 0
@@ -0,0 +1,173 @@
+"""Unit tests for the model pricing index behind span cost calculation.
+
+The index must price exactly what litellm prices for the models it covers, and
+hand everything else (tiered rates, unknown names) back to litellm.
+"""
+
+import litellm
+import pytest
+from litellm import cost_calculator
+
+from oss.src.core.tracing.utils import pricing
+from oss.src.core.tracing.utils.pricing import (
+    ModelPrices,
+    PricingIndex,
+    cost_for_spans,
+    cost_per_token,
+    get_pricing_index,
+    refresh_pricing_index,
+)
+
+
+MODEL_COST = {
+    "gpt-4o-mini": {
+        "litellm_provider": "openai",
+        "input_cost_per_token": 1.5e-07,
+        "output_cost_per_token": 6e-07,
+        "cache_read_input_token_cost": 7.5e-08,
+    },
+    "Mistral-Large": {
+        "litellm_provider": "mistral",
+        "input_cost_per_token": 2e-06,
+        "output_cost_per_token": 6e-06,
+    },
+    "gpt-long": {
+        "litellm_provider": "openai",
+        "input_cost_per_token": 1e-06,
+        "output_cost_per_token": 2e-06,
+        "input_cost_per_token_above_200k_tokens": 2e-06,
+    },
+    "fireworks_ai/llama": {
+        "litellm_provider": "fireworks_ai",
+        "input_cost_per_token": 1e-06,
+        "output_cost_per_token": 1e-06,
+    },
+    "dall-e-3": {
+        "litellm_provider": "openai",
+        "output_cost_per_image": 0.04,
+    },
+}
+
+
+@pytest.fixture
+def model_cost_index():
+    yield refresh_pricing_index(model_cost=MODEL_COST)
+
+    refresh_pricing_index()
+
+
+def test_index_keeps_only_flat_per_token_prices(model_cost_index):
+    assert model_cost_index.prices == {
+        "gpt-4o-mini": ModelPrices(input=1.5e-07, output=6e-07, cache_read=7.5e-08),
+        # No cache-read rate: cached tokens bill as fresh input
+        "Mistral-Large": ModelPrices(input=2e-06, output=6e-06, cache_read=2e-06),
+    }
+
+
+@pytest.mark.parametrize(
+    "model,key",
+    [
+        ("gpt-4o-mini", "gpt-4o-mini"),
+        ("GPT-4o-mini", "gpt-4o-mini"),
+        ("openai/gpt-4o-mini", "gpt-4o-mini"),
+        ("openrouter/openai/gpt-4o-mini", "gpt-4o-mini"),
+        ("mistral/mistral-large", "Mistral-Large"),
+        ("gpt-long", None),
+        ("unknown-model", None),
+        ("", None),
+    ],
+)
+def test_index_resolves_aliases(model_cost_index, model, key):
+    assert model_cost_index.resolve(model) == key
+
+
+def test_index_memoizes_resolution(model_cost_index):
+    model_cost_index.resolve("openai/gpt-4o-mini")
+    model_cost_index.resolve("openai/gpt-4o-mini")
+
+    assert model_cost_index.resolve.cache_info().hits == 1
+
+
+def test_cost_per_token_prices_cached_tokens_at_the_cache_read_rate(
+    model_cost_index,
+):
+    prompt_cost, completion_cost = cost_per_token(
+        model="openai/gpt-4o-mini",
+        prompt_tokens=1_000,
+        completion_tokens=200,
+        cache_read_input_tokens=400,
+    )
+
+    assert prompt_cost == pytest.approx(600 * 1.5e-07 + 400 * 7.5e-08)
+    assert completion_cost == pytest.approx(200 * 6e-07)
+
+
+def test_cost_per_token_falls_back_to_litellm(model_cost_index, monkeypatch):
+    seen = []
+
+    def _litellm(**kwargs):
+        seen.append(kwargs)
+        return (0.1, 0.2)
+
+    monkeypatch.setattr(pricing.cost_calculator, "cost_per_token", _litellm)
+
+    assert cost_per_token(model="gpt-long", prompt_tokens=10, completion_tokens=5) == (
+        0.1,
+        0.2,
+    )
+    # No cached tokens, no cache kwarg
+    assert seen == [{"model": "gpt-long", "prompt_tokens": 10, "completion_tokens": 5}]
+
+
+def test_cost_for_spans_yields_none_for_what_cannot_be_priced(model_cost_index):
+    costs = cost_for_spans(
+        [
+            {"model": "gpt-4o-mini", "prompt_tokens": 10, "completion_tokens": 0},
+            {"model": None, "prompt_tokens": 10, "completion_tokens": 0},
+            {"model": "unknown-model", "prompt_tokens": 10, "completion_tokens": 0},
+        ]
+    )
+
+    assert costs[0] == pytest.approx((10 * 1.5e-07, 0.0))
+    assert costs[1:] == [None, None]
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        "gpt-4o-mini",
+        "gpt-4o",
+        "azure/gpt-4o",
+        "text-embedding-3-small",
+        "mistral/mistral-large-latest",
+    ],
+)
+@pytest.mark.parametrize("cache_read_input_tokens", [None, 300])
+def test_index_matches_litellm(model, cache_read_input_tokens):
+    index = PricingIndex(litellm.model_cost)
+    assert index.lookup(model) is not None
+
+    cache_kwargs = (
+        {"cache_read_input_tokens": cache_read_input_tokens}
+        if cache_read_input_tokens
+        else {}
+    )
+
+    expected = cost_calculator.cost_per_token(
+        model=model,
+        prompt_tokens=1_000,
+        completion_tokens=200,
+        **cache_kwargs,
+    )
+    actual = cost_per_token(
+        model=model,
+        prompt_tokens=1_000,
+        completion_tokens=200,
+        **cache_kwargs,
+    )
+
+    assert actual == pytest.approx(expected)
+
+
+def test_pricing_index_is_built_once():
+    assert get_pricing_index() is get_pricing_index()
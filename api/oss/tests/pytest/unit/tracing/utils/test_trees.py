@@ -14,11 +14,13 @@ from oss.src.core.tracing.utils.trees import (
     cumulate_costs,
     cumulate_errors,
     cumulate_tokens,
+    find_partial_traces,
     get_span_from_trace,
     infer_and_propagate_trace_type_by_trace,
     parse_span_dtos_to_span_idx,
     parse_span_idx_to_span_id_tree,
     promote_identity_by_trace,
+    reassemble_trace_rollups,
     trace_map_to_traces,
     traces_to_trace_map,
 )
@@ -225,7 +227,7 @@ def test_calculate_costs_sets_incremental_values_for_cost_supported_types(monkey
     span_idx = {span.span_id: span}
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         lambda **_: (0.12, 0.34),
     )
 
@@ -249,7 +251,7 @@ def test_calculate_costs_swallows_calculation_errors(monkeypatch):
         raise RuntimeError("boom")
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _raise,
     )
 
@@ -286,7 +288,7 @@ def test_calculate_costs_passes_cached_tokens_to_the_pricer(
         return (0.005, 0.001)
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _capture,
     )
 
@@ -326,7 +328,7 @@ def test_calculate_costs_sends_the_cached_count_as_an_int(monkeypatch):
         return (0.001, 0.002)
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _capture,
     )
 
@@ -358,7 +360,7 @@ def test_calculate_costs_omits_cache_kwarg_when_nothing_was_cached(monkeypatch):
         return (0.1, 0.2)
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _legacy_signature,
     )
 
@@ -386,7 +388,7 @@ def test_calculate_costs_ignores_a_zero_cached_count(monkeypatch):
         return (0.1, 0.2)
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _legacy_signature,
     )
 
@@ -419,7 +421,7 @@ def test_calculate_costs_ignores_a_non_numeric_cached_count(monkeypatch):
         return (0.1, 0.2)
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _legacy_signature,
     )
 
@@ -451,7 +453,7 @@ def test_calculate_costs_ignores_a_negative_cached_count(monkeypatch):
         return (0.1, 0.2)
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _legacy_signature,
     )
 
@@ -485,7 +487,7 @@ def test_calculate_costs_prefers_cache_read_over_cached_when_both_present(monkey
         return (0.001, 0.002)
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _capture,
     )
 
@@ -513,7 +515,7 @@ def test_calculate_costs_bills_cached_tokens_below_fresh_input(monkeypatch):
         )
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         _priced,
     )
 
@@ -570,7 +572,7 @@ def test_calculate_and_propagate_metrics_runs_full_pipeline(monkeypatch):
     )
 
     monkeypatch.setattr(
-        "oss.src.core.tracing.utils.trees.cost_calculator.cost_per_token",
+        "oss.src.core.tracing.utils.pricing.cost_per_token",
         lambda model, prompt_tokens, completion_tokens: (
             prompt_tokens * 0.01,
             completion_tokens * 0.02,
@@ -649,6 +651,121 @@ def test_infer_and_propagate_trace_type_by_trace_treats_empty_links_as_annotatio
     )
 
 
+def test_find_partial_traces_skips_self_contained_traces():
+    complete = [
+        _span(span_id=ROOT_UUID, span_name="root", trace_id="trace-a"),
+        _span(
+            span_id=CHILD_A_UUID,
+            parent_id=ROOT_UUID,
+            span_name="child",
+            trace_id="trace-a",
+        ),
+    ]
+    # Root arrived, but its child's own child is from an earlier batch
+    late_root = [
+        _span(span_id="root-b", span_name="root", trace_id="trace-b"),
+        _span(
+            span_id="child-b",
+            parent_id="earlier-b",
+            span_name="child",
+            trace_id="trace-b",
+        ),
+    ]
+    # No root yet
+    rootless = [
+        _span(
+            span_id="child-c",
+            parent_id="root-c",
+            span_name="child",
+            trace_id="trace-c",
+        ),
+    ]
+
+    assert find_partial_traces(complete + late_root + rootless) == {
+        "trace-b": True,
+        "trace-c": False,
+    }
+
+
+def test_reassemble_trace_rollups_settles_a_trace_split_across_batches():
+    root = _span(span_id=ROOT_UUID, span_name="root", prompt_tokens=1)
+    child_a = _span(
+        span_id=CHILD_A_UUID,
+        parent_id=ROOT_UUID,
+        span_name="a",
+        prompt_tokens=10,
+        start_offset_s=1,
+    )
+    child_b = _span(
+        span_id=CHILD_B_UUID,
+        parent_id=ROOT_UUID,
+        span_name="b",
+        prompt_tokens=100,
+        errors=1,
+        start_offset_s=2,
+    )
+
+    # Two batches: child_b was rolled up without its parent, the rest without it
+    stored = [
+        deepcopy(span)
+        for batch in ([root, child_a], [child_b])
+        for span in calculate_and_propagate_metrics(
+            infer_and_propagate_trace_type_by_trace(batch)
+        )
+    ]
+
+    changed = reassemble_trace_rollups(stored)
+
+    # child_a was already settled; child_b had no rollup at all as an orphan
+    changed_idx = {span.span_id: span for span in changed}
+    assert set(changed_idx) == {ROOT_UUID, CHILD_B_UUID}
+    metrics = changed_idx[ROOT_UUID].attributes["ag"]["metrics"]
+    assert metrics["tokens"]["cumulative"]["prompt"] == 111
+    assert metrics["errors"]["cumulative"] == 1
+    metrics = changed_idx[CHILD_B_UUID].attributes["ag"]["metrics"]
+    assert metrics["tokens"]["cumulative"]["prompt"] == 100
+
+
+def test_reassemble_trace_rollups_keeps_annotation_traces_annotations():
+    root = _span(span_id=ROOT_UUID, span_name="root", trace_id="trace-a", links=[])
+    child = _span(
+        span_id=CHILD_A_UUID,
+        parent_id=ROOT_UUID,
+        span_name="child",
+        trace_id="trace-a",
+        start_offset_s=1,
+    )
+    # The annotation's root and child were written by different batches
+    infer_and_propagate_trace_type_by_trace([root])
+    infer_and_propagate_trace_type_by_trace([child])
+    child.links = []
+    calculate_and_propagate_metrics([root, child])
+
+    changed = reassemble_trace_rollups([root, child])
+
+    # Stored spans carry links=[] either way, so only the stored type counts
+    assert [span.span_id for span in changed] == [CHILD_A_UUID]
+    assert changed[0].trace_type == TraceType.ANNOTATION
+    assert changed[0].attributes["ag"]["type"]["trace"] == TraceType.ANNOTATION.value
+
+
+def test_reassemble_trace_rollups_returns_nothing_when_settled():
+    root = _span(span_id=ROOT_UUID, span_name="root")
+    child = _span(
+        span_id=CHILD_A_UUID,
+        parent_id=ROOT_UUID,
+        span_name="child",
+        prompt_tokens=5,
+        start_offset_s=1,
+    )
+    spans = calculate_and_propagate_metrics(
+        infer_and_propagate_trace_type_by_trace([root, child])
+    )
+
+    assert reassemble_trace_rollups(spans) == []
+    assert reassemble_trace_rollups([]) == []
+
+
 def test_trace_map_to_traces_and_back_and_get_span_helpers():
     root = _otel_span_from_flat(_span(span_id=ROOT_UUID, span_name="root"))
     child = _otel_span_from_flat(
@@ -1,11 +1,15 @@
+import asyncio
 import logging
 
 import pytest
 from redis.exceptions import RedisError
 
+from oss.src.utils import throttling
+from oss.src.utils.env import env
 from oss.src.utils.throttling import (
     Algorithm,
     FailureMode,
+    ThrottleMode,
     check_throttle,
     check_throttles,
 )
@@ -76,3 +80,138 @@ async def test_check_throttles_fails_open_on_redis_error(monkeypatch, caplog):
     assert all(result.tokens_remaining is None for result in results)
     assert all(result.retry_after_ms is None for result in results)
     assert not any(record.levelno >= logging.ERROR for record in caplog.records)
+
+
+# ---------------------------------------------------------------------------
+# Lease mode
+# ---------------------------------------------------------------------------
+
+
+class _Bucket:
+    """Stands in for the lease scripts: a bucket that does not refill."""
+
+    def __init__(self, tokens: int):
+        self.tokens = tokens
+        self.reservations: list[int] = []
+
+    async def reserve(self, key, first, second, count):
+        self.reservations.append(count)
+        granted = min(count, self.tokens)
+        self.tokens -= granted
+        return granted, float(self.tokens), 0 if granted else 500
+
+
+@pytest.fixture
+def leases(monkeypatch):
+    monkeypatch.setattr(throttling, "_leases", throttling._Leases())
+    monkeypatch.setattr(env.agenta.api.throttling, "lease_error", 0.05)
+
+
+async def _drain_refills():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_strict_mode_is_the_default(monkeypatch, leases):
+    bucket = _Bucket(1000)
+    calls = []
+
+    async def _gcra(*args):
+        calls.append(args)
+        return True, 999.0, 0
+
+    monkeypatch.setattr(throttling, "execute_gcra", _gcra)
+    monkeypatch.setattr(throttling, "execute_gcra_lease", bucket.reserve)
+
+    for _ in range(3):
+        await check_throttle("global", 1000, 60, algorithm=Algorithm.GCRA)
+
+    assert len(calls) == 3
+    assert bucket.reservations == []
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_spends_reserved_blocks_locally(monkeypatch, leases):
+    bucket = _Bucket(1000)
+    monkeypatch.setattr(throttling, "execute_tbra_lease", bucket.reserve)
+
+    for spent in range(1, 101):
+        result = await check_throttle(
+            "global", 1000, 60, algorithm=Algorithm.TBRA, mode=ThrottleMode.LEASE
+        )
+        assert result.allow is True
+        await _drain_refills()
+
+        # Never holds more than lease_error x capacity unspent
+        assert (1000 - bucket.tokens) - spent <= 50
+
+    # Blocks double up to 50 tokens, then are topped up half a block at a time
+    assert bucket.reservations[:4] == [1, 2, 3, 5]
+    assert bucket.reservations[-1] == 25
+    assert len(bucket.reservations) <= 10
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_never_admits_more_than_the_bucket_holds(monkeypatch, leases):
+    monkeypatch.setattr(env.agenta.api.throttling, "lease_error", 0.5)
+    bucket = _Bucket(37)
+    monkeypatch.setattr(throttling, "execute_gcra_lease", bucket.reserve)
+
+    results = await check_throttles(
+        [("global", 100, 60)] * 60,
+        algorithm=Algorithm.GCRA,
+        mode=ThrottleMode.LEASE,
+    )
+    for _ in range(20):
+        result = await check_throttle(
+            "global", 100, 60, algorithm=Algorithm.GCRA, mode=ThrottleMode.LEASE
+        )
+        results.append(result)
+        await _drain_refills()
+
+    assert sum(result.allow for result in results) == 37
+    denied = results[-1]
+    assert denied.allow is False
+    assert denied.retry_after_ms == 500
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_keeps_small_keys_strict(monkeypatch, leases):
+    bucket = _Bucket(10)
+    calls = []
+
+    async def _gcra(*args):
+        calls.append(args)
+        return True, 9.0, 0
+
+    monkeypatch.setattr(throttling, "execute_gcra", _gcra)
+    monkeypatch.setattr(throttling, "execute_gcra_lease", bucket.reserve)
+
+    await check_throttle(
+        "global", 10, 60, algorithm=Algorithm.GCRA, mode=ThrottleMode.LEASE
+    )
+
+    assert len(calls) == 1
+    assert bucket.reservations == []
+
+
+@pytest.mark.asyncio
+async def test_lease_mode_applies_failure_mode_when_a_reservation_fails(
+    monkeypatch, leases
+):
+    async def _raise(*args, **kwargs):
+        raise RedisError("redis down")
+
+    monkeypatch.setattr(throttling, "execute_tbra_lease", _raise)
+
+    result = await check_throttle(
+        "global",
+        1000,
+        60,
+        failure_mode=FailureMode.CLOSED,
+        mode=ThrottleMode.LEASE,
+    )
+
+    assert result.allow is False
+    assert result.tokens_remaining is None
@@ -9,6 +9,7 @@ from oss.src.core.webhooks.types import WebhookEventType
 from oss.src.tasks.asyncio.webhooks.dispatcher import (
     WebhooksDispatcher,
     WebhookDispatchError,
+    _delivery_id,
 )
 
 
@@ -32,6 +33,7 @@ class FakeSubscription:
         subscription_id: str,
         event_types: list[WebhookEventType] | None,
         secret: str,
+        batch_size: int | None = None,
     ):
         self.id = subscription_id
         self.name = f"sub-{subscription_id}"
@@ -42,6 +44,7 @@ class FakeSubscription:
             headers=None,
             payload_fields=None,
             auth_mode=None,
+            batch_size=batch_size,
         )
 
     def model_dump(self, **_kwargs):
@@ -208,6 +211,73 @@ async def test_dispatch_one_failing_delivery_raises_after_others_enqueue(
     assert failing.id in enqueued_subscription_ids  # attempted, but its enqueue failed
 
 
+@pytest.mark.anyio
+async def test_dispatch_batches_events_for_a_subscription_with_batch_size(
+    anyio_backend,
+):
+    assert anyio_backend == "asyncio"
+    batched = FakeSubscription(
+        subscription_id=str(uuid4()),
+        event_types=None,
+        secret="secret-batch",
+        batch_size=2,
+    )
+    single = FakeSubscription(
+        subscription_id=str(uuid4()),
+        event_types=None,
+        secret="secret-single",
+    )
+
+    deliver_task = MagicMock()
+    deliver_task.kiq = AsyncMock()
+    deliver_batch_task = MagicMock()
+    deliver_batch_task.kiq = AsyncMock()
+
+    dispatcher = WebhooksDispatcher(
+        subscriptions_dao=MagicMock(),
+        vault_service=MagicMock(),
+        deliver_task=deliver_task,
+        deliver_batch_task=deliver_batch_task,
+    )
+    dispatcher._get_subscriptions = AsyncMock(return_value=[batched, single])
+
+    project_id = uuid4()
+    events = [
+        FakeEvent(event_type=EventType.ENVIRONMENTS_REVISIONS_COMMITTED)
+        for _ in range(3)
+    ]
+
+    with patch(
+        "oss.src.tasks.asyncio.webhooks.dispatcher.encrypt",
+        side_effect=lambda secret: f"enc:{secret}",
+    ):
+        await dispatcher.dispatch(
+            batches=[
+                {
+                    "project_id": project_id,
+                    "events": [SimpleNamespace(event=event) for event in events],
+                }
+            ]
+        )
+
+    # The subscription without a batch size still gets one task per event
+    assert [
+        call.kwargs["subscription_id"] for call in deliver_task.kiq.await_args_list
+    ] == [single.id] * 3
+
+    calls = [call.kwargs for call in deliver_batch_task.kiq.await_args_list]
+    assert [len(call["deliveries"]) for call in calls] == [2, 1]
+    assert all(call["subscription_id"] == batched.id for call in calls)
+    assert all(call["encrypted_secret"] == "enc:secret-batch" for call in calls)
+    assert [
+        delivery["event_id"] for call in calls for delivery in call["deliveries"]
+    ] == [str(event.event_id) for event in events]
+    # Same ids the per-event path would mint, so a redelivered batch dedups
+    assert calls[0]["deliveries"][0]["delivery_id"] == str(
+        _delivery_id(event_id=events[0].event_id, subscription_id=batched.id)
+    )
+
+
 @pytest.fixture
 def anyio_backend():
     return "asyncio"
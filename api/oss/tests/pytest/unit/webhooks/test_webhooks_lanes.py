@@ -0,0 +1,366 @@
+"""Unit tests for webhook delivery lanes.
+
+Adaptive concurrency, the circuit breaker, pooled clients, and how the
+delivery task acts on each lane admission. No network or database involved.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from oss.src.core.webhooks.delivery import (
+    prepare_webhook_batch_request,
+    webhook_destination,
+)
+from oss.src.core.webhooks.types import (
+    WEBHOOK_BREAKER_COOLDOWN,
+    WEBHOOK_BREAKER_FAILURE_THRESHOLD,
+    WEBHOOK_LANE_INITIAL_CONCURRENCY,
+    WEBHOOK_LANE_MAX_CONCURRENCY,
+    WEBHOOK_LANE_MAX_DEFERRALS,
+)
+from oss.src.tasks.taskiq.webhooks import lanes as lanes_module
+from oss.src.tasks.taskiq.webhooks.lanes import (
+    LaneAdmission,
+    WebhookLane,
+    WebhookLanes,
+)
+from oss.src.tasks.taskiq.webhooks.tasks import PARKED_ERROR, deliver_webhook
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(lanes_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+async def _fail(lane: WebhookLane, times: int) -> None:
+    for _ in range(times):
+        assert await lane.acquire(always_wait=True) is LaneAdmission.ADMITTED
+        await lane.release(ok=False)
+
+
+# ---------------------------------------------------------------------------
+# Adaptive concurrency
+# ---------------------------------------------------------------------------
+
+
+class TestLaneConcurrency:
+    @pytest.mark.anyio
+    async def test_limit_grows_after_a_window_of_successes_and_halves_on_failure(
+        self,
+    ):
+        lane = WebhookLane()
+        assert lane.limit == WEBHOOK_LANE_INITIAL_CONCURRENCY
+
+        for _ in range(100):
+            await lane.acquire()
+            await lane.release(ok=True)
+        assert lane.limit == WEBHOOK_LANE_MAX_CONCURRENCY
+
+        await _fail(lane, 1)
+        assert lane.limit == WEBHOOK_LANE_MAX_CONCURRENCY // 2
+
+    @pytest.mark.anyio
+    async def test_a_full_lane_queues_up_to_its_limit_then_reports_full(self):
+        lane = WebhookLane()
+        limit = lane.limit
+
+        for _ in range(limit):
+            assert await lane.acquire() is LaneAdmission.ADMITTED
+
+        waiters = [asyncio.create_task(lane.acquire()) for _ in range(limit)]
+        await asyncio.sleep(0)
+        assert lane.waiting == limit
+
+        assert await lane.acquire() is LaneAdmission.FULL
+
+        await lane.release(ok=True)
+        assert await asyncio.wait_for(waiters[0], timeout=1) is LaneAdmission.ADMITTED
+
+        for waiter in waiters[1:]:
+            waiter.cancel()
+        await asyncio.gather(*waiters[1:], return_exceptions=True)
+        assert lane.waiting == 0
+
+
+# ---------------------------------------------------------------------------
+# Circuit breaker
+# ---------------------------------------------------------------------------
+
+
+class TestLaneBreaker:
+    @pytest.mark.anyio
+    async def test_consecutive_failures_park_the_endpoint(self, clock):
+        lane = WebhookLane()
+
+        await _fail(lane, WEBHOOK_BREAKER_FAILURE_THRESHOLD - 1)
+        assert await lane.acquire() is LaneAdmission.ADMITTED
+        await lane.release(ok=True)  # a success resets the count
+
+        await _fail(lane, WEBHOOK_BREAKER_FAILURE_THRESHOLD)
+        assert await lane.acquire() is LaneAdmission.PARKED
+
+    @pytest.mark.anyio
+    async def test_one_probe_after_the_cooldown_closes_or_reparks(self, clock):
+        lane = WebhookLane()
+        await _fail(lane, WEBHOOK_BREAKER_FAILURE_THRESHOLD)
+
+        clock.now += WEBHOOK_BREAKER_COOLDOWN
+        assert await lane.acquire() is LaneAdmission.ADMITTED
+        # Only the probe goes out while half-open
+        assert await lane.acquire() is LaneAdmission.PARKED
+
+        await lane.release(ok=False)
+        clock.now += WEBHOOK_BREAKER_COOLDOWN
+        assert await lane.acquire() is LaneAdmission.PARKED  # cooldown doubled
+
+        clock.now += WEBHOOK_BREAKER_COOLDOWN
+        assert await lane.acquire() is LaneAdmission.ADMITTED
+        await lane.release(ok=True)
+
+        assert lane.parked_until is None
+        assert lane.cooldown == WEBHOOK_BREAKER_COOLDOWN
+        assert await lane.acquire() is LaneAdmission.ADMITTED
+
+
+# ---------------------------------------------------------------------------
+# Pooled clients
+# ---------------------------------------------------------------------------
+
+
+class TestLanesClients:
+    @pytest.mark.anyio
+    async def test_one_pooled_client_per_destination(self):
+        lanes = WebhookLanes()
+        a = webhook_destination(url="https://a.example.com/hook", resolved_ip="1.2.3.4")
+        b = webhook_destination(url="https://b.example.com/hook", resolved_ip="1.2.3.4")
+
+        async with lanes.client(a) as first:
+            pass
+        async with lanes.client(a) as again:
+            pass
+        async with lanes.client(b) as other:
+            pass
+
+        assert first is again
+        # Same IP, different TLS hostname: never the same connections
+        assert other is not first
+
+        for client in (first, other):
+            await client.aclose()
+
+    @pytest.mark.anyio
+    async def test_eviction_skips_clients_in_use(self, monkeypatch):
+        monkeypatch.setattr(lanes_module, "WEBHOOK_MAX_POOLED_DESTINATIONS", 1)
+        lanes = WebhookLanes()
+        a = webhook_destination(url="https://a.example.com/hook", resolved_ip="1.2.3.4")
+        b = webhook_destination(url="https://b.example.com/hook", resolved_ip="1.2.3.5")
+
+        async with lanes.client(a) as held:
+            async with lanes.client(b) as newer:
+                pass
+            assert not held.is_closed
+
+        async with lanes.client(b):
+            pass
+        await asyncio.sleep(0)
+        assert held.is_closed
+
+        await newer.aclose()
+
+
+# ---------------------------------------------------------------------------
+# deliver_webhook — acting on the lane's admission
+# ---------------------------------------------------------------------------
+
+
+def _delivery_kwargs(**overrides):
+    return {
+        "project_id": uuid4(),
+        "delivery_id": uuid4(),
+        "subscription_id": uuid4(),
+        "event_id": uuid4(),
+        "event_type": "environments.revisions.committed",
+        "url": "https://example.com/hook",
+        "headers": {},
+        "payload_fields": None,
+        "auth_mode": None,
+        "event": {"event_type": "environments.revisions.committed"},
+        "subscription": {"name": "hook"},
+        "encrypted_secret": "enc",
+        "retry_count": 0,
+        **overrides,
+    }
+
+
+def _patched_delivery():
+    return (
+        patch(
+            "oss.src.core.webhooks.delivery.resolve_validated_webhook_ip",
+            return_value="93.184.216.34",
+        ),
+        patch("oss.src.core.webhooks.delivery.decrypt", return_value="secret"),
+    )
+
+
+def _response(status_code: int) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        request=httpx.Request("POST", "https://example.com/hook"),
+    )
+
+
+class TestDeliverWebhookLanes:
+    @pytest.mark.anyio
+    async def test_a_parked_endpoint_is_recorded_without_a_request(self, clock):
+        lanes = WebhookLanes()
+        kwargs = _delivery_kwargs()
+        await _fail(
+            lanes.lane(str(kwargs["subscription_id"])),
+            WEBHOOK_BREAKER_FAILURE_THRESHOLD,
+        )
+        dao = AsyncMock()
+        send = AsyncMock()
+
+        resolve, decrypt = _patched_delivery()
+        with (
+            resolve,
+            decrypt,
+            patch("oss.src.tasks.taskiq.webhooks.tasks.send_webhook_request", send),
+        ):
+            await deliver_webhook(**kwargs, dao=dao, lanes=lanes, defer=AsyncMock())
+
+        send.assert_not_awaited()
+        delivery = dao.create_delivery.await_args.kwargs["delivery"]
+        assert delivery.status.message == "failed"
+        assert delivery.data.error == PARKED_ERROR
+
+    @pytest.mark.anyio
+    async def test_a_full_lane_requeues_until_deferrals_run_out(self):
+        lanes = WebhookLanes()
+        kwargs = _delivery_kwargs()
+        lane = lanes.lane(str(kwargs["subscription_id"]))
+        lane.limit = 1
+        lane.in_flight = 1
+        lane.waiting = 1
+
+        dao = AsyncMock()
+        defer = AsyncMock()
+        resolve, decrypt = _patched_delivery()
+        with resolve, decrypt:
+            await deliver_webhook(
+                **kwargs, dao=dao, lanes=lanes, defer=defer, deferrals=0
+            )
+            defer.assert_awaited_once()
+            dao.create_delivery.assert_not_awaited()
+
+            # Out of deferrals: it waits its turn instead
+            waiting = asyncio.create_task(
+                deliver_webhook(
+                    **kwargs,
+                    dao=dao,
+                    lanes=lanes,
+                    defer=defer,
+                    deferrals=WEBHOOK_LANE_MAX_DEFERRALS,
+                )
+            )
+            await asyncio.sleep(0)
+            assert lane.waiting == 2
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+        assert defer.await_count == 1
+
+    @pytest.mark.anyio
+    async def test_a_5xx_counts_against_the_lane_and_a_4xx_does_not(self):
+        lanes = WebhookLanes()
+        kwargs = _delivery_kwargs()
+        lane = lanes.lane(str(kwargs["subscription_id"]))
+
+        resolve, decrypt = _patched_delivery()
+        with resolve, decrypt:
+            with patch(
+                "oss.src.tasks.taskiq.webhooks.tasks.send_webhook_request",
+                AsyncMock(return_value=_response(503)),
+            ):
+                with pytest.raises(httpx.HTTPStatusError):
+                    await deliver_webhook(**kwargs, dao=AsyncMock(), lanes=lanes)
+            assert lane.failures == 1
+
+            with patch(
+                "oss.src.tasks.taskiq.webhooks.tasks.send_webhook_request",
+                AsyncMock(return_value=_response(404)),
+            ):
+                await deliver_webhook(**kwargs, dao=AsyncMock(), lanes=lanes)
+            assert lane.failures == 0
+            assert lane.in_flight == 0
+
+
+# ---------------------------------------------------------------------------
+# prepare_webhook_batch_request
+# ---------------------------------------------------------------------------
+
+
+class TestPrepareWebhookBatchRequest:
+    def test_one_signed_payload_with_every_event(self):
+        project_id = uuid4()
+        batch_id = uuid4()
+        deliveries = [
+            {
+                "delivery_id": str(uuid4()),
+                "event_id": str(uuid4()),
+                "event_type": "environments.revisions.committed",
+                "event": {"event_id": f"e{i}", "attributes": {"i": i}},
+            }
+            for i in range(2)
+        ]
+
+        resolve, decrypt = _patched_delivery()
+        with resolve, decrypt:
+            prepared = prepare_webhook_batch_request(
+                project_id=project_id,
+                batch_id=batch_id,
+                deliveries=deliveries,
+                url="https://example.com/hook",
+                headers={"X-Custom": "kept"},
+                payload_fields={"id": "$.event.event_id"},
+                auth_mode=None,
+                subscription={"name": "hook"},
+                encrypted_secret="enc",
+            )
+
+        assert json.loads(prepared.payload_json) == {
+            "events": [{"id": "e0"}, {"id": "e1"}]
+        }
+        headers = prepared.request_headers
+        assert headers["X-Agenta-Event-Type"] == "batch"
+        assert headers["X-Agenta-Delivery-Id"] == str(batch_id)
+        assert headers["Idempotency-Key"] == str(batch_id)
+        assert headers["X-Agenta-Event-Count"] == "2"
+        assert "X-Agenta-Event-Id" not in headers
+        assert headers["X-Agenta-Signature"].startswith("t=")
+        assert headers["X-Custom"] == "kept"
+
+        assert [str(item.delivery_id) for item in prepared.items] == [
+            delivery["delivery_id"] for delivery in deliveries
+        ]
+        assert prepared.items[1].data.payload == {"id": "e1"}
+        assert prepared.items[1].data.headers["X-Agenta-Signature"] == "[REDACTED]"
@@ -0,0 +1,291 @@
+"""Shared plumbing for the api-hot-paths benchmark: paths, timing, stats, stand-ins, results I/O.
+
+Nothing in here knows what a span or a scenario is. The workloads live in `workloads.py`, the suites
+in `run_benchmark.py`; this file is the part that must stay identical between two runs for their
+numbers to be comparable, so it changes rarely and on purpose.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+from urllib.parse import urlparse
+
+HERE = pathlib.Path(__file__).resolve().parent
+REPO_ROOT = HERE.parents[1]
+API_ROOT = REPO_ROOT / "api"
+RESULTS_DIR = HERE / "results"
+MANIFEST = RESULTS_DIR / "MANIFEST.md"
+
+# A case regresses when its headline number moves the wrong way by more than this fraction of the
+# baseline. Throughput and latency on a laptop wobble by 5-10% between identical runs; 20% is the
+# smallest band that does not turn every comparison into noise.
+DEFAULT_TOLERANCE = 0.20
+
+
+# -- environment -------------------------------------------------------------------------------
+
+
+def bootstrap_api_path() -> None:
+    """Make `oss.src.*` importable exactly as the API container does (`api/` on the path)."""
+    if str(API_ROOT) not in sys.path:
+        sys.path.insert(0, str(API_ROOT))
+
+
+def postgres_uri() -> str | None:
+    return os.getenv("POSTGRES_URI_TRACING")
+
+
+def postgres_reachable(uri: str | None = None, timeout: float = 1.0) -> bool:
+    """A TCP probe, not a login. It answers "is there a server to measure", which is all a SKIP needs."""
+    uri = uri or postgres_uri()
+    if not uri:
+        return False
+    parsed = urlparse(uri.replace("+asyncpg", ""))
+    try:
+        with socket.create_connection(
+            (parsed.hostname or "localhost", parsed.port or 5432), timeout=timeout
+        ):
+            return True
+    except OSError:
+        return False
+
+
+def git_revision() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        return f"{out}-dirty" if dirty else out
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def fingerprint() -> dict:
+    """What a reader needs to decide whether two runs are comparable at all."""
+    return {
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "postgres": _redact(postgres_uri()),
+    }
+
+
+def _redact(uri: str | None) -> str | None:
+    if not uri:
+        return None
+    parsed = urlparse(uri)
+    if parsed.password:
+        uri = uri.replace(f":{parsed.password}@", ":***@")
+    return uri
+
+
+# -- timing ------------------------------------------------------------------------------------
+
+
+@contextmanager
+def stopwatch() -> Iterator[dict]:
+    box = {"seconds": 0.0}
+    start = time.perf_counter()
+    try:
+        yield box
+    finally:
+        box["seconds"] = time.perf_counter() - start
+
+
+def summarize(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    if not ordered:
+        return {"n": 0}
+    return {
+        "n": len(ordered),
+        "min": ordered[0],
+        "p50": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+    }
+
+
+def throughput_case(*, items: int, seconds: list[float], unit: str, **extra) -> dict:
+    """A higher-is-better case: `items` processed per repetition, one wall time per repetition."""
+    rates = [items / s for s in seconds if s > 0]
+    return {
+        "kind": "throughput",
+        "unit": unit,
+        "items": items,
+        "seconds": summarize(seconds),
+        "rate": summarize(rates),
+        "headline": summarize(rates).get("p50"),
+        **extra,
+    }
+
+
+def latency_case(*, seconds: list[float], **extra) -> dict:
+    """A lower-is-better case: one wall time per call, reported in milliseconds."""
+    ms = [s * 1000.0 for s in seconds]
+    return {
+        "kind": "latency",
+        "unit": "ms",
+        "ms": summarize(ms),
+        "headline": summarize(ms).get("p50"),
+        **extra,
+    }
+
+
+def skipped_case(reason: str) -> dict:
+    """A case that could not run. It is RECORDED, never omitted: a missing row reads like a pass."""
+    return {"kind": "skipped", "reason": reason, "headline": None}
+
+
+def repeat(fn: Callable[[], Any], *, repeats: int, warmup: int = 1) -> list[float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeats):
+        with stopwatch() as sw:
+            fn()
+        samples.append(sw["seconds"])
+    return samples
+
+
+async def arepeat(
+    fn: Callable[[], Any], *, repeats: int, warmup: int = 1
+) -> list[float]:
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    for _ in range(repeats):
+        with stopwatch() as sw:
+            await fn()
+        samples.append(sw["seconds"])
+    return samples
+
+
+# -- results -----------------------------------------------------------------------------------
+
+
+def utc_stamp() -> str:
+    return time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+
+
+def write_run(out_dir: pathlib.Path, results: dict, summary: str) -> None:
+    """Write a run directory. Refuses to overwrite: the history is append-only."""
+    out_dir.mkdir(parents=True, exist_ok=False)
+    (out_dir / "results.json").write_text(json.dumps(results, indent=2, sort_keys=True))
+    (out_dir / "summary.md").write_text(summary)
+
+
+def append_manifest(out_dir: pathlib.Path, results: dict) -> None:
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    if not MANIFEST.exists():
+        MANIFEST.write_text(
+            "# Run manifest\n\n"
+            "Append-only. One line per benchmark run. A row whose path is marked "
+            "`(outside results/)` was written to scratch and is not part of the history.\n\n"
+            "| run | git | suites | cases | skipped | regressions | against |\n"
+            "|---|---|---|---|---|---|---|\n"
+        )
+
+    try:
+        rel = out_dir.resolve().relative_to(RESULTS_DIR.resolve())
+        where = f"[{rel}]({rel}/summary.md)"
+    except ValueError:
+        where = f"`{out_dir}` (outside results/)"
+
+    cases = [case for suite in results["suites"].values() for case in suite.values()]
+    comparison = results.get("comparison") or {}
+    row = (
+        f"| {where} | `{results['fingerprint']['git']}` | {', '.join(results['suites'])} "
+        f"| {len(cases)} | {sum(case['kind'] == 'skipped' for case in cases)} "
+        f"| {len(comparison.get('regressions', [])) if comparison else '—'} "
+        f"| {comparison.get('against') or '—'} |\n"
+    )
+    with MANIFEST.open("a") as fh:
+        fh.write(row)
+
+
+def load_run(path: str | pathlib.Path) -> dict:
+    path = pathlib.Path(path)
+    if path.is_dir():
+        path = path / "results.json"
+    return json.loads(path.read_text())
+
+
+def compare(
+    baseline: dict, current: dict, tolerance: float = DEFAULT_TOLERANCE
+) -> dict:
+    """Case-by-case delta of `current` against `baseline`.
+
+    Only cases measured in BOTH runs are compared; a case skipped on either side is listed as
+    such rather than silently dropped, because "we did not measure it" is not "it did not move".
+    """
+    rows, regressions, unmatched = [], [], []
+    for suite_name, suite in current["suites"].items():
+        for case_name, case in suite.items():
+            key = f"{suite_name}/{case_name}"
+            before = baseline.get("suites", {}).get(suite_name, {}).get(case_name)
+            if (
+                not before
+                or before.get("headline") is None
+                or case.get("headline") is None
+                or before.get("kind") != case.get("kind")
+            ):
+                unmatched.append(key)
+                continue
+
+            old, new = before["headline"], case["headline"]
+            change = (new - old) / old if old else 0.0
+            worse = -change if case["kind"] == "throughput" else change
+            row = {
+                "case": key,
+                "kind": case["kind"],
+                "unit": case["unit"],
+                "before": old,
+                "after": new,
+                "change": change,
+                "regressed": worse > tolerance,
+            }
+            rows.append(row)
+            if row["regressed"]:
+                regressions.append(key)
+
+    return {
+        "against": baseline.get("stamp"),
+        "tolerance": tolerance,
+        "rows": rows,
+        "regressions": regressions,
+        "unmatched": unmatched,
+    }
+
+
+def fmt(value: float | None) -> str:
+    if value is None:
+        return "—"
+    if value >= 100:
+        return f"{value:,.0f}"
+    if value >= 10:
+        return f"{value:.1f}"
+    return f"{value:.2f}"
@@ -0,0 +1,710 @@
+"""The api-hot-paths throughput and latency benchmark.
+
+Run it from `api/`, inside the API's own environment, so it measures the code and the dependency
+versions that ship:
+
+    cd api
+    python ../benchmarks/api-hot-paths/run_benchmark.py                     # all suites, defaults
+    python ../benchmarks/api-hot-paths/run_benchmark.py --suite otlp --suite evaluations
+    python ../benchmarks/api-hot-paths/run_benchmark.py --suite query --scale 1m --scale 10m
+    python ../benchmarks/api-hot-paths/run_benchmark.py --against ../benchmarks/api-hot-paths/results/<stamp>
+
+There is deliberately no PEP 723 header: the thing under test is the API's dependency set, and a
+script that resolved its own would benchmark whatever `uv` picked that day.
+
+WHAT IT MEASURES
+
+  otlp         parse_otlp_stream, and parse + parse_from_otel_span_dto, on raw and gzipped
+               payloads                                                       spans/s
+  ingest       TracingService.ingest_span_dtos into a fakeredis stream (publish_spans),
+               the TracingWorker drain of that stream into Postgres, and TracingDAO.ingest
+               alone                                                          spans/s
+  query        TracingService.query (span and trace focus, attribute, full-text and session
+               filters) and TracingService.analytics over seeded 1M / 10M span projects   ms
+  evaluations  the SDK evaluation engine's process_sources (the API's slice processor) over
+               mock runners                                                   cells/s
+
+Redis is always fakeredis: the suite measures our serialization and batching, not a network hop.
+Postgres is the real thing, from POSTGRES_URI_TRACING; without it the Postgres-bound cases are
+SKIPPED with their reason, and the skip is recorded like any other result.
+
+WHAT A RUN PRODUCES
+
+  results/<utc-stamp>/results.json   every case: samples, p50/p95, headline number, fingerprint
+  results/<utc-stamp>/summary.md     the suite x case table (and the comparison, if any)
+  results/MANIFEST.md                one appended line per run
+
+The results directory is append-only, for the same reason as in `agent-config-editing`: the
+question this benchmark answers is "did this upgrade cost us ingest capacity", and that needs a
+history nobody rewrote.
+
+EXIT CODE
+
+  0  every case ran (or was skipped with a reason) and, with --against, none regressed
+  1  a case errored, or with --against a headline moved the wrong way by more than --tolerance
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import pathlib
+import sys
+import traceback
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+
+import bench_lib as B  # noqa: E402
+import workloads as W  # noqa: E402
+
+SUITES = ("otlp", "ingest", "query", "evaluations")
+
+SCALES = {"100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+
+# (traces, spans per trace) per OTLP payload: a single SDK flush, and a busy collector's batch.
+OTLP_PAYLOADS = {"small": (10, 5), "large": (400, 5)}
+
+
+# -- otlp --------------------------------------------------------------------------------------
+
+
+async def suite_otlp(args) -> dict:
+    from oss.src.apis.fastapi.otlp.opentelemetry.otlp import parse_otlp_stream
+    from oss.src.apis.fastapi.otlp.utils.processing import parse_from_otel_span_dto
+
+    cases = {}
+    for label, (traces, per_trace) in OTLP_PAYLOADS.items():
+        raw = W.otlp_request(traces=traces, spans_per_trace=per_trace, seed=args.seed)
+        spans = traces * per_trace
+
+        for encoding, payload in (("raw", raw), ("gzip", W.gzipped(raw))):
+            parsed = B.repeat(lambda: parse_otlp_stream(payload), repeats=args.repeats)
+            cases[f"parse_{label}_{encoding}"] = B.throughput_case(
+                items=spans,
+                seconds=parsed,
+                unit="spans/s",
+                payload_bytes=len(payload),
+            )
+
+        def parse_and_convert(payload=raw):
+            return [
+                parse_from_otel_span_dto(span) for span in parse_otlp_stream(payload)
+            ]
+
+        converted = parse_and_convert()
+        if len(converted) != spans:
+            raise AssertionError(f"parsed {len(converted)} of {spans} spans")
+
+        cases[f"parse_convert_{label}"] = B.throughput_case(
+            items=spans,
+            seconds=B.repeat(parse_and_convert, repeats=args.repeats),
+            unit="spans/s",
+            payload_bytes=len(raw),
+        )
+
+    return cases
+
+
+# -- ingest ------------------------------------------------------------------------------------
+
+
+def _span_dtos(traces: int, per_trace: int, seed: int):
+    from oss.src.apis.fastapi.otlp.opentelemetry.otlp import parse_otlp_stream
+    from oss.src.apis.fastapi.otlp.utils.processing import parse_from_otel_span_dto
+
+    payload = W.otlp_request(traces=traces, spans_per_trace=per_trace, seed=seed)
+    return [parse_from_otel_span_dto(span) for span in parse_otlp_stream(payload)]
+
+
+async def _count_spans(engine, project_ids) -> int:
+    from sqlalchemy import text
+
+    async with engine.session() as session:
+        result = await session.execute(
+            text(
+                "SELECT count(*) FROM spans WHERE project_id = ANY(CAST(:ids AS uuid[]))"
+            ),
+            {"ids": [str(p) for p in project_ids]},
+        )
+        return int(result.scalar_one())
+
+
+async def _delete_spans(engine, project_ids) -> None:
+    from sqlalchemy import text
+
+    async with engine.session() as session:
+        await session.execute(
+            text("DELETE FROM spans WHERE project_id = ANY(CAST(:ids AS uuid[]))"),
+            {"ids": [str(p) for p in project_ids]},
+        )
+
+
+async def suite_ingest(args) -> dict:
+    import fakeredis
+
+    from oss.src.core.tracing import streaming
+    from oss.src.core.tracing.service import TracingService
+    from oss.src.dbs.postgres.tracing.dao import TracingDAO
+    from oss.src.tasks.asyncio.tracing.worker import TracingWorker
+
+    traces = max(1, args.spans // 5)
+    spans = traces * 5
+    stream = "streams:spans"
+    group = "worker-spans"
+
+    fake = fakeredis.FakeAsyncRedis()
+    has_postgres = B.postgres_reachable()
+    engine = None
+    if has_postgres:
+        from oss.src.dbs.postgres.shared.engine import get_analytics_engine
+
+        engine = get_analytics_engine()
+
+    service = TracingService(tracing_dao=TracingDAO(engine) if engine else None)
+    cases = {}
+    written = []
+
+    async def publish(project_id):
+        await service.ingest_span_dtos(
+            organization_id=W.ORGANIZATION_ID,
+            project_id=project_id,
+            user_id=W.USER_ID,
+            span_dtos=_span_dtos(traces, 5, args.seed),
+        )
+
+    with patch.object(streaming, "_get_redis", lambda: fake):
+        # publish: the request-path half. Serialization + pipelined XADD.
+        samples = []
+        for rep in range(args.repeats + 1):
+            await fake.delete(stream)
+            span_dtos = _span_dtos(traces, 5, args.seed)
+            with B.stopwatch() as sw:
+                await service.ingest_span_dtos(
+                    organization_id=W.ORGANIZATION_ID,
+                    project_id=W.ingest_project_id("publish"),
+                    user_id=W.USER_ID,
+                    span_dtos=span_dtos,
+                )
+            if rep:  # the first repetition is warmup
+                samples.append(sw["seconds"])
+        if await fake.xlen(stream) != spans:
+            raise AssertionError(
+                f"published {await fake.xlen(stream)} of {spans} spans"
+            )
+        cases["publish_spans"] = B.throughput_case(
+            items=spans, seconds=samples, unit="spans/s"
+        )
+        await fake.delete(stream)
+
+        if not has_postgres:
+            reason = "Postgres unreachable (POSTGRES_URI_TRACING)"
+            cases["worker_drain"] = B.skipped_case(reason)
+            cases["dao_ingest"] = B.skipped_case(reason)
+            return cases
+
+        # worker_drain: the worker half. XREADGROUP batches -> deserialize -> rollups -> TracingDAO.ingest.
+        # Every repetition writes into a fresh project so the inserts never degrade into updates.
+        worker = TracingWorker(
+            service=service,
+            redis_client=fake,
+            stream_name=stream,
+            consumer_group=group,
+            consumer_name="bench",
+            max_block_ms=10,
+            max_delay_ms=0,
+        )
+        await worker.create_consumer_group()
+
+        samples = []
+        try:
+            for rep in range(args.repeats + 1):
+                project_id = W.ingest_project_id(f"{args.stamp}:drain:{rep}")
+                written.append(project_id)
+                await publish(project_id)
+                with B.stopwatch() as sw:
+                    while batch := await worker.read_batch():
+                        _, message_ids = await worker.process_batch(batch)
+                        await worker.ack_and_delete(message_ids)
+                if rep:
+                    samples.append(sw["seconds"])
+                stored = await _count_spans(engine, [project_id])
+                if stored != spans:
+                    raise AssertionError(f"worker stored {stored} of {spans} spans")
+            cases["worker_drain"] = B.throughput_case(
+                items=spans,
+                seconds=samples,
+                unit="spans/s",
+                batch_size=worker.max_batch_size,
+            )
+
+            # dao_ingest: TracingDAO.ingest alone, in the worker's batch size, for attribution.
+            span_dtos = _span_dtos(traces, 5, args.seed)
+            batch_size = worker.max_batch_size
+            samples = []
+            for rep in range(args.repeats + 1):
+                project_id = W.ingest_project_id(f"{args.stamp}:dao:{rep}")
+                written.append(project_id)
+                with B.stopwatch() as sw:
+                    for lo in range(0, len(span_dtos), batch_size):
+                        await service.tracing_dao.ingest(
+                            project_id=project_id,
+                            user_id=W.USER_ID,
+                            span_dtos=span_dtos[lo : lo + batch_size],
+                        )
+                if rep:
+                    samples.append(sw["seconds"])
+            cases["dao_ingest"] = B.throughput_case(
+                items=spans,
+                seconds=samples,
+                unit="spans/s",
+                batch_size=batch_size,
+            )
+        finally:
+            if not args.keep:
+                await _delete_spans(engine, written)
+
+    return cases
+
+
+# -- query -------------------------------------------------------------------------------------
+
+
+async def _seed(engine, project_id, spans: int, log) -> dict:
+    """Bring the scale's project to exactly `spans` rows. Idempotent: a complete seed is reused."""
+    from sqlalchemy import text
+
+    have = await _count_spans(engine, [project_id])
+    if have == spans:
+        return {"seeded": False, "seconds": 0.0}
+    if have:
+        log(f"  reseeding {project_id}: found {have:,} of {spans:,} rows")
+        await _delete_spans(engine, [project_id])
+
+    anchor = datetime.now(timezone.utc)
+    with B.stopwatch() as sw:
+        for lo in range(0, spans, W.SEED_CHUNK):
+            hi = min(spans, lo + W.SEED_CHUNK)
+            async with engine.session() as session:
+                await session.execute(
+                    text(W.SEED_SQL),
+                    {
+                        "project_id": str(project_id),
+                        "user_id": str(W.USER_ID),
+                        "anchor": anchor,
+                        "lo": lo,
+                        "hi": hi,
+                    },
+                )
+            log(f"  seeded {hi:,}/{spans:,}")
+        async with engine.session() as session:
+            await session.execute(text("ANALYZE spans"))
+    return {"seeded": True, "seconds": sw["seconds"]}
+
+
+async def _newest(engine, project_id) -> datetime:
+    from sqlalchemy import text
+
+    async with engine.session() as session:
+        result = await session.execute(
+            text(
+                "SELECT max(start_time) FROM spans WHERE project_id = CAST(:id AS uuid)"
+            ),
+            {"id": str(project_id)},
+        )
+        return result.scalar_one()
+
+
+def _query_cases(newest: datetime) -> dict:
+    from oss.src.core.shared.dtos import Windowing
+    from oss.src.core.tracing.dtos import (
+        Condition,
+        Filtering,
+        Focus,
+        Formatting,
+        StringOperator,
+        TracingQuery,
+    )
+
+    day = Windowing(oldest=newest - timedelta(days=1), newest=newest, limit=100)
+    month = Windowing(oldest=newest - timedelta(days=30), newest=newest, limit=100)
+
+    def q(focus, windowing, *conditions):
+        return TracingQuery(
+            formatting=Formatting(focus=focus),
+            windowing=windowing.model_copy(),
+            filtering=Filtering(conditions=list(conditions)) if conditions else None,
+        )
+
+    return {
+        "spans_last_day": q(Focus.SPAN, day),
+        "traces_last_day": q(Focus.TRACE, day),
+        "spans_by_model": q(
+            Focus.SPAN,
+            month,
+            Condition(field="attributes", key="ag.meta.response.model", value="gpt-4o"),
+        ),
+        "spans_by_session": q(
+            Focus.SPAN, month, Condition(field="session_id", value="session-42")
+        ),
+        "spans_full_text": q(
+            Focus.SPAN,
+            month,
+            Condition(
+                field="content", value="refunds", operator=StringOperator.CONTAINS
+            ),
+        ),
+    }
+
+
+async def suite_query(args) -> dict:
+    if not B.postgres_reachable():
+        return {
+            f"{scale}/*": B.skipped_case("Postgres unreachable (POSTGRES_URI_TRACING)")
+            for scale in args.scale
+        }
+
+    from oss.src.core.shared.dtos import Windowing
+    from oss.src.core.tracing.dtos import MetricSpec, MetricType, TracingQuery
+    from oss.src.core.tracing.service import TracingService
+    from oss.src.dbs.postgres.shared.engine import get_analytics_engine
+    from oss.src.dbs.postgres.tracing.dao import TracingDAO
+
+    engine = get_analytics_engine()
+    service = TracingService(tracing_dao=TracingDAO(engine))
+    cases = {}
+
+    for scale in args.scale:
+        spans = SCALES[scale]
+        project_id = W.query_project_id(spans)
+        args.log(f"query {scale}: project {project_id}")
+        seed = await _seed(engine, project_id, spans, args.log)
+        # Seeding time is reported once, on the scale's first case; it is context, not a headline.
+        seed_note = {"seed_seconds": seed["seconds"]} if seed["seeded"] else {}
+        newest = await _newest(engine, project_id)
+
+        for name, query in _query_cases(newest).items():
+
+            async def run(query=query):
+                return await service.query(
+                    project_id=project_id, query=query.model_copy(deep=True)
+                )
+
+            rows = len(await run())
+            cases[f"{scale}/{name}"] = B.latency_case(
+                seconds=await B.arepeat(run, repeats=args.repeats),
+                rows=rows,
+                spans=spans,
+                **seed_note,
+            )
+            seed_note = {}
+
+        specs = [
+            MetricSpec(
+                type=MetricType.NUMERIC_CONTINUOUS,
+                path="attributes.ag.metrics.duration.cumulative",
+            ),
+            MetricSpec(
+                type=MetricType.NUMERIC_CONTINUOUS,
+                path="attributes.ag.metrics.costs.cumulative.total",
+            ),
+            MetricSpec(
+                type=MetricType.CATEGORICAL_SINGLE,
+                path="attributes.ag.meta.response.model",
+            ),
+        ]
+
+        async def analytics():
+            return await service.analytics(
+                project_id=project_id,
+                query=TracingQuery(
+                    windowing=Windowing(
+                        oldest=newest - timedelta(days=30),
+                        newest=newest,
+                        interval=1440,
+                    )
+                ),
+                specs=specs,
+            )
+
+        buckets = len(await analytics())
+        cases[f"{scale}/analytics_30d_daily"] = B.latency_case(
+            seconds=await B.arepeat(analytics, repeats=args.repeats),
+            rows=buckets,
+            spans=spans,
+        )
+
+    return cases
+
+
+# -- evaluations -------------------------------------------------------------------------------
+
+
+async def suite_evaluations(args) -> dict:
+    from uuid import uuid4
+
+    from agenta.sdk.evaluations.runtime.processor import Concurrency, process_sources
+
+    async def create_scenario(run_id):
+        return type("Scenario", (), {"id": uuid4()})()
+
+    async def refresh_metrics(run_id, scenario_id):
+        return None
+
+    cases = {}
+    for label, latency, batch_size in (
+        ("engine_overhead", 0.0, None),
+        ("runner_5ms_batch_32", 0.005, 32),
+    ):
+        source_items, steps = W.evaluation_inputs(
+            scenarios=args.scenarios, evaluators=args.evaluators, seed=args.seed
+        )
+        runnable = [step.key for step in steps if step.type != "input"]
+        setter = W.CountingResultSetter()
+
+        async def run():
+            runners = {key: W.MockBatchRunner(latency=latency) for key in runnable}
+            return await process_sources(
+                run_id=uuid4(),
+                steps=steps,
+                repeats=args.eval_repeats,
+                source_items=source_items,
+                revisions={key: {"id": key} for key in runnable},
+                runners=runners,
+                concurrency=Concurrency(batch_size=batch_size),
+                create_scenario=create_scenario,
+                set_results=setter,
+                refresh_metrics=refresh_metrics,
+            )
+
+        processed = await run()
+        if len(processed) != args.scenarios:
+            raise AssertionError(
+                f"processed {len(processed)} of {args.scenarios} scenarios"
+            )
+        cells = setter.cells
+
+        cases[label] = B.throughput_case(
+            items=cells,
+            seconds=await B.arepeat(run, repeats=args.repeats, warmup=0),
+            unit="cells/s",
+            scenarios=args.scenarios,
+            evaluators=args.evaluators,
+            repeats=args.eval_repeats,
+        )
+
+    return cases
+
+
+# -- reporting ---------------------------------------------------------------------------------
+
+
+def build_summary(results: dict) -> str:
+    fp = results["fingerprint"]
+    lines = [
+        f"# api-hot-paths — {results['stamp']}",
+        "",
+        f"git `{fp['git']}` · python {fp['python']} · {fp['machine']} x{fp['cpus']} · "
+        f"postgres `{fp['postgres'] or 'none'}`",
+        "",
+        "Headline is the median. Tail is the worst side: p95 for latency, the slowest "
+        "repetition for throughput.",
+        "",
+        "| suite | case | headline | tail | unit | notes |",
+        "|---|---|---|---|---|---|",
+    ]
+    for suite_name, suite in results["suites"].items():
+        for case_name, case in suite.items():
+            if case["kind"] == "skipped":
+                lines.append(
+                    f"| {suite_name} | {case_name} | — | — | — | SKIPPED: {case['reason']} |"
+                )
+                continue
+            if case["kind"] == "error":
+                lines.append(
+                    f"| {suite_name} | {case_name} | — | — | — | ERROR: {case['error']} |"
+                )
+                continue
+            stats = case["rate"] if case["kind"] == "throughput" else case["ms"]
+            # For a rate, the bad tail is the LOW end; p95 of the rates would flatter it.
+            tail = (
+                stats.get("min") if case["kind"] == "throughput" else stats.get("p95")
+            )
+            notes = ", ".join(
+                f"{k}={B.fmt(v) if isinstance(v, float) else v}"
+                for k, v in case.items()
+                if k in ("rows", "payload_bytes", "batch_size", "spans", "seed_seconds")
+            )
+            lines.append(
+                f"| {suite_name} | {case_name} | {B.fmt(case['headline'])} | {B.fmt(tail)} "
+                f"| {case['unit']} | {notes} |"
+            )
+
+    comparison = results.get("comparison")
+    if comparison:
+        lines += [
+            "",
+            f"## Against {comparison['against']} (tolerance {comparison['tolerance']:.0%})",
+            "",
+            "| case | before | after | change | |",
+            "|---|---|---|---|---|",
+        ]
+        for row in comparison["rows"]:
+            lines.append(
+                f"| {row['case']} | {B.fmt(row['before'])} | {B.fmt(row['after'])} "
+                f"| {row['change']:+.1%} | {'**REGRESSED**' if row['regressed'] else ''} |"
+            )
+        if comparison["unmatched"]:
+            lines += ["", "Not compared: " + ", ".join(comparison["unmatched"])]
+
+    return "\n".join(lines) + "\n"
+
+
+# -- main --------------------------------------------------------------------------------------
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--suite", action="append", choices=SUITES, help="repeatable; default all"
+    )
+    parser.add_argument(
+        "--scale",
+        action="append",
+        choices=sorted(SCALES),
+        help="query scales; default 1m",
+    )
+    parser.add_argument(
+        "--spans", type=int, default=5_000, help="spans per ingest repetition"
+    )
+    parser.add_argument(
+        "--scenarios", type=int, default=200, help="evaluation scenarios per slice"
+    )
+    parser.add_argument(
+        "--evaluators", type=int, default=3, help="auto evaluators per scenario"
+    )
+    parser.add_argument(
+        "--eval-repeats", type=int, default=1, help="evaluation repeats per cell"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="timed repetitions per case"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--against", help="a previous run directory or results.json to compare with"
+    )
+    parser.add_argument("--tolerance", type=float, default=B.DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--out", help="write the run here instead of results/<stamp> (scratch runs)"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="keep the ingest suite's rows in Postgres"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="print the plan and exit"
+    )
+    parser.add_argument("-q", "--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    args.suite = args.suite or list(SUITES)
+    args.scale = args.scale or ["1m"]
+    return args
+
+
+async def amain(args) -> int:
+    B.bootstrap_api_path()
+    # The engine and the SDK log at INFO; a benchmark's stdout is its progress, not theirs.
+    logging.disable(logging.INFO)
+    os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+    results = {
+        "stamp": args.stamp,
+        "fingerprint": B.fingerprint(),
+        "params": {
+            k: getattr(args, k)
+            for k in (
+                "suite",
+                "scale",
+                "spans",
+                "scenarios",
+                "evaluators",
+                "eval_repeats",
+                "repeats",
+                "seed",
+            )
+        },
+        "suites": {},
+    }
+    failed = False
+
+    runners = {
+        "otlp": suite_otlp,
+        "ingest": suite_ingest,
+        "query": suite_query,
+        "evaluations": suite_evaluations,
+    }
+    for name in args.suite:
+        args.log(f"suite {name} ...")
+        try:
+            results["suites"][name] = await runners[name](args)
+        except Exception as exc:  # one broken suite must not hide the others' numbers
+            failed = True
+            args.log(traceback.format_exc())
+            results["suites"][name] = {
+                "*": {
+                    "kind": "error",
+                    "error": f"{type(exc).__name__}: {exc}",
+                    "headline": None,
+                }
+            }
+        for case_name, case in results["suites"][name].items():
+            args.log(
+                f"  {case_name:<32} {B.fmt(case.get('headline')):>12} {case.get('unit', case['kind'])}"
+            )
+
+    try:
+        from oss.src.dbs.postgres.shared.engine import _analytics_engine
+
+        if _analytics_engine is not None:
+            await _analytics_engine.close()
+    except ImportError:
+        pass
+
+    if args.against:
+        results["comparison"] = B.compare(
+            B.load_run(args.against), results, args.tolerance
+        )
+        failed = failed or bool(results["comparison"]["regressions"])
+
+    out_dir = pathlib.Path(args.out) if args.out else B.RESULTS_DIR / args.stamp
+    B.write_run(out_dir, results, build_summary(results))
+    B.append_manifest(out_dir, results)
+    print(build_summary(results))
+    print(f"wrote {out_dir}")
+
+    return 1 if failed else 0
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    args.stamp = B.utc_stamp()
+    args.log = (
+        (lambda *_: None)
+        if args.quiet
+        else (lambda msg: print(msg, file=sys.stderr, flush=True))
+    )
+
+    if args.dry_run:
+        plan = {k: v for k, v in vars(args).items() if k != "log"}
+        plan["postgres_reachable"] = B.postgres_reachable()
+        print(json.dumps(plan, indent=2, default=str))
+        return 0
+
+    return asyncio.run(amain(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
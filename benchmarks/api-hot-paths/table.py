@@ -0,0 +1,44 @@
+"""Re-render the summary table from a stored results.json, and diff two runs.
+
+    python table.py results/20261019-101500
+    python table.py results/20261019-101500 --against results/20261001-080000
+
+Re-tabulating must never require re-running: the numbers depend on the machine they were taken on,
+and the results files are append-only history. `--against` is the "did the upgrade cost us
+anything" question, asked after the fact. Exits 1 when a headline regressed beyond --tolerance,
+so the same command works as a CI gate over two stored runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+
+import bench_lib as B  # noqa: E402
+from run_benchmark import build_summary  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("run", help="a run directory or its results.json")
+    parser.add_argument("--against", help="an older run directory or results.json")
+    parser.add_argument("--tolerance", type=float, default=B.DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    results = B.load_run(args.run)
+    if args.against:
+        results["comparison"] = B.compare(
+            B.load_run(args.against), results, args.tolerance
+        )
+
+    print(build_summary(results))
+
+    comparison = results.get("comparison")
+    return 1 if comparison and comparison["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
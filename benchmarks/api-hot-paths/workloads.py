@@ -0,0 +1,284 @@
+"""Synthetic, deterministic workloads for the api-hot-paths benchmark.
+
+Every builder takes a seed and produces byte-identical output for it, so two runs on two commits
+measure the same work. The shapes imitate what the SDK actually sends — a workflow root with chat
+children carrying `ag.data`, `ag.meta` and `ag.metrics.unit.tokens` attributes — because the hot
+paths' cost is dominated by attribute handling, and an attribute-free span would flatter them.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import uuid
+from types import SimpleNamespace
+from uuid import UUID
+
+# Stable identities for everything the benchmark writes, so re-runs find (and reuse) their own rows
+# and never collide with real projects in a shared database.
+BENCH_NAMESPACE = uuid.UUID("6f1d7c7e-3a52-5f0e-9a53-0b1a9e0c4e11")
+ORGANIZATION_ID = uuid.uuid5(BENCH_NAMESPACE, "organization")
+USER_ID = uuid.uuid5(BENCH_NAMESPACE, "user")
+
+MODELS = ("gpt-4o-mini", "gpt-4o", "claude-3-5-haiku-20241022")
+
+# Spans per seeded trace in the query suite: one workflow root and four chat children.
+SEED_SPANS_PER_TRACE = 5
+# Seeded traces are spread over this many seconds (30 days) back from the seeding time.
+SEED_SPREAD_SECONDS = 30 * 24 * 3600
+# Part of the seeded project's identity: bump it whenever SEED_SQL changes shape, so an old seed
+# is never silently reused under a new definition.
+SEED_VERSION = 1
+# Rows per INSERT statement while seeding; bounded so a 10M seed never holds one huge transaction.
+SEED_CHUNK = 200_000
+
+
+def ingest_project_id(run: str) -> UUID:
+    """A fresh project per ingest run, so ON CONFLICT never turns inserts into updates."""
+    return uuid.uuid5(BENCH_NAMESPACE, f"ingest:{run}")
+
+
+def query_project_id(spans: int) -> UUID:
+    """One project per seeded scale; 1M and 10M live side by side and are seeded once each."""
+    return uuid.uuid5(BENCH_NAMESPACE, f"query:v{SEED_VERSION}:{spans}")
+
+
+# -- OTLP --------------------------------------------------------------------------------------
+
+
+def _json(value) -> str:
+    return "@ag.type=json:" + json.dumps(value)
+
+
+def _set(span, key: str, value) -> None:
+    attribute = span.attributes.add()
+    attribute.key = key
+    if isinstance(value, bool):
+        attribute.value.bool_value = value
+    elif isinstance(value, int):
+        attribute.value.int_value = value
+    elif isinstance(value, float):
+        attribute.value.double_value = value
+    else:
+        attribute.value.string_value = value
+
+
+def otlp_request(*, traces: int, spans_per_trace: int, seed: int = 0) -> bytes:
+    """A serialized `ExportTraceServiceRequest` of `traces` x `spans_per_trace` agenta-shaped spans."""
+    from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+        ExportTraceServiceRequest,
+    )
+
+    rng = random.Random(seed)
+    request = ExportTraceServiceRequest()
+    resource_span = request.resource_spans.add()
+    _set(resource_span.resource, "service.name", "bench")
+    scope_span = resource_span.scope_spans.add()
+    scope_span.scope.name = "agenta"
+
+    start = 1_700_000_000_000_000_000
+    for t in range(traces):
+        trace_id = rng.randbytes(16)
+        root_id = rng.randbytes(8)
+        t0 = start + t * 1_000_000_000
+
+        root = scope_span.spans.add()
+        root.trace_id = trace_id
+        root.span_id = root_id
+        root.name = "workflow"
+        root.kind = 1
+        root.start_time_unix_nano = t0
+        root.end_time_unix_nano = t0 + 900_000_000
+        root.status.code = 1
+        _set(root, "ag.type.node", "workflow")
+        _set(root, "ag.session.id", f"session-{t % 97}")
+        _set(root, "ag.user.id", f"user-{t % 31}")
+        _set(root, "ag.data.inputs", _json({"question": f"question #{t}", "k": 3}))
+        _set(root, "ag.data.outputs", _json({"answer": "lorem ipsum " * 8}))
+        _set(root, "ag.refs.application.slug", "bench-app")
+
+        for c in range(spans_per_trace - 1):
+            model = MODELS[(t + c) % len(MODELS)]
+            prompt = rng.randint(50, 2000)
+            completion = rng.randint(10, 500)
+
+            child = scope_span.spans.add()
+            child.trace_id = trace_id
+            child.span_id = rng.randbytes(8)
+            child.parent_span_id = root_id
+            child.name = "chat"
+            child.kind = 3
+            child.start_time_unix_nano = t0 + (c + 1) * 10_000_000
+            child.end_time_unix_nano = t0 + (c + 1) * 10_000_000 + 150_000_000
+            child.status.code = 1
+            _set(child, "ag.type.node", "chat")
+            _set(child, "ag.meta.response.model", model)
+            _set(
+                child, "ag.data.parameters", _json({"model": model, "temperature": 0.2})
+            )
+            _set(
+                child,
+                "ag.data.inputs",
+                _json(
+                    {
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "You are a helpful assistant.",
+                            },
+                            {"role": "user", "content": f"question #{t} part {c}"},
+                        ]
+                    }
+                ),
+            )
+            _set(
+                child,
+                "ag.data.outputs",
+                _json({"role": "assistant", "content": "lorem ipsum " * 16}),
+            )
+            _set(child, "ag.metrics.unit.tokens.prompt", prompt)
+            _set(child, "ag.metrics.unit.tokens.completion", completion)
+            _set(child, "ag.metrics.unit.tokens.total", prompt + completion)
+
+    return request.SerializeToString()
+
+
+def gzipped(payload: bytes) -> bytes:
+    return gzip.compress(payload, compresslevel=6, mtime=0)
+
+
+# -- query seeding -----------------------------------------------------------------------------
+
+# Rows are derived from their position alone, so seeding is restartable chunk by chunk and two
+# machines seeding the same scale hold the same data. Timestamps are relative to the seeding time;
+# the query suite reads the window back from the data instead of assuming "now". `created_at` is
+# spread like `start_time` because analytics buckets on it; left at its default, a 30-day
+# analytics query would collapse every seeded trace into one bucket.
+SEED_SQL = """
+INSERT INTO spans (
+    project_id, created_at, created_by_id,
+    trace_id, span_id, parent_id,
+    trace_type, span_type, span_kind, span_name,
+    start_time, end_time, status_code,
+    session_id, user_id,
+    attributes
+)
+SELECT
+    CAST(:project_id AS uuid),
+    CAST(:anchor AS timestamptz) - make_interval(secs => (t * 7919) % {spread}) + make_interval(secs => p * 0.1 + 0.5),
+    CAST(:user_id AS uuid),
+    CAST(md5(:project_id || ':t:' || t) AS uuid),
+    CAST(md5(:project_id || ':s:' || i) AS uuid),
+    CASE WHEN p = 0 THEN NULL ELSE CAST(md5(:project_id || ':s:' || (t * {per_trace})) AS uuid) END,
+    'INVOCATION'::tracetype,
+    CASE WHEN p = 0 THEN 'WORKFLOW'::spantype ELSE 'CHAT'::spantype END,
+    CASE WHEN p = 0 THEN 'SPAN_KIND_INTERNAL'::otelspankind ELSE 'SPAN_KIND_CLIENT'::otelspankind END,
+    CASE WHEN p = 0 THEN 'workflow' ELSE 'chat' END,
+    CAST(:anchor AS timestamptz) - make_interval(secs => (t * 7919) % {spread}) + make_interval(secs => p * 0.1),
+    CAST(:anchor AS timestamptz) - make_interval(secs => (t * 7919) % {spread}) + make_interval(secs => p * 0.1 + 0.4),
+    CASE WHEN t % 50 = 0 THEN 'STATUS_CODE_ERROR'::otelstatuscode ELSE 'STATUS_CODE_OK'::otelstatuscode END,
+    CASE WHEN p = 0 THEN 'session-' || (t % 1000) END,
+    CASE WHEN p = 0 THEN 'user-' || (t % 200) END,
+    jsonb_build_object('ag', jsonb_build_object(
+        'type', jsonb_build_object('trace', 'invocation', 'span', CASE WHEN p = 0 THEN 'workflow' ELSE 'chat' END),
+        'data', jsonb_build_object(
+            'inputs', jsonb_build_object('question', 'question #' || t || ' about ' || (ARRAY['refunds','billing','shipping','returns'])[1 + t % 4]),
+            'outputs', jsonb_build_object('answer', repeat('lorem ipsum ', 8))
+        ),
+        'meta', jsonb_build_object('response', jsonb_build_object('model', (ARRAY['gpt-4o-mini','gpt-4o','claude-3-5-haiku-20241022'])[1 + (t + p) % 3])),
+        'metrics', jsonb_build_object(
+            'duration', jsonb_build_object('cumulative', 400 + (i * 37) % 2000),
+            'tokens', jsonb_build_object('cumulative', jsonb_build_object('total', 100 + (i * 53) % 4000)),
+            'costs', jsonb_build_object('cumulative', jsonb_build_object('total', ((i * 29) % 1000) / 100000.0))
+        )
+    ))
+FROM (
+    SELECT i, i / {per_trace} AS t, i % {per_trace} AS p
+    FROM generate_series(CAST(:lo AS bigint), CAST(:hi AS bigint) - 1) AS i
+) AS g
+ON CONFLICT DO NOTHING
+""".format(per_trace=SEED_SPANS_PER_TRACE, spread=SEED_SPREAD_SECONDS)
+
+
+# -- evaluations -------------------------------------------------------------------------------
+
+
+class MockBatchRunner:
+    """Stands in for a workflow runner: answers every request immediately, optionally after `latency`.
+
+    With `latency=0` the suite measures the evaluation engine's own overhead (planning, fan-out,
+    result bookkeeping) — the part an upgrade can regress without any model being involved.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    async def execute_batch(self, requests, semaphore=None):
+        import asyncio
+
+        from agenta.sdk.evaluations.runtime.models import WorkflowExecutionResult
+        from agenta.sdk.models.evaluations import EvaluationStatus
+
+        async def one(request):
+            if self.latency:
+                if semaphore is not None:
+                    async with semaphore:
+                        await asyncio.sleep(self.latency)
+                else:
+                    await asyncio.sleep(self.latency)
+            self.calls += 1
+            return WorkflowExecutionResult(
+                status=EvaluationStatus.SUCCESS,
+                trace_id=uuid.uuid4().hex,
+                span_id=uuid.uuid4().hex[16:],
+            )
+
+        return await asyncio.gather(*(one(request) for request in requests))
+
+
+class CountingResultSetter:
+    """The `set_results` seam, minus the API: counts the cells the engine would have persisted."""
+
+    def __init__(self):
+        self.cells = 0
+
+    async def set(
+        self,
+        *,
+        cell,
+        trace_id=None,
+        hash_id=None,
+        testcase_id=None,
+        error=None,
+    ):
+        self.cells += 1
+        return SimpleNamespace(id=uuid.uuid4())
+
+
+def evaluation_inputs(*, scenarios: int, evaluators: int, seed: int = 0):
+    """Source items and steps for one slice: a testset, one application and `evaluators` auto evaluators."""
+    from agenta.sdk.evaluations.runtime.models import (
+        EvaluationStep,
+        ResolvedSourceItem,
+    )
+
+    rng = random.Random(seed)
+    source_items = [
+        ResolvedSourceItem(
+            kind="testcase",
+            step_key="testset-main",
+            testcase_id=uuid.UUID(int=rng.getrandbits(128)),
+            inputs={"question": f"question #{s}", "expected": "lorem ipsum"},
+        )
+        for s in range(scenarios)
+    ]
+    steps = [
+        EvaluationStep(key="testset-main", type="input", origin="custom"),
+        EvaluationStep(key="application-main", type="invocation", origin="auto"),
+    ] + [
+        EvaluationStep(key=f"evaluator-{e}", type="annotation", origin="auto")
+        for e in range(evaluators)
+    ]
+    return source_items, steps
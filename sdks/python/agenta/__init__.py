@@ -1,89 +1,190 @@
+from importlib import import_module
 from importlib.metadata import version as _version
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 try:
     __version__ = _version("agenta")
 except Exception:
     __version__ = "0.0.0-dev"
 
-from typing import Any, Callable, Optional
-
-import agenta.client.types as client_types  # pylint: disable=wrong-import-order
-from agenta.client import AgentaApi, AsyncAgentaApi
-
-from .sdk.utils import assets as assets
-
-# evaluations
-from .sdk import testsets as testsets
-from .sdk.utils.init import AgentaSingleton
-from .sdk.utils.init import init as _init
-from .sdk.contexts.running import workflow_mode_enabled  # noqa: F401
-from .sdk.decorators.running import (
-    application,  # noqa: F401
-    evaluator,  # noqa: F401
-    workflow,  # noqa: F401
-)
-from .sdk.decorators.routing import default_app as app, route, create_app  # noqa: F401
-from .sdk.decorators.tracing import instrument  # noqa: F401
-from .sdk.managers.apps import AppManager  # noqa: F401
-from .sdk.managers.config import ConfigManager  # noqa: F401
-from .sdk.managers.deployment import DeploymentManager  # noqa: F401
-from .sdk.managers.secrets import SecretsManager  # noqa: F401
-from .sdk.managers.variant import VariantManager  # noqa: F401
-from .sdk.managers.vault import VaultManager  # noqa: F401
-from .sdk.engines.tracing import Tracing, get_tracer  # noqa: F401
-from .sdk.engines.tracing.conventions import Reference  # noqa: F401
-from .sdk.utils.types import (
-    BinaryParam,  # noqa: F401
-    DictInput,  # noqa: F401
-    FileInputURL,  # noqa: F401
-    FloatParam,  # noqa: F401
-    GroupedMultipleChoiceParam,  # noqa: F401
-    IntParam,  # noqa: F401
-    MCField,  # noqa: F401
-    Message,  # noqa: F401
-    Messages,  # noqa: F401
-    MultipleChoice,  # noqa: F401
-    MultipleChoiceParam,  # noqa: F401
-    Prompt,  # noqa: F401
-    PromptTemplate,  # noqa: F401
-    TextParam,  # noqa: F401
-)
-from .sdk.utils.costs import calculate_token_usage  # noqa: F401
-from .sdk.utils.logging import get_module_logger  # noqa: F401
-from .sdk.utils.preinit import PreInitObject  # noqa: F401
-
-# Agent runtime (the agents subsystem). `Message` is intentionally not re-exported here:
-# `agenta.Message` already names the prompt message type; import the agents one from
-# `agenta.sdk.agents` when needed.
-from .sdk.agents import (  # noqa: F401
-    AgentaHarness,
-    AgentTemplate,
-    ClaudeHarness,
-    Environment,
-    LocalBackend,
-    PiHarness,
-    SandboxAgentBackend,
-    SessionConfig,
-    make_harness,
-)
-
-DEFAULT_AGENTA_SINGLETON_INSTANCE = AgentaSingleton()
-
-types = client_types
-
-api = AgentaApi
-async_api = AsyncAgentaApi
-
-tracing = DEFAULT_AGENTA_SINGLETON_INSTANCE.tracing  # type: ignore
-tracer = get_tracer(tracing)
-
-
-def __getattr__(name: str):
-    if name == "callbacks":
-        from .sdk.litellm import litellm as callbacks
-
-        return callbacks
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+if TYPE_CHECKING:
+    import agenta.client.types as client_types  # pylint: disable=wrong-import-order
+    from agenta.client import AgentaApi, AsyncAgentaApi  # noqa: F401
+
+    from .sdk.utils import assets as assets
+
+    # evaluations
+    from .sdk import testsets as testsets
+    from .sdk.utils.init import AgentaSingleton
+    from .sdk.utils.init import init as _init  # noqa: F401
+    from .sdk.contexts.running import workflow_mode_enabled  # noqa: F401
+    from .sdk.decorators.running import (
+        application,  # noqa: F401
+        evaluator,  # noqa: F401
+        workflow,  # noqa: F401
+    )
+    from .sdk.decorators.routing import default_app as app, route, create_app  # noqa: F401
+    from .sdk.decorators.tracing import instrument  # noqa: F401
+    from .sdk.managers.apps import AppManager  # noqa: F401
+    from .sdk.managers.config import ConfigManager  # noqa: F401
+    from .sdk.managers.deployment import DeploymentManager  # noqa: F401
+    from .sdk.managers.secrets import SecretsManager  # noqa: F401
+    from .sdk.managers.variant import VariantManager  # noqa: F401
+    from .sdk.managers.vault import VaultManager  # noqa: F401
+    from .sdk.engines.tracing import Tracing, get_tracer  # noqa: F401
+    from .sdk.engines.tracing.conventions import Reference  # noqa: F401
+    from .sdk.utils.types import (
+        BinaryParam,  # noqa: F401
+        DictInput,  # noqa: F401
+        FileInputURL,  # noqa: F401
+        FloatParam,  # noqa: F401
+        GroupedMultipleChoiceParam,  # noqa: F401
+        IntParam,  # noqa: F401
+        MCField,  # noqa: F401
+        Message,  # noqa: F401
+        Messages,  # noqa: F401
+        MultipleChoice,  # noqa: F401
+        MultipleChoiceParam,  # noqa: F401
+        Prompt,  # noqa: F401
+        PromptTemplate,  # noqa: F401
+        TextParam,  # noqa: F401
+    )
+    from .sdk.utils.costs import calculate_token_usage  # noqa: F401
+    from .sdk.utils.logging import get_module_logger  # noqa: F401
+    from .sdk.utils.preinit import PreInitObject  # noqa: F401
+
+    # Agent runtime (the agents subsystem). `Message` is intentionally not re-exported here:
+    # `agenta.Message` already names the prompt message type; import the agents one from
+    # `agenta.sdk.agents` when needed.
+    from .sdk.agents import (  # noqa: F401
+        AgentaHarness,
+        AgentTemplate,
+        ClaudeHarness,
+        Environment,
+        LocalBackend,
+        PiHarness,
+        SandboxAgentBackend,
+        SessionConfig,
+        make_harness,
+    )
+
+    DEFAULT_AGENTA_SINGLETON_INSTANCE: AgentaSingleton
+    types = client_types
+    api: Any
+    async_api: Any
+    tracing: Optional[Tracing]
+    tracer: Any
+
+# Everything below is resolved on first attribute access, so a script that only
+# calls `ag.init()` and `@ag.instrument` does not import FastAPI, litellm, the
+# managers or the agents subsystem (guarded by `test_lazy_imports.py`).
+#
+# name -> (module, attribute); `None` exports the module itself.
+_dynamic_imports: Dict[str, Tuple[str, Optional[str]]] = {
+    "client_types": ("agenta.client.types", None),
+    "types": ("agenta.client.types", None),
+    "AgentaApi": ("agenta.client", "AgentaApi"),
+    "AsyncAgentaApi": ("agenta.client", "AsyncAgentaApi"),
+    "assets": ("agenta.sdk.utils.assets", None),
+    # evaluations
+    "testsets": ("agenta.sdk.managers.testsets", None),
+    "AgentaSingleton": ("agenta.sdk.utils.init", "AgentaSingleton"),
+    "_init": ("agenta.sdk.utils.init", "init"),
+    "workflow_mode_enabled": (
+        "agenta.sdk.contexts.running",
+        "workflow_mode_enabled",
+    ),
+    "application": ("agenta.sdk.decorators.running", "application"),
+    "evaluator": ("agenta.sdk.decorators.running", "evaluator"),
+    "workflow": ("agenta.sdk.decorators.running", "workflow"),
+    "app": ("agenta.sdk.decorators.routing", "default_app"),
+    "route": ("agenta.sdk.decorators.routing", "route"),
+    "create_app": ("agenta.sdk.decorators.routing", "create_app"),
+    "instrument": ("agenta.sdk.decorators.tracing", "instrument"),
+    "AppManager": ("agenta.sdk.managers.apps", "AppManager"),
+    "ConfigManager": ("agenta.sdk.managers.config", "ConfigManager"),
+    "DeploymentManager": ("agenta.sdk.managers.deployment", "DeploymentManager"),
+    "SecretsManager": ("agenta.sdk.managers.secrets", "SecretsManager"),
+    "VariantManager": ("agenta.sdk.managers.variant", "VariantManager"),
+    "VaultManager": ("agenta.sdk.managers.vault", "VaultManager"),
+    "Tracing": ("agenta.sdk.engines.tracing", "Tracing"),
+    "get_tracer": ("agenta.sdk.engines.tracing", "get_tracer"),
+    "Reference": ("agenta.sdk.engines.tracing.conventions", "Reference"),
+    "BinaryParam": ("agenta.sdk.utils.types", "BinaryParam"),
+    "DictInput": ("agenta.sdk.utils.types", "DictInput"),
+    "FileInputURL": ("agenta.sdk.utils.types", "FileInputURL"),
+    "FloatParam": ("agenta.sdk.utils.types", "FloatParam"),
+    "GroupedMultipleChoiceParam": (
+        "agenta.sdk.utils.types",
+        "GroupedMultipleChoiceParam",
+    ),
+    "IntParam": ("agenta.sdk.utils.types", "IntParam"),
+    "MCField": ("agenta.sdk.utils.types", "MCField"),
+    "Message": ("agenta.sdk.utils.types", "Message"),
+    "Messages": ("agenta.sdk.utils.types", "Messages"),
+    "MultipleChoice": ("agenta.sdk.utils.types", "MultipleChoice"),
+    "MultipleChoiceParam": ("agenta.sdk.utils.types", "MultipleChoiceParam"),
+    "Prompt": ("agenta.sdk.utils.types", "Prompt"),
+    "PromptTemplate": ("agenta.sdk.utils.types", "PromptTemplate"),
+    "TextParam": ("agenta.sdk.utils.types", "TextParam"),
+    "calculate_token_usage": ("agenta.sdk.utils.costs", "calculate_token_usage"),
+    "get_module_logger": ("agenta.sdk.utils.logging", "get_module_logger"),
+    "PreInitObject": ("agenta.sdk.utils.preinit", "PreInitObject"),
+    # Agent runtime (the agents subsystem). `Message` is intentionally not re-exported here:
+    # `agenta.Message` already names the prompt message type; import the agents one from
+    # `agenta.sdk.agents` when needed.
+    "AgentaHarness": ("agenta.sdk.agents", "AgentaHarness"),
+    "AgentTemplate": ("agenta.sdk.agents", "AgentTemplate"),
+    "ClaudeHarness": ("agenta.sdk.agents", "ClaudeHarness"),
+    "Environment": ("agenta.sdk.agents", "Environment"),
+    "LocalBackend": ("agenta.sdk.agents", "LocalBackend"),
+    "PiHarness": ("agenta.sdk.agents", "PiHarness"),
+    "SandboxAgentBackend": ("agenta.sdk.agents", "SandboxAgentBackend"),
+    "SessionConfig": ("agenta.sdk.agents", "SessionConfig"),
+    "make_harness": ("agenta.sdk.agents", "make_harness"),
+    "callbacks": ("agenta.sdk.litellm.litellm", None),
+}
+
+
+def _default_singleton() -> "AgentaSingleton":
+    from .sdk.utils.init import AgentaSingleton
+
+    return AgentaSingleton()
+
+
+def __getattr__(name: str) -> Any:
+    # Runtime state: read through the singleton until `init()` pins it here.
+    if name == "DEFAULT_AGENTA_SINGLETON_INSTANCE":
+        return _default_singleton()
+    if name == "tracing":
+        return _default_singleton().tracing
+    if name == "tracer":
+        from .sdk.engines.tracing import get_tracer
+
+        return get_tracer(_default_singleton().tracing)
+    # Before `init()`, `api`/`async_api` are the client classes themselves.
+    if name == "api":
+        name = "AgentaApi"
+    elif name == "async_api":
+        name = "AsyncAgentaApi"
+
+    target = _dynamic_imports.get(name)
+    if target is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module_name, member_name = target
+    module = import_module(module_name)
+    value = module if member_name is None else getattr(module, member_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals())
+        | set(_dynamic_imports)
+        | {"DEFAULT_AGENTA_SINGLETON_INSTANCE", "api", "async_api", "tracing", "tracer"}
+    )
 
 
 def init(
@@ -98,6 +199,9 @@ def init(
 ):
     global api, async_api, tracing, tracer  # pylint: disable=global-statement
 
+    from .sdk.engines.tracing import get_tracer
+    from .sdk.utils.init import init as _init  # noqa: F401
+
     _init(
         host=host,
         api_url=api_url,
@@ -109,10 +213,12 @@ def init(
         scope_id=scope_id,
     )
 
-    api = DEFAULT_AGENTA_SINGLETON_INSTANCE.api  # type: ignore
-    async_api = DEFAULT_AGENTA_SINGLETON_INSTANCE.async_api  # type: ignore
+    singleton = _default_singleton()
+
+    api = singleton.api  # type: ignore
+    async_api = singleton.async_api  # type: ignore
 
-    tracing = DEFAULT_AGENTA_SINGLETON_INSTANCE.tracing  # type: ignore
+    tracing = singleton.tracing  # type: ignore
     tracer = get_tracer(tracing)
 
 
@@ -145,4 +251,4 @@ def get_trace_url(trace_id: Optional[str] = None) -> str:
         >>>     print(url)
         >>>     return "result"
     """
-    return DEFAULT_AGENTA_SINGLETON_INSTANCE.tracing.get_trace_url(trace_id)
+    return _default_singleton().tracing.get_trace_url(trace_id)
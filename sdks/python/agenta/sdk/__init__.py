@@ -1,8 +1,51 @@
-import sys
-from typing import Optional, Callable, Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from .utils.preinit import PreInitObject  # always the first import!  # noqa: F401
 
+if TYPE_CHECKING:
+    import agenta.client.types as client_types  # noqa: F401
+    import agenta.sdk.utils.types as types  # noqa: F401
+    import agenta.sdk.utils.assets as assets  # noqa: F401
+
+    from .utils.types import (  # noqa: F401
+        DictInput,
+        MultipleChoice,
+        FloatParam,
+        IntParam,
+        MultipleChoiceParam,
+        GroupedMultipleChoiceParam,
+        TextParam,
+        Message,
+        Messages,
+        FileInputURL,
+        BinaryParam,
+        Prompt,
+    )
+
+    from .engines.tracing import Tracing, get_tracer  # noqa: F401
+    from agenta.sdk.decorators.tracing import instrument  # noqa: F401
+    from agenta.sdk.decorators.running import (  # noqa: F401
+        workflow,
+        application,
+        evaluator,
+    )
+    from agenta.sdk.decorators.routing import route, default_app as app  # noqa: F401
+    from .engines.tracing.conventions import Reference  # noqa: F401
+    from .utils.init import AgentaSingleton, init as _init  # noqa: F401
+    from .utils.costs import calculate_token_usage  # noqa: F401
+    from .managers.apps import AppManager  # noqa: F401
+    from .managers.vault import VaultManager  # noqa: F401
+    from .managers.secrets import SecretsManager  # noqa: F401
+    from .managers.config import ConfigManager  # noqa: F401
+    from .managers.variant import VariantManager  # noqa: F401
+    from .managers.deployment import DeploymentManager  # noqa: F401
+    from .managers import testsets as testsets  # noqa: F401
+
+    DEFAULT_AGENTA_SINGLETON_INSTANCE: AgentaSingleton
+    tracing: Optional[Tracing]
+    tracer: Any
+
 __all__ = [
     # Decorators
     "workflow",
@@ -47,70 +90,86 @@ __all__ = [
     "types",
 ]
 
-import agenta.client.types as client_types  # noqa: E402, F401
-import agenta.sdk.utils.types as types  # noqa: E402, F401
-import agenta.sdk.utils.assets as assets  # noqa: E402, F401
-
-from .utils.types import (  # noqa: E402
-    DictInput,
-    MultipleChoice,
-    FloatParam,
-    IntParam,
-    MultipleChoiceParam,
-    GroupedMultipleChoiceParam,
-    TextParam,
-    Message,
-    Messages,
-    FileInputURL,
-    BinaryParam,
-    Prompt,
-)
-
-from .engines.tracing import Tracing, get_tracer
-from agenta.sdk.decorators.tracing import instrument
-from agenta.sdk.decorators.running import (
-    workflow,
-    application,
-    evaluator,
-)
-from agenta.sdk.decorators.routing import route, default_app as app
-from .engines.tracing.conventions import Reference
-from .utils.init import AgentaSingleton, init as _init
-from .utils.costs import calculate_token_usage
-from .managers.apps import AppManager
-from .managers.vault import VaultManager
-from .managers.secrets import SecretsManager
-from .managers.config import ConfigManager
-from .managers.variant import VariantManager
-from .managers.deployment import DeploymentManager
-from .managers import testsets as testsets
-
-sys.modules.setdefault("agenta.sdk.types", types)
-sys.modules.setdefault("agenta.sdk.assets", assets)
-
-# Compat shims: agenta.sdk.workflows.* → agenta.sdk.engines.running.*
-import agenta.sdk.engines.running as _running  # noqa: E402
-import agenta.sdk.engines.running.errors as _running_errors  # noqa: E402
-import agenta.sdk.engines.running.handlers as _running_handlers  # noqa: E402
-import agenta.sdk.engines.running.utils as _running_utils  # noqa: E402
-import agenta.sdk.engines.running.runners as _running_runners  # noqa: E402
-import agenta.sdk.engines.running.runners.daytona as _running_runners_daytona  # noqa: E402
-
-sys.modules.setdefault("agenta.sdk.workflows", _running)
-sys.modules.setdefault("agenta.sdk.workflows.errors", _running_errors)
-sys.modules.setdefault("agenta.sdk.workflows.handlers", _running_handlers)
-sys.modules.setdefault("agenta.sdk.workflows.utils", _running_utils)
-sys.modules.setdefault("agenta.sdk.workflows.runners", _running_runners)
-sys.modules.setdefault("agenta.sdk.workflows.runners.daytona", _running_runners_daytona)
-
-DEFAULT_AGENTA_SINGLETON_INSTANCE: AgentaSingleton = AgentaSingleton()
+# Exports are resolved on first access so that `import agenta.sdk` (and every
+# `agenta.sdk.*` submodule import, which runs this file first) does not pay for
+# FastAPI, litellm, the managers and the running engine up front.
+#
+# name -> (module, attribute); `None` exports the module itself.
+_dynamic_imports: Dict[str, Tuple[str, Optional[str]]] = {
+    "client_types": ("agenta.client.types", None),
+    "types": ("agenta.sdk.utils.types", None),
+    "assets": ("agenta.sdk.utils.assets", None),
+    "DictInput": ("agenta.sdk.utils.types", "DictInput"),
+    "MultipleChoice": ("agenta.sdk.utils.types", "MultipleChoice"),
+    "FloatParam": ("agenta.sdk.utils.types", "FloatParam"),
+    "IntParam": ("agenta.sdk.utils.types", "IntParam"),
+    "MultipleChoiceParam": ("agenta.sdk.utils.types", "MultipleChoiceParam"),
+    "GroupedMultipleChoiceParam": (
+        "agenta.sdk.utils.types",
+        "GroupedMultipleChoiceParam",
+    ),
+    "TextParam": ("agenta.sdk.utils.types", "TextParam"),
+    "Message": ("agenta.sdk.utils.types", "Message"),
+    "Messages": ("agenta.sdk.utils.types", "Messages"),
+    "FileInputURL": ("agenta.sdk.utils.types", "FileInputURL"),
+    "BinaryParam": ("agenta.sdk.utils.types", "BinaryParam"),
+    "Prompt": ("agenta.sdk.utils.types", "Prompt"),
+    "Tracing": ("agenta.sdk.engines.tracing", "Tracing"),
+    "get_tracer": ("agenta.sdk.engines.tracing", "get_tracer"),
+    "instrument": ("agenta.sdk.decorators.tracing", "instrument"),
+    "workflow": ("agenta.sdk.decorators.running", "workflow"),
+    "application": ("agenta.sdk.decorators.running", "application"),
+    "evaluator": ("agenta.sdk.decorators.running", "evaluator"),
+    "route": ("agenta.sdk.decorators.routing", "route"),
+    "app": ("agenta.sdk.decorators.routing", "default_app"),
+    "Reference": ("agenta.sdk.engines.tracing.conventions", "Reference"),
+    "AgentaSingleton": ("agenta.sdk.utils.init", "AgentaSingleton"),
+    "_init": ("agenta.sdk.utils.init", "init"),
+    "calculate_token_usage": ("agenta.sdk.utils.costs", "calculate_token_usage"),
+    "AppManager": ("agenta.sdk.managers.apps", "AppManager"),
+    "VaultManager": ("agenta.sdk.managers.vault", "VaultManager"),
+    "SecretsManager": ("agenta.sdk.managers.secrets", "SecretsManager"),
+    "ConfigManager": ("agenta.sdk.managers.config", "ConfigManager"),
+    "VariantManager": ("agenta.sdk.managers.variant", "VariantManager"),
+    "DeploymentManager": ("agenta.sdk.managers.deployment", "DeploymentManager"),
+    "testsets": ("agenta.sdk.managers.testsets", None),
+}
 
 
 api = None
 async_api = None
 
-tracing = DEFAULT_AGENTA_SINGLETON_INSTANCE.tracing  # type: ignore
-tracer = get_tracer(tracing)
+
+def _default_singleton() -> "AgentaSingleton":
+    from .utils.init import AgentaSingleton
+
+    return AgentaSingleton()
+
+
+def __getattr__(attr_name: str) -> Any:
+    # Runtime state: read through the singleton until `init()` pins it here.
+    if attr_name == "DEFAULT_AGENTA_SINGLETON_INSTANCE":
+        return _default_singleton()
+    if attr_name == "tracing":
+        return _default_singleton().tracing
+    if attr_name == "tracer":
+        from .engines.tracing import get_tracer
+
+        return get_tracer(_default_singleton().tracing)
+
+    target = _dynamic_imports.get(attr_name)
+    if target is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{attr_name}'")
+
+    module_name, member_name = target
+    module = import_module(module_name)
+    value = module if member_name is None else getattr(module, member_name)
+    globals()[attr_name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_dynamic_imports) | {"tracing", "tracer"})
 
 
 def init(
@@ -124,6 +183,9 @@ def init(
 ):
     global api, async_api, tracing, tracer  # pylint: disable=global-statement
 
+    from .engines.tracing import get_tracer
+    from .utils.init import init as _init
+
     _init(
         host=host,
         api_key=api_key,
@@ -134,8 +196,10 @@ def init(
         scope_id=scope_id,
     )
 
-    api = DEFAULT_AGENTA_SINGLETON_INSTANCE.api  # type: ignore
-    async_api = DEFAULT_AGENTA_SINGLETON_INSTANCE.async_api  # type: ignore
+    singleton = _default_singleton()
+
+    api = singleton.api  # type: ignore
+    async_api = singleton.async_api  # type: ignore
 
-    tracing = DEFAULT_AGENTA_SINGLETON_INSTANCE.tracing  # type: ignore
+    tracing = singleton.tracing  # type: ignore
     tracer = get_tracer(tracing)
@@ -31,6 +31,7 @@ from ..streaming import AgentStream
 from ..utils import (
     deliver_http_result,
     deliver_http_stream,
+    deliver_pooled_stream,
     deliver_subprocess_result,
     deliver_subprocess_stream,
     request_to_wire,
@@ -151,6 +152,9 @@ class SandboxAgentBackend(Backend):
         )
         self._cwd = cwd
         self._timeout = timeout
+        # The bundled runner CLI serves runs from warm processes (`cli.ts --serve`); a custom
+        # command is only known to speak the one-run-per-process protocol.
+        self._pooled = command is None
 
     async def create_sandbox(self) -> SandboxAgentSandbox:
         return SandboxAgentSandbox(self._sandbox)
@@ -194,6 +198,10 @@ class SandboxAgentBackend(Backend):
         """The live counterpart of ``_deliver_result``: an NDJSON record stream from the runner."""
         if self._url:
             return deliver_http_stream(self._url, payload, timeout=self._timeout)
+        if self._pooled:
+            return deliver_pooled_stream(
+                self._command, payload, cwd=self._cwd, timeout=self._timeout
+            )
         return deliver_subprocess_stream(
             self._command, payload, cwd=self._cwd, timeout=self._timeout
         )
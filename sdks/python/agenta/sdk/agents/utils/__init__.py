@@ -1,5 +1,5 @@
 """Shared plumbing for the runner-backed adapters: the ``/run`` wire shape and the two
-transports to the TypeScript runner."""
+transports to the TypeScript runner (the subprocess one optionally over a warm process pool)."""
 
 from .ts_runner import (
     deliver_http_result,
@@ -7,6 +7,7 @@ from .ts_runner import (
     deliver_subprocess_result,
     deliver_subprocess_stream,
 )
+from .runner_pool import RunnerPool, deliver_pooled_stream, get_runner_pool
 from .wire import request_to_wire, result_from_wire
 
 __all__ = [
@@ -16,4 +17,7 @@ __all__ = [
     "deliver_subprocess_result",
     "deliver_http_stream",
     "deliver_subprocess_stream",
+    "deliver_pooled_stream",
+    "get_runner_pool",
+    "RunnerPool",
 ]
@@ -0,0 +1,351 @@
+"""A pool of warm TypeScript runner processes for the subprocess transport.
+
+``deliver_subprocess_stream`` spawns ``cli.ts`` once per run, so every agent turn pays Node
+startup and module loading. Here each runner is started once with ``--serve`` and kept: runs are
+multiplexed over its stdio as NDJSON, one line per message, each tagged with the run's id (see
+``ServeCommand`` / ``ServeReply`` in ``cli.ts``). A runner is retired -- drained, then exited --
+after ``max_runs`` runs or once its RSS passes ``max_rss_mb``, and replaced when a health check
+(``ping``) goes unanswered or it dies.
+
+The pool mirrors ``deliver_subprocess_stream``'s contract record for record: the runner's
+``StreamRecord`` lines, an idle (between-record) timeout, and a loud failure when the stream
+ends without a terminal result. Closing the stream early cancels only that run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import signal
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from agenta.sdk.utils.logging import get_module_logger
+
+from .ts_runner import (
+    _DEFAULT_TIMEOUT,
+    _drain_stderr,
+    _transport_error,
+    deliver_subprocess_stream,
+)
+
+log = get_module_logger(__name__)
+
+# Runner processes per pool. 0 turns pooling off: every run spawns its own process again.
+_DEFAULT_POOL_SIZE = int(os.getenv("AGENTA_RUNNER_POOL_SIZE", "2"))
+# Runs a process serves before it is retired, bounding slow leaks in long-lived runners.
+_DEFAULT_MAX_RUNS = int(os.getenv("AGENTA_RUNNER_POOL_MAX_RUNS", "200"))
+# Resident memory past which a process is retired at its next health check.
+_DEFAULT_MAX_RSS_MB = float(os.getenv("AGENTA_RUNNER_POOL_MAX_RSS_MB", "1536"))
+# How stale a process's last health check may be before it is checked again on acquire.
+_DEFAULT_HEALTH_INTERVAL = float(
+    os.getenv("AGENTA_RUNNER_POOL_HEALTH_INTERVAL_SECONDS", "30")
+)
+_PING_TIMEOUT = 5.0
+
+# Marks the end of a run's queue when its process exits under it.
+_EXITED = object()
+
+
+class RunnerProcess:
+    """One ``cli.ts --serve`` child and the runs in flight on it, keyed by run id."""
+
+    def __init__(self, proc: asyncio.subprocess.Process) -> None:
+        assert (
+            proc.stdin is not None
+            and proc.stdout is not None
+            and proc.stderr is not None
+        )
+        self.proc = proc
+        self.runs = 0
+        self.retiring = False
+        self.checked_at = time.monotonic()
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._pings: Dict[str, asyncio.Future] = {}
+        self._stderr_task = asyncio.create_task(_drain_stderr(proc.stderr))
+        self._reader_task = asyncio.create_task(self._read())
+
+    @classmethod
+    async def start(
+        cls,
+        command: Sequence[str],
+        *,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> "RunnerProcess":
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            "--serve",
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        return cls(proc)
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None and not self._reader_task.done()
+
+    @property
+    def active(self) -> int:
+        return len(self._queues)
+
+    async def _read(self) -> None:
+        assert self.proc.stdout is not None
+        try:
+            while True:
+                raw = await self.proc.stdout.readline()
+                if not raw:  # EOF: the process exited
+                    break
+                line = raw.decode("utf-8", "replace").strip()
+                if not line:
+                    continue
+                try:
+                    reply = json.loads(line)
+                except json.JSONDecodeError:
+                    log.warning("agent: runner pool: invalid line: %s", line[:500])
+                    continue
+                run_id = reply.get("id")
+                if "record" in reply and run_id in self._queues:
+                    self._queues[run_id].put_nowait(reply["record"])
+                elif "pong" in reply and run_id in self._pings:
+                    future = self._pings.pop(run_id)
+                    if not future.done():
+                        future.set_result(reply["pong"])
+                elif "error" in reply:
+                    log.warning("agent: runner pool: %s", reply["error"])
+        finally:
+            for queue in self._queues.values():
+                queue.put_nowait(_EXITED)
+            for future in self._pings.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("Agent runner exited"))
+            self._pings.clear()
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        assert self.proc.stdin is not None
+        self.proc.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+
+    def open_run(self, payload: Dict[str, Any]) -> Tuple[str, asyncio.Queue]:
+        run_id = uuid.uuid4().hex
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues[run_id] = queue
+        self.runs += 1
+        if self._reader_task.done():  # exited since it was acquired
+            queue.put_nowait(_EXITED)
+        else:
+            self._send({"id": run_id, "op": "run", "request": payload})
+        return run_id, queue
+
+    def close_run(self, run_id: str, *, cancel: bool) -> None:
+        self._queues.pop(run_id, None)
+        if cancel and self.alive:
+            try:
+                self._send({"id": run_id, "op": "cancel"})
+            except Exception:  # pylint: disable=broad-except
+                # The process is going away; its runs go with it
+                log.debug("agent: runner pool: cancel not sent", exc_info=True)
+
+    async def ping(self, timeout: float = _PING_TIMEOUT) -> Dict[str, Any]:
+        ping_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._pings[ping_id] = future
+        try:
+            self._send({"id": ping_id, "op": "ping"})
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pings.pop(ping_id, None)
+            self.checked_at = time.monotonic()
+
+    async def stderr_tail(self) -> str:
+        if self.alive:
+            return ""
+        tail = await asyncio.gather(self._stderr_task, return_exceptions=True)
+        return tail[0].decode("utf-8", "replace") if isinstance(tail[0], bytes) else ""
+
+    async def retire(self) -> None:
+        """Take no new runs; once idle, close stdin and let the runner exit on its own.
+
+        Stdin stays open while runs are in flight so their cancels can still be sent.
+        """
+        self.retiring = True
+        assert self.proc.stdin is not None
+        if self.active == 0 and self.alive and not self.proc.stdin.is_closing():
+            self.proc.stdin.close()
+
+    async def kill(self) -> None:
+        self.retiring = True
+        if self.proc.returncode is None:
+            try:
+                self.proc.kill()
+            except ProcessLookupError:
+                pass
+            await self.proc.wait()
+        await asyncio.gather(
+            self._reader_task, self._stderr_task, return_exceptions=True
+        )
+
+
+class RunnerPool:
+    """Warm ``cli.ts --serve`` processes for one runner command, shared across runs.
+
+    Runs go to the least busy live process; a new one is started while the pool is below
+    ``size`` and every process is already busy. Processes are health-checked lazily, on
+    acquire, when their last check is older than ``health_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        *,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        size: int = _DEFAULT_POOL_SIZE,
+        max_runs: int = _DEFAULT_MAX_RUNS,
+        max_rss_mb: float = _DEFAULT_MAX_RSS_MB,
+        health_interval: float = _DEFAULT_HEALTH_INTERVAL,
+    ) -> None:
+        self.command = list(command)
+        self.cwd = cwd
+        self.env = env
+        self.size = max(1, size)
+        self.max_runs = max_runs
+        self.max_rss_mb = max_rss_mb
+        self.health_interval = health_interval
+        self.processes: List[RunnerProcess] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _bind_loop(self) -> asyncio.Lock:
+        # Subprocess pipes belong to the loop that opened them. A caller on a new loop (a fresh
+        # `asyncio.run`) starts over; the old loop's children are killed outright.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._lock is None:
+            for process in self.processes:
+                if process.proc.returncode is None:
+                    try:
+                        os.kill(process.proc.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+            self.processes = []
+            self._loop = loop
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _healthy(self, process: RunnerProcess) -> bool:
+        if not process.alive:
+            return False
+        if time.monotonic() - process.checked_at < self.health_interval:
+            return True
+        try:
+            pong = await process.ping()
+        except Exception:  # pylint: disable=broad-except
+            log.warning("agent: runner pool: health check failed; replacing runner")
+            await process.kill()
+            return False
+        if pong.get("rss", 0) > self.max_rss_mb * 1024 * 1024:
+            log.info("agent: runner pool: retiring runner at %s bytes RSS", pong["rss"])
+            await process.retire()
+            return False
+        return True
+
+    async def acquire(self) -> RunnerProcess:
+        async with self._bind_loop():
+            self.processes = [process for process in self.processes if process.alive]
+
+            candidates = [
+                process
+                for process in self.processes
+                if not process.retiring and await self._healthy(process)
+            ]
+
+            if candidates:
+                process = min(candidates, key=lambda candidate: candidate.active)
+                if process.active == 0 or len(self.processes) >= self.size:
+                    return self._count(process)
+
+            process = await RunnerProcess.start(
+                self.command, cwd=self.cwd, env=self.env
+            )
+            self.processes.append(process)
+            return self._count(process)
+
+    def _count(self, process: RunnerProcess) -> RunnerProcess:
+        # The run about to open is its last: take it out of rotation now, and let the
+        # run's own cleanup close it once idle
+        if process.runs + 1 >= self.max_runs:
+            process.retiring = True
+        return process
+
+    async def stream(
+        self,
+        payload: Dict[str, Any],
+        *,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        process = await self.acquire()
+        run_id, queue = process.open_run(payload)
+        saw_result = False
+        try:
+            while True:
+                # Idle timeout, reset on each record, as on the per-run subprocess transport
+                try:
+                    record = await asyncio.wait_for(queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    raise RuntimeError(
+                        f"Agent runner stream stalled: no record for {timeout}s: "
+                        f"{' '.join(self.command)}"
+                    )
+                if record is _EXITED:
+                    raise _transport_error(
+                        "Agent runner stream ended without a terminal result record",
+                        detail=f"exit={process.proc.returncode} "
+                        f"stderr={await process.stderr_tail()}",
+                    )
+                if record.get("kind") == "result":
+                    saw_result = True
+                yield record
+                if saw_result:
+                    break
+        finally:
+            process.close_run(run_id, cancel=not saw_result)
+            if process.retiring:
+                await process.retire()
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(process.kill() for process in self.processes), return_exceptions=True
+        )
+        self.processes = []
+
+
+_pools: Dict[Tuple[Tuple[str, ...], Optional[str]], RunnerPool] = {}
+
+
+def get_runner_pool(
+    command: Sequence[str],
+    *,
+    cwd: Optional[str] = None,
+) -> RunnerPool:
+    """The process-wide pool for a runner command, shared by every backend that uses it."""
+    key = (tuple(command), cwd)
+    if key not in _pools:
+        _pools[key] = RunnerPool(command, cwd=cwd)
+    return _pools[key]
+
+
+def deliver_pooled_stream(
+    command: Sequence[str],
+    payload: Dict[str, Any],
+    *,
+    cwd: Optional[str] = None,
+    timeout: float = _DEFAULT_TIMEOUT,
+) -> AsyncIterator[Dict[str, Any]]:
+    """``deliver_subprocess_stream`` over a warm runner from the command's shared pool."""
+    if _DEFAULT_POOL_SIZE <= 0:
+        return deliver_subprocess_stream(command, payload, cwd=cwd, timeout=timeout)
+    return get_runner_pool(command, cwd=cwd).stream(payload, timeout=timeout)
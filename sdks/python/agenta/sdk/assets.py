@@ -0,0 +1,6 @@
+import sys
+
+import agenta.sdk.utils.assets as _target
+
+# Compat shim: `agenta.sdk.assets` → `agenta.sdk.utils.assets`.
+sys.modules[__name__] = _target
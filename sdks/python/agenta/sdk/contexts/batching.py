@@ -0,0 +1,57 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from contextvars import ContextVar, Token
+from contextlib import contextmanager
+
+
+class BatchingContext:
+    """Lookups shared by every cell of one ``/invoke/batch`` request.
+
+    The running middlewares resolve secrets and references per invocation; inside
+    a batch, the first cell to need a given lookup runs it and the others await
+    that same result, so each is done once per batch rather than once per cell.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def once(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(fetch())
+            self._pending[key] = pending
+
+        # A cell cancelled mid-lookup must not cancel it for the others
+        return await asyncio.shield(pending)
+
+    @classmethod
+    def get(cls) -> Optional["BatchingContext"]:
+        """The current batch, or None outside of ``/invoke/batch``."""
+        return batching_context.get()
+
+    @classmethod
+    def set(cls, ctx: Optional["BatchingContext"]) -> Token:
+        return batching_context.set(ctx)
+
+    @classmethod
+    def reset(cls, token: Token) -> None:
+        return batching_context.reset(token)
+
+
+batching_context: ContextVar[Optional[BatchingContext]] = ContextVar(
+    "batching_context",
+    default=None,
+)
+
+
+@contextmanager
+def batching_context_manager(context: BatchingContext):
+    token = BatchingContext.set(context)
+    try:
+        yield
+    finally:
+        BatchingContext.reset(token)
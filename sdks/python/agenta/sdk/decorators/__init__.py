@@ -1 +1,13 @@
-from .running import application, evaluator  # noqa: F401
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .running import application, evaluator  # noqa: F401
+
+
+def __getattr__(attr_name: str) -> Any:
+    # `running` pulls in the whole running engine; keep `decorators.tracing` importable without it.
+    if attr_name in ("application", "evaluator"):
+        from . import running
+
+        return getattr(running, attr_name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{attr_name}'")
@@ -1,7 +1,9 @@
 # /agenta/sdk/decorators/routing.py
 
+import asyncio
 import warnings
-from typing import Any, Callable, Optional, AsyncGenerator, Union
+from os import getenv
+from typing import Any, Awaitable, Callable, Optional, AsyncGenerator, Union
 from json import dumps
 from uuid import UUID
 from traceback import format_exception
@@ -13,6 +15,7 @@ from starlette.routing import Mount
 from agenta.sdk.utils.exceptions import suppress
 from agenta.sdk.models.workflows import (
     WorkflowInvokeRequest,
+    WorkflowInvokeBatchRequest,
     WorkflowInspectRequest,
     WorkflowInspectResponse,
     WorkflowServiceStatus,
@@ -40,6 +43,8 @@ from agenta.sdk.middlewares.routing.cors import CORSMiddleware
 from agenta.sdk.middlewares.routing.auth import AuthMiddleware
 from agenta.sdk.middlewares.routing.otel import OTelMiddleware
 from agenta.sdk.middlewares.running.vault import invalidate_secrets_cache
+from agenta.sdk.contexts.batching import BatchingContext, batching_context_manager
+from agenta.sdk.contexts.running import RunningContext, running_context_manager
 from agenta.sdk.contexts.tracing import TracingContext, tracing_context_manager
 from agenta.sdk.decorators.running import auto_workflow, inspect_workflow, Workflow
 from agenta.sdk.engines.running.errors import ErrorStatus
@@ -52,6 +57,10 @@ from agenta.sdk.engines.running.errors import ErrorStatus
 
 _RESERVED_PATHS = {"invoke", "inspect", "messages"}
 
+# /invoke/batch: cells run at once per batch, and requests accepted per batch.
+INVOKE_BATCH_CONCURRENCY = int(getenv("AGENTA_SERVICES_INVOKE_BATCH_CONCURRENCY", "16"))
+INVOKE_BATCH_MAX_SIZE = int(getenv("AGENTA_SERVICES_INVOKE_BATCH_MAX_SIZE", "1000"))
+
 
 def _validate_path(path: str) -> None:
     """Raise ValueError if *path* contains a reserved segment."""
@@ -179,6 +188,18 @@ def _parse_workflow_embeds_header(request: Request) -> Optional[bool]:
     return None
 
 
+def _parse_llm_cache_header(request: Request) -> Optional[bool]:
+    """New negotiation: the `x-ag-llm-cache` header is HTTP sugar over the
+    canonical `flags.cache` command. ``bypass`` -> False (call the provider and
+    leave the LLM response cache untouched). Absent/unrecognized -> None (unset
+    -> the cache is used whenever one is configured).
+    """
+    value = request.headers.get("x-ag-llm-cache", "").strip().lower()
+    if value == "bypass":
+        return False
+    return None
+
+
 def _stream_wire_format(media_type: str) -> str:
     """Map a streaming Accept media type to its wire format name."""
     if media_type == "text/event-stream":
@@ -207,6 +228,10 @@ def apply_invoke_prelude(req: Request, request: WorkflowInvokeRequest) -> None:
         _resolve = _parse_workflow_embeds_header(req)
         if _resolve is not None:
             _flags["resolve"] = _resolve
+    if "cache" not in _flags:
+        _cache = _parse_llm_cache_header(req)
+        if _cache is not None:
+            _flags["cache"] = _cache
     request.flags = _flags
 
     if request.session_id is None:
@@ -481,7 +506,25 @@ async def handle_invoke_success(
     )
 
 
+def _invalidate_secrets_on_invalid_status(
+    credentials: Optional[str],
+    response: Any,
+) -> None:
+    """Drop the cached secrets of ``credentials`` once a run reports them invalid."""
+    status = getattr(response, "status", None)
+    status_type = getattr(status, "type", None)
+
+    if isinstance(status_type, str) and status_type.endswith(
+        "#v0:schemas:invalid-secrets"
+    ):
+        invalidate_secrets_cache(credentials)
+
+
 async def handle_invoke_failure(exception: Exception) -> Response:
+    return _make_json_response(_invoke_failure_response(exception))
+
+
+def _invoke_failure_response(exception: Exception) -> WorkflowBatchResponse:
     status = None
 
     if isinstance(exception, ErrorStatus):
@@ -531,13 +574,107 @@ async def handle_invoke_failure(exception: Exception) -> Response:
         trace_id = UUID(int=_trace_id).hex if _trace_id else None
         span_id = UUID(int=_span_id).hex[16:] if _span_id else None
 
-    error = WorkflowBatchResponse(
+    return WorkflowBatchResponse(
         status=status,
         trace_id=trace_id,
         span_id=span_id,
     )
 
-    return _make_json_response(error)
+
+# ---------------------------------------------------------------------------
+# /invoke/batch
+# ---------------------------------------------------------------------------
+
+
+async def handle_invoke_batch(
+    req: Request,
+    batch: WorkflowInvokeBatchRequest,
+    invoke: Callable[[WorkflowInvokeRequest], Awaitable[Any]],
+) -> Response:
+    """Run every request of ``batch`` through ``invoke``, streaming NDJSON results.
+
+    Auth has already run once for the HTTP request; secrets and references are
+    resolved once per batch through the ``BatchingContext``. Each cell gets its
+    own tracing and running contexts, and fails on its own line without failing
+    the batch.
+    """
+    if len(batch.requests) > INVOKE_BATCH_MAX_SIZE:
+        return JSONResponse(
+            status_code=413,
+            content={
+                "detail": (
+                    f"Batch of {len(batch.requests)} requests exceeds the limit "
+                    f"of {INVOKE_BATCH_MAX_SIZE}."
+                ),
+            },
+        )
+
+    concurrency = max(
+        1,
+        min(batch.concurrency or INVOKE_BATCH_CONCURRENCY, INVOKE_BATCH_CONCURRENCY),
+    )
+
+    credentials = req.state.auth.get("credentials")
+
+    async def invoke_cell(index: int, request: WorkflowInvokeRequest) -> dict:
+        # A batch answers each cell with one line, never a stream
+        request.flags = {"stream": False, **(request.flags or {})}
+
+        with tracing_context_manager(_get_request_tracing_context(req)):
+            with running_context_manager(RunningContext()):
+                try:
+                    apply_invoke_prelude(req, request)
+
+                    response = await invoke(request)
+
+                    if isinstance(response, WorkflowStreamingResponse):
+                        response = WorkflowBatchResponse(
+                            status=WorkflowServiceStatus(
+                                code=406,
+                                message="Runnable produced a stream response "
+                                "inside a batch.",
+                            ),
+                            trace_id=response.trace_id,
+                            span_id=response.span_id,
+                        )
+                    elif not isinstance(response, WorkflowBatchResponse):
+                        response = WorkflowBatchResponse(
+                            data=WorkflowServiceResponseData(outputs=response)
+                        )
+
+                except Exception as exception:
+                    response = _invoke_failure_response(exception)
+
+        _invalidate_secrets_on_invalid_status(credentials, response)
+
+        return {
+            "index": index,
+            **response.model_dump(mode="json", exclude_none=True),
+        }
+
+    async def lines():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(index: int, request: WorkflowInvokeRequest) -> dict:
+            async with semaphore:
+                return await invoke_cell(index, request)
+
+        # Cells inherit the batch while their tasks are created
+        with batching_context_manager(BatchingContext()):
+            tasks = [
+                asyncio.ensure_future(bounded(index, request))
+                for index, request in enumerate(batch.requests)
+            ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield dumps(await next_done, ensure_ascii=False) + "\n"
+        finally:
+            # The client went away: stop the cells still queued or running
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 def _to_inspect_response(
@@ -639,19 +776,28 @@ class route:
                         credentials=credentials,
                     )
 
-                status = getattr(response, "status", None)
-                status_type = getattr(status, "type", None)
-
-                if isinstance(status_type, str) and status_type.endswith(
-                    "#v0:schemas:invalid-secrets"
-                ):
-                    invalidate_secrets_cache(credentials)
+                _invalidate_secrets_on_invalid_status(credentials, response)
 
                 return await handle_invoke_success(req, response)
 
             except Exception as exception:
                 return await handle_invoke_failure(exception)
 
+        async def invoke_batch_endpoint(
+            req: Request,
+            batch: WorkflowInvokeBatchRequest,
+        ):
+            credentials = req.state.auth.get("credentials")
+
+            async def invoke(request: WorkflowInvokeRequest):
+                return await wf.invoke(
+                    request=request,
+                    secrets=None,
+                    credentials=credentials,
+                )
+
+            return await handle_invoke_batch(req, batch, invoke)
+
         async def inspect_endpoint(req: Request, request: WorkflowInspectRequest):
             credentials = req.state.auth.get("credentials")
 
@@ -730,6 +876,11 @@ class route:
                 methods=["POST"],
                 responses=invoke_responses,
             )
+            self.router_fallback.add_api_route(
+                self.path + "/invoke/batch",
+                invoke_batch_endpoint,
+                methods=["POST"],
+            )
             self.router_fallback.add_api_route(
                 self.path + "/inspect",
                 inspect_endpoint,
@@ -752,6 +903,11 @@ class route:
                 methods=["POST"],
                 responses=invoke_responses,
             )
+            self.mount_root.add_api_route(
+                "/invoke/batch",
+                invoke_batch_endpoint,
+                methods=["POST"],
+            )
             self.mount_root.add_api_route(
                 "/inspect",
                 inspect_endpoint,
@@ -769,6 +925,11 @@ class route:
             methods=["POST"],
             responses=invoke_responses,
         )
+        sub_app.add_api_route(
+            "/invoke/batch",
+            invoke_batch_endpoint,
+            methods=["POST"],
+        )
         sub_app.add_api_route(
             "/inspect",
             inspect_endpoint,
@@ -26,6 +26,7 @@ from agenta.sdk.utils.rendering import render_json_like, render_messages
 from agenta.sdk.utils.templating import render_template
 
 from agenta.sdk.litellm import mockllm
+from agenta.sdk.litellm import cache as llm_cache
 from agenta.sdk.utils.types import (  # noqa: F401
     FallbackPolicy,
     Message,
@@ -2085,7 +2086,8 @@ async def _run_prompt_llm_config_with_retry(
             with mockllm.user_aws_credentials_from(
                 _coerce_credentials(provider_settings)
             ):
-                return await mockllm.acompletion(
+                return await llm_cache.acompletion(
+                    mockllm.acompletion,
                     **{k: v for k, v in openai_kwargs.items() if k != "model"},
                     **provider_settings,
                 )
@@ -3620,7 +3622,7 @@ async def _call_llm_with_fallback(
             if val is not None:
                 kwargs[field] = val
         try:
-            response = await litellm.acompletion(**kwargs)
+            response = await llm_cache.acompletion(litellm.acompletion, **kwargs)
             msg = response.choices[0].message
             assistant_message = (
                 msg.model_dump(exclude_none=True)
@@ -2,6 +2,9 @@ from typing import Dict, List, Any, Union, Optional
 from uuid import UUID
 from copy import deepcopy
 from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+import json
 
 from pydantic import BaseModel
 
@@ -25,6 +28,7 @@ from agenta.sdk.managers.evaluators import (
 )
 from agenta.sdk.evaluations.runs import (
     RunData,
+    afetch as afetch_run,
     acreate as acreate_run,
     aclose as aclose_run,
     aurl as aget_url,
@@ -43,6 +47,7 @@ from agenta.sdk.evaluations.metrics import (
 )
 from agenta.sdk.evaluations.runtime.processor import process_sources
 from agenta.sdk.evaluations.runtime.executor import AsyncioEvaluationTaskRunner
+from agenta.sdk.evaluations.runtime.checkpoint import EvaluationCheckpoint
 from agenta.sdk.evaluations.runtime.adapters import (
     SDKWorkflowRunner,
 )
@@ -395,6 +400,34 @@ async def _prepare_run_data(
     )
 
 
+def _run_fingerprint(
+    *,
+    run_data: RunData,
+    testsets: Optional[Target],
+) -> str:
+    """A digest of what a checkpointed run evaluates, to refuse resuming another.
+
+    Inline testset data is minted as a new testset revision on every call, so
+    its (fresh) revision ids are left out; the journal's run data is reused.
+    """
+    inline = isinstance(testsets, list) and all(
+        isinstance(testset, list) for testset in testsets
+    )
+
+    return sha256(
+        json.dumps(
+            {
+                "testset_steps": None if inline else run_data.testset_steps,
+                "application_steps": run_data.application_steps,
+                "evaluator_steps": run_data.evaluator_steps,
+                "repeats": run_data.repeats or 1,
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
 def _build_local_runner() -> AsyncioEvaluationTaskRunner:
     """Wire the in-process runner from the SDK's module-level API wrappers.
 
@@ -435,7 +468,15 @@ async def aevaluate(
     repeats: Optional[int] = None,
     #
     specs: Optional[Union[EvaluateSpecs, Dict[str, Any]]] = None,
+    #
+    checkpoint: Optional[Union[str, Path]] = None,
 ):
+    """Run an evaluation locally and return its run, scenarios and metrics.
+
+    With `checkpoint`, progress is journaled to that file; calling `aevaluate`
+    again with the same arguments and file resumes the interrupted run instead
+    of starting a new one (see `runtime/checkpoint.py`).
+    """
     run_data = await _prepare_run_data(
         name=name,
         description=description,
@@ -458,36 +499,77 @@ async def aevaluate(
         "────────────────────────────────────────────────────────────────────────────"
     )
 
-    run = await acreate_run(
-        name=run_data.name,
-        description=run_data.description,
-        #
-        testset_steps=run_data.testset_steps,
-        application_steps=run_data.application_steps,
-        evaluator_steps=run_data.evaluator_steps,
-        #
-        repeats=run_data.repeats,
+    journal = EvaluationCheckpoint(checkpoint) if checkpoint is not None else None
+
+    fingerprint = (
+        _run_fingerprint(run_data=run_data, testsets=testsets)
+        if journal is not None
+        else None
     )
 
-    if not run.id:
-        print("[failure] could not create evaluation")
-        return None
+    if journal is not None and journal.run_id is not None:
+        if journal.fingerprint != fingerprint:
+            raise ValueError(
+                f"Checkpoint {journal.path} belongs to a different evaluation",
+            )
 
-    log.info(
-        "[EVAL] run created",
-        run_id=str(run.id),
-        **({"name": run_data.name} if run_data.name else {}),
-        testsets=len(run_data.testset_steps or {}),
-        applications=len(run_data.application_steps or {}),
-        evaluators=len(run_data.evaluator_steps or {}),
-        repeats=run_data.repeats or 1,
-    )
+        run_data = RunData.model_validate(journal.run_data)
+
+        run = await afetch_run(
+            run_id=UUID(journal.run_id),
+        )
+
+        if not run or not run.id:
+            raise ValueError(
+                f"Checkpoint {journal.path} refers to a missing run {journal.run_id}",
+            )
+
+        log.info(
+            "[EVAL] run resumed",
+            run_id=str(run.id),
+            checkpoint=str(journal.path),
+        )
+
+    else:
+        run = await acreate_run(
+            name=run_data.name,
+            description=run_data.description,
+            #
+            testset_steps=run_data.testset_steps,
+            application_steps=run_data.application_steps,
+            evaluator_steps=run_data.evaluator_steps,
+            #
+            repeats=run_data.repeats,
+        )
+
+        if not run.id:
+            print("[failure] could not create evaluation")
+            return None
+
+        if journal is not None:
+            journal.start_run(
+                run_id=run.id,
+                fingerprint=fingerprint,
+                run_data=run_data,
+            )
+
+        log.info(
+            "[EVAL] run created",
+            run_id=str(run.id),
+            **({"name": run_data.name} if run_data.name else {}),
+            testsets=len(run_data.testset_steps or {}),
+            applications=len(run_data.application_steps or {}),
+            evaluators=len(run_data.evaluator_steps or {}),
+            repeats=run_data.repeats or 1,
+        )
 
     runner = _build_local_runner()
 
     scenarios, run_status = await runner.process_run_locally(
         run_id=run.id,
         run_data=run_data,
+        #
+        checkpoint=journal,
     )
 
     if not scenarios:
@@ -496,17 +578,21 @@ async def aevaluate(
             run_id=str(run.id),
         )
 
-    run = await aclose_run(
-        run_id=run.id,
-        status=run_status.value,
-    )
+    if journal is None or journal.closed is None:
+        run = await aclose_run(
+            run_id=run.id,
+            status=run_status.value,
+        )
 
-    log.info(
-        "[EVAL] run closed",
-        run_id=str(run.id),
-        status=run_status.value,
-        scenarios=len(scenarios),
-    )
+        if journal is not None:
+            journal.close_run(status=run_status.value)
+
+        log.info(
+            "[EVAL] run closed",
+            run_id=str(run.id),
+            status=run_status.value,
+            scenarios=len(scenarios),
+        )
 
     # Global (headline) + variational (per-scenario) metrics — two explicit
     # selectors, two queries.
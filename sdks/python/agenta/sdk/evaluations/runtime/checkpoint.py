@@ -0,0 +1,305 @@
+"""
+Local checkpoint journal for SDK-local evaluations.
+
+`aevaluate(checkpoint=path)` appends one JSON line per durable step to `path`:
+
+    {"type": "run", "run_id": ..., "fingerprint": ..., "run_data": {...}}
+    {"type": "scenarios", "testset_revision_id": ..., "scenarios": [...]}
+    {"type": "execution", "cell": "<scenario>/<step>/<repeat>", "execution": {...}}
+    {"type": "result", "cell": "<scenario>/<step>/<repeat>", "result": {...}}
+    {"type": "scenario", "scenario_id": ..., "status": ...}
+    {"type": "closed", "status": ...}
+
+Re-running the same evaluation against the same file resumes its run: minted
+scenarios are reused, finished scenarios are skipped (errored ones are
+retried), executed cells replay their trace links instead of running again,
+and only results missing from the backend are uploaded.
+
+Lines are flushed as they are written, so they survive the process being
+killed; a torn last line is ignored on load.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from agenta.sdk.evaluations.runtime.models import (
+    PlannedCell,
+    WorkflowExecutionRequest,
+    WorkflowExecutionResult,
+)
+from agenta.sdk.evaluations.runtime.status import ProcessedScenario
+from agenta.sdk.models.evaluations import EvaluationScenario, EvaluationStatus
+from agenta.sdk.utils.logging import get_module_logger
+
+log = get_module_logger(__name__)
+
+
+def _cell_key(cell: PlannedCell) -> str:
+    return f"{cell.scenario_id}/{cell.step_key}/{cell.repeat_idx}"
+
+
+def _dump(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", exclude_none=True)
+    return value
+
+
+class EvaluationCheckpoint:
+    """An append-only journal of one evaluation run, replayed on open."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+
+        self.run_id: Optional[str] = None
+        self.fingerprint: Optional[str] = None
+        self.run_data: Optional[Dict[str, Any]] = None
+        self.closed: Optional[str] = None
+
+        self._scenarios: Dict[str, List[Dict[str, Any]]] = {}
+        self._executions: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._statuses: Dict[str, str] = {}
+
+        self._load()
+
+    # ─ loading ────────────────────────────────────────────────────────────────
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+
+        with self.path.open(encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    log.warning(
+                        "[EVAL] ignoring unreadable checkpoint line",
+                        path=str(self.path),
+                        line=number,
+                    )
+                    continue
+
+                self._apply(record)
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        kind = record.get("type")
+
+        if kind == "run":
+            self.run_id = record["run_id"]
+            self.fingerprint = record["fingerprint"]
+            self.run_data = record["run_data"]
+        elif kind == "scenarios":
+            self._scenarios[record["testset_revision_id"]] = record["scenarios"]
+        elif kind == "execution":
+            self._executions[record["cell"]] = record["execution"]
+        elif kind == "result":
+            self._results[record["cell"]] = record["result"]
+        elif kind == "scenario":
+            self._statuses[record["scenario_id"]] = record["status"]
+        elif kind == "closed":
+            self.closed = record["status"]
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        self._apply(record)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(record, default=str) + "\n")
+            file.flush()
+
+    # ─ run ────────────────────────────────────────────────────────────────────
+
+    def start_run(
+        self,
+        *,
+        run_id: Any,
+        fingerprint: str,
+        run_data: Any,
+    ) -> None:
+        self._append(
+            {
+                "type": "run",
+                "run_id": str(run_id),
+                "fingerprint": fingerprint,
+                "run_data": _dump(run_data),
+            }
+        )
+
+    def close_run(self, *, status: str) -> None:
+        self._append({"type": "closed", "status": status})
+
+    # ─ scenarios ──────────────────────────────────────────────────────────────
+
+    def scenarios(self, *, testset_revision_id: Any) -> Optional[List[Any]]:
+        """The scenarios minted for a testset revision by an earlier attempt."""
+        scenarios = self._scenarios.get(str(testset_revision_id))
+        if scenarios is None:
+            return None
+        return [EvaluationScenario.model_validate(s) for s in scenarios]
+
+    def record_scenarios(self, *, testset_revision_id: Any, scenarios: List[Any]):
+        self._append(
+            {
+                "type": "scenarios",
+                "testset_revision_id": str(testset_revision_id),
+                "scenarios": [_dump(scenario) for scenario in scenarios],
+            }
+        )
+
+    def processed(self, *, scenario: Any) -> Optional[ProcessedScenario]:
+        """A scenario finished by an earlier attempt, with its recorded results.
+
+        Until the run is closed, scenarios that finished with errors are
+        processed again; their successful cells replay, only the failed ones run.
+        """
+        status = self._statuses.get(str(scenario.id))
+        if status is None:
+            return None
+        if status == EvaluationStatus.ERRORS.value and self.closed is None:
+            return None
+
+        prefix = f"{scenario.id}/"
+        results: Dict[str, Dict[int, Any]] = {}
+        for key, result in self._results.items():
+            if key.startswith(prefix):
+                results.setdefault(result["step_key"], {})[result["repeat_idx"]] = (
+                    result
+                )
+
+        return ProcessedScenario(
+            scenario=scenario,
+            results=results,
+            has_errors=status == EvaluationStatus.ERRORS.value,
+            has_pending=status == EvaluationStatus.PENDING.value,
+        )
+
+    def record_processed(self, *, scenario: Any, status: Any) -> None:
+        self._append(
+            {
+                "type": "scenario",
+                "scenario_id": str(scenario.id),
+                "status": getattr(status, "value", status),
+            }
+        )
+
+    # ─ cells ──────────────────────────────────────────────────────────────────
+
+    def execution(self, *, cell: PlannedCell) -> Optional[WorkflowExecutionResult]:
+        execution = self._executions.get(_cell_key(cell))
+        if execution is None:
+            return None
+        return WorkflowExecutionResult.model_validate(execution)
+
+    def record_execution(
+        self,
+        *,
+        cell: PlannedCell,
+        execution: WorkflowExecutionResult,
+    ) -> None:
+        self._append(
+            {
+                "type": "execution",
+                "cell": _cell_key(cell),
+                # The trace is fetched again by id; only its links are kept
+                "execution": execution.model_dump(
+                    mode="json",
+                    exclude_none=True,
+                    exclude={"trace"},
+                ),
+            }
+        )
+
+    def result(self, *, cell: PlannedCell) -> Optional[Dict[str, Any]]:
+        return self._results.get(_cell_key(cell))
+
+    def record_result(self, *, cell: PlannedCell, result: Dict[str, Any]) -> None:
+        self._append({"type": "result", "cell": _cell_key(cell), "result": result})
+
+
+class CheckpointedWorkflowRunner:
+    """Runner adapter replaying executions the checkpoint already holds.
+
+    Successful executions are journaled with their trace links; on resume the
+    same cell returns the recorded execution, and the engine fetches its trace
+    by id for downstream steps, instead of running the workflow again.
+    """
+
+    def __init__(self, *, runner: Any, checkpoint: EvaluationCheckpoint) -> None:
+        self._runner = runner
+        self._checkpoint = checkpoint
+
+    async def execute(
+        self,
+        *,
+        request: WorkflowExecutionRequest,
+    ) -> WorkflowExecutionResult:
+        recorded = self._checkpoint.execution(cell=request.cell)
+        if recorded is not None:
+            return recorded
+
+        execution = await self._runner.execute(request=request)
+
+        if execution.status == EvaluationStatus.SUCCESS and execution.trace_id:
+            self._checkpoint.record_execution(cell=request.cell, execution=execution)
+
+        return execution
+
+
+class CheckpointedResultSetter:
+    """Result setter adapter uploading only results the backend does not have.
+
+    A cell whose recorded result matches what would be written (same status
+    and trace) was already populated by an earlier attempt and is skipped.
+    """
+
+    def __init__(self, *, setter: Any, checkpoint: EvaluationCheckpoint) -> None:
+        self._setter = setter
+        self._checkpoint = checkpoint
+
+    async def set(
+        self,
+        *,
+        cell,
+        trace_id=None,
+        hash_id=None,
+        testcase_id=None,
+        error=None,
+    ) -> Any:
+        recorded = self._checkpoint.result(cell=cell)
+        if recorded is not None and (
+            recorded.get("status") == getattr(cell.status, "value", cell.status)
+            and recorded.get("trace_id")
+            == (str(trace_id) if trace_id is not None else cell.trace_id)
+        ):
+            return recorded
+
+        result = await self._setter.set(
+            cell=cell,
+            trace_id=trace_id,
+            hash_id=hash_id,
+            testcase_id=testcase_id,
+            error=error,
+        )
+
+        self._checkpoint.record_result(cell=cell, result=_dump(result))
+
+        return result
+
+
+class CheckpointedScenarioEditor:
+    """`edit_scenario` adapter marking a scenario finished once its status is written."""
+
+    def __init__(self, *, edit: Any, checkpoint: EvaluationCheckpoint) -> None:
+        self._edit = edit
+        self._checkpoint = checkpoint
+
+    async def __call__(self, *, scenario: Any, status: Any) -> Any:
+        edited = await self._edit(scenario=scenario, status=status)
+
+        self._checkpoint.record_processed(scenario=scenario, status=status)
+
+        return edited
@@ -9,6 +9,11 @@ from agenta.sdk.evaluations.runtime.adapters import (
     SDKMetricsRefresher,
     SDKTraceFetcher,
 )
+from agenta.sdk.evaluations.runtime.checkpoint import (
+    CheckpointedResultSetter,
+    CheckpointedScenarioEditor,
+    CheckpointedWorkflowRunner,
+)
 from agenta.sdk.evaluations.runtime.models import (
     EvaluationStep,
     PlannedCell,
@@ -394,6 +399,8 @@ class AsyncioEvaluationTaskRunner:
         run_id: UUID,
         #
         run_data: RunData,
+        #
+        checkpoint: Optional[Any] = None,
     ) -> Tuple[List[Dict[str, Any]], Any]:
         """Run the evaluation locally via the API-mirroring slice sequence.
 
@@ -403,6 +410,12 @@ class AsyncioEvaluationTaskRunner:
         testset: add_scenarios (bulk) -> ONE process_sources slice over all
         scenarios (live cell writes, inline + global metric refresh, status
         writes). Empty/unresolved testsets are skipped, not failed.
+
+        With a `checkpoint` (an `EvaluationCheckpoint`), scenarios minted and
+        finished by an earlier attempt are reused from it, and executed cells
+        replay instead of running again (see `runtime/checkpoint.py`). Until the
+        checkpoint records the run as closed, the run-level metrics are refreshed
+        even when nothing was left to process.
         """
         (
             testset_revisions,
@@ -416,6 +429,8 @@ class AsyncioEvaluationTaskRunner:
         # run status is rolled up once via the shared `run_status` — not
         # re-derived by the caller at close time.
         all_processed: List[Any] = []
+        # Whether any slice ran, and with it the engine's global refresh
+        sliced = False
 
         for testset_revision_pair in testset_revisions:
             testset_revision, _origin = testset_revision_pair
@@ -444,12 +459,25 @@ class AsyncioEvaluationTaskRunner:
                 testset_revision=testset_revision,
             )
 
-            # add_scenarios — bulk-mint one skeleton per source item, in order.
-            minted = await self._add_scenarios(
-                run_id=run_id,
-                #
-                count=len(source_items),
+            minted = (
+                checkpoint.scenarios(testset_revision_id=testset_revision.id)
+                if checkpoint is not None
+                else None
             )
+
+            if minted is None:
+                # add_scenarios — bulk-mint one skeleton per source item, in order.
+                minted = await self._add_scenarios(
+                    run_id=run_id,
+                    #
+                    count=len(source_items),
+                )
+                if len(minted) == len(source_items) and checkpoint is not None:
+                    checkpoint.record_scenarios(
+                        testset_revision_id=testset_revision.id,
+                        scenarios=minted,
+                    )
+
             if len(minted) != len(source_items):
                 _log.warning(
                     "[EVAL] add_scenarios returned an unexpected count; skipping",
@@ -459,6 +487,53 @@ class AsyncioEvaluationTaskRunner:
                 )
                 continue
 
+            set_results: Any = SDKResultSetter(populate=self._populate_slice)
+            edit_scenario: Any = SDKScenarioEditor(edit=self._edit_scenario)
+
+            if checkpoint is not None:
+                # Scenarios an earlier attempt finished are not processed again
+                finished = []
+                pending = []
+                for scenario, source_item in zip(minted, source_items):
+                    processed_scenario = checkpoint.processed(scenario=scenario)
+                    if processed_scenario is not None:
+                        finished.append(processed_scenario)
+                    else:
+                        pending.append((scenario, source_item))
+
+                if finished:
+                    _log.info(
+                        "[EVAL] resuming testset from checkpoint",
+                        testset_revision_id=str(testset_revision.id),
+                        finished=len(finished),
+                        pending=len(pending),
+                    )
+
+                all_processed.extend(finished)
+                scenarios.extend(_scenario_payload(item) for item in finished)
+
+                minted = [scenario for scenario, _ in pending]
+                source_items = [source_item for _, source_item in pending]
+
+                runners = {
+                    step_key: CheckpointedWorkflowRunner(
+                        runner=runner,
+                        checkpoint=checkpoint,
+                    )
+                    for step_key, runner in runners.items()
+                }
+                set_results = CheckpointedResultSetter(
+                    setter=set_results,
+                    checkpoint=checkpoint,
+                )
+                edit_scenario = CheckpointedScenarioEditor(
+                    edit=edit_scenario,
+                    checkpoint=checkpoint,
+                )
+
+                if not source_items:
+                    continue
+
             # ONE slice over ALL scenarios — the design's `process_slice(all
             # scenarios, all steps)`. The engine's internal gather + semaphore run
             # the scenarios concurrently (bounded by batch_size), which is what
@@ -481,37 +556,61 @@ class AsyncioEvaluationTaskRunner:
                 runners=runners,
                 #
                 create_scenario=_PreMintedScenarios(minted),
-                edit_scenario=SDKScenarioEditor(edit=self._edit_scenario),
-                set_results=SDKResultSetter(populate=self._populate_slice),
+                edit_scenario=edit_scenario,
+                set_results=set_results,
                 refresh_metrics=SDKMetricsRefresher(refresh=self._refresh_metrics),
                 fetch_trace=SDKTraceFetcher(fetch=self._fetch_trace),
                 # The SDK evaluate() loop IS the executor for custom-origin steps.
                 execute_custom=True,
             )
+            sliced = True
 
             # Cells are live-written and status is written in-loop by the engine's
             # edit_scenario adapter (same as the API), so here we only assemble
             # the return payload.
-            for item in processed:
-                scenarios.append(
-                    {
-                        "scenario": item.scenario,
-                        "results": item.results,
-                        "metrics": item.metrics,
-                        "status": scenario_status(
-                            has_errors=item.has_errors,
-                            has_pending=item.has_pending,
-                        ),
-                    }
-                )
+            scenarios.extend(_scenario_payload(item) for item in processed)
             all_processed.extend(processed)
 
+        # An earlier attempt may have finished every scenario and died before
+        # its global refresh; a resume with nothing left to run still owes it.
+        if (
+            checkpoint is not None
+            and checkpoint.closed is None
+            and all_processed
+            and not sliced
+        ):
+            try:
+                await SDKMetricsRefresher(refresh=self._refresh_metrics)(
+                    run_id=run_id,
+                    scenario_id=None,
+                )
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Best-effort, as in the engine: the per-scenario metrics and
+                # result cells are already persisted.
+                _log.error(
+                    "[EVAL] run-level metrics refresh failed",
+                    run_id=str(run_id),
+                    exc_info=True,
+                )
+
         # Run status rolled up once from every touched scenario (shared with the
         # API). The caller applies it (closes the run with it); it is NOT
         # re-derived there.
         return scenarios, run_status(all_processed)
 
 
+def _scenario_payload(item: Any) -> Dict[str, Any]:
+    return {
+        "scenario": item.scenario,
+        "results": item.results,
+        "metrics": item.metrics,
+        "status": scenario_status(
+            has_errors=item.has_errors,
+            has_pending=item.has_pending,
+        ),
+    }
+
+
 class _PreMintedScenarios:
     """`create_scenario` adapter handing back bulk-minted scenarios in order.
 
@@ -0,0 +1,248 @@
+"""
+Exact-match cache for LLM responses.
+
+A response is keyed by a hash of the final provider request (model, messages,
+sampling parameters, tools and provider settings), so re-running the same
+prompt on the same inputs is served without calling the provider again.
+
+The cache is off unless configured, either with `AGENTA_LLM_CACHE` (one of
+`memory`, `disk` or `redis`) or with `set_llm_cache()`. A single invocation can
+skip it with `flags.cache = false`, or the `x-ag-llm-cache: bypass` header.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from os import getenv
+from pathlib import Path
+from time import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Protocol, Union
+
+from agenta.sdk.contexts.routing import RoutingContext
+from agenta.sdk.contexts.tracing import TracingContext
+from agenta.sdk.litellm.mockllm import AGENTA_LITELLM_MOCK
+from agenta.sdk.utils.cache import TTLLRUCache
+from agenta.sdk.utils.lazy import _load_litellm
+from agenta.sdk.utils.logging import get_module_logger
+
+log = get_module_logger(__name__)
+
+LLM_CACHE = (getenv("AGENTA_LLM_CACHE") or "").lower() or None
+LLM_CACHE_TTL = int(getenv("AGENTA_LLM_CACHE_TTL", str(24 * 60 * 60)))  # 1 day
+LLM_CACHE_CAPACITY = int(getenv("AGENTA_LLM_CACHE_CAPACITY", "1024"))
+LLM_CACHE_PATH = getenv("AGENTA_LLM_CACHE_PATH", "~/.agenta/llm-cache")
+LLM_CACHE_URL = getenv("AGENTA_LLM_CACHE_URL", "redis://localhost:6379/0")
+
+# Bump when the key or the stored payload changes shape.
+_KEY_VERSION = "v1"
+
+
+class LLMCacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[Dict[str, Any]]: ...
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None: ...
+
+
+class MemoryBackend:
+    """In-process LRU, lost on restart."""
+
+    def __init__(self, capacity: int = LLM_CACHE_CAPACITY):
+        self._cache = TTLLRUCache(capacity=capacity, ttl=LLM_CACHE_TTL)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._cache.put(key, value, ttl=ttl)
+
+
+class DiskBackend:
+    """One JSON file per response under a local directory, kept across runs."""
+
+    def __init__(self, path: Union[str, Path] = LLM_CACHE_PATH):
+        self.path = Path(path).expanduser()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        await asyncio.to_thread(self._write, key, value, ttl)
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        file = self._file(key)
+        if not file.exists():
+            return None
+
+        cached = json.loads(file.read_text(encoding="utf-8"))
+        if time() > cached["expires_at"]:
+            file.unlink(missing_ok=True)
+            return None
+
+        return cached["value"]
+
+    def _write(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        file = self._file(key)
+        file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written aside and renamed, so concurrent readers never see half a file
+        temporary = file.with_name(f".{file.name}.{os.getpid()}.tmp")
+        temporary.write_text(
+            json.dumps({"expires_at": time() + ttl, "value": value}),
+            encoding="utf-8",
+        )
+        os.replace(temporary, file)
+
+
+class RedisBackend:
+    """Shared across workers and hosts; requires the `redis` package."""
+
+    def __init__(self, url: str = LLM_CACHE_URL, prefix: str = "agenta:llm-cache"):
+        self.url = url
+        self.prefix = prefix
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            try:
+                from redis.asyncio import Redis
+            except Exception as exc:
+                raise ImportError(
+                    "redis is required for the redis LLM cache backend."
+                ) from exc
+
+            self._client = Redis.from_url(self.url)
+
+        return self._client
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        cached = await self.client.get(f"{self.prefix}:{key}")
+        return json.loads(cached) if cached else None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        await self.client.set(f"{self.prefix}:{key}", json.dumps(value), ex=ttl)
+
+
+class LLMCache:
+    def __init__(self, backend: LLMCacheBackend, ttl: int = LLM_CACHE_TTL):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def key(request: Dict[str, Any]) -> str:
+        """
+        Hash of the canonical provider request.
+
+        Credentials are part of the request, so responses are never shared
+        across provider keys; only their digest is ever stored.
+        """
+        canonical = json.dumps(
+            request,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_jsonable,
+        )
+
+        return hashlib.blake2b(
+            f"{_KEY_VERSION}:{canonical}".encode("utf-8"),
+            digest_size=32,
+        ).hexdigest()
+
+    async def acompletion(
+        self,
+        call: Callable[..., Awaitable[Any]],
+        **kwargs: Any,
+    ) -> Any:
+        key = self.key(kwargs)
+
+        cached = None
+        try:
+            cached = await self.backend.get(key)
+        except Exception as e:
+            log.warning("Agenta - LLM cache lookup failed: %s", e)
+
+        if cached is not None:
+            litellm = _load_litellm()
+            if litellm is not None:
+                _mark_span(hit=True, key=key)
+                return litellm.ModelResponse(**cached)
+
+        response = await call(**kwargs)
+
+        _mark_span(hit=False, key=key)
+
+        try:
+            await self.backend.set(key, response.model_dump(mode="json"), self.ttl)
+        except Exception as e:
+            log.warning("Agenta - LLM cache write failed: %s", e)
+
+        return response
+
+
+def _jsonable(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", exclude_none=True)
+    return str(value)
+
+
+def _mark_span(*, hit: bool, key: str) -> None:
+    import agenta as ag
+
+    if ag.tracing is not None and ag.tracing.tracer is not None:
+        ag.tracing.store_meta({"llm_cache": {"hit": hit, "key": key}})
+
+
+def _bypassed(kwargs: Dict[str, Any]) -> bool:
+    if kwargs.get("stream"):
+        return True
+
+    # Mocked calls cost nothing and must not land in a shared cache
+    if AGENTA_LITELLM_MOCK or RoutingContext.get().mock:
+        return True
+
+    flags = TracingContext.get().flags or {}
+
+    return flags.get("cache") is False
+
+
+def _backend_from_env() -> Optional[LLMCacheBackend]:
+    if LLM_CACHE == "memory":
+        return MemoryBackend()
+    if LLM_CACHE == "disk":
+        return DiskBackend()
+    if LLM_CACHE == "redis":
+        return RedisBackend()
+
+    if LLM_CACHE:
+        log.warning("Agenta - Unknown AGENTA_LLM_CACHE backend: %s", LLM_CACHE)
+
+    return None
+
+
+_backend = _backend_from_env()
+_llm_cache: Optional[LLMCache] = LLMCache(backend=_backend) if _backend else None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    return _llm_cache
+
+
+def set_llm_cache(llm_cache: Optional[LLMCache]) -> None:
+    global _llm_cache
+
+    _llm_cache = llm_cache
+
+
+async def acompletion(call: Callable[..., Awaitable[Any]], **kwargs: Any) -> Any:
+    """Run `call(**kwargs)` through the LLM cache, when one is configured."""
+    llm_cache = get_llm_cache()
+
+    if llm_cache is None or _bypassed(kwargs):
+        return await call(**kwargs)
+
+    return await llm_cache.acompletion(call, **kwargs)
@@ -1,6 +1,23 @@
-from agenta.sdk.managers.config import ConfigManager
-from agenta.sdk.managers.variant import VariantManager
-from agenta.sdk.managers.deployment import DeploymentManager
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agenta.sdk.managers.config import ConfigManager
+    from agenta.sdk.managers.variant import VariantManager
+    from agenta.sdk.managers.deployment import DeploymentManager
+
+_dynamic_imports = {
+    "ConfigManager": "agenta.sdk.managers.config",
+    "VariantManager": "agenta.sdk.managers.variant",
+    "DeploymentManager": "agenta.sdk.managers.deployment",
+}
+
+
+def __getattr__(attr_name: str) -> Any:
+    module_name = _dynamic_imports.get(attr_name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{attr_name}'")
+    return getattr(import_module(module_name), attr_name)
 
 
 __all__ = ["ConfigManager", "VariantManager", "DeploymentManager"]
@@ -0,0 +1,323 @@
+import asyncio
+import json
+import os
+import threading
+from dataclasses import dataclass
+from os import getenv
+from pathlib import Path
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from agenta.sdk.utils.logging import get_module_logger
+from agenta.sdk.utils.types import ConfigurationResponse
+
+log = get_module_logger(__name__)
+
+# Opt-in: the cache is off unless a TTL is configured.
+CONFIG_CACHE_TTL = getenv("AGENTA_CONFIG_CACHE_TTL")
+CONFIG_CACHE_SNAPSHOT = getenv("AGENTA_CONFIG_CACHE_SNAPSHOT")
+
+# fetch(etag) -> (configuration, etag); (None, etag) when unchanged
+Fetch = Callable[
+    [Optional[str]],
+    Tuple[Optional[ConfigurationResponse], Optional[str]],
+]
+AsyncFetch = Callable[
+    [Optional[str]],
+    Awaitable[Tuple[Optional[ConfigurationResponse], Optional[str]]],
+]
+
+
+@dataclass
+class _Entry:
+    configuration: ConfigurationResponse
+    etag: Optional[str]
+    expires_at: float
+
+
+class ConfigCache:
+    """
+    Stale-while-revalidate cache for configurations fetched from the registry.
+
+    A configuration is fetched once, then served from memory. Once its TTL has
+    passed it is still served as is, while one background refresh per key
+    revalidates it with a conditional request. A failed refresh keeps the last
+    known good configuration for another TTL.
+
+    With a snapshot path, every fetched configuration is also written to disk,
+    and a cold start that cannot reach the API serves the snapshot instead.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        snapshot: Optional[Union[str, Path]] = None,
+    ):
+        self.ttl = ttl
+        self.snapshot = Path(snapshot) if snapshot else None
+
+        self._entries: Dict[str, _Entry] = {}
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._refreshing: Set[str] = set()
+        self._pending: Dict[str, "asyncio.Future[ConfigurationResponse]"] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    # ─ public ─────────────────────────────────────────────────────────────────
+
+    def get(
+        self,
+        key: Dict[str, Any],
+        fetch: Fetch,
+    ) -> ConfigurationResponse:
+        _key = self._pack(key)
+
+        entry = self._entries.get(_key)
+        if entry is None:
+            with self._key_lock(_key):
+                # Concurrent misses wait for the first one to fetch
+                entry = self._entries.get(_key)
+                if entry is None:
+                    entry = self._fetch(_key, fetch)
+
+        elif self._claim_refresh(_key, entry):
+            threading.Thread(
+                target=self._refresh,
+                args=(_key, fetch),
+                daemon=True,
+            ).start()
+
+        return entry.configuration.model_copy(deep=True)
+
+    async def aget(
+        self,
+        key: Dict[str, Any],
+        fetch: AsyncFetch,
+    ) -> ConfigurationResponse:
+        _key = self._pack(key)
+
+        entry = self._entries.get(_key)
+        if entry is None:
+            pending = self._pending.get(_key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._afetch(_key, fetch))
+                self._pending[_key] = pending
+                pending.add_done_callback(lambda _: self._pending.pop(_key, None))
+
+            # Concurrent misses await the first one's fetch
+            configuration = await asyncio.shield(pending)
+
+            return configuration.model_copy(deep=True)
+
+        if self._claim_refresh(_key, entry):
+            task = asyncio.ensure_future(self._arefresh(_key, fetch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return entry.configuration.model_copy(deep=True)
+
+    def clear(self) -> None:
+        """Forget every configuration held in memory, e.g. after a commit."""
+        with self._lock:
+            self._entries.clear()
+
+    # ─ fetching ───────────────────────────────────────────────────────────────
+
+    def _fetch(self, key: str, fetch: Fetch) -> _Entry:
+        try:
+            configuration, etag = fetch(None)
+        except Exception:
+            entry = self._from_snapshot(key)
+            if entry is None:
+                raise
+            log.warning("Agenta - Serving configuration from snapshot: %s", key)
+            return entry
+
+        return self._store(key, configuration, etag)
+
+    async def _afetch(self, key: str, fetch: AsyncFetch) -> ConfigurationResponse:
+        try:
+            configuration, etag = await fetch(None)
+        except Exception:
+            entry = self._from_snapshot(key)
+            if entry is None:
+                raise
+            log.warning("Agenta - Serving configuration from snapshot: %s", key)
+            return entry.configuration
+
+        return self._store(key, configuration, etag).configuration
+
+    def _refresh(self, key: str, fetch: Fetch) -> None:
+        try:
+            entry = self._entries.get(key)
+            configuration, etag = fetch(entry.etag if entry else None)
+            self._revalidate(key, configuration, etag)
+        except Exception as e:
+            self._defer(key, e)
+        finally:
+            self._refreshing.discard(key)
+
+    async def _arefresh(self, key: str, fetch: AsyncFetch) -> None:
+        try:
+            entry = self._entries.get(key)
+            configuration, etag = await fetch(entry.etag if entry else None)
+            self._revalidate(key, configuration, etag)
+        except Exception as e:
+            self._defer(key, e)
+        finally:
+            self._refreshing.discard(key)
+
+    # ─ entries ────────────────────────────────────────────────────────────────
+
+    def _claim_refresh(self, key: str, entry: _Entry) -> bool:
+        if monotonic() < entry.expires_at:
+            return False
+
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+
+        return True
+
+    def _store(
+        self,
+        key: str,
+        configuration: ConfigurationResponse,
+        etag: Optional[str],
+    ) -> _Entry:
+        entry = _Entry(
+            configuration=configuration,
+            etag=etag,
+            expires_at=monotonic() + self.ttl,
+        )
+
+        with self._lock:
+            self._entries[key] = entry
+
+        self._save(key, entry)
+
+        return entry
+
+    def _revalidate(
+        self,
+        key: str,
+        configuration: Optional[ConfigurationResponse],
+        etag: Optional[str],
+    ) -> None:
+        if configuration is not None:
+            self._store(key, configuration, etag)
+            return
+
+        # Not modified: keep the configuration for another TTL
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = monotonic() + self.ttl
+
+    def _defer(self, key: str, error: Exception) -> None:
+        log.warning("Agenta - Failed to refresh configuration %s: %s", key, error)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = monotonic() + self.ttl
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _pack(key: Dict[str, Any]) -> str:
+        return json.dumps(
+            {k: v for k, v in key.items() if v is not None},
+            sort_keys=True,
+            default=str,
+        )
+
+    # ─ snapshot ───────────────────────────────────────────────────────────────
+
+    def _load(self) -> Dict[str, Any]:
+        if self._snapshot is None:
+            self._snapshot = {}
+
+            if self.snapshot and self.snapshot.exists():
+                try:
+                    self._snapshot = json.loads(
+                        self.snapshot.read_text(encoding="utf-8")
+                    )
+                except Exception as e:
+                    log.warning("Agenta - Failed to read config snapshot: %s", e)
+
+        return self._snapshot
+
+    def _from_snapshot(self, key: str) -> Optional[_Entry]:
+        if not self.snapshot:
+            return None
+
+        with self._lock:
+            cached = self._load().get(key)
+
+        if not cached:
+            return None
+
+        # Served right away, but revalidated on the next lookup
+        entry = _Entry(
+            configuration=ConfigurationResponse.model_validate(cached["configuration"]),
+            etag=cached.get("etag"),
+            expires_at=0,
+        )
+
+        with self._lock:
+            self._entries.setdefault(key, entry)
+
+        return entry
+
+    def _save(self, key: str, entry: _Entry) -> None:
+        if not self.snapshot:
+            return
+
+        try:
+            with self._lock:
+                snapshot = self._load()
+                snapshot[key] = {
+                    "configuration": entry.configuration.model_dump(mode="json"),
+                    "etag": entry.etag,
+                }
+
+                # Written aside and renamed, so readers never see half a file
+                self.snapshot.parent.mkdir(parents=True, exist_ok=True)
+                temporary = self.snapshot.with_name(f".{self.snapshot.name}.tmp")
+                temporary.write_text(json.dumps(snapshot), encoding="utf-8")
+                os.replace(temporary, self.snapshot)
+
+        except Exception as e:
+            log.warning("Agenta - Failed to write config snapshot: %s", e)
+
+
+_config_cache: Optional[ConfigCache] = (
+    ConfigCache(ttl=float(CONFIG_CACHE_TTL), snapshot=CONFIG_CACHE_SNAPSHOT)
+    if CONFIG_CACHE_TTL
+    else None
+)
+
+
+def get_config_cache() -> Optional[ConfigCache]:
+    return _config_cache
+
+
+def set_config_cache(config_cache: Optional[ConfigCache]) -> None:
+    global _config_cache
+
+    _config_cache = config_cache
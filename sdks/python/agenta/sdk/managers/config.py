@@ -7,6 +7,7 @@ from pydantic import BaseModel
 from agenta.sdk.utils.logging import get_module_logger
 from agenta.sdk.utils.lazy import _load_yaml
 from agenta.sdk.managers.shared import SharedManager
+from agenta.sdk.managers.cache import ConfigCache, set_config_cache
 from agenta.sdk.contexts.routing import RoutingContext
 
 T = TypeVar("T", bound=BaseModel)
@@ -57,6 +58,32 @@ class ConfigManager:
 
         return schema(**parameters)
 
+    @staticmethod
+    def enable_cache(
+        ttl: float = 60,
+        snapshot: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Caches configurations pulled from the registry in this process.
+
+        A cached configuration is returned without waiting on the server. Once
+        it is older than `ttl` seconds, it is still returned while a background
+        request checks whether it changed. Can also be enabled by setting
+        `AGENTA_CONFIG_CACHE_TTL` (and `AGENTA_CONFIG_CACHE_SNAPSHOT`).
+
+        Args:
+            ttl (float): Seconds before a cached configuration is revalidated.
+            snapshot (Optional[Union[str, Path]]): JSON file that keeps the last
+                configurations fetched, served on a cold start when the server
+                cannot be reached.
+        """
+        set_config_cache(ConfigCache(ttl=ttl, snapshot=snapshot))
+
+    @staticmethod
+    def disable_cache() -> None:
+        """Pulls every configuration from the registry again."""
+        set_config_cache(None)
+
     @staticmethod
     def get_from_registry(
         schema: Optional[Type[T]] = None,
@@ -1,6 +1,7 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from uuid import uuid4
 
+from agenta.sdk.managers.cache import get_config_cache
 from agenta.sdk.utils.client import authed_api, authed_async_api
 from agenta.sdk.utils.exceptions import handle_exceptions
 from agenta.sdk.utils.logging import get_module_logger
@@ -144,6 +145,13 @@ def _raise_revision_not_found(
     raise ValueError(f"Application revision not found for {details}.")
 
 
+def _clear_config_cache() -> None:
+    config_cache = get_config_cache()
+
+    if config_cache is not None:
+        config_cache.clear()
+
+
 def _revision_has_parameters(revision: Optional[Dict[str, Any]]) -> bool:
     if not revision:
         return False
@@ -392,6 +400,15 @@ class SharedManager:
 
     @classmethod
     def _retrieve_revision(
+        cls,
+        **kwargs: Any,
+    ) -> ConfigurationResponse:
+        configuration, _ = cls._retrieve_tagged_revision(**kwargs)
+
+        return configuration
+
+    @classmethod
+    def _retrieve_tagged_revision(
         cls,
         *,
         app_id: Optional[str] = None,
@@ -402,7 +419,15 @@ class SharedManager:
         environment_id: Optional[str] = None,
         environment_slug: Optional[str] = None,
         environment_version: Optional[int] = None,
-    ) -> ConfigurationResponse:
+        #
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[ConfigurationResponse], Optional[str]]:
+        """Retrieve a configuration along with the ETag it was served with.
+
+        With `etag`, the retrieve is conditional: an unchanged configuration
+        comes back as `(None, etag)`. The ETag is dropped whenever the
+        configuration did not come from the tagged retrieve alone.
+        """
         fetch_signatures = cls._parse_fetch_request(
             app_id=app_id,
             app_slug=app_slug,
@@ -447,11 +472,17 @@ class SharedManager:
             method="POST",
             endpoint="/applications/revisions/retrieve",
             json=request,
+            headers={"If-None-Match": etag} if etag else {},
         )
+
+        if etag and response.status_code == 304:
+            return None, etag
+
         _raise_for_status(response)
 
         result = response.json()
         revision = result.get("application_revision")
+        etag = response.headers.get("etag")
 
         if not _revision_has_parameters(revision) and not (
             fetch_signatures["environment_id"] or fetch_signatures["environment_slug"]
@@ -478,6 +509,7 @@ class SharedManager:
 
             if _revision_has_parameters(fallback_revision):
                 revision = fallback_revision
+                etag = None
 
         if not revision:
             variant = None
@@ -509,24 +541,39 @@ class SharedManager:
                     variant_version=fetch_signatures["variant_version"],
                 )
 
-            return _empty_configuration_response(
-                app_id=resolved_application_id,
-                app_slug=resolved_application_slug,
-                variant_id=resolved_variant_id,
-                variant_slug=resolved_variant_slug,
+            return (
+                _empty_configuration_response(
+                    app_id=resolved_application_id,
+                    app_slug=resolved_application_slug,
+                    variant_id=resolved_variant_id,
+                    variant_slug=resolved_variant_slug,
+                ),
+                None,
             )
 
-        return ConfigurationResponse(
-            **_flatten_revision_response(
-                application_revision=revision,
-                app_slug=resolved_application_slug,
-                variant_slug=resolved_variant_slug,
-                environment_slug=fetch_signatures["environment_slug"],
-            )
+        return (
+            ConfigurationResponse(
+                **_flatten_revision_response(
+                    application_revision=revision,
+                    app_slug=resolved_application_slug,
+                    variant_slug=resolved_variant_slug,
+                    environment_slug=fetch_signatures["environment_slug"],
+                )
+            ),
+            etag,
         )
 
     @classmethod
     async def _aretrieve_revision(
+        cls,
+        **kwargs: Any,
+    ) -> ConfigurationResponse:
+        configuration, _ = await cls._aretrieve_tagged_revision(**kwargs)
+
+        return configuration
+
+    @classmethod
+    async def _aretrieve_tagged_revision(
         cls,
         *,
         app_id: Optional[str] = None,
@@ -537,7 +584,15 @@ class SharedManager:
         environment_id: Optional[str] = None,
         environment_slug: Optional[str] = None,
         environment_version: Optional[int] = None,
-    ) -> ConfigurationResponse:
+        #
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[ConfigurationResponse], Optional[str]]:
+        """Retrieve a configuration along with the ETag it was served with.
+
+        With `etag`, the retrieve is conditional: an unchanged configuration
+        comes back as `(None, etag)`. The ETag is dropped whenever the
+        configuration did not come from the tagged retrieve alone.
+        """
         fetch_signatures = cls._parse_fetch_request(
             app_id=app_id,
             app_slug=app_slug,
@@ -582,11 +637,17 @@ class SharedManager:
             method="POST",
             endpoint="/applications/revisions/retrieve",
             json=request,
+            headers={"If-None-Match": etag} if etag else {},
         )
+
+        if etag and response.status_code == 304:
+            return None, etag
+
         _raise_for_status(response)
 
         result = response.json()
         revision = result.get("application_revision")
+        etag = response.headers.get("etag")
 
         if not _revision_has_parameters(revision) and not (
             fetch_signatures["environment_id"] or fetch_signatures["environment_slug"]
@@ -613,6 +674,7 @@ class SharedManager:
 
             if _revision_has_parameters(fallback_revision):
                 revision = fallback_revision
+                etag = None
 
         if not revision:
             variant = None
@@ -644,20 +706,26 @@ class SharedManager:
                     variant_version=fetch_signatures["variant_version"],
                 )
 
-            return _empty_configuration_response(
-                app_id=resolved_application_id,
-                app_slug=resolved_application_slug,
-                variant_id=resolved_variant_id,
-                variant_slug=resolved_variant_slug,
+            return (
+                _empty_configuration_response(
+                    app_id=resolved_application_id,
+                    app_slug=resolved_application_slug,
+                    variant_id=resolved_variant_id,
+                    variant_slug=resolved_variant_slug,
+                ),
+                None,
             )
 
-        return ConfigurationResponse(
-            **_flatten_revision_response(
-                application_revision=revision,
-                app_slug=resolved_application_slug,
-                variant_slug=resolved_variant_slug,
-                environment_slug=fetch_signatures["environment_slug"],
-            )
+        return (
+            ConfigurationResponse(
+                **_flatten_revision_response(
+                    application_revision=revision,
+                    app_slug=resolved_application_slug,
+                    variant_slug=resolved_variant_slug,
+                    environment_slug=fetch_signatures["environment_slug"],
+                )
+            ),
+            etag,
         )
 
     @classmethod
@@ -817,7 +885,7 @@ class SharedManager:
         environment_slug: Optional[str] = None,
         environment_version: Optional[int] = None,
     ) -> ConfigurationResponse:
-        return cls._retrieve_revision(
+        references = dict(
             app_id=app_id,
             app_slug=app_slug,
             variant_id=variant_id,
@@ -828,6 +896,16 @@ class SharedManager:
             environment_version=environment_version,
         )
 
+        config_cache = get_config_cache()
+
+        if config_cache is None:
+            return cls._retrieve_revision(**references)
+
+        return config_cache.get(
+            references,
+            lambda etag: cls._retrieve_tagged_revision(**references, etag=etag),
+        )
+
     @classmethod
     @handle_exceptions()
     async def afetch(
@@ -842,7 +920,7 @@ class SharedManager:
         environment_slug: Optional[str] = None,
         environment_version: Optional[int] = None,
     ):
-        return await cls._aretrieve_revision(
+        references = dict(
             app_id=app_id,
             app_slug=app_slug,
             variant_id=variant_id,
@@ -853,6 +931,16 @@ class SharedManager:
             environment_version=environment_version,
         )
 
+        config_cache = get_config_cache()
+
+        if config_cache is None:
+            return await cls._aretrieve_revision(**references)
+
+        return await config_cache.aget(
+            references,
+            lambda etag: cls._aretrieve_tagged_revision(**references, etag=etag),
+        )
+
     @classmethod
     @handle_exceptions()
     def list(
@@ -1108,6 +1196,7 @@ class SharedManager:
             },
         )
         _raise_for_status(response)
+        _clear_config_cache()
 
         revision = response.json().get("application_revision")
         if not revision:
@@ -1153,6 +1242,7 @@ class SharedManager:
             },
         )
         _raise_for_status(response)
+        _clear_config_cache()
 
         revision = response.json().get("application_revision")
         if not revision:
@@ -1178,7 +1268,8 @@ class SharedManager:
         app_slug: Optional[str] = None,
         variant_version: Optional[int] = None,
     ):
-        config = cls.fetch(
+        # Deploy what the registry holds now, not what the cache last saw
+        config = cls._retrieve_revision(
             app_id=app_id,
             app_slug=app_slug,
             variant_slug=variant_slug,
@@ -1206,6 +1297,7 @@ class SharedManager:
             },
         )
         _raise_for_status(response)
+        _clear_config_cache()
 
         deployed_revision = response.json().get("application_revision")
         if not deployed_revision:
@@ -1237,7 +1329,8 @@ class SharedManager:
         app_slug: Optional[str] = None,
         variant_version: Optional[int] = None,
     ):
-        config = await cls.afetch(
+        # Deploy what the registry holds now, not what the cache last saw
+        config = await cls._aretrieve_revision(
             app_id=app_id,
             app_slug=app_slug,
             variant_slug=variant_slug,
@@ -1265,6 +1358,7 @@ class SharedManager:
             },
         )
         _raise_for_status(response)
+        _clear_config_cache()
 
         deployed_revision = response.json().get("application_revision")
         if not deployed_revision:
@@ -1311,6 +1405,7 @@ class SharedManager:
             ),
         )
         _raise_for_status(response)
+        _clear_config_cache()
 
         return response.json()
 
@@ -1341,5 +1436,6 @@ class SharedManager:
             ),
         )
         _raise_for_status(response)
+        _clear_config_cache()
 
         return response.json()
@@ -1,4 +1,6 @@
 # /agenta/sdk/middlewares/running/resolver.py
+from copy import deepcopy
+from json import dumps
 from typing import Callable, Any, Optional, Dict
 
 import httpx
@@ -9,6 +11,7 @@ from agenta.sdk.models.workflows import (
     WorkflowInvokeRequest,
     WorkflowRevisionData,
 )
+from agenta.sdk.contexts.batching import BatchingContext
 from agenta.sdk.contexts.running import RunningContext
 from agenta.sdk.contexts.tracing import TracingContext
 from agenta.sdk.engines.running.utils import (
@@ -225,6 +228,52 @@ async def resolve_references_with_info(
     Optional[WorkflowRevisionData],
     Optional[Dict[str, Any]],
     Optional[Dict[str, Any]],
+]:
+    """Resolve references to a revision, once per batch inside ``/invoke/batch``.
+
+    See ``_resolve_references_with_info`` for the lookup itself.
+    """
+    batching = BatchingContext.get()
+
+    if batching is None:
+        return await _resolve_references_with_info(
+            request=request,
+            credentials=credentials,
+        )
+
+    key = (
+        "references",
+        credentials,
+        dumps(
+            request.model_dump(
+                mode="json",
+                include={"references", "selector"},
+                exclude_none=True,
+            ),
+            sort_keys=True,
+        ),
+    )
+
+    resolved = await batching.once(
+        key,
+        lambda: _resolve_references_with_info(
+            request=request,
+            credentials=credentials,
+        ),
+    )
+
+    # Each cell goes on to edit its revision (embeds, default parameters)
+    return deepcopy(resolved)
+
+
+async def _resolve_references_with_info(
+    *,
+    request: WorkflowInvokeRequest,
+    credentials: Optional[str] = None,
+) -> tuple[
+    Optional[WorkflowRevisionData],
+    Optional[Dict[str, Any]],
+    Optional[Dict[str, Any]],
 ]:
     """Resolve environment/workflow references by calling the API retrieve endpoint.
 
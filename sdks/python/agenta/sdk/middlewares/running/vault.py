@@ -11,6 +11,7 @@ from agenta.sdk.utils.exceptions import suppress, display_exception
 from agenta.sdk.utils.providers import normalize_provider_kind
 
 from agenta.sdk.models.workflows import WorkflowServiceRequest
+from agenta.sdk.contexts.batching import BatchingContext
 from agenta.sdk.contexts.running import RunningContext
 
 from agenta.client.types import SecretDto as SecretDTO
@@ -286,6 +287,25 @@ async def get_secrets(
     host: Optional[str] = None,
     scope_type: Optional[str] = None,
     scope_id: Optional[str] = None,
+) -> tuple[list, list, list]:
+    batching = BatchingContext.get()
+
+    if batching is None:
+        return await _fetch_secrets(api_url, credentials, host, scope_type, scope_id)
+
+    # Once per batch and caller, even when the secrets cache is disabled or cold
+    return await batching.once(
+        ("secrets", api_url, credentials),
+        lambda: _fetch_secrets(api_url, credentials, host, scope_type, scope_id),
+    )
+
+
+async def _fetch_secrets(
+    api_url: str,
+    credentials: Optional[str],
+    host: Optional[str] = None,
+    scope_type: Optional[str] = None,
+    scope_id: Optional[str] = None,
 ) -> tuple[list, list, list]:
     headers = None
     if credentials:
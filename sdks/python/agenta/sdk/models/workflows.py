@@ -130,12 +130,14 @@ class WorkflowQueryFlags(BaseModel):
 class WorkflowInvokeRequestFlags(BaseModel):
     """Per-call command directives. ``stream``/``trim``/``force`` are handler-owned,
     unset=False; ``resolve`` is middleware-owned (stripped before the handler), unset=True.
+    ``cache`` gates the LLM response cache (when one is configured), unset=True.
     """
 
     stream: Optional[bool] = None
     trim: Optional[bool] = None
     force: Optional[bool] = None
     resolve: Optional[bool] = None
+    cache: Optional[bool] = None
 
 
 class WorkflowRevisionData(BaseModel):
@@ -290,6 +292,19 @@ class WorkflowInvokeRequest(WorkflowBaseRequest):
 WorkflowServiceRequest = WorkflowInvokeRequest
 
 
+class WorkflowInvokeBatchRequest(BaseModel):
+    """The ``/invoke/batch`` request: many invocations, answered as NDJSON lines.
+
+    Each line is the cell's ``WorkflowBatchResponse`` plus its ``index`` in
+    ``requests``; lines arrive as cells finish, not in request order.
+    ``concurrency`` bounds how many cells run at once (capped by the service).
+    """
+
+    requests: List[WorkflowInvokeRequest]
+
+    concurrency: Optional[int] = None
+
+
 class WorkflowInspectRequest(Metadata, SessionID):
     version: Optional[str] = "2025.07.14"
 
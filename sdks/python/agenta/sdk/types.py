@@ -0,0 +1,6 @@
+import sys
+
+import agenta.sdk.utils.types as _target
+
+# Compat shim: `agenta.sdk.types` → `agenta.sdk.utils.types`.
+sys.modules[__name__] = _target
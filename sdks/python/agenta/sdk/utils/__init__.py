@@ -1,2 +1,22 @@
-from agenta.sdk.utils.assets import *  # noqa: F401, F403
-from agenta.sdk.utils.types import *  # noqa: F401, F403
+from importlib import import_module
+from typing import Any
+
+# `agenta.sdk.utils` used to star-import `assets` and `types` eagerly, which pulled litellm in
+# for every `agenta.sdk.utils.*` import. Their names are still reachable from here, resolved on
+# first access.
+_star_modules = (
+    "agenta.sdk.utils.assets",
+    "agenta.sdk.utils.types",
+)
+
+
+def __getattr__(attr_name: str) -> Any:
+    if attr_name.startswith("_"):
+        raise AttributeError(f"module '{__name__}' has no attribute '{attr_name}'")
+
+    for module_name in _star_modules:
+        module = import_module(module_name)
+        if hasattr(module, attr_name):
+            return getattr(module, attr_name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{attr_name}'")
@@ -0,0 +1,6 @@
+# Compat shim: `agenta.sdk.workflows.*` → `agenta.sdk.engines.running.*`.
+#
+# The package itself is kept (rather than aliased in `sys.modules`) so that its submodules
+# resolve to the shim files next to this one, each of which aliases the real module. Aliasing
+# the package would make `import agenta.sdk.workflows.handlers` load a second copy of
+# `handlers.py` under the old name.
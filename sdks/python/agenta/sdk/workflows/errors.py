@@ -0,0 +1,6 @@
+import sys
+
+import agenta.sdk.engines.running.errors as _target
+
+# Compat shim: `agenta.sdk.workflows.errors` → `agenta.sdk.engines.running.errors`.
+sys.modules[__name__] = _target
@@ -0,0 +1,6 @@
+import sys
+
+import agenta.sdk.engines.running.handlers as _target
+
+# Compat shim: `agenta.sdk.workflows.handlers` → `agenta.sdk.engines.running.handlers`.
+sys.modules[__name__] = _target
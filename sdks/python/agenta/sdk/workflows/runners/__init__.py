@@ -0,0 +1,3 @@
+# Compat shim: `agenta.sdk.workflows.runners` → `agenta.sdk.engines.running.runners`.
+from agenta.sdk.engines.running.runners import *  # noqa: F401, F403
+from agenta.sdk.engines.running.runners import __all__  # noqa: F401
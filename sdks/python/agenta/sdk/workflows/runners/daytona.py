@@ -0,0 +1,6 @@
+import sys
+
+import agenta.sdk.engines.running.runners.daytona as _target
+
+# Compat shim: `agenta.sdk.workflows.runners.daytona` → `agenta.sdk.engines.running.runners.daytona`.
+sys.modules[__name__] = _target
@@ -0,0 +1,6 @@
+import sys
+
+import agenta.sdk.engines.running.utils as _target
+
+# Compat shim: `agenta.sdk.workflows.utils` → `agenta.sdk.engines.running.utils`.
+sys.modules[__name__] = _target
@@ -0,0 +1,180 @@
+"""Tests for the warm runner pool (``RunnerPool``) behind the subprocess transport.
+
+A small Python stand-in speaks the ``cli.ts --serve`` protocol: NDJSON commands on stdin
+(``run`` / ``cancel`` / ``ping``), id-tagged replies on stdout, runs on threads so they overlap,
+and a drain-then-exit on stdin EOF. Each run reports the serving process's pid, so the tests can
+tell reuse from a fresh spawn.
+
+Run: ``uv run pytest oss/tests/pytest/unit/agents/test_runner_pool.py`` from ``sdks/python``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from agenta.sdk.agents.utils import RunnerPool
+
+_FAKE_SERVE_RUNNER = r"""
+import json, os, sys, threading, time
+
+lock = threading.Lock()
+cancelled = {}
+threads = []
+runs = 0
+
+
+def reply(message):
+    with lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def run(run_id, request):
+    reply({"id": run_id, "record": {"kind": "event", "event": {"type": "pid", "pid": os.getpid()}}})
+    if request.get("crash"):
+        os._exit(3)
+    deadline = time.monotonic() + request.get("seconds", 0)
+    while time.monotonic() < deadline and not cancelled[run_id].is_set():
+        time.sleep(0.01)
+    result = {"ok": False, "error": "aborted"} if cancelled[run_id].is_set() else {"ok": True}
+    reply({"id": run_id, "record": {"kind": "result", "result": result}})
+    del cancelled[run_id]
+
+
+assert sys.argv[-1] == "--serve"
+for line in sys.stdin:
+    command = json.loads(line)
+    if command["op"] == "run":
+        runs += 1
+        cancelled[command["id"]] = threading.Event()
+        thread = threading.Thread(target=run, args=(command["id"], command["request"]))
+        thread.start()
+        threads.append(thread)
+    elif command["op"] == "cancel":
+        if command["id"] in cancelled:
+            cancelled[command["id"]].set()
+    elif command["op"] == "ping":
+        rss = int(os.environ.get("FAKE_RSS", "1000"))
+        reply({"id": command["id"], "pong": {"active": len(cancelled), "runs": runs, "rss": rss}})
+
+for thread in threads:
+    thread.join()
+"""
+
+
+@pytest.fixture
+def runner_command(tmp_path) -> List[str]:
+    script = tmp_path / "serve_runner.py"
+    script.write_text(_FAKE_SERVE_RUNNER)
+    return [sys.executable, "-u", str(script)]
+
+
+@pytest.fixture
+async def make_pool(runner_command):
+    pools: List[RunnerPool] = []
+
+    def _make(**kwargs: Any) -> RunnerPool:
+        kwargs.setdefault("health_interval", 60)
+        pools.append(RunnerPool(runner_command, **kwargs))
+        return pools[-1]
+
+    yield _make
+
+    for pool in pools:
+        await pool.close()
+
+
+async def _run(pool: RunnerPool, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [record async for record in pool.stream(payload, timeout=10)]
+
+
+def _pid(records: List[Dict[str, Any]]) -> int:
+    return records[0]["event"]["pid"]
+
+
+async def test_runs_reuse_a_warm_process(make_pool) -> None:
+    pool = make_pool(size=2)
+
+    first = await _run(pool, {})
+    second = await _run(pool, {})
+
+    assert [record["kind"] for record in first] == ["event", "result"]
+    assert first[-1]["result"] == {"ok": True}
+    assert _pid(first) == _pid(second)
+    assert len(pool.processes) == 1
+
+
+async def test_concurrent_runs_share_one_process(make_pool) -> None:
+    pool = make_pool(size=1)
+
+    started = time.monotonic()
+    results = await asyncio.gather(*(_run(pool, {"seconds": 0.3}) for _ in range(3)))
+    elapsed = time.monotonic() - started
+
+    assert len({_pid(records) for records in results}) == 1
+    assert elapsed < 0.8, "runs were multiplexed, not served one after another"
+
+
+async def test_busy_pool_grows_up_to_its_size(make_pool) -> None:
+    pool = make_pool(size=2)
+
+    results = await asyncio.gather(*(_run(pool, {"seconds": 0.2}) for _ in range(3)))
+
+    assert len({_pid(records) for records in results}) == 2
+
+
+async def test_process_is_recycled_after_max_runs(make_pool) -> None:
+    pool = make_pool(size=1, max_runs=2)
+
+    pids = [_pid(await _run(pool, {})) for _ in range(3)]
+
+    assert pids[0] == pids[1] != pids[2]
+    # The retired process was drained, then exited on its own once stdin closed
+    retired = pool.processes[0]
+    assert retired.retiring
+    assert await asyncio.wait_for(retired.proc.wait(), timeout=5) == 0
+
+
+async def test_closing_a_stream_early_cancels_only_that_run(make_pool) -> None:
+    pool = make_pool(size=1)
+
+    stream = pool.stream({"seconds": 30}, timeout=10)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    process = pool.processes[0]
+    for _ in range(50):
+        if (await process.ping())["active"] == 0:
+            break
+        await asyncio.sleep(0.02)
+
+    assert (await process.ping())["active"] == 0
+    assert _pid(await _run(pool, {})) == first["event"]["pid"]
+
+
+async def test_process_exit_mid_run_fails_the_run_and_is_replaced(make_pool) -> None:
+    pool = make_pool(size=1)
+
+    with pytest.raises(RuntimeError, match="without a terminal result record"):
+        await _run(pool, {"crash": True})
+
+    records = await _run(pool, {})
+    assert records[-1]["result"] == {"ok": True}
+
+
+async def test_process_over_memory_limit_is_retired_on_health_check(
+    make_pool,
+    monkeypatch,
+) -> None:
+    monkeypatch.setenv("FAKE_RSS", str(2 * 1024 * 1024))
+    pool = make_pool(size=1, max_rss_mb=1, health_interval=0)
+
+    first = _pid(await _run(pool, {}))
+    second = _pid(await _run(pool, {}))
+
+    assert first != second
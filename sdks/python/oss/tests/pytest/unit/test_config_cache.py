@@ -0,0 +1,171 @@
+"""Unit tests for the stale-while-revalidate registry config cache."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from agenta.sdk.managers.cache import ConfigCache
+from agenta.sdk.managers.shared import SharedManager
+from agenta.sdk.utils.types import ConfigurationResponse
+
+
+KEY = {"app_slug": "my-app", "environment_slug": "production"}
+
+
+def _config(temperature):
+    return ConfigurationResponse(params={"temperature": temperature})
+
+
+class _Registry:
+    """Serves the current config, and answers a matching ETag with 'unchanged'."""
+
+    def __init__(self):
+        self.temperature = 0.1
+        self.calls = []
+        self.down = False
+        self.gate = None
+
+    @property
+    def etag(self):
+        return f'"{self.temperature}"'
+
+    def fetch(self, etag):
+        if self.gate:
+            self.gate.wait()
+        self.calls.append(etag)
+        if self.down:
+            raise ConnectionError("registry unreachable")
+        if etag == self.etag:
+            return None, etag
+        return _config(self.temperature), self.etag
+
+    async def afetch(self, etag):
+        await asyncio.sleep(0)
+        return self.fetch(etag)
+
+
+def _expire(cache):
+    for entry in cache._entries.values():
+        entry.expires_at = 0
+
+
+def _settle(cache):
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and thread.daemon:
+            thread.join(timeout=1)
+
+
+class TestConfigCache:
+    def test_serves_stale_then_revalidates_in_background(self):
+        registry, cache = _Registry(), ConfigCache(ttl=60)
+
+        assert cache.get(KEY, registry.fetch).params == {"temperature": 0.1}
+        assert cache.get(KEY, registry.fetch).params == {"temperature": 0.1}
+        assert registry.calls == [None]
+
+        # Unchanged: a conditional request keeps the cached config
+        _expire(cache)
+        cache.get(KEY, registry.fetch)
+        _settle(cache)
+        assert registry.calls == [None, '"0.1"']
+
+        # Changed: the stale config is served once, the new one afterwards
+        registry.temperature = 0.9
+        _expire(cache)
+        assert cache.get(KEY, registry.fetch).params == {"temperature": 0.1}
+        _settle(cache)
+        assert cache.get(KEY, registry.fetch).params == {"temperature": 0.9}
+
+    def test_failed_refresh_keeps_the_last_good_config(self):
+        registry, cache = _Registry(), ConfigCache(ttl=60)
+        cache.get(KEY, registry.fetch)
+
+        registry.down = True
+        _expire(cache)
+        assert cache.get(KEY, registry.fetch).params == {"temperature": 0.1}
+        _settle(cache)
+
+        # Not retried until another TTL has passed
+        cache.get(KEY, registry.fetch)
+        assert len(registry.calls) == 2
+
+    def test_returned_configs_are_copies(self):
+        registry, cache = _Registry(), ConfigCache(ttl=60)
+
+        cache.get(KEY, registry.fetch).params["temperature"] = 2.0
+
+        assert cache.get(KEY, registry.fetch).params == {"temperature": 0.1}
+
+    async def test_concurrent_lookups_share_one_fetch(self):
+        registry, cache = _Registry(), ConfigCache(ttl=60)
+
+        configs = await asyncio.gather(
+            *(cache.aget(KEY, registry.afetch) for _ in range(10))
+        )
+        assert {config.params["temperature"] for config in configs} == {0.1}
+        assert registry.calls == [None]
+
+        registry.temperature = 0.9
+        _expire(cache)
+        await asyncio.gather(*(cache.aget(KEY, registry.afetch) for _ in range(10)))
+        await asyncio.gather(*cache._tasks)
+        assert registry.calls == [None, '"0.1"']
+        assert (await cache.aget(KEY, registry.afetch)).params == {"temperature": 0.9}
+
+    def test_concurrent_refreshes_are_coalesced(self):
+        registry, cache = _Registry(), ConfigCache(ttl=60)
+        cache.get(KEY, registry.fetch)
+
+        registry.gate = threading.Event()
+        _expire(cache)
+        for _ in range(10):
+            cache.get(KEY, registry.fetch)
+        registry.gate.set()
+        _settle(cache)
+
+        assert len(registry.calls) == 2
+
+    def test_snapshot_serves_a_cold_start_without_the_registry(self, tmp_path):
+        snapshot = tmp_path / "configs.json"
+        registry = _Registry()
+        ConfigCache(ttl=60, snapshot=snapshot).get(KEY, registry.fetch)
+
+        registry.down = True
+        cold = ConfigCache(ttl=60, snapshot=snapshot)
+        assert cold.get(KEY, registry.fetch).params == {"temperature": 0.1}
+
+        with pytest.raises(ConnectionError):
+            cold.get({"app_slug": "other-app"}, registry.fetch)
+
+        # Once reachable again, the snapshot is revalidated on the next lookup
+        registry.down = False
+        registry.temperature = 0.9
+        cold.get(KEY, registry.fetch)
+        _settle(cold)
+        assert cold.get(KEY, registry.fetch).params == {"temperature": 0.9}
+
+
+class TestSharedManagerCache:
+    def test_fetch_uses_the_cache_and_writes_clear_it(self):
+        registry, cache = _Registry(), ConfigCache(ttl=60)
+
+        def _retrieve(**kwargs):
+            return registry.fetch(kwargs.pop("etag"))
+
+        with (
+            patch("agenta.sdk.managers.shared.get_config_cache", return_value=cache),
+            patch.object(
+                SharedManager, "_retrieve_tagged_revision", side_effect=_retrieve
+            ),
+        ):
+            SharedManager.fetch(app_slug="my-app", variant_slug="default")
+            SharedManager.fetch(app_slug="my-app", variant_slug="default")
+            assert registry.calls == [None]
+
+            from agenta.sdk.managers.shared import _clear_config_cache
+
+            _clear_config_cache()
+            SharedManager.fetch(app_slug="my-app", variant_slug="default")
+            assert registry.calls == [None, None]
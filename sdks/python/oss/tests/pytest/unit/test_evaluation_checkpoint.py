@@ -0,0 +1,276 @@
+"""
+CHECKPOINT: `aevaluate(checkpoint=path)` journals a local run's progress so a
+rerun after the process died resumes the same run — finished scenarios are
+skipped, executed cells replay their trace links, and only results the backend
+does not have yet are uploaded.
+
+Driven through `aevaluate` with the same fakes as test_evaluations_runtime.py.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+import agenta.sdk.evaluations.preview.evaluate as preview_evaluate
+import agenta.sdk.evaluations.runtime.adapters as runtime_adapters
+from agenta.sdk.evaluations.runtime.checkpoint import EvaluationCheckpoint
+from agenta.sdk.models.evaluations import EvaluationScenario
+
+
+async def _async(value):
+    return value
+
+
+def test_checkpoint_ignores_a_torn_last_line(tmp_path):
+    path = tmp_path / "run.jsonl"
+
+    checkpoint = EvaluationCheckpoint(path)
+    checkpoint.start_run(run_id=uuid4(), fingerprint="f", run_data={})
+    checkpoint.record_processed(
+        scenario=SimpleNamespace(id="s-1"),
+        status="success",
+    )
+
+    with path.open("a") as file:
+        file.write('{"type": "scenario", "scenario_id": "s-2", "sta')
+
+    resumed = EvaluationCheckpoint(path)
+
+    assert resumed.fingerprint == "f"
+    assert resumed.processed(scenario=SimpleNamespace(id="s-1")) is not None
+    assert resumed.processed(scenario=SimpleNamespace(id="s-2")) is None
+
+
+class _Backend:
+    """The API surface `aevaluate` talks to, recording what it was sent."""
+
+    def __init__(self, monkeypatch):
+        self.run_id = uuid4()
+        self.created = 0
+        self.invoked = []
+        self.populated = []
+        self.edited = []
+        self.fail = set()
+        self.crash_on_close = False
+        self.closed = 0
+
+        testset_revision_id = uuid4()
+        application_revision_id = uuid4()
+        evaluator_revision_id = uuid4()
+
+        self.kwargs = dict(
+            testsets={testset_revision_id: "custom"},
+            applications={application_revision_id: "custom"},
+            evaluators={evaluator_revision_id: "auto"},
+            repeats=1,
+        )
+
+        def _testcase(prompt):
+            tcid = uuid4()
+            return SimpleNamespace(
+                id=tcid,
+                data={"prompt": prompt},
+                model_dump=lambda **kwargs: {
+                    "id": str(tcid),
+                    "data": {"prompt": prompt},
+                },
+            )
+
+        testset_revision = SimpleNamespace(
+            id=testset_revision_id,
+            testset_id=uuid4(),
+            testset_slug="ts-main",
+            testset_variant_id=uuid4(),
+            testset_variant_slug="tsv-main",
+            slug="main",
+            version="1",
+            data=SimpleNamespace(testcases=[_testcase("a"), _testcase("b")]),
+        )
+
+        def _revision(kind, revision_id):
+            return SimpleNamespace(
+                id=revision_id,
+                **{
+                    f"{kind}_id": uuid4(),
+                    f"{kind}_slug": f"{kind}-slug",
+                    f"{kind}_variant_id": uuid4(),
+                    f"{kind}_variant_slug": f"{kind}-variant-slug",
+                },
+                slug=kind,
+                version="1",
+                data=SimpleNamespace(parameters={}),
+                model_dump=lambda **kwargs: {"id": str(revision_id)},
+            )
+
+        async def fake_create_run(**kwargs):
+            self.created += 1
+            return SimpleNamespace(id=self.run_id)
+
+        async def fake_fetch_run(*, run_id):
+            assert run_id == self.run_id
+            return SimpleNamespace(id=self.run_id)
+
+        async def fake_close_run(**kwargs):
+            if self.crash_on_close:
+                raise RuntimeError("process died")
+            self.closed += 1
+            return SimpleNamespace(id=self.run_id)
+
+        async def fake_add_scenarios(*, run_id, count, timestamp=None):
+            return [EvaluationScenario(id=uuid4(), run_id=run_id) for _ in range(count)]
+
+        async def fake_populate_slice(*, results):
+            self.populated.extend(results)
+            return [SimpleNamespace(id=uuid4()) for _ in results]
+
+        async def fake_edit_scenario(*, scenario_id, status, **kwargs):
+            self.edited.append((scenario_id, status))
+
+        async def fake_invoke_application(**kwargs):
+            prompt = kwargs["request"].data.inputs["prompt"]
+            self.invoked.append(prompt)
+            if prompt in self.fail:
+                raise RuntimeError("application failed")
+            return SimpleNamespace(
+                data=SimpleNamespace(),
+                trace_id=f"app-trace-{prompt}",
+                span_id="app-span",
+            )
+
+        async def fake_invoke_evaluator(**kwargs):
+            return SimpleNamespace(
+                data=SimpleNamespace(),
+                trace_id=f"eval-trace-{uuid4().hex}",
+                span_id="eval-span",
+            )
+
+        async def fake_afetch_trace(trace_id, **kwargs):
+            return {"spans": {"root": {"attributes": {"ag": {"data": {}}}}}}
+
+        for name, value in {
+            "aretrieve_testset": lambda **k: _async(testset_revision),
+            "aretrieve_application": lambda **k: _async(
+                _revision("application", application_revision_id)
+            ),
+            "aretrieve_evaluator": lambda **k: _async(
+                _revision("evaluator", evaluator_revision_id)
+            ),
+            "acreate_run": fake_create_run,
+            "afetch_run": fake_fetch_run,
+            "aclose_run": fake_close_run,
+            "aadd_scenarios": fake_add_scenarios,
+            "apopulate_slice": fake_populate_slice,
+            "arefresh": AsyncMock(return_value=None),
+            "aedit_scenario": fake_edit_scenario,
+            "aquery_global": AsyncMock(return_value=None),
+            "aquery_variational": AsyncMock(return_value=[]),
+            "afetch_trace": fake_afetch_trace,
+            "aget_url": lambda **k: _async(""),
+        }.items():
+            monkeypatch.setattr(preview_evaluate, name, value)
+
+        monkeypatch.setattr(
+            runtime_adapters, "invoke_application", fake_invoke_application
+        )
+        monkeypatch.setattr(runtime_adapters, "invoke_evaluator", fake_invoke_evaluator)
+
+
+@pytest.mark.asyncio
+async def test_aevaluate_resumes_an_interrupted_run_from_its_checkpoint(
+    monkeypatch, tmp_path
+):
+    backend = _Backend(monkeypatch)
+    path = tmp_path / "run.jsonl"
+
+    # First attempt: "b" fails, then the process dies before closing the run
+    backend.fail = {"b"}
+    backend.crash_on_close = True
+
+    with pytest.raises(RuntimeError):
+        await preview_evaluate.aevaluate(**backend.kwargs, checkpoint=path)
+
+    assert backend.created == 1
+    assert sorted(backend.invoked) == ["a", "b"]
+
+    first_populated = list(backend.populated)
+
+    # Second attempt: same run, "a" is skipped, only "b" runs and uploads
+    backend.fail = set()
+    backend.crash_on_close = False
+    backend.invoked.clear()
+    backend.populated.clear()
+
+    result = await preview_evaluate.aevaluate(**backend.kwargs, checkpoint=path)
+
+    assert backend.created == 1
+    assert backend.invoked == ["b"]
+
+    scenario_a = next(
+        cell["scenario_id"]
+        for cell in first_populated
+        if cell["trace_id"] == "app-trace-a"
+    )
+    resumed_scenarios = {cell["scenario_id"] for cell in backend.populated}
+    assert len(resumed_scenarios) == 1
+    assert scenario_a not in resumed_scenarios
+
+    assert len(result["scenarios"]) == 2
+    assert {str(item["status"].value) for item in result["scenarios"]} == {"success"}
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[-1] == {"type": "closed", "status": "success"}
+
+    # A closed run is not processed or closed again
+    backend.invoked.clear()
+    backend.populated.clear()
+
+    await preview_evaluate.aevaluate(**backend.kwargs, checkpoint=path)
+
+    assert backend.created == 1
+    assert backend.invoked == []
+    assert backend.populated == []
+
+
+@pytest.mark.asyncio
+async def test_aevaluate_closes_a_fully_processed_run_it_resumes(monkeypatch, tmp_path):
+    backend = _Backend(monkeypatch)
+    path = tmp_path / "run.jsonl"
+
+    # Every scenario finishes, then the process dies before closing the run
+    backend.crash_on_close = True
+
+    with pytest.raises(RuntimeError):
+        await preview_evaluate.aevaluate(**backend.kwargs, checkpoint=path)
+
+    backend.crash_on_close = False
+    backend.invoked.clear()
+    refresh = AsyncMock(return_value=None)
+    monkeypatch.setattr(preview_evaluate, "arefresh", refresh)
+
+    await preview_evaluate.aevaluate(**backend.kwargs, checkpoint=path)
+
+    assert backend.invoked == []
+    refresh.assert_awaited_once_with(run_id=backend.run_id, scenario_id=None)
+    assert backend.closed == 1
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[-1] == {"type": "closed", "status": "success"}
+
+
+@pytest.mark.asyncio
+async def test_aevaluate_refuses_a_checkpoint_of_another_evaluation(
+    monkeypatch, tmp_path
+):
+    backend = _Backend(monkeypatch)
+    path = tmp_path / "run.jsonl"
+
+    await preview_evaluate.aevaluate(**backend.kwargs, checkpoint=path)
+
+    with pytest.raises(ValueError):
+        await preview_evaluate.aevaluate(
+            **{**backend.kwargs, "repeats": 2},
+            checkpoint=path,
+        )
@@ -0,0 +1,186 @@
+"""
+ROUTING: `/invoke/batch` runs many `WorkflowInvokeRequest`s in one HTTP request
+and streams one NDJSON line per cell (`index` + the cell's batch response), in
+completion order. A failing cell fails its own line, not the batch; concurrency
+is bounded; secrets and references are looked up once per batch, and dropped
+from the secrets cache when a cell reports them invalid.
+
+Driven through a Starlette TestClient on the real `route()` wiring, like
+test_invoke_route_aggregation_routing.py.
+"""
+
+import asyncio
+import json
+from contextlib import contextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from agenta.sdk.contexts.batching import BatchingContext, batching_context_manager
+from agenta.sdk.decorators import routing
+from agenta.sdk.decorators.routing import route
+from agenta.sdk.middlewares.running import vault
+from agenta.sdk.models.workflows import (
+    WorkflowBatchResponse,
+    WorkflowInvokeBatchRequest,
+    WorkflowServiceStatus,
+)
+
+
+@contextmanager
+def _offline_tracing():
+    from unittest.mock import MagicMock, patch
+
+    with (
+        patch("agenta.sdk.decorators.tracing.ag") as mock_ag,
+        patch("agenta.sdk.decorators.running.ag") as mock_run_ag,
+    ):
+        span = MagicMock()
+        span.is_recording.return_value = False
+        span.get_span_context.return_value = MagicMock(trace_id=0, span_id=0)
+        mock_ag.tracing = MagicMock()
+        mock_ag.tracing.get_current_span.return_value = span
+        mock_ag.tracing.redact = None
+        tracer = MagicMock()
+        tracer.start_as_current_span.return_value.__enter__ = MagicMock(
+            return_value=span
+        )
+        tracer.start_as_current_span.return_value.__exit__ = MagicMock(
+            return_value=None
+        )
+        mock_ag.tracer = tracer
+        mock_run_ag.DEFAULT_AGENTA_SINGLETON_INSTANCE = MagicMock()
+        mock_run_ag.DEFAULT_AGENTA_SINGLETON_INSTANCE.api_key = None
+        yield
+
+
+_running = {"now": 0, "peak": 0}
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def _fake_auth(request, call_next):
+        request.state.auth = {}
+        return await call_next(request)
+
+    @route("/", app=app)
+    async def wf(value: int = 0):
+        _running["now"] += 1
+        _running["peak"] = max(_running["peak"], _running["now"])
+        try:
+            await asyncio.sleep(0.01)
+            if value < 0:
+                raise ValueError("negative value")
+            return {"double": value * 2}
+        finally:
+            _running["now"] -= 1
+
+    return TestClient(app)
+
+
+def _post_batch(client, values, **body):
+    body["requests"] = [{"data": {"inputs": {"value": value}}} for value in values]
+    return client.post(
+        "/invoke/batch",
+        json=body,
+        headers={"accept": "application/x-ndjson"},
+    )
+
+
+def _lines(response):
+    return sorted(
+        (json.loads(line) for line in response.text.splitlines() if line),
+        key=lambda line: line["index"],
+    )
+
+
+def test_batch_streams_one_line_per_cell_and_isolates_failures():
+    with _offline_tracing():
+        response = _post_batch(_client(), [1, -1, 3])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = _lines(response)
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert lines[0]["data"]["outputs"] == {"double": 2}
+    assert lines[2]["data"]["outputs"] == {"double": 6}
+    assert lines[1]["status"]["code"] == 500
+    assert "negative value" in lines[1]["status"]["message"]
+
+
+def test_batch_bounds_concurrency():
+    _running["peak"] = 0
+
+    with _offline_tracing():
+        response = _post_batch(_client(), list(range(8)), concurrency=2)
+
+    assert len(_lines(response)) == 8
+    assert _running["peak"] <= 2
+
+
+def test_batch_over_the_size_limit_is_413(monkeypatch):
+    monkeypatch.setattr(routing, "INVOKE_BATCH_MAX_SIZE", 2)
+
+    with _offline_tracing():
+        response = _post_batch(_client(), [1, 2, 3])
+
+    assert response.status_code == 413
+
+
+async def test_secrets_are_fetched_once_per_batch(monkeypatch):
+    calls = []
+
+    async def _fetch_secrets(api_url, credentials, *args):
+        calls.append(credentials)
+        await asyncio.sleep(0.01)
+        return [], [], []
+
+    monkeypatch.setattr(vault, "_fetch_secrets", _fetch_secrets)
+
+    with batching_context_manager(BatchingContext()):
+        await asyncio.gather(
+            *(vault.get_secrets("http://api", "ApiKey a") for _ in range(5)),
+            vault.get_secrets("http://api", "ApiKey b"),
+        )
+
+    assert sorted(calls) == ["ApiKey a", "ApiKey b"]
+
+    # Outside of a batch, every call looks up (or hits the secrets cache) again
+    await vault.get_secrets("http://api", "ApiKey a")
+    assert len(calls) == 3
+
+
+def test_batch_invalidates_secrets_a_cell_reports_invalid(monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(routing, "invalidate_secrets_cache", invalidated.append)
+
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def _fake_auth(request, call_next):
+        request.state.auth = {"credentials": "ApiKey a"}
+        return await call_next(request)
+
+    async def invoke(request):
+        if request.data.inputs["value"] < 0:
+            return WorkflowBatchResponse(
+                status=WorkflowServiceStatus(
+                    type="https://agenta.ai/docs/errors#v0:schemas:invalid-secrets",
+                    code=424,
+                    message="No API key found for model 'gpt-4'.",
+                )
+            )
+        return WorkflowBatchResponse()
+
+    @app.post("/invoke/batch")
+    async def invoke_batch(req: routing.Request, batch: WorkflowInvokeBatchRequest):
+        return await routing.handle_invoke_batch(req, batch, invoke)
+
+    with _offline_tracing():
+        response = _post_batch(TestClient(app), [1, -1])
+
+    assert [line["status"]["code"] for line in _lines(response)] == [200, 424]
+    assert invalidated == ["ApiKey a"]
@@ -1,7 +1,7 @@
 """
 Level 4 (specs.md "Testing contract"): header-semantics sweep per axis, over the real
-`/invoke` route. Five axes: `Accept`, `x-ag-messages-transcript`, `x-ag-session-control`,
-`x-ag-workflow-embeds`, `x-ag-messages-format`.
+`/invoke` route. Six axes: `Accept`, `x-ag-messages-transcript`, `x-ag-session-control`,
+`x-ag-workflow-embeds`, `x-ag-llm-cache`, `x-ag-messages-format`.
 
 For each axis: absent -> default; each recognized value -> the mapped flag/behavior;
 unrecognized value -> existing lenient behavior (treated as absent, per
@@ -249,6 +249,30 @@ def test_workflow_embeds_header_body_resolve_flag_wins():
     assert request.flags["resolve"] is False
 
 
+# =========================================================================== #
+# Axis: x-ag-llm-cache -> flags.cache
+# =========================================================================== #
+@pytest.mark.parametrize(
+    "llm_cache,expected_cache",
+    [
+        (None, None),  # absent -> unset; the cache is used when configured
+        ("bypass", False),
+        ("bogus", None),  # unrecognized -> lenient (treated as absent)
+    ],
+)
+def test_llm_cache_header_axis_maps_to_cache_flag(llm_cache, expected_cache):
+    headers = {"x-ag-llm-cache": llm_cache} if llm_cache else {}
+    request = _prelude_request(headers=headers)
+    assert (request.flags or {}).get("cache") is expected_cache
+
+
+def test_llm_cache_header_body_cache_flag_wins():
+    request = _prelude_request(
+        headers={"x-ag-llm-cache": "bypass"}, flags={"cache": True}
+    )
+    assert request.flags["cache"] is True
+
+
 # =========================================================================== #
 # Axis: x-ag-messages-format -> HTTP-only projection (no flag; asserted via response shape).
 # =========================================================================== #
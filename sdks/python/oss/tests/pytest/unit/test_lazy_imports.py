@@ -0,0 +1,121 @@
+"""
+Import-time regression guard for the lazy top-level `agenta` package.
+
+`import agenta` resolves its exports on first access, so a script that only calls
+`ag.init()` and `@ag.instrument` must not load FastAPI, litellm, the managers or the
+agents subsystem. Each check runs in a fresh interpreter, since this test process has
+already imported most of the SDK.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+import agenta as ag
+
+
+HEAVY_MODULES = (
+    "fastapi",
+    "litellm",
+    "openai",
+    "agenta.sdk.agents",
+    "agenta.sdk.decorators.running",
+    "agenta.sdk.engines.running.handlers",
+    "agenta.sdk.managers.config",
+)
+
+# Generous on purpose: the eager package took several seconds, the lazy one well under one.
+IMPORT_BUDGET_SECONDS = 2.5
+
+_MARK = "@@probe@@"
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    # The SDK may log to stdout while importing; the probe tags its own line.
+    lines = [line for line in result.stdout.splitlines() if line.startswith(_MARK)]
+    return lines[-1][len(_MARK) :]
+
+
+def _loaded_after(code: str) -> set:
+    probe = (
+        f"import json, sys\n{code}\n"
+        f"print({_MARK!r} + json.dumps([m for m in {list(HEAVY_MODULES)!r} if m in sys.modules]))"
+    )
+    return set(json.loads(_run(probe)))
+
+
+class TestLazyTopLevelImport:
+    def test_import_agenta_loads_no_heavy_modules(self):
+        assert _loaded_after("import agenta") == set()
+
+    def test_init_and_instrument_load_no_heavy_modules(self):
+        code = (
+            "import agenta as ag\nag.init\n@ag.instrument()\ndef f():\n    return 1\n"
+        )
+        assert _loaded_after(code) == set()
+
+    def test_heavy_exports_still_resolve_on_access(self):
+        assert "agenta.sdk.managers.config" in _loaded_after(
+            "import agenta as ag\nag.ConfigManager"
+        )
+
+    @pytest.mark.lens_performance
+    def test_import_time_stays_within_budget(self):
+        code = (
+            "import time\n"
+            "t = time.perf_counter()\n"
+            "import agenta as ag\n"
+            "ag.init\n"
+            "ag.instrument\n"
+            f"print({_MARK!r} + str(time.perf_counter() - t))"
+        )
+        samples = [float(_run(code)) for _ in range(3)]
+
+        assert statistics.median(samples) < IMPORT_BUDGET_SECONDS
+
+
+class TestLazyExportTable:
+    @pytest.mark.parametrize("name", sorted(ag._dynamic_imports))
+    def test_every_export_resolves(self, name):
+        assert getattr(ag, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            ag.definitely_not_an_export  # noqa: B018
+
+    def test_runtime_state_reads_through_singleton(self):
+        assert ag.DEFAULT_AGENTA_SINGLETON_INSTANCE is ag.AgentaSingleton()
+        assert ag.tracer is not None
+
+    def test_dir_lists_lazy_exports(self):
+        assert {"instrument", "ConfigManager", "tracing"} <= set(dir(ag))
+
+
+class TestCompatShims:
+    def test_sdk_types_alias(self):
+        import agenta.sdk.types
+        import agenta.sdk.utils.types
+
+        assert sys.modules["agenta.sdk.types"] is agenta.sdk.utils.types
+
+    def test_workflows_handlers_alias(self):
+        from agenta.sdk.engines.running import handlers
+        from agenta.sdk.workflows import handlers as legacy_handlers
+
+        assert legacy_handlers is handlers
+
+    def test_workflows_runners_daytona_alias(self):
+        from agenta.sdk.engines.running.runners import daytona
+        from agenta.sdk.workflows.runners import daytona as legacy_daytona
+
+        assert legacy_daytona is daytona
@@ -0,0 +1,130 @@
+"""Unit tests for the exact-match LLM response cache."""
+
+import pytest
+
+from agenta.sdk.contexts.tracing import TracingContext, tracing_context_manager
+from agenta.sdk.litellm import cache as llm_cache
+from agenta.sdk.litellm.cache import DiskBackend, LLMCache, MemoryBackend
+from agenta.sdk.utils.lazy import _load_litellm
+
+
+REQUEST = {
+    "model": "openai/gpt-4o-mini",
+    "messages": [{"role": "user", "content": "Capital of France?"}],
+    "temperature": 0,
+    "api_key": "sk-test",
+}
+
+
+class _Provider:
+    def __init__(self):
+        self.calls = 0
+
+    async def acompletion(self, **kwargs):
+        self.calls += 1
+        return _load_litellm().ModelResponse(
+            model=kwargs["model"],
+            choices=[{"message": {"role": "assistant", "content": "Paris"}}],
+            usage={"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+        )
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    cache = LLMCache(backend=MemoryBackend())
+    monkeypatch.setattr(llm_cache, "get_llm_cache", lambda: cache)
+    return _Provider()
+
+
+class TestKey:
+    def test_is_independent_of_key_order(self):
+        reordered = dict(reversed(list(REQUEST.items())))
+
+        assert LLMCache.key(REQUEST) == LLMCache.key(reordered)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"temperature": 0.7},
+            {"model": "openai/gpt-4o"},
+            {"messages": [{"role": "user", "content": "Capital of Spain?"}]},
+            {"api_key": "sk-other"},
+        ],
+    )
+    def test_changes_with_the_request(self, change):
+        assert LLMCache.key(REQUEST) != LLMCache.key({**REQUEST, **change})
+
+    def test_does_not_contain_credentials(self):
+        assert "sk-test" not in LLMCache.key(REQUEST)
+
+
+class TestAcompletion:
+    async def test_repeated_request_is_served_from_cache(self, provider):
+        first = await llm_cache.acompletion(provider.acompletion, **REQUEST)
+        second = await llm_cache.acompletion(provider.acompletion, **REQUEST)
+
+        assert provider.calls == 1
+        assert second.choices[0].message.content == "Paris"
+        assert second.usage.total_tokens == first.usage.total_tokens
+
+        await llm_cache.acompletion(provider.acompletion, **REQUEST, top_p=0.5)
+        assert provider.calls == 2
+
+    async def test_cache_flag_bypasses_the_cache(self, provider):
+        await llm_cache.acompletion(provider.acompletion, **REQUEST)
+
+        context = TracingContext(flags={"cache": False})
+        with tracing_context_manager(context):
+            await llm_cache.acompletion(provider.acompletion, **REQUEST)
+
+        assert provider.calls == 2
+
+    async def test_streaming_requests_are_not_cached(self, provider):
+        await llm_cache.acompletion(provider.acompletion, **REQUEST, stream=True)
+        await llm_cache.acompletion(provider.acompletion, **REQUEST, stream=True)
+
+        assert provider.calls == 2
+
+    async def test_without_a_cache_the_provider_is_always_called(self, monkeypatch):
+        monkeypatch.setattr(llm_cache, "get_llm_cache", lambda: None)
+        provider = _Provider()
+
+        await llm_cache.acompletion(provider.acompletion, **REQUEST)
+        await llm_cache.acompletion(provider.acompletion, **REQUEST)
+
+        assert provider.calls == 2
+
+    async def test_backend_failures_fall_through_to_the_provider(self):
+        class _Broken:
+            async def get(self, key):
+                raise ConnectionError("cache down")
+
+            async def set(self, key, value, ttl):
+                raise ConnectionError("cache down")
+
+        provider = _Provider()
+        cache = LLMCache(backend=_Broken())
+
+        response = await cache.acompletion(provider.acompletion, **REQUEST)
+
+        assert response.choices[0].message.content == "Paris"
+        assert provider.calls == 1
+
+
+class TestDiskBackend:
+    async def test_persists_across_instances_until_expiry(self, tmp_path):
+        provider = _Provider()
+
+        await LLMCache(backend=DiskBackend(tmp_path)).acompletion(
+            provider.acompletion, **REQUEST
+        )
+        response = await LLMCache(backend=DiskBackend(tmp_path)).acompletion(
+            provider.acompletion, **REQUEST
+        )
+        assert provider.calls == 1
+        assert response.choices[0].message.content == "Paris"
+
+        expired = LLMCache(backend=DiskBackend(tmp_path), ttl=-1)
+        await expired.acompletion(provider.acompletion, **REQUEST, top_p=1)
+        await expired.acompletion(provider.acompletion, **REQUEST, top_p=1)
+        assert provider.calls == 3
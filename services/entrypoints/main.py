@@ -10,11 +10,16 @@ from agenta.sdk.decorators.routing import (
     apply_invoke_prelude,
     handle_invoke_success,
     handle_invoke_failure,
+    handle_invoke_batch,
     handle_inspect_success,
     handle_inspect_failure,
 )
 from agenta.sdk.decorators.running import invoke_workflow, inspect_workflow
-from agenta.sdk.models.workflows import WorkflowInvokeRequest, WorkflowInspectRequest
+from agenta.sdk.models.workflows import (
+    WorkflowInvokeRequest,
+    WorkflowInvokeBatchRequest,
+    WorkflowInspectRequest,
+)
 from agenta.sdk.contexts.routing import RoutingContext, routing_context_manager
 from agenta.sdk.litellm.mocks import MOCKS
 from oss.src.managed import (
@@ -91,6 +96,17 @@ async def services_invoke(req: Request, request: WorkflowInvokeRequest):
         return await handle_invoke_failure(exception)
 
 
+@services_app.post("/invoke/batch")
+async def services_invoke_batch(req: Request, batch: WorkflowInvokeBatchRequest):
+    """Many invocations, of the same or different URIs, in one request (NDJSON)."""
+    credentials = req.state.auth.get("credentials")
+
+    async def invoke(request: WorkflowInvokeRequest):
+        return await invoke_workflow(request=request, credentials=credentials)
+
+    return await handle_invoke_batch(req, batch, invoke)
+
+
 @services_app.post("/inspect")
 async def services_inspect(req: Request, request: WorkflowInspectRequest):
     credentials = req.state.auth.get("credentials")
@@ -6,7 +6,12 @@
  * With `--stream`, writes NDJSON instead: one `{kind:"event"}` line per event the moment it
  * is built, then exactly one terminal `{kind:"result"}` line.
  *
- * `runCli(raw, stream, io)` is the testable seam: it takes the raw stdin string and an
+ * With `--serve`, the process stays up and multiplexes runs over stdio, so a pool of warm
+ * runners (`agenta.sdk.agents.utils.runner_pool`) skips Node startup on every turn. Each stdin
+ * line is one `ServeCommand`; each stdout line is one `ServeReply` tagged with the command's `id`.
+ * Runs execute concurrently; stdin EOF drains the in-flight runs and exits.
+ *
+ * `runCli(raw, stream, io)` (and `serveCli(lines, io)`) is the testable seam: it takes the raw stdin string and an
  * injectable engine runner + output sink, and returns the exit code. Tests pass a fake engine
  * and a collecting `write`, so no stdin/stdout/process.exit mocking is needed; production
  * defaults to the real engine and `process.stdout` (which keeps streaming live).
@@ -15,7 +20,10 @@ import type {
   AgentRunRequest,
   AgentRunResult,
   EmitEvent,
+  StreamRecord,
 } from "./protocol.ts";
+import { createInterface } from "node:readline";
+
 import { runSandboxAgent } from "./engines/sandbox_agent.ts";
 import { isEntrypoint } from "./entry.ts";
 
@@ -23,11 +31,13 @@ import { isEntrypoint } from "./entry.ts";
 export type RunAgent = (
   request: AgentRunRequest,
   emit?: EmitEvent,
+  signal?: AbortSignal,
 ) => Promise<AgentRunResult>;
 
 // One engine: `sandbox-agent` drives a harness (Pi or Claude) over ACP. The harness is
 // selected by `request.harness`, not by an engine selector.
-const runAgent: RunAgent = (request, emit) => runSandboxAgent(request, emit);
+const runAgent: RunAgent = (request, emit, signal) =>
+  runSandboxAgent(request, emit, signal);
 
 function errorMessage(err: unknown): string {
   return err instanceof Error ? err.stack ?? err.message : String(err);
@@ -84,6 +94,83 @@ export async function runCli(
   return result.ok ? 0 : 1;
 }
 
+/** One `--serve` stdin line. `cancel` aborts the run with the same `id`. */
+export type ServeCommand =
+  | { id: string; op: "run"; request: AgentRunRequest }
+  | { id: string; op: "cancel" }
+  | { id: string; op: "ping" };
+
+/** One `--serve` stdout line: a run's stream record, or a health-check answer. */
+export type ServeReply =
+  | { id: string; record: StreamRecord }
+  | { id: string; pong: { active: number; runs: number; rss: number } }
+  | { id: string | null; error: string };
+
+/**
+ * Serve runs from `lines` until it ends, then wait for the in-flight ones. Returns the exit code.
+ * A cancelled run still ends with its terminal record, so the caller can always release its id.
+ */
+export async function serveCli(
+  lines: AsyncIterable<string>,
+  io: CliIO = {},
+): Promise<number> {
+  const run = io.run ?? runAgent;
+  const write = io.write ?? ((chunk: string) => void process.stdout.write(chunk));
+  const reply = (message: ServeReply) => write(JSON.stringify(message) + "\n");
+
+  const inflight = new Map<string, { controller: AbortController; done: Promise<void> }>();
+  let runs = 0;
+
+  const start = (id: string, request: AgentRunRequest): void => {
+    const controller = new AbortController();
+    const emit: EmitEvent = (event) => reply({ id, record: { kind: "event", event } });
+    const done = (async () => {
+      let result: AgentRunResult;
+      try {
+        result = await run(request ?? {}, emit, controller.signal);
+      } catch (err) {
+        result = { ok: false, error: errorMessage(err) };
+      }
+      reply({ id, record: { kind: "result", result: { ...result, events: [] } } });
+    })().finally(() => inflight.delete(id));
+    inflight.set(id, { controller, done });
+    runs += 1;
+  };
+
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+
+    let command: ServeCommand;
+    try {
+      command = JSON.parse(line) as ServeCommand;
+    } catch (err) {
+      reply({ id: null, error: `Invalid JSON on stdin: ${String(err)}` });
+      continue;
+    }
+
+    if (command.op === "run") {
+      if (inflight.has(command.id)) {
+        reply({ id: command.id, error: `Run ${command.id} is already in flight` });
+        continue;
+      }
+      start(command.id, command.request);
+    } else if (command.op === "cancel") {
+      inflight.get(command.id)?.controller.abort();
+    } else if (command.op === "ping") {
+      reply({
+        id: command.id,
+        pong: { active: inflight.size, runs, rss: process.memoryUsage().rss },
+      });
+    } else {
+      reply({ id: (command as { id?: string }).id ?? null, error: "Unknown op" });
+    }
+  }
+
+  // EOF is how the pool retires a process: finish what is running, then exit.
+  await Promise.all([...inflight.values()].map(({ done }) => done));
+  return 0;
+}
+
 async function readStdin(): Promise<string> {
   const chunks: Buffer[] = [];
   for await (const chunk of process.stdin) {
@@ -93,6 +180,11 @@ async function readStdin(): Promise<string> {
 }
 
 async function main(): Promise<void> {
+  if (process.argv.includes("--serve")) {
+    const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+    process.exit(await serveCli(lines));
+  }
+
   const stream = process.argv.includes("--stream");
   const raw = await readStdin();
   const code = await runCli(raw, stream);
@@ -4,13 +4,15 @@
  * Injects a FAKE engine and a collecting `write`, so no stdin/stdout/process.exit mocking is
  * needed. Covers the one-shot happy path, invalid JSON, a failing result, and the streaming
  * order (event lines then exactly one terminal result line). No harness, no process exit.
+ * `serveCli` gets the same treatment over an in-memory line source: multiplexed runs, cancel,
+ * ping, and the drain on EOF.
  *
  * Run: pnpm test (or: pnpm exec vitest run tests/unit/cli.test.ts)
  */
 import { describe, it } from "vitest";
 import assert from "node:assert/strict";
 
-import { runCli, type RunAgent } from "../../src/cli.ts";
+import { runCli, serveCli, type RunAgent } from "../../src/cli.ts";
 
 const okRun: RunAgent = async () => ({ ok: true, output: "hi" });
 
@@ -64,3 +66,128 @@ describe("runCli", () => {
     assert.deepEqual(records[2].result!.events, [], "terminal result does not echo events");
   });
 });
+
+/** A line source the test feeds by hand; `end()` is stdin EOF. */
+function lineSource() {
+  const queue: string[] = [];
+  let wake: (() => void) | undefined;
+  let ended = false;
+  const push = (line: string) => {
+    queue.push(line);
+    wake?.();
+  };
+  return {
+    send: (command: unknown) => push(JSON.stringify(command)),
+    raw: push,
+    end: () => {
+      ended = true;
+      wake?.();
+    },
+    async *[Symbol.asyncIterator]() {
+      while (true) {
+        if (queue.length) {
+          yield queue.shift()!;
+        } else if (ended) {
+          return;
+        } else {
+          await new Promise<void>((resolve) => (wake = resolve));
+        }
+      }
+    },
+  };
+}
+
+function replies(out: ReturnType<typeof collector>) {
+  return out
+    .text()
+    .trim()
+    .split("\n")
+    .filter(Boolean)
+    .map((line) => JSON.parse(line) as Record<string, any>);
+}
+
+const tick = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+describe("serveCli", () => {
+  it("multiplexes concurrent runs, each ending with its own result record", async () => {
+    const out = collector();
+    const gates: Record<string, () => void> = {};
+    const run: RunAgent = async (request, emit) => {
+      const name = String(request.harness);
+      emit?.({ type: "message", text: name });
+      await new Promise<void>((resolve) => (gates[name] = resolve));
+      return { ok: true, output: name };
+    };
+
+    const lines = lineSource();
+    const served = serveCli(lines, { run, write: out.write });
+    lines.send({ id: "a", op: "run", request: { harness: "pi_core" } });
+    lines.send({ id: "b", op: "run", request: { harness: "claude" } });
+    await tick();
+
+    // Both are in flight at once; finish them out of order
+    gates.claude();
+    gates.pi_core();
+    lines.end();
+    assert.equal(await served, 0);
+
+    const records = replies(out);
+    assert.deepEqual(
+      records.map((r) => [r.id, r.record.kind]),
+      [
+        ["a", "event"],
+        ["b", "event"],
+        ["b", "result"],
+        ["a", "result"],
+      ],
+    );
+    assert.equal(records[3].record.result.output, "pi_core");
+    assert.deepEqual(records[3].record.result.events, []);
+  });
+
+  it("cancel aborts the run's signal and still ends it with a result", async () => {
+    const out = collector();
+    const run: RunAgent = (_request, _emit, signal) =>
+      new Promise((resolve) =>
+        signal?.addEventListener("abort", () => resolve({ ok: false, error: "aborted" })),
+      );
+
+    const lines = lineSource();
+    const served = serveCli(lines, { run, write: out.write });
+    lines.send({ id: "a", op: "run", request: {} });
+    await tick();
+    lines.send({ id: "a", op: "cancel" });
+    lines.end();
+    await served;
+
+    assert.deepEqual(replies(out), [
+      { id: "a", record: { kind: "result", result: { ok: false, error: "aborted", events: [] } } },
+    ]);
+  });
+
+  it("ping reports in-flight runs; bad lines get an error reply, not a crash", async () => {
+    const out = collector();
+    let release!: () => void;
+    const run: RunAgent = () =>
+      new Promise((resolve) => (release = () => resolve({ ok: true })));
+
+    const lines = lineSource();
+    const served = serveCli(lines, { run, write: out.write });
+    lines.send({ id: "a", op: "run", request: {} });
+    lines.raw("{not json");
+    lines.send({ id: "p", op: "ping" });
+    await tick();
+    release();
+    lines.end();
+    await served;
+
+    const [invalid, pong, result] = replies(out);
+    assert.equal(invalid.id, null);
+    assert.match(invalid.error, /Invalid JSON on stdin/);
+    assert.equal(pong.id, "p");
+    assert.equal(pong.pong.active, 1);
+    assert.equal(pong.pong.runs, 1);
+    assert.ok(pong.pong.rss > 0);
+    assert.equal(result.record.kind, "result");
+  });
+});
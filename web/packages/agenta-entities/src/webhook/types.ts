@@ -13,6 +13,7 @@ export interface WebhookSubscriptionData {
     payload_fields?: Record<string, unknown>
     auth_mode?: "signature" | "authorization"
     event_types?: WebhookEventType[]
+    batch_size?: number
 }
 
 export type WebhookProvider = "webhook" | "github"
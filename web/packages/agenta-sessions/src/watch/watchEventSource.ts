@@ -4,6 +4,19 @@ const RETRY_BASE_MS = 1_000
 const RETRY_MAX_MS = 30_000
 const MIN_INTERVAL_MS = 3_000
 
+/**
+ * A `ready` after a `Last-Event-ID` reconnect that the server caught up from its replay log: the
+ * frames before it were everything missed, so there is nothing to revalidate.
+ */
+const isReplayedReady = (eventName: string, event: MessageEvent<string>): boolean => {
+    if (eventName !== "ready") return false
+    try {
+        return JSON.parse(event.data)?.replayed === true
+    } catch {
+        return false
+    }
+}
+
 const retryDelayMs = (attempt: number): number =>
     Math.round(Math.min(RETRY_BASE_MS * 2 ** attempt, RETRY_MAX_MS) * (0.5 + Math.random() / 2))
 
@@ -100,7 +113,9 @@ export const useWatchEventSource = ({
             }
             for (const eventName of eventNames) {
                 eventSource.addEventListener(eventName, (event) => {
-                    notify(eventName, event as MessageEvent<string>)
+                    const message = event as MessageEvent<string>
+                    if (isReplayedReady(eventName, message)) return
+                    notify(eventName, message)
                 })
             }
             eventSource.onerror = () => {